@@ -1,13 +1,41 @@
 import re
-import random
+import secrets
+import sys
 import datetime
-import hashlib
+import functools
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional
 
 import streamlit as st
 import streamlit.components.v1 as components
 
+# The headless core lives next to this file; make it importable however the
+# app is launched (streamlit run, streamlit_app.py, or the test loader).
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+from musicwordle.config import ANSWERS, COLS, LENGTHS, ROWS, answers_for, rows_for  # noqa: E402
+from musicwordle.dictionary import shared_dictionary  # noqa: E402
+from musicwordle.engine import (  # noqa: E402
+    CONTINUE, FINISHED, HARD_MODE, STRICT_MODE, UNKNOWN, WON, LOST, GameEngine, GameState, build_share_summary,
+    compute_key_status, describe, seeded_choice,
+)
+from musicwordle.dictionary import load_bundled_words as load_bundled_dictionary  # noqa: E402
+from musicwordle import events  # noqa: E402
+from musicwordle.finder import QueryError, shared_index  # noqa: E402
+from musicwordle.memory import approx_size  # noqa: E402
+from musicwordle.multiboard import (  # noqa: E402
+    BOARD_COUNTS, MultiEngine, MultiGameState, describe_multi, pick_secrets, rows_for_boards,
+)
+from musicwordle.schedule import daily_secret  # noqa: E402
+from musicwordle.scoring import decode_pattern, score_guess, shared_matrix  # noqa: E402
+from musicwordle.solver import STRATEGIES, full_candidates, suggest  # noqa: E402
+from musicwordle.spelling import did_you_mean, format_suggestions  # noqa: E402
+from musicwordle.stats import GameRecord, shared_store  # noqa: E402
+from musicwordle.telemetry import PROFILE_MODES, capture, format_summary, metrics_dir, shared_recorder  # noqa: E402
+from musicwordle.warmup import start_background as start_warm_up  # noqa: E402
+
 
 # Simple haptic feedback helper usable across the module
 def haptic():
@@ -24,81 +52,6 @@ def haptic():
         pass
 
 
-# --- Config ---
-ROWS = 6
-COLS = 5
-
-# Curated 5-letter music answers (same spirit as the web version)
-ANSWERS = [
-    # Composers / artists
-    'haydn','liszt','verdi','ravel','bizet','elgar','satie','grieg','glass','reich','adams','faure','dukas','ibert','nyman',
-    'berio','weber','wolfe','sousa','price','rouse',
-    'adele','bjork','swift','sting','drake','lorde','seger',
-
-    # Instruments
-    'piano','viola','cello','organ','oboes','flute','drums','synth','tabla','sitar','lyres','harps','banjo','reeds',
-    'kazoo','guqin','zurna','veena','sarod','rebab','mbira','bongo','conga','shawm','cajon','snare','fifes','pipes',
-    'guiro','tiple','viols',
-
-    # Notation, technique, and theory
-    'forte','largo','tenor','mezzo','lento','dolce','grave','segue','segno','ossia','pedal','clefs','tacet','tutti',
-    'theme','motif','rests','slurs','trill','staff','stave','codas','pitch','voice','lyric','sheet','meter','metre','tempo',
-    'sharp','flats','third','fifth','sixth','ninth','tenth','round','drone','beats','riffs','licks','tunes','songs','vocal',
-    'notes','score','solfa','cresc','frets','capos','barre','beams','octet','nonet','duets','trios','solos','choir','arias',
-    'carol','vibes','sines','mixer','delay','phase','codec','music','audio','hertz',
-
-    # Pieces, forms, dances, styles, and genres
-    'canon','fugue','etude','opera','rondo','tango','waltz','missa','motet','suite','gigue','salsa','mambo','rumba','polka',
-    'choro','djent','drill','swing','disco','house','grime','metal','indie','blues','folky','samba','bossa','noise','chant',
-    'chime','psalm','verse',
-]
-
-
-def load_bundled_dictionary() -> List[str]:
-    """Attempt to load the bundled JS dictionary and extract 5-letter words.
-    It reads music-wordle/allowed-guesses.js and regex-parses 'word' entries.
-    Returns an empty list if not found.
-    """
-    js_path = Path(__file__).resolve().parent.parent / 'music-wordle' / 'allowed-guesses.js'
-    if not js_path.exists():
-        return []
-    text = js_path.read_text(encoding='utf-8', errors='ignore')
-    # Extract 'word' in single quotes, 5 letters
-    words = re.findall(r"'([a-z]{5})'", text)
-    # Deduplicate while preserving order
-    seen = set()
-    out = []
-    for w in words:
-        if w not in seen:
-            seen.add(w)
-            out.append(w)
-    return out
-
-
-def score_guess(guess: str, answer: str) -> List[str]:
-    """Wordle scoring with duplicate handling.
-    Returns a list with values in {'correct','present','absent'}.
-    """
-    res = ['absent'] * COLS
-    a = list(answer)
-    g = list(guess)
-
-    counts = {}
-    for i in range(COLS):
-        if g[i] == a[i]:
-            res[i] = 'correct'
-        else:
-            counts[a[i]] = counts.get(a[i], 0) + 1
-    for i in range(COLS):
-        if res[i] == 'correct':
-            continue
-        ch = g[i]
-        if counts.get(ch, 0) > 0:
-            res[i] = 'present'
-            counts[ch] -= 1
-    return res
-
-
 def tile_html(ch: str, status: str) -> str:
     colors = {
         'correct': '#538d4e',  # green
@@ -120,132 +73,709 @@ def tile_html(ch: str, status: str) -> str:
     """
 
 
+@functools.lru_cache(maxsize=None)
+def answers_of(length: int = COLS) -> tuple:
+    """The curated answers of one word length, one shared tuple per process."""
+    return tuple(answers_for(length))
+
+
+@functools.lru_cache(maxsize=None)
+def answer_set(length: int = COLS) -> frozenset:
+    return frozenset(answers_of(length))
+
+
+_ANSWERS = answers_of(COLS)
+
+
+BOARD_CSS = (
+    '<style>'
+    '.mw-board { display:flex; flex-direction:column; gap:4px; align-items:center; }'
+    '.mw-row { display:flex; gap:4px; justify-content:center; margin-bottom:4px; }'
+    '.mw-tile { --tile-size: 44px; display:flex; align-items:center; justify-content:center;'
+    ' width: var(--tile-size,48px); height: var(--tile-size,48px); background:#1a1a1b;'
+    ' border: 2px solid #1a1a1b; border-radius: 6px; font-weight: 800; font-size: 22px; line-height: 1;'
+    ' color: #e5e5e5; font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif;'
+    ' text-transform: uppercase; text-align:center; }'
+    '.mw-tile.correct { background:#538d4e; border-color:#538d4e; }'
+    '.mw-tile.present { background:#b59f3b; border-color:#b59f3b; }'
+    '.mw-tile.absent { background:#3a3a3c; border-color:#3a3a3c; }'
+    '@media (max-width: 420px) { .mw-tile { --tile-size: 38px; } .mw-tile { font-size: 16px; } }'
+    '.mw-mini .mw-row { gap:2px; margin-bottom:2px; }'
+    '.mw-mini .mw-tile { --tile-size: 22px; border-width:1px; border-radius:3px; font-size: 12px; }'
+    '.mw-mini.solved { opacity: 0.6; }'
+    '</style>'
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def row_html(guess: str = '', code: Optional[int] = None, cols: int = COLS) -> str:
+    """One board row as compact single-line HTML, cached by content.
+
+    Styling lives in ``BOARD_CSS`` (same look as ``tile_html``), so a row is
+    a few hundred bytes; single-line so markdown never turns indented
+    markup into a code block. An empty ``guess`` renders a blank row of
+    ``cols`` tiles.
+    """
+    if guess:
+        statuses = decode_pattern(code, len(guess))
+        tiles = ''.join(f'<div class="mw-tile {s_}">{ch.upper()}</div>' for ch, s_ in zip(guess, statuses))
+    else:
+        tiles = '<div class="mw-tile"></div>' * cols
+    return f'<div class="mw-row">{tiles}</div>'
+
+
+def board_rows(game: GameState) -> List[str]:
+    rows = [row_html(g, c) for g, c in zip(game.guess_words, game.codes)]
+    rows.extend(row_html(cols=game.cols) for _ in range(rows_for(game.cols) - len(rows)))
+    return rows
+
+
+@functools.lru_cache(maxsize=1024)
+def mini_board_html(guesses: bytes, codes: tuple, cols: int, rows: int) -> str:
+    """One board of a multi-board game as a single element, cached by content.
+
+    A guess leaves solved boards untouched, so their markup is the same
+    cached string as last run and only the boards that changed differ.
+    """
+    words = [guesses[i:i + cols].decode('ascii') for i in range(0, len(guesses), cols)]
+    html = ''.join(row_html(w, c, cols) for w, c in zip(words, codes))
+    html += row_html(cols=cols) * (rows - len(codes))
+    solved = ' solved' if codes and codes[-1] == 3 ** cols - 1 else ''
+    return f'<div class="mw-board mw-mini{solved}">{html}</div>'
+
+
+# Off unless MUSIC_WORDLE_TELEMETRY is set or a session opens ?debug=1
+_telemetry = shared_recorder()
+
+# Off unless MUSIC_WORDLE_EVENTS_DIR is set
+_events = events.shared_log()
+
+# st.fragment (Streamlit 1.37+) reruns only the decorated block when one of
+# its widgets changes; older versions simply rerun the whole script.
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda fn: fn)
+
+
+def word_length() -> int:
+    return st.session_state.get('length', COLS)
+
+
+def board_count() -> int:
+    return st.session_state.get('boards', 1)
+
+
 def ensure_state():
     if 'answers' not in st.session_state:
-        st.session_state.answers = [w for w in ANSWERS if len(w) == COLS]
+        st.session_state.answers = answers_of(word_length())
     if 'allowed' not in st.session_state:
-        bundled = load_bundled_dictionary()
-        # Union with answers to ensure every answer is guessable
-        allowed = set(bundled or []) | set(st.session_state.answers)
-        # Fallback small seed if bundled missing
-        if not allowed:
-            allowed = set([
-                'about','other','which','their','there','first','would','these','music','audio','piano','opera','canon','fugue'
-            ])
-        st.session_state.allowed = sorted(allowed)
-    if 'secret' not in st.session_state:
-        # Secret will be set by seeded picker later in main()
-        st.session_state.secret = None
-    if 'guesses' not in st.session_state:
-        st.session_state.guesses = []  # list[str]
-    if 'statuses' not in st.session_state:
-        st.session_state.statuses = []  # list[list[str]]
+        # One immutable WordList per process and word length, shared by every
+        # session; other lengths are only loaded when someone picks them
+        st.session_state.allowed = shared_dictionary(word_length())
+    if 'game' not in st.session_state:
+        # GameState is created by the seeded picker later in main()
+        st.session_state.game = None
     if 'message' not in st.session_state:
         st.session_state.message = ''
-    if 'finished' not in st.session_state:
-        st.session_state.finished = False
-    if 'current_guess' not in st.session_state:
-        st.session_state.current_guess = ''
+    if 'candidates' not in st.session_state:
+        # Built on first hint, then narrowed after every submitted guess
+        st.session_state.candidates = None
+
+
+def game_engine() -> GameEngine:
+    """Engine over this session's dictionary (cheap; holds references only)."""
+    return GameEngine(st.session_state.allowed, st.session_state.answers, hard=st.session_state.get('hard'))
+
+
+def multi_engine() -> MultiEngine:
+    """Engine for multi-board games; the shared matrix scores all boards in one lookup."""
+    return MultiEngine(st.session_state.allowed, st.session_state.answers, matrix=shared_matrix(word_length()))
+
+
+def pick_secret(seed_str: str, daily: bool) -> str:
+    """Daily games follow the precomputed calendar; custom seeds hash the seed."""
+    if daily:
+        try:
+            return daily_secret(datetime.date.fromisoformat(seed_str), st.session_state.answers)
+        except ValueError:
+            pass
+    return seeded_choice(st.session_state.answers, seed_str)
+
+
+def make_game(seed_str: str, daily: bool):
+    """A single board, or ``board_count()`` boards with secrets from derived seeds."""
+    boards = board_count()
+    if boards > 1:
+        return MultiGameState(pick_secrets(st.session_state.answers, seed_str, boards))
+    return GameState(pick_secret(seed_str, daily))
 
 
 def new_game():
     # Pick a deterministic secret based on the current seed string
     seed_str = st.session_state.get('seed_str') or 'default'
-    st.session_state.secret = seeded_choice(st.session_state.answers, seed_str)
-    st.session_state.guesses = []
-    st.session_state.statuses = []
+    st.session_state.game = make_game(seed_str, st.session_state.get('daily', False))
     st.session_state.message = 'New secret picked. Good luck!'
-    st.session_state.finished = False
+    st.session_state.candidates = None
+    st.session_state.did_you_mean = []
+    log_event(events.NEW)
+
+
+def switch_length(length: int):
+    """Play ``length``-letter words from now on: that length's answers and
+    dictionary, and a new game (created by ``_render`` with the seed)."""
+    st.session_state.length = length
+    st.session_state.answers = answers_of(length)
+    st.session_state.allowed = shared_dictionary(length)
+    st.session_state.game = None
+    st.session_state.candidates = None
+    st.session_state.did_you_mean = []
+    # An uploaded dictionary is parsed again at the new length
+    st.session_state.upload_id = None
+    st.session_state.message = f'Now playing {length}-letter words. Good luck!'
+
+
+def switch_boards(boards: int):
+    """Play ``boards`` boards at once from now on; ``_render`` creates the game."""
+    st.session_state.boards = boards
+    st.session_state.game = None
+    st.session_state.candidates = None
+    st.session_state.did_you_mean = []
+    st.session_state.message = ('One board. Good luck!' if boards == 1
+                                else f'{boards} boards, one guess for all. Good luck!')
+
+
+def current_candidates():
+    """Answers still consistent with this session's feedback."""
+    cands = st.session_state.get('candidates')
+    if cands is None:
+        game = st.session_state.game
+        cands = full_candidates(game.cols)
+        for guess, code in zip(game.guess_words, game.codes):
+            cands = cands.narrow(guess, code)
+        st.session_state.candidates = cands
+    return cands
+
+
+def _rerun():
+    # Rerun to refresh board/keyboard
+    try:
+        st.rerun()
+    except Exception:
+        import streamlit as _st
+        if hasattr(_st, 'experimental_rerun'):
+            _st.experimental_rerun()
+
+
+def log_event(kind: int, guess: Optional[str] = None, status: int = events.NO_STATUS, row: Optional[int] = None):
+    """Append one gameplay event (a buffered 24-byte record) when the event log is on."""
+    if _events is None:
+        return
+    game: GameState = st.session_state.game
+    if not isinstance(game, GameState) or game.cols != COLS:
+        # Records have room for one 5-letter guess and a one-byte pattern code
+        return
+    key = st.session_state.get('session_key')
+    if key is None:
+        key = st.session_state.session_key = secrets.randbits(64)
+    _events.log(key, kind, game.current if guess is None else guess, status, game.tries if row is None else row)
+
+
+def type_letter(ch: str):
+    # Typing only touches the shared buffer, so the single-board engine serves both
+    if game_engine().type_letter(st.session_state.game, ch):
+        log_event(events.KEY)
+        haptic()
+
 
+def backspace():
+    if game_engine().backspace(st.session_state.game):
+        log_event(events.BACK)
+        haptic()
 
-def load_custom_dictionary(file_bytes: bytes):
-    text = file_bytes.decode('utf-8', errors='ignore')
-    words = []
-    # Try JSON array first
+
+def submit_multi_guess(game: MultiGameState):
+    """Submit the typing buffer to every board; not recorded to stats or the event log."""
+    outcome = multi_engine().submit(game)
+    st.session_state.message = describe_multi(outcome, game)
+    st.session_state.did_you_mean = []
+    if outcome == UNKNOWN:
+        near = did_you_mean(game.current, st.session_state.allowed, st.session_state.answers, 3)
+        st.session_state.did_you_mean = near
+        if near:
+            st.session_state.message += f". {format_suggestions(near)}"
+
+
+def submit_guess_from_state():
+    with _telemetry.span('submit'):
+        game: GameState = st.session_state.game
+        game.current = re.sub(r"[^A-Za-z]", "", game.current).lower()
+        if isinstance(game, MultiGameState):
+            submit_multi_guess(game)
+            st.session_state.board_dirty = True
+            haptic()
+            return
+        outcome = game_engine().submit(game)
+        if outcome in (CONTINUE, WON, LOST) and st.session_state.get('candidates') is not None:
+            st.session_state.candidates = st.session_state.candidates.narrow(game.guess_words[-1], game.codes[-1])
+        st.session_state.message = describe(outcome, game)
+        st.session_state.did_you_mean = []
+        if outcome in (CONTINUE, WON, LOST):
+            kind = events.GUESS if outcome == CONTINUE else events.WON if outcome == WON else events.LOST
+            log_event(kind, game.guess_words[-1], game.codes[-1], game.tries - 1)
+        elif outcome != FINISHED:
+            log_event(events.INVALID)
+        if outcome == UNKNOWN:
+            near = spelling_suggestions(game.current)
+            st.session_state.did_you_mean = near
+            if near:
+                st.session_state.message += f". {format_suggestions(near)}"
+        elif outcome in (WON, LOST):
+            record_finished_game(game)
+    # Board and message live outside the keyboard fragment; ask for a full rerun
+    st.session_state.board_dirty = True
+    haptic()
+
+
+def spelling_suggestions(guess: str, limit: int = 3) -> List[str]:
+    """Valid words near a rejected guess, answers first; hard mode drops ones it would reject."""
+    with _telemetry.span('did_you_mean'):
+        allowed, answers = st.session_state.allowed, st.session_state.answers
+        hard, game = st.session_state.get('hard'), st.session_state.game
+        if not (hard and game.codes):
+            return did_you_mean(guess, allowed, answers, limit)
+        knowledge = game.knowledge
+        near = did_you_mean(guess, allowed, answers, limit * 4)
+        return [w for w in near if knowledge.violation(w, hard == STRICT_MODE) is None][:limit]
+
+
+def use_suggestion(word: str):
+    st.session_state.game.current = word
+    st.session_state.did_you_mean = []
+
+
+def player_id() -> str:
+    """Anonymous player id, kept in the URL (?player=) so stats survive a refresh."""
+    pid = st.session_state.get('player')
+    if pid is None:
+        pid = st.query_params.get('player')
+        if isinstance(pid, list):
+            pid = pid[0] if pid else None
+        if not pid or len(pid) > 40:
+            pid = secrets.token_urlsafe(8)
+            try:
+                st.query_params['player'] = pid
+            except Exception:
+                pass
+        st.session_state.player = pid
+    return pid
+
+
+def record_finished_game(game: GameState):
+    """Queue the finished game for the stats database (returns at once; a writer thread commits)."""
+    store = shared_store()
+    if store is not None:
+        store.record(GameRecord.from_state(player_id(), game, bool(st.session_state.get('daily')),
+                                           st.session_state.get('seed_str') or 'default', st.session_state.get('hard')))
+
+
+def restore_daily_result(seed_str: str):
+    """After a refresh, show today's finished daily game instead of a blank board (checked once per day)."""
+    game: GameState = st.session_state.game
+    if st.session_state.get('restore_checked') == seed_str or game.codes:
+        return
+    st.session_state.restore_checked = seed_str
+    store = shared_store()
+    previous = store.last_daily(player_id(), seed_str) if store is not None else None
+    if previous is not None and previous.answer == game.secret:
+        st.session_state.game = previous.to_state()
+        st.session_state.message = "You've already played today's puzzle — here is your result."
+
+
+def distribution_lines(counts: List[int], lost: Optional[int] = None) -> List[str]:
+    """Text bar chart of wins by number of tries (plus losses when given)."""
+    labelled = [(str(i + 1), n) for i, n in enumerate(counts)] + ([('X', lost)] if lost is not None else [])
+    top = max([n for _, n in labelled] + [1])
+    return [f"{label} {'█' * max(1 if n else 0, round(20 * n / top)):<20} {n}" for label, n in labelled]
+
+
+def stats_panel(game: GameState, daily: bool, seed_str: str):
+    """Sidebar statistics; every figure comes from the store's time-limited cache."""
+    store = shared_store()
+    if store is None:
+        return
+    with _telemetry.span('stats'), st.expander('Statistics'):
+        mine = store.player_stats(player_id())
+        st.write(f"Played {mine['played']} · Won {mine['win_pct']}% · "
+                 f"Streak {mine['streak']} (best {mine['max_streak']})")
+        st.code('\n'.join(distribution_lines(mine['distribution'])))
+        if game.finished and daily:
+            day = store.day_distribution(seed_str)
+            st.caption(f"Everyone today: {day['played']} {'game' if day['played'] == 1 else 'games'}")
+            st.code('\n'.join(distribution_lines(day['distribution'], day['lost'])))
+        if game.finished:
+            answer = store.answer_stats(game.secret)
+            if answer['played']:
+                st.caption(f"{game.secret.upper()} solved in {answer['solve_rate']:.0%} of {answer['played']} games")
+
+
+def _refresh_if_board_changed():
+    """Full-app rerun after a submit so the board and message catch up."""
+    if st.session_state.get('board_dirty'):
+        st.session_state.board_dirty = False
+        _rerun()
+
+
+def load_custom_dictionary(file_bytes):
+    """Load an uploaded .txt/.json dictionary (bytes or a binary file object)."""
+    # Uploads are rare; the parser stays off the start-up path
+    import io
+
+    from musicwordle.ingest import DictionaryTooLarge, ingest
+
+    stream = io.BytesIO(file_bytes) if isinstance(file_bytes, (bytes, bytearray)) else file_bytes
+    if stream.seekable():
+        stream.seek(0)
     try:
-        import json
-        parsed = json.loads(text)
-        if isinstance(parsed, list):
-            words = parsed
-    except Exception:
-        # Fallback: split by non-alpha
-        words = re.split(r"[^A-Za-z]+", text)
-    cleaned = [w.strip().lower() for w in words if re.fullmatch(r"[a-z]{5}", str(w).strip().lower())]
-    if len(cleaned) < 50:
+        result = ingest(stream, st.session_state.answers, length=word_length())
+    except DictionaryTooLarge as exc:
+        st.session_state.message = f"{exc}; keeping the current dictionary."
+        return
+    if result.kept_bundled:
         st.session_state.message = 'Loaded dictionary seems small; keeping bundled too.'
-        # keep bundled
-        bundled = load_bundled_dictionary()
-        cleaned.extend([w for w in bundled if w not in cleaned])
-    # Always include answers
-    allowed = set(cleaned) | set(st.session_state.answers)
-    st.session_state.allowed = sorted(allowed)
+    # Always include answers (done by ingest); shared with any session uploading the same file
+    st.session_state.allowed = result.words
+
+
+def session_state_bytes() -> int:
+    """Approximate memory charged to this session (shared objects excluded)."""
+    # The answer tuple is module-level too; walking its 161 strings on every
+    # rerun was most of the cost of this caption
+    shared = [shared_dictionary(word_length()), st.session_state.answers]
+    cands = st.session_state.get('candidates')
+    if cands is not None:
+        # Hints point into the process-wide pattern matrix; only the narrowed
+        # indices belong to this session. Asking shared_matrix() here would
+        # build the matrix on the first render.
+        shared += [cands.matrix, full_candidates(cands.matrix.length)]
+    return approx_size(dict(st.session_state), shared=shared)
+
+
+KEYBOARD_CSS = """
+<style>
+  .stButton { display:inline-block; margin: 1px; }
+  .stButton>button { min-width: 34px; padding: 4px 4px; font-size: 12px; line-height: 1.1; }
+  @media (max-width: 420px) {
+    .stButton>button { min-width: 30px; padding: 3px 3px; font-size: 12px; }
+  }
+</style>
+"""
+HARD_LABELS = {None: 'Off', HARD_MODE: 'Hard', STRICT_MODE: 'Strict'}
+KEY_EMOJI = {'correct': '🟩', 'present': '🟨', 'absent': '⬛', '': '⬜️'}
+
+
+@_fragment
+def board_panel():
+    """Board as one markdown element per row.
+
+    Rows are cached by content and keep their position, so after a submit
+    only the new row's markup differs and the browser patches it in place
+    instead of rebuilding an iframe.
+    """
+    with _telemetry.span('board'):
+        st.markdown(BOARD_CSS, unsafe_allow_html=True)
+        for html in board_rows(st.session_state.game):
+            st.markdown(html, unsafe_allow_html=True)
+
+
+def multi_board_panel():
+    """Multi-board game: one cached element per board at a fixed position,
+    up to four boards a line; only boards the last guess touched are rebuilt."""
+    game: MultiGameState = st.session_state.game
+    rows = rows_for_boards(len(game.boards), game.cols)
+    per_line = min(len(game.boards), 4)
+    with _telemetry.span('board'):
+        st.markdown(BOARD_CSS, unsafe_allow_html=True)
+        for start in range(0, len(game.boards), per_line):
+            for col, board in zip(st.columns(per_line), game.boards[start:start + per_line]):
+                with col:
+                    st.markdown(mini_board_html(bytes(board.guesses), tuple(board.codes), game.cols, rows),
+                                unsafe_allow_html=True)
+
+
+def _key_status(game: GameState):
+    # The game's Knowledge absorbs each new row once; this is a 26-entry read
+    with _telemetry.span('key_status'):
+        if isinstance(game, MultiGameState):
+            return game.key_status()
+        return compute_key_status(game)
+
+
+@_fragment
+def keyboard_panel(hints_on: bool, strategy: Optional[str]):
+    """Current guess, buttons and keyboard; typing reruns only this block."""
+    # A submit from a keyboard callback changed the board: rerun everything
+    _refresh_if_board_changed()
+    game: GameState = st.session_state.game
+    # On-screen keyboard status (shows which letters you've tried)
+    key_status = _key_status(game)
+
+    length = game.cols
+    st.write(f"Current guess: {game.current.upper():<{length}}")
+    if st.button('Guess', disabled=(len(game.current) != length)):
+        submit_guess_from_state()
+    near = st.session_state.get('did_you_mean')
+    if near:
+        # One click puts the suggestion in the typing buffer; Guess submits it
+        for col, word in zip(st.columns(len(near)), near):
+            col.button(word.upper(), key=f'dym_{word}', on_click=use_suggestion, args=(word,))
+    if hints_on and st.button('Hint'):
+        cands = current_candidates()
+        top = suggest(cands, strategy, top=3)
+        if st.session_state.get('hard') and game.codes:
+            # Only suggest guesses the current mode accepts
+            knowledge, strict = game.knowledge, st.session_state.hard == STRICT_MODE
+            top = [(w, s) for w, s in suggest(cands, strategy, top=50)
+                   if knowledge.violation(w, strict) is None][:3]
+        if top:
+            picks = ', '.join(w.upper() for w, _ in top)
+            st.caption(f"Try: {picks} — {len(cands)} possible {'answer' if len(cands) == 1 else 'answers'} left")
+
+    # Colored keyboard removed for reliability on Cloud; using robust fallbacks below
+
+    # Fallback input: typed guess field
+    typed = st.text_input('Type a guess (fallback)', key='typed_guess', max_chars=length)
+    if st.button('Submit typed guess', disabled=(len(typed or '') != length)):
+        tg = re.sub(r"[^A-Za-z]", "", typed or '').lower()
+        if len(tg) == length:
+            game.current = tg
+            submit_guess_from_state()
+
+    # Streamlit-native clickable keyboard (no flicker).
+    st.caption('Keyboard')
+    def press_enter():
+        if len(st.session_state.game.current) == length:
+            submit_guess_from_state()
+
+    with _telemetry.span('keyboard'):
+        # Compact inline buttons (with emoji status on keys)
+        st.markdown(KEYBOARD_CSS, unsafe_allow_html=True)
+
+        # Row 1 (10 columns)
+        row1 = "QWERTYUIOP"
+        cols = st.columns(len(row1), gap='small')
+        for i, ch in enumerate(row1):
+            with cols[i]:
+                label = f"{KEY_EMOJI.get(key_status.get(ch, ''), '⬜️')} {ch}"
+                st.button(label, key=f'kb_{ch}_r1', on_click=type_letter, args=(ch.lower(),))
+
+        st.markdown("<div style='width:100%; height:6px'></div>", unsafe_allow_html=True)
+
+        # Row 2 (9 columns)
+        row2 = "ASDFGHJKL"
+        cols = st.columns(len(row2), gap='small')
+        for i, ch in enumerate(row2):
+            with cols[i]:
+                label = f"{KEY_EMOJI.get(key_status.get(ch, ''), '⬜️')} {ch}"
+                st.button(label, key=f'kb_{ch}_r2', on_click=type_letter, args=(ch.lower(),))
+
+        st.markdown("<div style='width:100%; height:6px'></div>", unsafe_allow_html=True)
+
+        # Row 3 (9 columns: ENTER + 7 letters + BACK)
+        row3_letters = "ZXCVBNM"
+        cols = st.columns(9, gap='small')
+        with cols[0]:
+            st.button('↵', key='kb_enter', disabled=(len(game.current) != length), on_click=press_enter)
+        for offset, ch in enumerate(row3_letters, start=1):
+            with cols[offset]:
+                label = f"{KEY_EMOJI.get(key_status.get(ch, ''), '⬜️')} {ch}"
+                st.button(label, key=f'kb_{ch}_r3', on_click=type_letter, args=(ch.lower(),))
+        with cols[-1]:
+            st.button('⌫', key='kb_back', disabled=(len(game.current) == 0), on_click=backspace)
+
+    # Guess / typed-guess submits happen in this run; refresh the board too
+    _refresh_if_board_changed()
+
+
+FINDER_PAGE = 40
+
+
+@functools.lru_cache(maxsize=256)
+def finder_page(query: tuple, page: int, length: int = COLS):
+    """(match count, page count, markdown) for one page; shared by all sessions."""
+    hits = shared_index(length).search(*query)
+    pages = max(1, -(-hits.count // FINDER_PAGE))
+    page = min(page, pages - 1)
+    # Only this page is materialised, however broad the pattern
+    words = hits.page(page, FINDER_PAGE)
+    answers = answer_set(length)
+    return hits.count, page, pages, ' '.join(f"**{w}**" if w in answers else w for w in words) or '—'
+
+
+def _finder_turn(step: int):
+    st.session_state.finder_page = max(0, st.session_state.get('finder_page', 0) + step)
+
+
+def finder_panel():
+    """Practice-mode word finder: pattern queries over the bundled dictionary and answers."""
+    length = word_length()
+    with st.sidebar:
+        with st.expander('Word finder'):
+            query = (
+                st.text_input('Pattern', key='finder_pattern', placeholder='p?a' + '?' * (length - 3),
+                              max_chars=length),
+                st.text_input('Must contain', key='finder_include', placeholder='ne'),
+                st.text_input('Must not contain', key='finder_exclude', placeholder='st'),
+                st.text_input('Not at position', key='finder_not_at', placeholder='r2 e5'),
+                st.toggle('Answers only', key='finder_answers'),
+            )
+            if st.session_state.get('finder_query') != query:
+                st.session_state.finder_query = query
+                st.session_state.finder_page = 0
+            if not any(query):
+                # The index is built by the first real query (or the warm-up), not by opening practice mode
+                st.caption('Enter a pattern or letters to search the dictionary.')
+                return
+            try:
+                count, page, pages, text = finder_page(query, st.session_state.finder_page, length)
+            except QueryError as exc:
+                st.caption(str(exc))
+                return
+            st.caption(f"{count} matches · page {page + 1}/{pages} · answers in bold")
+            st.markdown(text)
+            prev_col, next_col = st.columns(2)
+            with prev_col:
+                st.button('◀ Prev', key='finder_prev', disabled=page == 0, on_click=_finder_turn, args=(-1,))
+            with next_col:
+                st.button('Next ▶', key='finder_next', disabled=page >= pages - 1, on_click=_finder_turn, args=(1,))
+
+
+def debug_enabled() -> bool:
+    """Hidden debug panel: ``?debug=1`` (also turns span recording on)."""
+    flag = st.query_params.get('debug')
+    if isinstance(flag, list):
+        flag = flag[0] if flag else None
+    return flag == '1'
+
+
+def debug_panel():
+    """Span percentiles for this process, plus a one-shot profiler for the next rerun."""
+    with st.sidebar:
+        with st.expander('Debug: rerun timings'):
+            st.code(format_summary(_telemetry.snapshot()) or 'No spans recorded yet.')
+            mode = st.selectbox('Profile next rerun', PROFILE_MODES)
+            if st.button('Capture next rerun'):
+                st.session_state.profile_next = mode
+            captured = st.session_state.get('profile_report')
+            if captured:
+                st.caption(f'Last capture ({captured[0]})')
+                st.code(''.join(captured[1]))
 
 
 def main():
     st.set_page_config(page_title='Music Wordle (Streamlit)', page_icon='🎵', layout='centered')
-    ensure_state()
+    if debug_enabled():
+        _telemetry.enable()
+    mode = st.session_state.get('profile_next')
+    try:
+        if mode:
+            st.session_state.profile_next = None
+            with capture(mode) as report:
+                # Filled in when the capture ends, shown by the next rerun
+                st.session_state.profile_report = (mode, report)
+                _run()
+        else:
+            _run()
+    finally:
+        # st.rerun() raises out of _run; export on those runs as well
+        directory = metrics_dir()
+        if directory and _telemetry.enabled:
+            _telemetry.maybe_export(directory)
+    # First board is out: build hint, finder and spelling tables before anyone asks (once per process)
+    start_warm_up()
+
+
+def _run():
+    with _telemetry.span('rerun'):
+        _render()
+    if debug_enabled():
+        debug_panel()
+
+
+def _render():
+    with _telemetry.span('ensure_state'):
+        ensure_state()
 
     # Sidebar game settings: daily seed vs custom seed
     st.sidebar.header('Game settings')
     daily = st.sidebar.toggle('Daily mode', value=True, help="Use today's UTC date as the seed")
     seed_text = st.sidebar.text_input('Custom seed', value='', placeholder='(ignored if Daily mode is on)')
+    hard = st.sidebar.selectbox(
+        'Hard mode', (None, HARD_MODE, STRICT_MODE), format_func=HARD_LABELS.get,
+        help='Hard: keep greens in place and reuse yellows. Strict: every guess must fit all feedback.',
+    )
+    st.session_state.hard = hard
+    length = st.sidebar.selectbox('Word length', LENGTHS, index=LENGTHS.index(COLS), key='word_length',
+                                  format_func=lambda n: f'{n} letters')
+    if length != word_length():
+        switch_length(length)
+    boards = st.sidebar.selectbox('Boards', (1,) + BOARD_COUNTS, key='boards_choice',
+                                  format_func=lambda n: 'Single board' if n == 1 else f'{n} boards')
+    if boards != board_count():
+        switch_boards(boards)
+    hints_on = st.sidebar.toggle('Hints', value=False, help='Suggest the most informative next guess')
+    strategy = None
+    if hints_on:
+        strategy = st.sidebar.selectbox(
+            'Hint strategy', list(STRATEGIES), format_func=lambda k: STRATEGIES[k].label,
+        )
 
-    # Compute seed string and store for callbacks
-    if daily:
-        seed_str = datetime.datetime.utcnow().date().isoformat()
-    else:
-        seed_str = seed_text.strip() or 'default'
-    st.session_state.seed_str = seed_str
-
-    # Initialize secret deterministically if not set
-    if not st.session_state.secret:
-        st.session_state.secret = seeded_choice(st.session_state.answers, seed_str)
+    with _telemetry.span('secret'):
+        # Compute seed string and store for callbacks
+        if daily:
+            seed_str = datetime.datetime.utcnow().date().isoformat()
+            if length != COLS:
+                # Its own daily word; the calendar is for the default length
+                seed_str += f'/{length}'
+        else:
+            seed_str = seed_text.strip() or 'default'
+        st.session_state.seed_str = seed_str
+        st.session_state.daily = daily
+
+        # Initialize secret deterministically if not set
+        if st.session_state.game is None:
+            st.session_state.game = make_game(seed_str, daily)
+            log_event(events.NEW)
+        multi = isinstance(st.session_state.game, MultiGameState)
+        if daily and not multi:
+            restore_daily_result(seed_str)
+        game: GameState = st.session_state.game
 
     # Sidebar controls
     with st.sidebar:
         st.markdown('### 🎵 Music Wordle')
-        st.caption('Answers are music-related. Guesses must be valid English 5-letter words.')
+        st.caption(f'Answers are music-related. Guesses must be valid English {length}-letter words.')
         st.button('New Game', on_click=new_game, use_container_width=True)
         st.write(f"Answers: {len(st.session_state.answers)}")
         st.write(f"Dictionary: {len(st.session_state.allowed)}")
+        shared = shared_dictionary(length)
+        st.caption(
+            f"Dictionary load: {shared.load_seconds * 1000:.1f} ms · "
+            f"shared {shared.nbytes / 1024:.0f} KB · this session ≈ {session_state_bytes() / 1024:.1f} KB"
+        )
         uploaded = st.file_uploader('Load Dictionary (.txt or .json)', type=['txt', 'json'])
         if uploaded is not None:
-            load_custom_dictionary(uploaded.getvalue())
+            # The file stays in the uploader across reruns; only parse it once
+            upload_id = getattr(uploaded, 'file_id', None) or (uploaded.name, uploaded.size)
+            if st.session_state.get('upload_id') != upload_id:
+                load_custom_dictionary(uploaded)
+                st.session_state.upload_id = upload_id
             st.success(f"Loaded dictionary with {len(st.session_state.allowed)} words (answers included).")
 
+    if not daily:
+        finder_panel()
+
     st.caption(f"Seeded with: {seed_str}")
 
     st.title('Music Wordle')
 
-    # Helper to render raw HTML reliably (avoid stray closing tags in markdown)
-    def render_html(html: str, height: int):
-        # Use components.html for broad Streamlit compatibility across versions
-        components.html(html, height=height, scrolling=False)
-
-    # Build entire board as one HTML block with CSS to keep rows intact on mobile
-    css = """
-    <style>
-      .mw-board { display:flex; flex-direction:column; gap:4px; align-items:center; }
-      .mw-row { display:flex; gap:4px; justify-content:center; }
-      .mw-tile { --tile-size: 44px; }
-      @media (max-width: 420px) { .mw-tile { --tile-size: 38px; } .mw-tile { font-size: 16px; } }
-    </style>
-    """
-    rows_html = []
-    for r in range(ROWS):
-        if r < len(st.session_state.guesses):
-            guess = st.session_state.guesses[r]
-            status = st.session_state.statuses[r]
-            tiles = "".join(tile_html(guess[c].upper(), status[c]) for c in range(COLS))
-        else:
-            tiles = "".join(tile_html('', '') for _ in range(COLS))
-        rows_html.append(f'<div class="mw-row">{tiles}</div>')
-    board_html = css + '<div class="mw-board">' + "".join(rows_html) + '</div>'
-    render_html(board_html, height=ROWS * 56)
-
-    st.write('')
-    st.info(st.session_state.message or 'Guess the music word!')
-
     # Handle HTML keyboard clicks via query param (?k=LETTER/ENTER/BACK)
     def _get_qp_key():
         qp = st.query_params
@@ -261,213 +791,90 @@ def main():
         except Exception:
             pass
 
-    ev = _get_qp_key()
-    if ev:
-        if ev == 'ENTER':
-            submit_guess_from_state()
-        elif ev == 'BACK':
-            if st.session_state.get('current_guess'):
-                st.session_state.current_guess = st.session_state.get('current_guess','')[:-1]
-                haptic()
-        elif re.fullmatch(r"[A-Z]", ev):
-            if len(st.session_state.get('current_guess','')) < COLS:
-                st.session_state.current_guess = st.session_state.get('current_guess','') + ev.lower()
-                haptic()
-        _clear_qp()
-
-
-    # On-screen keyboard status (shows which letters you've tried)
-    def compute_key_status(guesses: List[str], stats_rows: List[List[str]]):
-        priority = {'absent': 0, 'present': 1, 'correct': 2}
-        ks = {ch: '' for ch in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'}
-        for r, guess in enumerate(guesses):
-            if r >= len(stats_rows):
-                break
-            row_stats = stats_rows[r]
-            for i, ch in enumerate(guess.upper()):
-                if i >= len(row_stats):
-                    continue
-                stv = row_stats[i] or ''
-                if stv not in priority:
-                    continue
-                cur = ks.get(ch, '')
-                if (not cur) or priority[stv] > priority.get(cur, -1):
-                    ks[ch] = stv
-        return ks
-
-    key_status = compute_key_status(st.session_state.guesses, st.session_state.statuses)
-    kb_rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-
-    # Input form
-    def submit_guess_from_state():
-        g = re.sub(r"[^A-Za-z]", "", st.session_state.get('current_guess', '')).lower()
-        if len(g) != COLS:
-            st.session_state.message = 'Not enough letters'
-        elif g not in st.session_state.allowed:
-            st.session_state.message = 'Not in dictionary'
-        else:
-            res = score_guess(g, st.session_state.secret)
-            st.session_state.guesses.append(g)
-            st.session_state.statuses.append(res)
-            if g == st.session_state.secret:
-                tries = len(st.session_state.guesses)
-                st.session_state.message = f"Bravo! You solved it in {tries} {'try' if tries == 1 else 'tries'}."
-                st.session_state.finished = True
-            elif len(st.session_state.guesses) >= ROWS:
-                st.session_state.message = f"Out of guesses — it was “{st.session_state.secret.upper()}”."
-                st.session_state.finished = True
-            else:
-                st.session_state.message = ''
-            st.session_state.current_guess = ''
-        haptic()
-        # Rerun to refresh board/keyboard
-        try:
-            st.rerun()
-        except Exception:
-            import streamlit as _st
-            if hasattr(_st, 'experimental_rerun'):
-                _st.experimental_rerun()
-
-    if not st.session_state.finished:
-        st.write(f"Current guess: {st.session_state.current_guess.upper():<{COLS}}")
-        if st.button('Guess', disabled=(len(st.session_state.get('current_guess','')) != COLS)):
-            submit_guess_from_state()
-
-        # Colored keyboard removed for reliability on Cloud; using robust fallbacks below
-
-        # Fallback input: typed guess field
-        typed = st.text_input('Type a guess (fallback)', key='typed_guess', max_chars=COLS)
-        if st.button('Submit typed guess', disabled=(len(typed or '') != COLS)):
-            tg = re.sub(r"[^A-Za-z]", "", typed or '').lower()
-            if len(tg) == COLS:
-                st.session_state.current_guess = tg
+    with _telemetry.span('query_params'):
+        ev = _get_qp_key()
+        if ev:
+            if ev == 'ENTER':
                 submit_guess_from_state()
+            elif ev == 'BACK':
+                backspace()
+            elif re.fullmatch(r"[A-Z]", ev):
+                type_letter(ev.lower())
+            _clear_qp()
+
+    # A full run renders everything fresh, including any submit made above
+    st.session_state.board_dirty = False
+    if multi:
+        multi_board_panel()
+    else:
+        board_panel()
 
-        # Streamlit-native clickable keyboard (no flicker).
-        st.caption('Keyboard')
-        def press_letter(ch: str):
-            if len(st.session_state.get('current_guess','')) < COLS:
-                st.session_state.current_guess = st.session_state.get('current_guess','') + ch
-                haptic()
-        def press_back():
-            if st.session_state.get('current_guess'):
-                st.session_state.current_guess = st.session_state.get('current_guess','')[:-1]
-                haptic()
-        def press_enter():
-            if len(st.session_state.get('current_guess','')) == COLS:
-                submit_guess_from_state()
+    st.write('')
+    st.info(st.session_state.message or 'Guess the music word!')
 
-        # Compact inline buttons (with emoji status on keys)
-        st.markdown(
-            """
-            <style>
-              .stButton { display:inline-block; margin: 1px; }
-              .stButton>button { min-width: 34px; padding: 4px 4px; font-size: 12px; line-height: 1.1; }
-              @media (max-width: 420px) {
-                .stButton>button { min-width: 30px; padding: 3px 3px; font-size: 12px; }
-              }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+    if not game.finished:
+        # Hints rank one board's candidates; they are off with several boards
+        keyboard_panel(hints_on and not multi, strategy)
+    else:
+        st.success(st.session_state.message)
+        # Shareable results block: rendered once per distinct result, then served from the card cache
+        card = finished_card(game, daily, seed_str)
+        # Quick copy button
+        if st.button('Copy result to clipboard'):
+            components.html(clipboard_html(card.text, 'Copied!'), height=0)
+        with st.expander('Share your result'):
+            copy_ui(card)
 
-        emoji = {'correct': '🟩', 'present': '🟨', 'absent': '⬛', '': '⬜️'}
+    # Drawn last so a game finished during this run is already counted
+    if not multi:
+        with st.sidebar:
+            stats_panel(game, daily, seed_str)
 
-        # Row 1 (10 columns)
-        row1 = "QWERTYUIOP"
-        cols = st.columns(len(row1), gap='small')
-        for i, ch in enumerate(row1):
-            with cols[i]:
-                label = f"{emoji.get(key_status.get(ch, ''), '⬜️')} {ch}"
-                st.button(label, key=f'kb_{ch}_r1', on_click=press_letter, args=(ch.lower(),))
 
-        st.markdown("<div style='width:100%; height:6px'></div>", unsafe_allow_html=True)
+def finished_card(game, daily: bool, seed_str: str):
+    """Share card (text, SVG, PNG) for a finished game, from the process-wide card cache."""
+    # Only finished games need the share module
+    from musicwordle.share import multi_share_card, share_card
 
-        # Row 2 (9 columns)
-        row2 = "ASDFGHJKL"
-        cols = st.columns(len(row2), gap='small')
-        for i, ch in enumerate(row2):
-            with cols[i]:
-                label = f"{emoji.get(key_status.get(ch, ''), '⬜️')} {ch}"
-                st.button(label, key=f'kb_{ch}_r2', on_click=press_letter, args=(ch.lower(),))
+    if isinstance(game, MultiGameState):
+        return multi_share_card(game, daily, seed_str, rows_for_boards(len(game.boards), game.cols))
+    return share_card(list(game.codes), daily, seed_str, rows_for(game.cols), game.cols)
 
-        st.markdown("<div style='width:100%; height:6px'></div>", unsafe_allow_html=True)
 
-        # Row 3 (9 columns: ENTER + 7 letters + BACK)
-        row3_letters = "ZXCVBNM"
-        cols = st.columns(9, gap='small')
-        with cols[0]:
-            st.button('↵', key='kb_enter', disabled=(len(st.session_state.get('current_guess','')) != COLS), on_click=press_enter)
-        for offset, ch in enumerate(row3_letters, start=1):
-            with cols[offset]:
-                label = f"{emoji.get(key_status.get(ch, ''), '⬜️')} {ch}"
-                st.button(label, key=f'kb_{ch}_r3', on_click=press_letter, args=(ch.lower(),))
-        with cols[-1]:
-            st.button('⌫', key='kb_back', disabled=(len(st.session_state.get('current_guess','')) == 0), on_click=press_back)
+@functools.lru_cache(maxsize=256)
+def clipboard_html(text: str, note: str) -> str:
+    """Small script that copies ``text`` and briefly shows ``note``; built once per text."""
+    return f"""
+    <script>
+    const text = {text!r};
+    navigator.clipboard.writeText(text).then(() => {{
+      const el = document.createElement('div');
+      el.innerText = {note!r};
+      el.style.position = 'fixed';
+      el.style.bottom = '12px';
+      el.style.right = '12px';
+      el.style.background = '#333';
+      el.style.color = 'white';
+      el.style.padding = '6px 10px';
+      el.style.borderRadius = '6px';
+      document.body.appendChild(el);
+      setTimeout(()=>document.body.removeChild(el), 900);
+    }});
+    </script>
+    """
 
-    else:
-        st.success(st.session_state.message)
-        # Shareable results block
-        summary_lines = build_share_summary(st.session_state.statuses, daily, seed_str)
-        result_text = "\n".join(summary_lines)
-        # Quick copy button
-        if st.button('Copy result to clipboard'):
-            components.html(
-                f"""
-                <script>
-                const text = {result_text!r};
-                navigator.clipboard.writeText(text).then(() => {{
-                  const el = document.createElement('div');
-                  el.innerText = 'Copied!';
-                  el.style.position = 'fixed';
-                  el.style.bottom = '12px';
-                  el.style.right = '12px';
-                  el.style.background = '#333';
-                  el.style.color = 'white';
-                  el.style.padding = '6px 10px';
-                  el.style.borderRadius = '6px';
-                  document.body.appendChild(el);
-                  setTimeout(()=>document.body.removeChild(el), 900);
-                }});
-                </script>
-                """,
-                height=0,
-            )
-        with st.expander('Share your result'):
-            copy_ui(result_text)
-
-def seeded_choice(items, seed_str: str):
-    """Deterministic choice from a list based on the provided seed string."""
-    h = int(hashlib.sha256(seed_str.encode()).hexdigest(), 16)
-    rng = random.Random(h)
-    return rng.choice(items)
-
-def build_share_summary(status_rows, daily: bool, seed_str: str):
-    title = f"Music Wordle — {'Daily' if daily else 'Seeded'} {seed_str}"
-    tries = len(status_rows)
-    header = f"Guesses: {tries}/{ROWS}"
-    emoji_map = {'correct': '🟩', 'present': '🟨', 'absent': '⬛'}
-    grid = ["".join(emoji_map.get(s, '⬛') for s in row) for row in status_rows]
-    return [title, header, *grid]
-
-def copy_ui(result_text: str):
-    st.text_area('Result', result_text, height=140)
+
+def copy_ui(card):
+    st.text_area('Result', card.text, height=140)
+    st.image(card.png)
+    png_col, svg_col = st.columns(2)
+    with png_col:
+        st.download_button('Download PNG', card.png, file_name=f'music-wordle-{card.key}.png', mime='image/png')
+    with svg_col:
+        st.download_button('Download SVG', card.svg, file_name=f'music-wordle-{card.key}.svg', mime='image/svg+xml')
     if st.button('Copy to clipboard'):
         # Inject small JS to copy; works in most browsers/Streamlit hosts
-        components.html(
-            f"""
-            <script>
-            const text = {result_text!r};
-            navigator.clipboard.writeText(text).then(() => {{
-              const el = document.createElement('div');
-              el.innerText = 'Copied to clipboard';
-              document.body.appendChild(el);
-              setTimeout(()=>document.body.removeChild(el), 800);
-            }});
-            </script>
-            """,
-            height=0,
-        )
+        components.html(clipboard_html(card.text, 'Copied to clipboard'), height=0)
 
 
 if __name__ == '__main__':
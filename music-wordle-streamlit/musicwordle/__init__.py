@@ -0,0 +1,5 @@
+"""Headless Music Wordle core shared by the Streamlit app and tooling.
+
+Nothing in this package imports Streamlit, so it can be used from CLIs,
+benchmarks and tests without the UI dependencies installed.
+"""
@@ -0,0 +1,179 @@
+"""Dictionary build: one canonical word source, artifacts for both clients.
+
+Sources: ``musicwordle/data/allowed.txt`` (guessable words, one per line;
+the artifacts take the default length, other lengths are read from the
+text by :mod:`musicwordle.dictionary`) and ``config.ANSWERS``. Outputs:
+
+* ``musicwordle/data/words.mwd``: the packed artifact the Python app maps
+  (see :mod:`musicwordle.packed`);
+* ``music-wordle/words.js``: words and answers for ``game.js``. Sorted words
+  are prefix encoded (a digit for the letters shared with the previous
+  word, then the rest: ``aahed aalii`` -> ``0aahed2lii``), with a few lines
+  of decoder that rebuild ``window.ALLOWED_GUESSES``;
+* ``musicwordle/data/manifest.json``: SHA-256 and sizes of every output.
+
+``words.js`` also carries a hash of the word data
+(``window.MUSIC_WORDLE_WORDS_VERSION``), and its ``<script>`` tag in
+``index.html`` is rewritten to ``words.js?v=<hash>``, so browsers fetch it
+again only when it changes. Run after editing the words or answers;
+``--check`` only reports stale outputs (for CI)::
+
+    python -m musicwordle.build
+    python -m musicwordle.build --check
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .config import ANSWERS, COLS
+from .dictionary import BUNDLED_WORDS, load_bundled_words
+from .packed import DEFAULT_PATH as PACKED_PATH, encode as encode_packed
+
+ROOT = Path(__file__).resolve().parents[2]
+SITE = ROOT / 'music-wordle'
+WORDS_JS = SITE / 'words.js'
+INDEX_HTML = SITE / 'index.html'
+MANIFEST = Path(__file__).resolve().parent / 'data' / 'manifest.json'
+_SCRIPT_TAG = re.compile(r'<script src="(?:words\.js(?:\?v=[0-9a-f]*)?|allowed-guesses\.js)"></script>')
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def prefix_encode(words: Sequence[str], length: int = COLS) -> str:
+    """Sorted, de-duplicated ``words`` as shared-prefix digit + remaining letters."""
+    out, prev = [], ' ' * length
+    for word in sorted({w for w in words if len(w) == length}):
+        k = 0
+        while k < length - 1 and prev[k] == word[k]:
+            k += 1
+        out.append(f'{k}{word[k:]}')
+        prev = word
+    return ''.join(out)
+
+
+def prefix_decode(payload: str, length: int = COLS) -> List[str]:
+    """Inverse of :func:`prefix_encode` (the JS decoder does the same)."""
+    words, word, i = [], '', 0
+    while i < len(payload):
+        k = int(payload[i])
+        word = word[:k] + payload[i + 1:i + 1 + length - k]
+        i += 1 + length - k
+        words.append(word)
+    return words
+
+
+def render_js(words: Sequence[str], answers: Sequence[str], length: int = COLS) -> str:
+    payload = prefix_encode(words, length)
+    answers = [w for w in answers if len(w) == length]
+    version = content_hash(f'{payload}|{",".join(answers)}'.encode())
+    return (
+        '// Generated by python -m musicwordle.build from musicwordle/data/allowed.txt; do not edit.\n'
+        '(function (w) {\n'
+        f'  var L = {length}, s = "{payload}";\n'
+        '  var out = [], word = "", i = 0, k;\n'
+        '  while (i < s.length) { k = +s[i]; word = word.slice(0, k) + s.substr(i + 1, L - k); i += 1 + L - k; '
+        'out.push(word); }\n'
+        '  w.ALLOWED_GUESSES = out;\n'
+        f'  w.MUSIC_WORDLE_ANSWERS = {json.dumps(answers, separators=(",", ":"))};\n'
+        f'  w.MUSIC_WORDLE_WORDS_VERSION = "{version}";\n'
+        '})(window);\n'
+    )
+
+
+def legacy_js(words: Sequence[str]) -> str:
+    """The old hand-committed ``allowed-guesses.js`` layout, for the size report."""
+    body = ''.join(f"'{w}',\n" for w in words)
+    return f'// Auto-generated allowed guesses list ({len(words)} words)\nwindow.ALLOWED_GUESSES = [\n{body}];\n'
+
+
+def _sizes(data: bytes) -> Dict[str, int]:
+    return {'bytes': len(data), 'gzip_bytes': len(gzip.compress(data, 9, mtime=0))}
+
+
+def _rel(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def outputs(source: Path = BUNDLED_WORDS, answers: Sequence[str] = ANSWERS) -> Dict[Path, bytes]:
+    """Every artifact's bytes, computed in memory from the sources."""
+    words = load_bundled_words(source)
+    js = render_js(words, answers).encode()
+    js_hash = content_hash(js)
+    html = INDEX_HTML.read_text(encoding='utf-8')
+    html, found = _SCRIPT_TAG.subn(f'<script src="words.js?v={js_hash}"></script>', html)
+    if not found:
+        raise ValueError(f'{INDEX_HTML}: no words.js <script> tag to update')
+    packed = encode_packed(words, answers)
+    built = {PACKED_PATH: packed, WORDS_JS: js, INDEX_HTML: html.encode()}
+    manifest = {
+        'source': {'path': _rel(source), 'sha256': content_hash(source.read_bytes()), 'words': len(words),
+                   'answers': len([w for w in answers if len(w) == COLS])},
+        'outputs': {_rel(path): {'sha256': content_hash(data), **_sizes(data)}
+                    for path, data in ((PACKED_PATH, packed), (WORDS_JS, js))},
+        'before': {'allowed-guesses.js': _sizes(legacy_js(sorted(set(words))).encode())},
+    }
+    built[MANIFEST] = (json.dumps(manifest, indent=2) + '\n').encode()
+    return built
+
+
+def stale(built: Dict[Path, bytes]) -> List[Path]:
+    return [path for path, data in built.items() if not path.exists() or path.read_bytes() != data]
+
+
+def write(built: Dict[Path, bytes]) -> List[Path]:
+    """Write the outputs that changed (atomically); returns them."""
+    changed = stale(built)
+    for path in changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_bytes(built[path])
+        tmp.replace(path)
+    return changed
+
+
+def size_report(built: Dict[Path, bytes]) -> List[str]:
+    manifest = json.loads(built[MANIFEST])
+    before = manifest['before']['allowed-guesses.js']
+    after = manifest['outputs'][_rel(WORDS_JS)]
+    lines = [f"{'file':<50} {'bytes':>9} {'gzip':>9}  sha256"]
+    lines.append(f"{'allowed-guesses.js (before)':<50} {before['bytes']:>9,} {before['gzip_bytes']:>9,}")
+    for name, info in manifest['outputs'].items():
+        lines.append(f"{name:<50} {info['bytes']:>9,} {info['gzip_bytes']:>9,}  {info['sha256']}")
+    lines.append(f"first-load words payload: {before['bytes']:,} -> {after['bytes']:,} bytes "
+                 f"({after['bytes'] / before['bytes']:.0%}), gzipped {before['gzip_bytes']:,} -> "
+                 f"{after['gzip_bytes']:,} ({after['gzip_bytes'] / before['gzip_bytes']:.0%})")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.build', description=__doc__.splitlines()[0])
+    parser.add_argument('--source', type=Path, default=BUNDLED_WORDS, help='canonical word list')
+    parser.add_argument('--check', action='store_true', help='only report outputs that are out of date')
+    args = parser.parse_args(argv)
+
+    built = outputs(args.source)
+    if args.check:
+        out_of_date = stale(built)
+        for path in out_of_date:
+            print(f'stale: {_rel(path)}')
+        if out_of_date:
+            print('run: python -m musicwordle.build')
+        return 1 if out_of_date else 0
+    for path in write(built):
+        print(f'wrote {_rel(path)}')
+    print('\n'.join(size_report(built)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
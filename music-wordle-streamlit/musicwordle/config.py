@@ -0,0 +1,79 @@
+"""Game configuration shared by the Streamlit app and the headless tools."""
+
+ROWS = 6
+COLS = 5
+
+# Word lengths a game can be played at (COLS is the default)
+LENGTHS = (4, 5, 6, 7, 8)
+
+# Curated 5-letter music answers (same spirit as the web version)
+ANSWERS = [
+    # Composers / artists
+    'haydn','liszt','verdi','ravel','bizet','elgar','satie','grieg','glass','reich','adams','faure','dukas','ibert','nyman',
+    'berio','weber','wolfe','sousa','price','rouse',
+    'adele','bjork','swift','sting','drake','lorde','seger',
+
+    # Instruments
+    'piano','viola','cello','organ','oboes','flute','drums','synth','tabla','sitar','lyres','harps','banjo','reeds',
+    'kazoo','guqin','zurna','veena','sarod','rebab','mbira','bongo','conga','shawm','cajon','snare','fifes','pipes',
+    'guiro','tiple','viols',
+
+    # Notation, technique, and theory
+    'forte','largo','tenor','mezzo','lento','dolce','grave','segue','segno','ossia','pedal','clefs','tacet','tutti',
+    'theme','motif','rests','slurs','trill','staff','stave','codas','pitch','voice','lyric','sheet','meter','metre','tempo',
+    'sharp','flats','third','fifth','sixth','ninth','tenth','round','drone','beats','riffs','licks','tunes','songs','vocal',
+    'notes','score','solfa','cresc','frets','capos','barre','beams','octet','nonet','duets','trios','solos','choir','arias',
+    'carol','vibes','sines','mixer','delay','phase','codec','music','audio','hertz',
+
+    # Pieces, forms, dances, styles, and genres
+    'canon','fugue','etude','opera','rondo','tango','waltz','missa','motet','suite','gigue','salsa','mambo','rumba','polka',
+    'choro','djent','drill','swing','disco','house','grime','metal','indie','blues','folky','samba','bossa','noise','chant',
+    'chime','psalm','verse',
+]
+
+# Curated answers for the other word lengths, by length
+MORE_ANSWERS = {
+    4: [
+        'alto','bass','band','beat','bell','clef','coda','drum','duet','echo','fife','flat','folk','fret','gong','harp',
+        'horn','hymn','jazz','jive','keys','lute','lyre','mode','mute','note','oboe','opus','pipe','punk','raga','reed',
+        'reel','rest','riff','rock','sing','solo','song','soul','tala','tone','trio','tuba','tune','vamp','vibe','viol',
+        'bach','berg','byrd','cage','ives','orff','bard','fado','funk','glam','brio',
+    ],
+    6: [
+        'violin','guitar','cornet','fiddle','chorus','sonata','rhythm','melody','ballad','anthem','octave','treble',
+        'timbre','unison','legato','presto','adagio','cymbal','lyrics','mozart','chopin','handel','wagner','brahms',
+        'mahler','dvorak','bartok','busker','encore','minuet','bolero','reggae','techno','grunge','gospel','zither',
+        'tuning','phrase','tenors','singer','sextet','choral','medley','record','stereo','stylus','finale','jingle',
+    ],
+    7: [
+        'trumpet','bassoon','harmony','cantata','allegro','fermata','vibrato','tremolo','ukulele','bagpipe','rossini',
+        'puccini','strauss','berlioz','gavotte','cadenza','cadence','concert','soprano','quartet','quintet','prelude',
+        'fanfare','requiem','chorale','marimba','piccolo','cellist','pianist','harpist','maestro','melodic','scherzo',
+        'partita','ragtime','calypso','organum','gamelan','recital','refrain','musical','baroque','debussy','vivaldi',
+        'purcell','drummer','bassist',
+    ],
+    8: [
+        'clarinet','trombone','sibelius','composer','nocturne','oratorio','falsetto','flamenco','harmonic','operetta',
+        'symphony','overture','rhapsody','serenade','cavatina','libretto','ostinato','staccato','arpeggio','dulcimer',
+        'recorder','bagpipes','mandolin','keyboard','drumbeat','songbook','notation','tonality','interval','semitone',
+        'dominant','diatonic','musician','virtuoso','ensemble','sinfonia','madrigal','courante','hornpipe','minstrel',
+        'schubert','schumann','gershwin','sondheim','baritone','woodwind','vocalist',
+    ],
+}
+
+
+def rows_for(length: int) -> int:
+    """Guesses allowed at a word length: ROWS, and one more than the length above that."""
+    return max(ROWS, length + 1)
+
+
+def answers_for(length: int = COLS):
+    """The curated answers of one word length (``ANSWERS`` order for 5 letters)."""
+    source = ANSWERS if length == COLS else MORE_ANSWERS.get(length, ())
+    return [w for w in source if len(w) == length]
+
+
+# Small seed used when the bundled dictionary is missing
+FALLBACK_ALLOWED = [
+    'about','other','which','their','there','first','would','these','music','audio','piano','opera','canon','fugue'
+]
@@ -0,0 +1,133 @@
+"""Process-wide allowed-guess dictionaries, one per word length.
+
+Reading the canonical word source (``data/allowed.txt``, every playable
+length in one file) is the most expensive thing a new session used to do,
+so each length's words are built once per process, the first time a game
+of that length asks for them, and shared by every session as an immutable
+:class:`WordList`. Players who only play the default length never pay for
+the others. When the prebuilt binary artifact for the default length (see
+:mod:`musicwordle.packed`, built by :mod:`musicwordle.build`) is present it
+is memory-mapped instead and no parsing happens at all.
+"""
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import ANSWERS, COLS, FALLBACK_ALLOWED, answers_for
+from .packed import open_packed
+
+BUNDLED_WORDS = Path(__file__).resolve().parent / 'data' / 'allowed.txt'
+
+
+def load_bundled_words(path: Optional[Path] = None, length: int = COLS) -> List[str]:
+    """Load the canonical word source: one word per line, ``#`` comments.
+
+    Only lowercase ``length``-letter words are kept. Returns an empty list
+    if the file is missing.
+    """
+    path = BUNDLED_WORDS if path is None else Path(path)
+    if not path.exists():
+        return []
+    text = path.read_text(encoding='utf-8', errors='ignore')
+    words = re.findall(r"^[ \t]*([a-z]{%d})[ \t]*$" % length, text, re.MULTILINE)
+    # Deduplicate while preserving order
+    return list(dict.fromkeys(words))
+
+
+class WordList:
+    """Immutable set of guessable words with O(1) membership.
+
+    The sorted view is only materialised when something asks for it
+    (``ordered`` / iteration); membership checks never need it.
+    """
+
+    __slots__ = ('_members', '_ordered', '_nbytes', 'source', 'load_seconds')
+
+    def __init__(self, words: Iterable[str], source: str = '', load_seconds: float = 0.0):
+        self._members = frozenset(words)
+        self._ordered: Optional[Tuple[str, ...]] = None
+        self._nbytes: Optional[int] = None
+        self.source = source
+        self.load_seconds = load_seconds
+
+    def __contains__(self, word) -> bool:
+        return word in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ordered)
+
+    def __repr__(self) -> str:
+        return f"WordList({len(self)} words, source={self.source!r})"
+
+    @property
+    def members(self) -> frozenset:
+        return self._members
+
+    @property
+    def ordered(self) -> Tuple[str, ...]:
+        if self._ordered is None:
+            self._ordered = tuple(sorted(self._members))
+        return self._ordered
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this object (set, strings, sorted view)."""
+        if self._nbytes is None:
+            # Words are ASCII: each costs a fixed str header plus one byte per
+            # letter, which avoids a getsizeof() call per word on big uploads
+            members = self._members
+            self._nbytes = (sys.getsizeof(members) + len(members) * sys.getsizeof('')
+                            + sum(map(len, members)))
+        total = self._nbytes
+        if self._ordered is not None:
+            total += sys.getsizeof(self._ordered)
+        return total
+
+
+def build_word_list(words: Iterable[str], answers: Iterable[str] = ANSWERS, source: str = '',
+                    length: int = COLS) -> WordList:
+    """Union ``words`` with ``answers`` so every answer is guessable."""
+    start = time.perf_counter()
+    allowed = set(words) | {w for w in answers if len(w) == length}
+    # Fallback small seed if bundled missing
+    if not allowed and length == COLS:
+        allowed = set(FALLBACK_ALLOWED)
+        source = source or 'fallback'
+    return WordList(allowed, source=source, load_seconds=time.perf_counter() - start)
+
+
+_shared: Dict[int, WordList] = {}
+_shared_lock = threading.Lock()
+
+
+def _open_artifact():
+    words = open_packed()
+    # A stale artifact (answers edited without a rebuild) is ignored
+    if words is None or not all(w in words for w in ANSWERS if len(w) == COLS):
+        return None
+    return words
+
+
+def shared_dictionary(length: int = COLS) -> WordList:
+    """Return the bundled ``length``-letter dictionary, loading it on first use in this process.
+
+    Uses the memory-mapped artifact for the default length when available,
+    else parses the word source.
+    """
+    words = _shared.get(length)
+    if words is None:
+        with _shared_lock:
+            words = _shared.get(length)
+            if words is None:
+                start = time.perf_counter()
+                words = (_open_artifact() if length == COLS else None) or build_word_list(
+                    load_bundled_words(length=length), answers_for(length), source='bundled', length=length)
+                words.load_seconds = time.perf_counter() - start
+                _shared[length] = words
+    return words
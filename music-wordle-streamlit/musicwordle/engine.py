@@ -0,0 +1,255 @@
+"""Headless game engine: the rules without Streamlit.
+
+:class:`GameState` is the whole per-session game in a few compact fields:
+the secret and every guess as ASCII bytes and each row's feedback as one
+base-3 pattern code (see :mod:`musicwordle.scoring`; two bytes per row for
+words longer than five letters). :class:`GameEngine`
+holds the shared, read-only pieces (dictionary, answers, optional pattern
+matrix) and applies moves to states, so one engine serves every session.
+
+Measure throughput and per-state size with::
+
+    python -m musicwordle.engine
+"""
+import argparse
+import functools
+import hashlib
+import random
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .config import ANSWERS, COLS, ROWS, rows_for
+from .knowledge import Knowledge
+from .scoring import ALL_CORRECT, code_array, decode_pattern, score_code
+
+# Outcomes of GameEngine.submit
+SHORT = 'short'
+UNKNOWN = 'unknown'
+CONTINUE = 'continue'
+WON = 'won'
+LOST = 'lost'
+FINISHED = 'finished'
+HARD = 'hard'
+
+# Hard-mode levels for GameEngine(hard=...)
+HARD_MODE = 'hard'      # greens stay, yellows are reused
+STRICT_MODE = 'strict'  # every guess must be consistent with all feedback
+
+EMOJI = {'correct': '🟩', 'present': '🟨', 'absent': '⬛'}
+
+# Players (and simulations) score the same few openers against the same
+# answers over and over; a bounded cache makes repeat pairs a dict lookup.
+_cached_score = functools.lru_cache(maxsize=1 << 15)(score_code)
+
+
+def seeded_choice(items, seed_str: str):
+    """Deterministic choice from a list based on the provided seed string."""
+    h = int(hashlib.sha256(seed_str.encode()).hexdigest(), 16)
+    rng = random.Random(h)
+    return rng.choice(items)
+
+
+class GameState:
+    """One game: secret word, guesses (ASCII bytes) and feedback codes."""
+
+    __slots__ = ('secret', 'guesses', 'codes', 'current', 'finished', '_knowledge')
+
+    def __init__(self, secret: str):
+        self.secret = secret
+        self.guesses = bytearray()  # len(secret) bytes per submitted guess
+        self.codes = code_array(len(secret))  # one base-3 pattern code per guess
+        self.current = ''
+        self.finished = False
+        self._knowledge = None
+
+    def __repr__(self) -> str:
+        return f"GameState(secret={self.secret!r}, guesses={self.guess_words!r}, finished={self.finished})"
+
+    @property
+    def cols(self) -> int:
+        return len(self.secret)
+
+    @property
+    def tries(self) -> int:
+        return len(self.codes)
+
+    @property
+    def won(self) -> bool:
+        return bool(self.codes) and self.codes[-1] == 3 ** self.cols - 1
+
+    @property
+    def guess_words(self) -> List[str]:
+        n = self.cols
+        g = self.guesses.decode('ascii')
+        return [g[i:i + n] for i in range(0, len(g), n)]
+
+    @property
+    def status_rows(self) -> List[List[str]]:
+        return [decode_pattern(c, self.cols) for c in self.codes]
+
+    @property
+    def knowledge(self) -> Knowledge:
+        """Constraints from the feedback so far, built on first use and
+        then extended one row at a time."""
+        k = self._knowledge
+        if k is None:
+            k = self._knowledge = Knowledge(self.cols)
+        if k.rows < len(self.codes):
+            k.sync(self)
+        return k
+
+
+class GameEngine:
+    """Applies moves to :class:`GameState` objects.
+
+    ``allowed`` is any container supporting ``in`` (``WordList``,
+    ``PackedWordList``, ``set``); ``None`` accepts every word. A
+    :class:`~musicwordle.scoring.PatternMatrix` speeds up scoring when given.
+    ``hard`` is ``None``, :data:`HARD_MODE` or :data:`STRICT_MODE`. ``rows``
+    defaults to :func:`~musicwordle.config.rows_for` the secret's length.
+    """
+
+    __slots__ = ('allowed', 'answers', 'rows', 'matrix', 'hard')
+
+    def __init__(self, allowed=None, answers: Sequence[str] = ANSWERS, rows: Optional[int] = None, matrix=None,
+                 hard: Optional[str] = None):
+        self.allowed = allowed
+        self.answers = answers
+        self.rows = rows
+        self.matrix = matrix
+        self.hard = hard
+
+    def new_game(self, seed_str: str) -> GameState:
+        return GameState(seeded_choice(self.answers, seed_str))
+
+    def type_letter(self, state: GameState, ch: str) -> bool:
+        if state.finished or len(state.current) >= state.cols or not ('a' <= ch <= 'z'):
+            return False
+        state.current += ch
+        return True
+
+    def backspace(self, state: GameState) -> bool:
+        if state.finished or not state.current:
+            return False
+        state.current = state.current[:-1]
+        return True
+
+    def submit(self, state: GameState, guess: Optional[str] = None, validate: bool = True) -> str:
+        """Play ``guess`` (default: the typing buffer) and return the outcome."""
+        if state.finished:
+            return FINISHED
+        g = state.current if guess is None else guess
+        if validate:
+            if len(g) != state.cols:
+                return SHORT
+            if self.allowed is not None and g not in self.allowed:
+                return UNKNOWN
+            if self.hard and state.codes:
+                knowledge = state.knowledge
+                knowledge.rejected = knowledge.violation(g, strict=self.hard == STRICT_MODE) or ''
+                if knowledge.rejected:
+                    return HARD
+        secret = state.secret
+        code = self.matrix.code(g, secret) if self.matrix is not None else _cached_score(g, secret)
+        state.guesses += g.encode('ascii')
+        state.codes.append(code)
+        state.current = ''
+        if g == secret:
+            state.finished = True
+            return WON
+        if len(state.codes) >= (self.rows or rows_for(state.cols)):
+            state.finished = True
+            return LOST
+        return CONTINUE
+
+    def play(self, secret: str, guesses: Iterable[str]) -> GameState:
+        """Run a whole game without validation (simulations, replays)."""
+        state = GameState(secret)
+        for g in guesses:
+            if self.submit(state, g, validate=False) != CONTINUE:
+                break
+        return state
+
+
+def describe(outcome: str, state: GameState) -> str:
+    """Player-facing message for a submit outcome."""
+    if outcome == SHORT:
+        return 'Not enough letters'
+    if outcome == UNKNOWN:
+        return 'Not in dictionary'
+    if outcome == HARD:
+        return f"Hard mode: {state.knowledge.rejected}"
+    if outcome == WON:
+        tries = state.tries
+        return f"Bravo! You solved it in {tries} {'try' if tries == 1 else 'tries'}."
+    if outcome == LOST:
+        return f"Out of guesses — it was “{state.secret.upper()}”."
+    return ''
+
+
+def compute_key_status(state: GameState) -> Dict[str, str]:
+    """Best status seen per keyboard letter: correct > present > absent.
+
+    Read from the game's incremental :class:`~musicwordle.knowledge.Knowledge`,
+    so only rows added since the last call are looked at.
+    """
+    return state.knowledge.key_status()
+
+
+def build_share_summary(status_rows, daily: bool, seed_str: str, rows: int = ROWS, cols: int = COLS):
+    """Title, score and emoji grid; rows may be status lists or pattern codes."""
+    title = f"Music Wordle — {'Daily' if daily else 'Seeded'} {seed_str}"
+    if cols != COLS:
+        title += f" ({cols} letters)"
+    tries = len(status_rows)
+    header = f"Guesses: {tries}/{rows}"
+    grid = []
+    for row in status_rows:
+        if isinstance(row, int):
+            row = decode_pattern(row, cols)
+        grid.append("".join(EMOJI.get(s, '⬛') for s in row))
+    return [title, header, *grid]
+
+
+def benchmark(games: int = 50000) -> Dict[str, float]:
+    """Games per second for a fixed opener sequence, plus state size."""
+    from .dictionary import shared_dictionary
+    from .memory import approx_size
+
+    answers = [w for w in ANSWERS if len(w) == COLS]
+    engine = GameEngine(shared_dictionary(), answers)
+    script = ['arose', 'until', 'dumpy', 'chowk', 'glyph']
+    start = time.perf_counter()
+    for i in range(games):
+        state = GameState(answers[i % len(answers)])
+        for g in script:
+            if engine.submit(state, g) != CONTINUE:
+                break
+    validated = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(games):
+        engine.play(answers[i % len(answers)], script)
+    fast = time.perf_counter() - start
+    state = engine.play('piano', script[:4])
+    legacy = {'secret': 'piano', 'guesses': state.guess_words, 'statuses': state.status_rows,
+              'finished': False, 'current_guess': ''}
+    return {
+        'games_per_second': games / validated,
+        'unvalidated_games_per_second': games / fast,
+        'state_bytes_4_guesses': float(approx_size(state)),
+        'legacy_state_bytes_4_guesses': float(approx_size(legacy)),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.engine', description='Benchmark the game engine.')
+    parser.add_argument('--games', type=int, default=50000)
+    args = parser.parse_args(argv)
+    for key, value in benchmark(args.games).items():
+        print(f"{key:32} {value:,.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,400 @@
+"""Append-only gameplay event log and a streaming aggregator.
+
+Every keystroke, guess and game end is one fixed-size 24-byte record::
+
+    <d  timestamp (Unix seconds)
+    Q   session id (random per browser session)
+    B   kind (NEW, KEY, BACK, GUESS, INVALID, WON, LOST)
+    B   row (0-based guess number)
+    5s  guess, or the typing buffer for keystrokes (NUL padded)
+    B   status: base-3 pattern code for GUESS/WON/LOST, 255 otherwise
+
+:class:`EventLog` appends records to an in-memory buffer and writes it out
+when it holds ``buffer_records`` records or ``flush_interval`` seconds
+have passed, so a keystroke costs a ``struct.pack`` and a lock. A
+background thread writes out a buffer left idle for ``flush_interval``.
+Files rotate at ``max_bytes`` (``events-000001.mwe``, ...) and are only
+ever created, never reopened, so writers in several processes sharing a
+directory each get their own files. Each file starts with a 24-byte
+header (magic, version, record size), so records stay aligned. A crash
+can at worst leave a partial last record, which readers ignore.
+
+:func:`aggregate` reads files with ``mmap``, a chunk of records at a time
+(vectorised with NumPy when it is installed), so gigabytes of logs are
+summarised in constant memory: per-day funnel (games started, first
+guess, finished, won), invalid-guess rate, and the most tried openers.
+Openers use a bounded Misra-Gries summary: exact while there are fewer
+distinct openers than ``capacity``, otherwise undercounted by at most
+``openers_error``::
+
+    python -m musicwordle.events /var/log/music-wordle --top 15
+    python -m musicwordle.events /tmp/ev --generate 100000   # synthetic log for testing
+"""
+import argparse
+import atexit
+import datetime
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import ANSWERS, COLS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+RECORD = struct.Struct('<dQBB5sB')
+HEADER = struct.pack('<8sHH12x', b'MWEVENTS', 1, RECORD.size)
+NEW, KEY, BACK, GUESS, INVALID, WON, LOST = range(7)
+KINDS = ('new', 'key', 'back', 'guess', 'invalid', 'won', 'lost')
+NO_STATUS = 255
+SUFFIX = '.mwe'
+MAX_BYTES = 64 * 2 ** 20
+BUFFER_RECORDS = 512
+FLUSH_INTERVAL = 1.0
+CHUNK_RECORDS = 1 << 18
+
+
+class EventLog:
+    """Buffered writer for rotating event files in ``directory`` (see module docs)."""
+
+    def __init__(self, directory, max_bytes: int = MAX_BYTES, buffer_records: int = BUFFER_RECORDS,
+                 flush_interval: float = FLUSH_INTERVAL, clock=time.time):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max(max_bytes, len(HEADER) + RECORD.size)
+        self.buffer_bytes = buffer_records * RECORD.size
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.written = 0
+        self._buf = bytearray()
+        self._lock = threading.Lock()
+        self._file = None
+        self._size = 0
+        self._last_flush = time.monotonic()
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        existing = [int(p.stem.rsplit('-', 1)[-1]) for p in self.directory.glob(f'events-*{SUFFIX}')
+                    if p.stem.rsplit('-', 1)[-1].isdigit()]
+        # Never append to a file an earlier process may have left mid-record
+        self._seq = max(existing, default=0)
+
+    @property
+    def path(self) -> Optional[Path]:
+        return Path(self._file.name) if self._file is not None else None
+
+    def log(self, session: int, kind: int, guess: str = '', status: int = NO_STATUS, row: int = 0) -> None:
+        record = RECORD.pack(self.clock(), session, kind, min(row, 255), guess.encode('ascii', 'replace')[:5], status)
+        with self._lock:
+            self._buf += record
+            if len(self._buf) >= self.buffer_bytes or time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+            elif self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name='event-log-flush', daemon=True)
+                self._flusher.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop.set()
+            flusher, self._flusher = self._flusher, None
+        if flusher is not None:
+            flusher.join()
+        with self._lock:
+            self._stop = threading.Event()
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _flush_loop(self) -> None:
+        # An idle session's last records reach the disk without waiting for another log()
+        stop = self._stop
+        while not stop.wait(self.flush_interval):
+            with self._lock:
+                if self._buf and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        buf = self._buf
+        while buf:
+            if self._file is None or self._size + RECORD.size > self.max_bytes:
+                self._rotate()
+            room = (self.max_bytes - self._size) // RECORD.size * RECORD.size
+            part = buf[:room]
+            self._file.write(part)
+            self._size += len(part)
+            self.written += len(part) // RECORD.size
+            del buf[:room]
+        if self._file is not None:
+            self._file.flush()
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        while True:
+            self._seq += 1
+            try:
+                # 'x': another process (or a restart) may have created this file since the scan
+                self._file = open(self.directory / f'events-{self._seq:06d}{SUFFIX}', 'xb')
+                break
+            except FileExistsError:
+                continue
+        self._file.write(HEADER)
+        self._size = len(HEADER)
+
+
+def log_files(paths: Iterable) -> List[Path]:
+    """Event files named by ``paths`` (files, or directories to scan), in order."""
+    files = []
+    for p in map(Path, paths):
+        files.extend(sorted(p.glob(f'*{SUFFIX}')) if p.is_dir() else [p])
+    return files
+
+
+def _mapped(path: Path):
+    """``(mmap, record count)`` for a valid event file, else ``(None, 0)``."""
+    with open(path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size < len(HEADER) or fh.read(len(HEADER)) != HEADER:
+            return None, 0
+        if size == len(HEADER):
+            return None, 0
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ), (size - len(HEADER)) // RECORD.size
+
+
+def read_records(path) -> Iterator[Tuple[float, int, int, int, str, int]]:
+    """Records of one file as ``(ts, session, kind, row, guess, status)``."""
+    mm, count = _mapped(Path(path))
+    if mm is None:
+        return
+    with mm:
+        view = memoryview(mm)
+        try:
+            for ts, session, kind, row, guess, status in RECORD.iter_unpack(
+                    view[len(HEADER):len(HEADER) + count * RECORD.size]):
+                yield ts, session, kind, row, guess.rstrip(b'\0').decode('ascii', 'replace'), status
+        finally:
+            view.release()
+
+
+class TopK:
+    """Misra-Gries heavy hitters: at most ``2 * capacity`` counters.
+
+    Counts are lower bounds, short by no more than :attr:`error`.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self.counts: Dict[bytes, int] = {}
+        self.error = 0
+
+    def add(self, key: bytes, n: int = 1) -> None:
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + n
+        if len(counts) > 2 * self.capacity:
+            cut = sorted(counts.values(), reverse=True)[self.capacity]
+            self.error += cut
+            self.counts = {k: c - cut for k, c in counts.items() if c > cut}
+
+    def top(self, n: int) -> List[Tuple[bytes, int]]:
+        return sorted(self.counts.items(), key=lambda kc: (-kc[1], kc[0]))[:n]
+
+
+_FUNNEL = ('started', 'first_guess', 'finished', 'won', 'guesses', 'invalid', 'keys')
+
+
+class _Totals:
+    def __init__(self, capacity: int):
+        self.days: Dict[int, List[int]] = {}
+        self.openers = TopK(capacity)
+        self.records = 0
+
+    def day(self, number: int) -> List[int]:
+        row = self.days.get(number)
+        if row is None:
+            row = self.days[number] = [0] * len(_FUNNEL)
+        return row
+
+    def add_python(self, view) -> None:
+        day_of = self.day
+        openers = self.openers
+        for ts, _session, kind, row, guess, _status in RECORD.iter_unpack(view):
+            counts = day_of(int(ts // 86400))
+            if kind == KEY or kind == BACK:
+                counts[6] += 1
+            elif kind == NEW:
+                counts[0] += 1
+            elif kind == INVALID:
+                counts[5] += 1
+            else:
+                counts[4] += 1
+                if row == 0:
+                    counts[1] += 1
+                    openers.add(guess)
+                if kind != GUESS:
+                    counts[2] += 1
+                    if kind == WON:
+                        counts[3] += 1
+            self.records += 1
+
+    def add_numpy(self, mm, offset: int, count: int) -> None:
+        dtype = np.dtype([('ts', '<f8'), ('session', '<u8'), ('kind', 'u1'), ('row', 'u1'), ('guess', 'S5'),
+                          ('status', 'u1')])
+        records = np.frombuffer(mm, dtype, count, offset)
+        days = (records['ts'] // 86400).astype(np.int64)
+        kind, row = records['kind'], records['row']
+        scored = kind >= GUESS
+        scored[kind == INVALID] = False
+        masks = (kind == NEW, scored & (row == 0), (kind == WON) | (kind == LOST), kind == WON, scored,
+                 kind == INVALID, (kind == KEY) | (kind == BACK))
+        for column, mask in enumerate(masks):
+            found, n = np.unique(days[mask], return_counts=True)
+            for d, k in zip(found.tolist(), n.tolist()):
+                self.day(d)[column] += k
+        words, n = np.unique(records['guess'][masks[1]], return_counts=True)
+        for w, k in zip(words.tolist(), n.tolist()):
+            self.openers.add(w, k)
+        self.records += count
+
+
+def aggregate(paths: Iterable, top: int = 10, capacity: int = 4096, use_numpy: Optional[bool] = None) -> dict:
+    """Funnel per day, invalid-guess rate and top openers over the event files in ``paths``."""
+    use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+    totals = _Totals(capacity)
+    files = skipped = 0
+    for path in log_files(paths):
+        mm, count = _mapped(path)
+        if mm is None:
+            skipped += 1
+            continue
+        files += 1
+        with mm:
+            for first in range(0, count, CHUNK_RECORDS):
+                n = min(CHUNK_RECORDS, count - first)
+                offset = len(HEADER) + first * RECORD.size
+                if use_numpy:
+                    totals.add_numpy(mm, offset, n)
+                else:
+                    view = memoryview(mm)[offset:offset + n * RECORD.size]
+                    try:
+                        totals.add_python(view)
+                    finally:
+                        view.release()
+    days = {}
+    for number in sorted(totals.days):
+        row = dict(zip(_FUNNEL, totals.days[number]))
+        attempts = row['guesses'] + row['invalid']
+        row['invalid_rate'] = round(row['invalid'] / attempts, 4) if attempts else 0.0
+        row['finish_rate'] = round(row['finished'] / row['started'], 4) if row['started'] else 0.0
+        days[(datetime.date(1970, 1, 1) + datetime.timedelta(days=number)).isoformat()] = row
+    return {
+        'files': files,
+        'skipped_files': skipped,
+        'records': totals.records,
+        'days': days,
+        'openers': [(w.rstrip(b'\0').decode('ascii', 'replace'), n) for w, n in totals.openers.top(top)],
+        'openers_error': totals.openers.error,
+    }
+
+
+def generate(directory, games: int, seed: int = 0, start: float = 1_750_000_000.0, **log_options) -> int:
+    """Write ``games`` synthetic games (keystrokes, some invalid guesses) for testing; returns records."""
+    from .scoring import ALL_CORRECT, PatternMatrix
+
+    rng = random.Random(seed)
+    answers = [w for w in ANSWERS if len(w) == COLS]
+    matrix = PatternMatrix(answers, answers)
+    clock = [start]
+    log = EventLog(directory, clock=lambda: clock[0], **log_options)
+    for _ in range(games):
+        session, secret = rng.getrandbits(64), rng.choice(answers)
+        clock[0] += rng.expovariate(1 / 20)
+        log.log(session, NEW)
+        for row in range(6):
+            guess = rng.choice(answers)
+            for i in range(1, COLS + 1):
+                log.log(session, KEY, guess[:i], row=row)
+            if rng.random() < 0.1:
+                log.log(session, INVALID, guess[::-1], row=row)
+            code = matrix.code(guess, secret)
+            last = code == ALL_CORRECT or row == 5
+            log.log(session, (WON if code == ALL_CORRECT else LOST) if last else GUESS, guess, code, row)
+            if last:
+                break
+        if rng.random() < 0.05:
+            # Abandoned after typing a little
+            log.log(session, NEW)
+            log.log(session, KEY, 'a')
+    log.close()
+    return log.written
+
+
+_shared: Optional[EventLog] = None
+_shared_lock = threading.Lock()
+
+
+def events_dir() -> Optional[str]:
+    """Directory for the app's event log (``MUSIC_WORDLE_EVENTS_DIR``), if configured."""
+    return os.environ.get('MUSIC_WORDLE_EVENTS_DIR') or None
+
+
+def shared_log() -> Optional[EventLog]:
+    """The process-wide log, or ``None`` when ``MUSIC_WORDLE_EVENTS_DIR`` is not set."""
+    global _shared
+    if _shared is None and events_dir():
+        with _shared_lock:
+            if _shared is None:
+                _shared = EventLog(events_dir())
+                atexit.register(_shared.close)
+    return _shared
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.events',
+                                     description='Summarise gameplay event logs in constant memory.')
+    parser.add_argument('paths', nargs='+', help='event files or directories')
+    parser.add_argument('--top', type=int, default=10, help='most tried openers to list')
+    parser.add_argument('--capacity', type=int, default=4096, help='opener counters kept (memory bound)')
+    parser.add_argument('--no-numpy', action='store_true', help='use the pure-Python reader')
+    parser.add_argument('--json', help='also write the report as JSON')
+    parser.add_argument('--generate', type=int, metavar='GAMES', help='write a synthetic log into the first path')
+    args = parser.parse_args(argv)
+
+    if args.generate:
+        records = generate(args.paths[0], args.generate)
+        print(f'wrote {records:,} records ({records * RECORD.size / 2 ** 20:.1f} MB) to {args.paths[0]}')
+        return 0
+    start = time.perf_counter()
+    report = aggregate(args.paths, args.top, args.capacity, use_numpy=not args.no_numpy)
+    elapsed = time.perf_counter() - start
+    rate = report['records'] / elapsed if elapsed else 0.0
+    print(f"{report['records']:,} records in {report['files']} files, {elapsed:.2f} s ({rate:,.0f} records/s)")
+    print(f"{'day':<10} {'started':>8} {'guessed':>8} {'finished':>8} {'won':>8} {'finish%':>8} {'invalid%':>8}")
+    for day, row in report['days'].items():
+        print(f"{day:<10} {row['started']:>8,} {row['first_guess']:>8,} {row['finished']:>8,} {row['won']:>8,} "
+              f"{row['finish_rate']:>8.1%} {row['invalid_rate']:>8.1%}")
+    openers = ', '.join(f'{w} {n:,}' for w, n in report['openers'])
+    print(f"top openers: {openers or '-'}" + (f" (counts within {report['openers_error']:,})"
+                                              if report['openers_error'] else ''))
+    if args.json:
+        with open(args.json, 'w') as fh:
+            import json
+
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""Pattern queries over the dictionary via per-position letter bitsets.
+
+:class:`WordIndex` numbers every word (allowed dictionary plus answers,
+sorted) and keeps one Python ``int`` bitset per (position, letter), per
+letter ("contains") and per letter repeated 2 or 3 times. A query such as
+``p?a??`` + must contain ``n`` + no ``e`` + ``r`` not 2nd is then a handful
+of big-int ANDs over ~15k bits rather than a regex scan of every word.
+
+Matches are yielded lazily in word order from the final bitset, 64 bits
+at a time, so a page of a broad pattern costs only that page::
+
+    idx = shared_index()
+    hits = idx.search('p?a??', include='n', exclude='e', not_at='r2')
+    hits.count, hits.page(0, 50)
+"""
+import re
+import sys
+import threading
+from array import array
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .config import ANSWERS, COLS, answers_for
+
+_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+_WILDCARDS = '?._* '
+MAX_REPEAT = 3
+
+
+class QueryError(ValueError):
+    """Raised for a malformed pattern or constraint string."""
+
+
+def _bitset(indices: Iterable[int], n: int) -> int:
+    bits = bytearray((n + 7) // 8)
+    for j in indices:
+        bits[j >> 3] |= 1 << (j & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class Matches:
+    """Lazy view of the words selected by a bitset."""
+
+    __slots__ = ('index', 'mask')
+
+    def __init__(self, index: 'WordIndex', mask: int):
+        self.index = index
+        self.mask = mask
+
+    @property
+    def count(self) -> int:
+        return self.mask.bit_count()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, skip: int = 0) -> Iterator[int]:
+        n = self.index.size
+        chunks = array('Q')
+        chunks.frombytes(self.mask.to_bytes(((n + 63) // 64) * 8, 'little'))
+        if sys.byteorder != 'little':
+            chunks.byteswap()
+        for c, word in enumerate(chunks):
+            if not word:
+                continue
+            if skip:
+                ones = word.bit_count()
+                if skip >= ones:
+                    skip -= ones
+                    continue
+            base = c * 64
+            while word:
+                low = word & -word
+                if skip:
+                    skip -= 1
+                else:
+                    yield base + low.bit_length() - 1
+                word ^= low
+
+    def __iter__(self) -> Iterator[str]:
+        words = self.index.words
+        return (words[j] for j in self._positions())
+
+    def page(self, number: int, size: int = 50) -> List[str]:
+        """Words ``number * size`` to ``(number + 1) * size`` (0-based pages)."""
+        words = self.index.words
+        return [words[j] for j in islice(self._positions(number * size), size)]
+
+    def answers(self) -> 'Matches':
+        """Only the matches that are also answers."""
+        return Matches(self.index, self.mask & self.index.answer_mask)
+
+
+class WordIndex:
+    """Bitset index over a fixed word list (see module docs)."""
+
+    def __init__(self, words: Iterable[str], answers: Iterable[str] = ANSWERS, length: int = COLS):
+        answer_set = {w for w in answers if len(w) == length}
+        self.length = length
+        self.words: Tuple[str, ...] = tuple(sorted({w for w in words if len(w) == length} | answer_set))
+        n = self.size = len(self.words)
+        self.all_mask = (1 << n) - 1
+        at: Dict[Tuple[int, str], List[int]] = {}
+        repeated: Dict[Tuple[str, int], List[int]] = {}
+        for j, w in enumerate(self.words):
+            for i, ch in enumerate(w):
+                at.setdefault((i, ch), []).append(j)
+            for ch in set(w):
+                for k in range(1, min(w.count(ch), MAX_REPEAT) + 1):
+                    repeated.setdefault((ch, k), []).append(j)
+        self.at = {key: _bitset(js, n) for key, js in at.items()}
+        self.repeated = {key: _bitset(js, n) for key, js in repeated.items()}
+        self.answer_mask = _bitset((j for j, w in enumerate(self.words) if w in answer_set), n)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return sum((b.bit_length() + 7) // 8 for b in (*self.at.values(), *self.repeated.values()))
+
+    def contains(self, ch: str, times: int = 1) -> int:
+        return self.repeated.get((ch, min(times, MAX_REPEAT)), 0)
+
+    def query(self, fixed: Sequence[Optional[str]] = (), include: Dict[str, int] = None,
+              exclude: Iterable[str] = (), not_at: Iterable[Tuple[int, str]] = (),
+              answers_only: bool = False) -> Matches:
+        """Words with ``fixed[i]`` at position ``i`` (``None``: any), at least
+        ``include[ch]`` copies of each letter, none of ``exclude`` and not
+        ``ch`` at position ``i`` for each ``(i, ch)`` in ``not_at``."""
+        mask = self.answer_mask if answers_only else self.all_mask
+        for i, ch in enumerate(fixed):
+            if ch is not None:
+                mask &= self.at.get((i, ch), 0)
+        for ch, times in (include or {}).items():
+            mask &= self.contains(ch, times)
+        for ch in exclude:
+            mask &= ~self.contains(ch)
+        for i, ch in not_at:
+            mask &= ~self.at.get((i, ch), 0)
+        return Matches(self, mask)
+
+    def search(self, pattern: str = '', include: str = '', exclude: str = '', not_at: str = '',
+               answers_only: bool = False) -> Matches:
+        """:meth:`query` from user-style strings.
+
+        ``pattern``: letters and wildcards (``?``, ``.``, ``_``, ``*``, space),
+        e.g. ``p?a??``; shorter patterns leave the rest open. ``include``:
+        letters the word must contain, repeated for multiples (``ee``).
+        ``exclude``: letters it must not contain. ``not_at``: letter and
+        1-based position pairs such as ``r2 s5``.
+        """
+        pattern = pattern.lower().rstrip()
+        if len(pattern) > self.length:
+            raise QueryError(f"pattern is longer than {self.length} letters")
+        fixed: List[Optional[str]] = []
+        for ch in pattern:
+            if ch in _WILDCARDS:
+                fixed.append(None)
+            elif ch in _LETTERS:
+                fixed.append(ch)
+            else:
+                raise QueryError(f"unexpected {ch!r} in pattern; use letters and ?")
+        counts: Dict[str, int] = {}
+        for ch in _only_letters(include, 'include'):
+            counts[ch] = counts.get(ch, 0) + 1
+        banned = set(_only_letters(exclude, 'exclude'))
+        pairs = []
+        for token in re.split(r'[\s,;]+', not_at.lower().strip()):
+            if not token:
+                continue
+            m = re.fullmatch(r'([a-z])(\d)|(\d)([a-z])', token)
+            if not m:
+                raise QueryError(f"not-at entries look like r2 (letter, position): got {token!r}")
+            ch, pos = (m.group(1), m.group(2)) if m.group(1) else (m.group(4), m.group(3))
+            if not 1 <= int(pos) <= self.length:
+                raise QueryError(f"position {pos} is outside 1-{self.length}")
+            pairs.append((int(pos) - 1, ch))
+        return self.query(fixed, counts, banned, pairs, answers_only)
+
+
+def _only_letters(text: str, what: str) -> List[str]:
+    letters = [ch for ch in text.lower() if not ch.isspace() and ch != ',']
+    bad = [ch for ch in letters if ch not in _LETTERS]
+    if bad:
+        raise QueryError(f"{what} takes letters only, got {bad[0]!r}")
+    return letters
+
+
+_shared: Dict[int, WordIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_index(length: int = COLS) -> WordIndex:
+    """Index over the bundled ``length``-letter dictionary and answers, built on first use."""
+    index = _shared.get(length)
+    if index is None:
+        with _shared_lock:
+            index = _shared.get(length)
+            if index is None:
+                from .dictionary import shared_dictionary
+
+                index = _shared[length] = WordIndex(shared_dictionary(length), answers_for(length), length)
+    return index
@@ -0,0 +1,253 @@
+"""Streaming, size-capped ingestion of uploaded dictionaries.
+
+Uploads are read in fixed-size chunks, tokenised incrementally and deduped
+into a set, so memory is bounded by the number of distinct valid words and
+not by the upload size. A JSON array of strings and plain text (any
+non-letter separators) are both accepted, as before. Parsed results are
+kept in a process-wide LRU keyed by the SHA-256 of the upload and bounded
+by a memory budget, so reruns and other sessions uploading the same file
+reuse the same :class:`~musicwordle.dictionary.WordList`. An upload is
+parsed separately for each word length it is used at.
+"""
+import codecs
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from .config import ANSWERS, COLS
+from .dictionary import WordList, build_word_list, shared_dictionary
+
+CHUNK_SIZE = 64 * 1024
+MAX_UPLOAD_BYTES = 8 * 1024 * 1024
+CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+MIN_WORDS = 50
+
+
+class DictionaryTooLarge(ValueError):
+    """Raised when an upload exceeds ``MAX_UPLOAD_BYTES``."""
+
+
+class _NotJson(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class IngestResult:
+    words: WordList
+    digest: str
+    valid: int            # distinct valid words found in the upload
+    kept_bundled: bool    # upload was small, so the bundled words were merged in
+    length: int = COLS
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        return self.digest, self.length
+
+
+def _chunks(stream: BinaryIO, limit: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    total = 0
+    while True:
+        data = stream.read(CHUNK_SIZE)
+        if not data:
+            break
+        total += len(data)
+        if total > limit:
+            raise DictionaryTooLarge(f"dictionary upload is larger than {limit // (1024 * 1024)} MB")
+        yield decoder.decode(data)
+    yield decoder.decode(b'', final=True)
+
+
+_JSON_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"|([\[\]{}])')
+
+
+def _text_words(chunks: Iterator[str], length: int) -> set:
+    """Distinct ``length``-letter runs of ASCII letters, lowercased."""
+    exact = re.compile(r'(?<![a-z])[a-z]{%d}(?![a-z])' % length)
+    out = set()
+    carry = ''
+    for text in chunks:
+        text = (carry + text).lower()
+        # Letters at the end of the chunk may continue in the next one
+        tail = len(text)
+        while tail and 'a' <= text[tail - 1] <= 'z':
+            tail -= 1
+        carry = text[tail:]
+        out.update(exact.findall(text, 0, tail))
+    out.update(exact.findall(carry))
+    return out
+
+
+def _json_strings(chunks: Iterator[str]) -> Iterator[str]:
+    """Top-level string items of a JSON array, scanned incrementally.
+
+    Raises ``_NotJson`` when the input is not a complete array so the caller
+    can fall back to plain text, like the old ``json.loads`` attempt did.
+    """
+    started = False
+    depth = 0
+    carry = ''
+    for text in chunks:
+        text = carry + text
+        if not started:
+            stripped = text.lstrip('\ufeff \t\r\n')
+            if not stripped:
+                continue
+            if stripped[0] != '[':
+                raise _NotJson
+            started = True
+        end = 0
+        for m in _JSON_TOKEN.finditer(text):
+            end = m.end()
+            item, bracket = m.group(1), m.group(2)
+            if bracket is not None:
+                depth += 1 if bracket in '[{' else -1
+                if depth < 0:
+                    raise _NotJson
+            elif depth == 1:
+                if '\\' in item:
+                    import json
+                    try:
+                        item = json.loads(f'"{item}"')
+                    except ValueError as exc:
+                        raise _NotJson from exc
+                yield item
+        # An unterminated string at the end of the chunk continues in the next one
+        quote = text.find('"', end)
+        carry = text[quote:] if quote >= 0 else ''
+    if not started or depth != 0 or carry:
+        raise _NotJson
+
+
+def _collect(words: Iterator[str], length: int) -> set:
+    out = set()
+    for w in words:
+        w = w.strip().lower()
+        if len(w) == length and w.isascii() and w.isalpha():
+            out.add(w)
+    return out
+
+
+def parse_upload(stream: BinaryIO, length: int = COLS, limit: int = MAX_UPLOAD_BYTES) -> set:
+    """Distinct valid words in ``stream`` (JSON array or free text)."""
+    if stream.seekable():
+        start = stream.tell()
+        try:
+            return _collect(_json_strings(_chunks(stream, limit)), length)
+        except _NotJson:
+            stream.seek(start)
+        return _text_words(_chunks(stream, limit), length)
+    # One pass only: keep what the JSON scan read so plain text can be parsed from the start.
+    # Text that is not JSON fails on its first chunk; only a broken array is buffered further.
+    chunks = _chunks(stream, limit)
+    seen: List[str] = []
+
+    def recorded():
+        for text in chunks:
+            seen.append(text)
+            yield text
+
+    try:
+        return _collect(_json_strings(recorded()), length)
+    except _NotJson:
+        return _text_words(_chain(seen, chunks), length)
+
+
+def _chain(*iterables):
+    for it in iterables:
+        yield from it
+
+
+def content_digest(stream: BinaryIO, limit: int = MAX_UPLOAD_BYTES) -> str:
+    h = hashlib.sha256()
+    total = 0
+    start = stream.tell()
+    while True:
+        data = stream.read(CHUNK_SIZE)
+        if not data:
+            break
+        total += len(data)
+        if total > limit:
+            raise DictionaryTooLarge(f"dictionary upload is larger than {limit // (1024 * 1024)} MB")
+        h.update(data)
+    stream.seek(start)
+    return h.hexdigest()
+
+
+class IngestCache:
+    """LRU of parsed uploads keyed by content hash and word length, bounded by total bytes."""
+
+    def __init__(self, budget: int = CACHE_BUDGET_BYTES):
+        self.budget = budget
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[Tuple[str, int], IngestResult]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, digest: str, length: int = COLS) -> Optional[IngestResult]:
+        with self._lock:
+            item = self._items.get((digest, length))
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end((digest, length))
+            self.hits += 1
+            return item
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.used = 0
+
+    def put(self, result: IngestResult) -> None:
+        size = result.words.nbytes
+        if size > self.budget:
+            return
+        with self._lock:
+            old = self._items.pop(result.key, None)
+            if old is not None:
+                self.used -= old.words.nbytes
+            self._items[result.key] = result
+            self.used += size
+            while self.used > self.budget:
+                _, evicted = self._items.popitem(last=False)
+                self.used -= evicted.words.nbytes
+
+
+_cache = IngestCache()
+
+
+def shared_ingest_cache() -> IngestCache:
+    return _cache
+
+
+def ingest(stream: BinaryIO, answers=ANSWERS, cache: Optional[IngestCache] = None,
+           length: int = COLS) -> IngestResult:
+    """Parse the ``length``-letter words of an upload into a ``WordList``; identical uploads are served from cache."""
+    cache = _cache if cache is None else cache
+    digest = content_digest(stream)
+    hit = cache.get(digest, length)
+    if hit is not None:
+        return hit
+    cleaned = parse_upload(stream, length)
+    valid = len(cleaned)
+    kept_bundled = valid < MIN_WORDS
+    if kept_bundled:
+        cleaned |= shared_dictionary(length).members
+    words = build_word_list(cleaned, answers, source=f"upload:{digest[:8]}", length=length)
+    result = IngestResult(words, digest, valid, kept_bundled, length)
+    cache.put(result)
+    return result
+
+
+def ingest_bytes(data: bytes, answers=ANSWERS, cache: Optional[IngestCache] = None,
+                 length: int = COLS) -> IngestResult:
+    return ingest(io.BytesIO(data), answers, cache, length)
@@ -0,0 +1,124 @@
+"""What the feedback so far proves about the secret, as a few integers.
+
+:class:`Knowledge` is built incrementally from a game's pattern codes:
+
+* ``allowed[i]``: 26-bit mask of letters still possible at position ``i``
+  (a green collapses it to one bit, yellow/grey letters clear their bit);
+* ``min_counts[l]``: the secret has at least this many of letter ``l``
+  (green + yellow copies in one guess);
+* ``max_counts[l]``: an upper bound, exact once a guess shows a grey copy
+  of ``l`` next to its green/yellow ones (0 for letters proven absent);
+* ``best[l]``: best feedback digit seen for ``l``, for the keyboard.
+
+Absorbing a row is O(word length); checking a guess against everything
+known is a mask test per position plus a count check per constrained
+letter, instead of re-scoring every earlier guess.
+"""
+from typing import Dict, List, Optional
+
+from .scoring import STATUSES
+
+FULL = (1 << 26) - 1
+ABSENT, PRESENT, CORRECT = 0, 1, 2
+_ORDINALS = ('1st', '2nd', '3rd')
+
+
+def _ordinal(i: int) -> str:
+    return _ORDINALS[i] if i < 3 else f'{i + 1}th'
+
+
+class Knowledge:
+    """Constraints proven by the rows absorbed so far (see module docs)."""
+
+    __slots__ = ('cols', 'rows', 'allowed', 'solved', 'min_counts', 'max_counts', 'counted', 'best', 'rejected')
+
+    def __init__(self, cols: int):
+        self.cols = cols
+        self.rows = 0
+        self.allowed = [FULL] * cols
+        self.solved = 0              # bit i set once position i is green
+        self.min_counts = bytearray(26)
+        self.max_counts = bytearray([cols]) * 26
+        self.counted: List[int] = []  # letters with a count constraint
+        self.best = bytearray(b'\xff') * 26  # 255: letter not played yet
+        self.rejected = ''           # last violation message, for describe()
+
+    def absorb(self, guess: str, code: int) -> None:
+        """Add one row: ``guess`` scored as base-3 pattern ``code``."""
+        n = self.cols
+        digits = [0] * n
+        for i in range(n - 1, -1, -1):
+            code, digits[i] = divmod(code, 3)
+        letters = [ord(c) - 97 for c in guess]
+        hits: Dict[int, int] = {}
+        grey = set()
+        allowed, best = self.allowed, self.best
+        for i, (l, d) in enumerate(zip(letters, digits)):
+            if d == CORRECT:
+                allowed[i] = 1 << l
+                self.solved |= 1 << i
+            else:
+                allowed[i] &= ~(1 << l)
+            if d == ABSENT:
+                grey.add(l)
+            else:
+                hits[l] = hits.get(l, 0) + 1
+            if best[l] == 255 or d > best[l]:
+                best[l] = d
+        for l, k in hits.items():
+            if k > self.min_counts[l]:
+                self.min_counts[l] = k
+        for l in grey:
+            k = hits.get(l, 0)
+            self.max_counts[l] = k
+            if k == 0:
+                # Proven absent: rule it out everywhere not already green
+                clear = ~(1 << l)
+                for i in range(n):
+                    if not self.solved >> i & 1:
+                        allowed[i] &= clear
+        self.counted = [l for l in range(26) if self.min_counts[l] or self.max_counts[l] < n]
+        self.rows += 1
+
+    def sync(self, state) -> 'Knowledge':
+        """Absorb any rows of ``state`` (a ``GameState``) not seen yet."""
+        n = self.cols
+        words = state.guesses
+        for r in range(self.rows, len(state.codes)):
+            self.absorb(words[r * n:(r + 1) * n].decode('ascii'), state.codes[r])
+        return self
+
+    def violation(self, guess: str, strict: bool = False) -> Optional[str]:
+        """Why ``guess`` ignores revealed hints, or ``None`` if it uses them all.
+
+        Hard mode (default) keeps greens in place and reuses every yellow
+        (as many copies as shown). ``strict`` also rejects letters in
+        positions or counts the feedback has ruled out.
+        """
+        letters = [ord(c) - 97 for c in guess]
+        for i, l in enumerate(letters):
+            if not self.allowed[i] >> l & 1:
+                if self.solved >> i & 1:
+                    return f"{_ordinal(i)} letter must be {chr(97 + self.allowed[i].bit_length() - 1).upper()}"
+                if strict:
+                    if self.max_counts[l] == 0:
+                        return f"{chr(97 + l).upper()} is not in the word"
+                    return f"{_ordinal(i)} letter can't be {chr(97 + l).upper()}"
+        for l in self.counted:
+            have = letters.count(l)
+            need, most = self.min_counts[l], self.max_counts[l]
+            if have < need:
+                ch = chr(97 + l).upper()
+                return f"Guess must contain {ch}" if need == 1 else f"Guess must contain {need} {ch}s"
+            if strict and have > most:
+                ch = chr(97 + l).upper()
+                return f"Guess can contain only {most} {ch}" + ('' if most == 1 else 's')
+        return None
+
+    def consistent(self, guess: str) -> bool:
+        """Could ``guess`` still be the secret?"""
+        return self.violation(guess, strict=True) is None
+
+    def key_status(self) -> Dict[str, str]:
+        """Best status per keyboard letter ('' when not played yet)."""
+        return {chr(65 + l): ('' if d == 255 else STATUSES[d]) for l, d in enumerate(self.best)}
@@ -0,0 +1,155 @@
+"""Load generator for :mod:`musicwordle.server`.
+
+Runs ``--concurrency`` simulated players, each on its own keep-alive
+connection, for ``--duration`` seconds. A player starts a game, guesses
+random answers until the game ends, fetches the share card, and repeats.
+Reports requests/sec and latency percentiles overall and per endpoint::
+
+    python -m musicwordle.loadgen --spawn --concurrency 64 --duration 10
+    python -m musicwordle.loadgen --url http://127.0.0.1:8765 --out load.json
+
+``--spawn`` starts the server in a subprocess on a free port, so the
+generator and the server do not share an event loop or a GIL.
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .config import ANSWERS, COLS
+
+
+async def _request(reader, writer, method: str, path: str, payload=None) -> Tuple[int, dict]:
+    body = b'' if payload is None else json.dumps(payload).encode()
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: load\r\nContent-Length: {len(body)}\r\n\r\n'.encode() + body)
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    length = 0
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    data = await reader.readexactly(length) if length else b''
+    return status, (json.loads(data) if data else {})
+
+
+async def _player(host: str, port: int, deadline: float, samples: Dict[str, List[float]],
+                  errors: List[str], rng: random.Random) -> int:
+    answers = [w for w in ANSWERS if len(w) == COLS]
+    games = 0
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            async def call(name, method, path, payload=None):
+                start = time.perf_counter()
+                status, data = await _request(reader, writer, method, path, payload)
+                samples[name].append(time.perf_counter() - start)
+                if status != 200:
+                    errors.append(f'{name}: {status} {data.get("error", "")}')
+                return data
+
+            game = await call('new', 'POST', '/api/new', {'seed': f'load-{rng.random()}'})
+            game_id = game.get('id')
+            if game_id is None:
+                break
+            finished = False
+            while not finished and time.perf_counter() < deadline:
+                result = await call('guess', 'POST', '/api/guess', {'id': game_id, 'guess': rng.choice(answers)})
+                finished = result.get('finished', True)
+            if finished:
+                await call('share', 'GET', f'/api/share?id={game_id}')
+                games += 1
+    except (ConnectionError, asyncio.IncompleteReadError) as exc:
+        errors.append(f'connection: {exc!r}')
+    finally:
+        writer.close()
+    return games
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    if not values:
+        return {}
+    pick = lambda q: values[min(len(values) - 1, int(q * len(values)))] * 1000  # noqa: E731
+    return {'count': len(values), 'p50_ms': round(pick(0.5), 3), 'p95_ms': round(pick(0.95), 3),
+            'p99_ms': round(pick(0.99), 3), 'max_ms': round(values[-1] * 1000, 3)}
+
+
+async def run_load(host: str, port: int, concurrency: int = 32, duration: float = 5.0, seed: int = 0) -> dict:
+    """Drive the server at ``host:port`` and summarise throughput and latency."""
+    samples: Dict[str, List[float]] = defaultdict(list)
+    errors: List[str] = []
+    start = time.perf_counter()
+    deadline = start + duration
+    games = await asyncio.gather(*(
+        _player(host, port, deadline, samples, errors, random.Random(seed * 100_003 + i)) for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    everything = [t for values in samples.values() for t in values]
+    return {
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 3),
+        'requests': len(everything),
+        'requests_per_second': round(len(everything) / elapsed, 1),
+        'games': sum(games),
+        'errors': len(errors),
+        'first_errors': errors[:5],
+        'latency': _percentiles(everything),
+        'endpoints': {name: _percentiles(values) for name, values in sorted(samples.items())},
+    }
+
+
+def _spawn_server() -> Tuple[subprocess.Popen, str, int]:
+    proc = subprocess.Popen([sys.executable, '-m', 'musicwordle.server', '--port', '0'],
+                            stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline().strip()
+    if not line.startswith('listening on '):
+        proc.kill()
+        raise RuntimeError(f'server did not start: {line!r}')
+    url = urlsplit(line[len('listening on '):])
+    return proc, url.hostname, url.port
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.loadgen', description='Load-test the game API.')
+    parser.add_argument('--url', default='http://127.0.0.1:8765')
+    parser.add_argument('--spawn', action='store_true', help='start a server subprocess on a free port')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--out', help='also write the report as JSON')
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.spawn:
+        proc, host, port = _spawn_server()
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    try:
+        report = asyncio.run(run_load(host, port, args.concurrency, args.duration))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+    lat = report['latency']
+    print(f"{report['requests']:,} requests in {report['seconds']} s: {report['requests_per_second']:,.0f} req/s, "
+          f"{report['games']:,} games, {report['errors']} errors")
+    print(f"latency p50 {lat.get('p50_ms', 0)} ms  p95 {lat.get('p95_ms', 0)} ms  "
+          f"p99 {lat.get('p99_ms', 0)} ms  max {lat.get('max_ms', 0)} ms")
+    for name, stats in report['endpoints'].items():
+        print(f"  {name:6} n={stats['count']:<8} p50 {stats['p50_ms']} ms  p99 {stats['p99_ms']} ms")
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    return 1 if report['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
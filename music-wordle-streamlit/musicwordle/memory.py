@@ -0,0 +1,33 @@
+"""Rough per-object memory accounting used by the sidebar diagnostics."""
+import sys
+from typing import Iterable
+
+
+def approx_size(obj, shared: Iterable[object] = ()) -> int:
+    """Shallow-recursive ``sys.getsizeof`` that skips objects in ``shared``.
+
+    Shared objects (e.g. the process-wide dictionary) are referenced by every
+    session but paid for once, so they are not charged to the caller.
+    """
+    skip = {id(o) for o in shared}
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen or id(cur) in skip:
+            continue
+        seen.add(id(cur))
+        nbytes = getattr(cur, 'nbytes', None)
+        if isinstance(nbytes, int) and not isinstance(cur, (bytes, bytearray)):
+            total += nbytes
+            continue
+        total += sys.getsizeof(cur)
+        if isinstance(cur, dict):
+            stack.extend(cur.keys())
+            stack.extend(cur.values())
+        elif isinstance(cur, (list, tuple, set, frozenset)):
+            stack.extend(cur)
+        elif hasattr(cur, '__slots__'):
+            stack.extend(getattr(cur, s) for s in cur.__slots__ if hasattr(cur, s))
+    return total
@@ -0,0 +1,175 @@
+"""Multi-board games: one guess played against 2, 4 or 8 secrets at once.
+
+:class:`MultiGameState` is a tuple of ordinary :class:`GameState` boards
+plus the shared typing buffer; each board keeps its own guesses and codes
+and stops taking rows once it is solved. :class:`MultiEngine` scores a
+guess against every unsolved board in one batched call
+(:meth:`~musicwordle.scoring.PatternMatrix.codes`: one matrix row lookup
+indexed by the secrets) instead of one ``score_guess`` per board, and
+records which boards changed so the UI can rebuild only those.
+
+Secrets come from :func:`~musicwordle.engine.seeded_choice` on derived
+seeds (``seed#0``, ``seed#1``, ...), skipping repeats. Games get
+``BOARDS - 1`` more rows than a single board: 7, 9 and 13 for 5 letters.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .config import COLS, rows_for
+from .engine import CONTINUE, FINISHED, LOST, SHORT, UNKNOWN, WON, GameEngine, GameState, seeded_choice
+from .scoring import STATUSES, score_code
+
+BOARD_COUNTS = (2, 4, 8)
+KEYCAPS = ('0️⃣', '1️⃣', '2️⃣', '3️⃣', '4️⃣', '5️⃣', '6️⃣', '7️⃣', '8️⃣', '9️⃣')
+
+
+def pick_secrets(answers: Sequence[str], seed_str: str, boards: int) -> List[str]:
+    """``boards`` distinct answers, one ``seeded_choice`` per derived seed."""
+    if boards > len(set(answers)):
+        raise ValueError(f"{boards} boards need at least {boards} distinct answers")
+    secrets: List[str] = []
+    i = 0
+    while len(secrets) < boards:
+        word = seeded_choice(answers, f'{seed_str}#{i}')
+        if word not in secrets:
+            secrets.append(word)
+        i += 1
+    return secrets
+
+
+def rows_for_boards(boards: int, length: int = COLS) -> int:
+    return rows_for(length) + boards - 1
+
+
+class MultiGameState:
+    """Several boards sharing every guess (see module docs).
+
+    Has the typing fields of :class:`GameState` (``current``, ``finished``,
+    ``cols``), so the engine's ``type_letter`` / ``backspace`` work on it.
+    """
+
+    __slots__ = ('boards', 'guesses', 'current', 'finished', 'changed')
+
+    def __init__(self, secrets: Sequence[str]):
+        self.boards: Tuple[GameState, ...] = tuple(GameState(s) for s in secrets)
+        self.guesses: List[str] = []
+        self.current = ''
+        self.finished = False
+        self.changed: Tuple[int, ...] = tuple(range(len(self.boards)))  # boards touched by the last move
+
+    def __repr__(self) -> str:
+        return f"MultiGameState(secrets={self.secrets!r}, guesses={self.guesses!r}, finished={self.finished})"
+
+    @property
+    def cols(self) -> int:
+        return self.boards[0].cols
+
+    @property
+    def secrets(self) -> List[str]:
+        return [b.secret for b in self.boards]
+
+    @property
+    def tries(self) -> int:
+        return len(self.guesses)
+
+    @property
+    def solved(self) -> int:
+        return sum(b.won for b in self.boards)
+
+    @property
+    def won(self) -> bool:
+        return all(b.won for b in self.boards)
+
+    def key_status(self) -> Dict[str, str]:
+        """Best status per keyboard letter over every board."""
+        best = bytearray(b'\xff') * 26
+        for board in self.boards:
+            k = board.knowledge
+            for l, d in enumerate(k.best):
+                if d != 255 and (best[l] == 255 or d > best[l]):
+                    best[l] = d
+        return {chr(65 + l): ('' if d == 255 else STATUSES[d]) for l, d in enumerate(best)}
+
+
+class MultiEngine(GameEngine):
+    """Applies guesses to :class:`MultiGameState` objects.
+
+    ``matrix`` (a :class:`~musicwordle.scoring.PatternMatrix` over the
+    answers) makes each submit one row lookup; without it each unsolved
+    board is scored directly. Hard mode is not applied across boards.
+    """
+
+    __slots__ = ()
+
+    def new_game(self, seed_str: str, boards: int = 4) -> MultiGameState:
+        return MultiGameState(pick_secrets(self.answers, seed_str, boards))
+
+    def max_rows(self, state: MultiGameState) -> int:
+        return self.rows or rows_for_boards(len(state.boards), state.cols)
+
+    def submit(self, state: MultiGameState, guess: Optional[str] = None, validate: bool = True) -> str:
+        """Play ``guess`` (default: the typing buffer) on every unsolved board."""
+        if state.finished:
+            return FINISHED
+        g = state.current if guess is None else guess
+        if validate:
+            if len(g) != state.cols:
+                return SHORT
+            if self.allowed is not None and g not in self.allowed:
+                return UNKNOWN
+        live = [i for i, b in enumerate(state.boards) if not b.finished]
+        secrets = [state.boards[i].secret for i in live]
+        # One batched call for all boards
+        codes = (self.matrix.codes(g, secrets) if self.matrix is not None
+                 else [score_code(g, s) for s in secrets])
+        raw = g.encode('ascii')
+        for i, code in zip(live, codes):
+            board = state.boards[i]
+            board.guesses += raw
+            board.codes.append(code)
+            board.finished = g == board.secret
+        state.guesses.append(g)
+        state.current = ''
+        state.changed = tuple(live)
+        if all(b.finished for b in state.boards):
+            state.finished = True
+            return WON
+        if state.tries >= self.max_rows(state):
+            state.finished = True
+            return LOST
+        return CONTINUE
+
+    def play(self, secrets: Sequence[str], guesses) -> MultiGameState:
+        """Run a whole game without validation (simulations, replays)."""
+        state = MultiGameState(secrets)
+        for g in guesses:
+            if self.submit(state, g, validate=False) != CONTINUE:
+                break
+        return state
+
+
+def describe_multi(outcome: str, state: MultiGameState) -> str:
+    """Player-facing message for a multi-board submit outcome."""
+    if outcome == SHORT:
+        return 'Not enough letters'
+    if outcome == UNKNOWN:
+        return 'Not in dictionary'
+    n = len(state.boards)
+    if outcome == WON:
+        return f"Bravo! All {n} boards solved in {state.tries} tries."
+    if outcome == LOST:
+        missed = ', '.join(b.secret.upper() for b in state.boards if not b.won)
+        return f"Out of guesses — {state.solved}/{n} solved. Missed: {missed}."
+    if outcome == CONTINUE and state.solved:
+        return f"{state.solved}/{n} boards solved."
+    return ''
+
+
+def build_multi_summary(state: MultiGameState, daily: bool, seed_str: str, rows: int) -> List[str]:
+    """Title, score and one keycap per board (tries to solve, 🟥 if missed), two boards a line."""
+    n = len(state.boards)
+    title = f"Music Wordle ×{n} — {'Daily' if daily else 'Seeded'} {seed_str}"
+    if state.cols != COLS:
+        title += f" ({state.cols} letters)"
+    header = f"Solved {state.solved}/{n} · Guesses: {state.tries}/{rows}"
+    marks = [''.join(KEYCAPS[int(d)] for d in str(b.tries)) if b.won else '🟥' for b in state.boards]
+    return [title, header, *(' '.join(marks[i:i + 2]) for i in range(0, n, 2))]
@@ -0,0 +1,223 @@
+"""Compact binary dictionary artifact (``.mwd``) with memory-mapped lookups.
+
+Layout (little-endian)::
+
+    header   32 bytes  magic 'MWDC', version u16, word length u8, flags u8,
+                       allowed count u32, answers count u32, CRC-32 of payload
+    allowed  u32 * n   base-26 packed words, sorted ascending (answers included)
+    answers  u32 * m   base-26 packed answers, in curated order
+
+Packing is order preserving (``aaaaa`` < ``aaaab`` ...), so lookups are a
+binary search straight over the mapped file with no parsing at all.
+
+It is one of the outputs of the dictionary build (``python -m
+musicwordle.build``); to rebuild only this file::
+
+    python -m musicwordle.packed build
+"""
+import argparse
+import bisect
+import mmap
+import struct
+import sys
+import time
+import zlib
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .config import ANSWERS, COLS
+
+MAGIC = b'MWDC'
+VERSION = 1
+HEADER = struct.Struct('<4sHBBIII12x')
+DEFAULT_PATH = Path(__file__).resolve().parent / 'data' / 'words.mwd'
+
+
+class PackedFormatError(ValueError):
+    """Raised when a ``.mwd`` file is truncated, corrupt or of another version."""
+
+
+# a..z -> base-26 digits 0..9a..p, so int(..., 26) packs in C
+_TO_DIGITS = str.maketrans('abcdefghijklmnopqrstuvwxyz', '0123456789abcdefghijklmnop')
+
+
+def pack_word(word: str) -> int:
+    return int(word.translate(_TO_DIGITS), 26)
+
+
+def unpack_word(code: int, length: int = COLS) -> str:
+    out = [''] * length
+    for i in range(length - 1, -1, -1):
+        code, rem = divmod(code, 26)
+        out[i] = chr(97 + rem)
+    return ''.join(out)
+
+
+def encode(allowed: Iterable[str], answers: Sequence[str], length: int = COLS) -> bytes:
+    """Serialise a dictionary; ``answers`` are also added to the allowed set."""
+    answers = [w for w in answers if len(w) == length]
+    words = {w for w in allowed if len(w) == length and w.isascii() and w.isalpha() and w.islower()}
+    words.update(answers)
+    body = array('I', sorted(pack_word(w) for w in words))
+    tail = array('I', (pack_word(w) for w in answers))
+    if sys.byteorder != 'little':
+        body.byteswap()
+        tail.byteswap()
+    payload = body.tobytes() + tail.tobytes()
+    header = HEADER.pack(MAGIC, VERSION, length, 0, len(body), len(tail), zlib.crc32(payload))
+    return header + payload
+
+
+def build(source: Optional[Path] = None, out: Path = DEFAULT_PATH) -> Path:
+    """Build the artifact from the canonical ``data/allowed.txt`` and ``ANSWERS``."""
+    from .dictionary import load_bundled_words
+
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    data = encode(load_bundled_words(source), ANSWERS)
+    tmp = out.with_suffix(out.suffix + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(out)
+    return out
+
+
+def _u32_view(buf, offset: int, count: int) -> Sequence[int]:
+    if sys.byteorder == 'little':
+        return memoryview(buf)[offset:offset + 4 * count].cast('I')
+    arr = array('I', bytes(buf[offset:offset + 4 * count]))
+    arr.byteswap()
+    return arr
+
+
+class PackedWordList:
+    """Read-only, memory-mapped word list with the same protocol as ``WordList``."""
+
+    __slots__ = ('path', 'length', '_mm', '_codes', '_answers', '_ordered', '_members',
+                 'source', 'load_seconds')
+
+    def __init__(self, path: Path = DEFAULT_PATH, verify: bool = True):
+        start = time.perf_counter()
+        self.path = Path(path)
+        with open(self.path, 'rb') as fh:
+            try:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise PackedFormatError(f"{self.path}: empty file") from exc
+        if len(mm) < HEADER.size:
+            mm.close()
+            raise PackedFormatError(f"{self.path}: truncated header")
+        magic, version, length, _flags, n_allowed, n_answers, crc = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            mm.close()
+            raise PackedFormatError(f"{self.path}: not a version {VERSION} dictionary")
+        end = HEADER.size + 4 * (n_allowed + n_answers)
+        if len(mm) != end:
+            mm.close()
+            raise PackedFormatError(f"{self.path}: size mismatch")
+        if verify and zlib.crc32(memoryview(mm)[HEADER.size:]) != crc:
+            mm.close()
+            raise PackedFormatError(f"{self.path}: checksum mismatch")
+        self._mm = mm
+        self.length = length
+        self._codes = _u32_view(mm, HEADER.size, n_allowed)
+        self._answers = _u32_view(mm, HEADER.size + 4 * n_allowed, n_answers)
+        self._ordered: Optional[Tuple[str, ...]] = None
+        self._members: Optional[frozenset] = None
+        self.source = f"packed:{self.path.name}"
+        self.load_seconds = time.perf_counter() - start
+
+    def __contains__(self, word) -> bool:
+        if not isinstance(word, str) or len(word) != self.length or not word.isascii() \
+                or not word.isalpha() or not word.islower():
+            return False
+        code = int(word.translate(_TO_DIGITS), 26)
+        i = bisect.bisect_left(self._codes, code)
+        return i < len(self._codes) and self._codes[i] == code
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ordered)
+
+    def __repr__(self) -> str:
+        return f"PackedWordList({len(self)} words, path={str(self.path)!r})"
+
+    def close(self) -> None:
+        for view in (self._codes, self._answers):
+            if isinstance(view, memoryview):
+                view.release()
+        self._mm.close()
+
+    def __enter__(self) -> 'PackedWordList':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def codes(self) -> Sequence[int]:
+        """Sorted packed codes, as a zero-copy view over the mapped file."""
+        return self._codes
+
+    @property
+    def answers(self) -> List[str]:
+        return [unpack_word(c, self.length) for c in self._answers]
+
+    @property
+    def members(self) -> frozenset:
+        if self._members is None:
+            self._members = frozenset(self.ordered)
+        return self._members
+
+    @property
+    def ordered(self) -> Tuple[str, ...]:
+        if self._ordered is None:
+            self._ordered = tuple(unpack_word(c, self.length) for c in self._codes)
+        return self._ordered
+
+    @property
+    def nbytes(self) -> int:
+        """Mapped file size; pages are shared by the OS page cache."""
+        return len(self._mm)
+
+
+def open_packed(path: Path = DEFAULT_PATH) -> Optional[PackedWordList]:
+    """Open the artifact if it exists and is valid, else return ``None``."""
+    try:
+        return PackedWordList(path)
+    except (OSError, PackedFormatError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.packed', description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p_build = sub.add_parser('build', help='build the artifact from data/allowed.txt')
+    p_build.add_argument('--source', type=Path, default=None)
+    p_build.add_argument('--out', type=Path, default=DEFAULT_PATH)
+    p_info = sub.add_parser('info', help='print header information')
+    p_info.add_argument('path', type=Path, nargs='?', default=DEFAULT_PATH)
+    p_look = sub.add_parser('lookup', help='check words against the artifact')
+    p_look.add_argument('words', nargs='+')
+    p_look.add_argument('--path', type=Path, default=DEFAULT_PATH)
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'build':
+        out = build(args.source, args.out)
+        words = PackedWordList(out)
+        print(f"wrote {out} ({words.nbytes} bytes, {len(words)} words, {len(words.answers)} answers)")
+    elif args.cmd == 'info':
+        words = PackedWordList(args.path)
+        print(f"{args.path}: v{VERSION}, length {words.length}, {len(words)} words, "
+              f"{len(words.answers)} answers, {words.nbytes} bytes, opened in {words.load_seconds * 1000:.3f} ms")
+    else:
+        words = PackedWordList(args.path)
+        for w in args.words:
+            print(f"{w}\t{'yes' if w.lower() in words else 'no'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
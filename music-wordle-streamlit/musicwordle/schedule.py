@@ -0,0 +1,256 @@
+"""Precomputed daily puzzle calendar.
+
+Daily secrets are generated ahead of time from a master seed as a sequence
+of shuffled, no-repeat cycles over the answer list: every answer is used
+once before any answer comes back, and the first quarter of a cycle avoids
+the words that ended the previous one. The calendar is stored in a small
+indexed file (``.mws``, little-endian)::
+
+    header   32 bytes  magic 'MWSC', version u16, word length u8, pad u8,
+                       epoch (proleptic ordinal) u32, answers u16, days u32,
+                       CRC-32 of the payload
+    answers  n * length ASCII bytes, the answer list the calendar was built from
+    days     u16 * d   answer index for epoch + i days
+    offsets  u32 * (n + 1)  CSR offsets into ``uses`` per answer
+    uses     u32 * d   day numbers grouped by answer, ascending
+
+so both "secret for date D" and "which dates used word W" are O(1) slices.
+The same calendar is exported for the static site (``schedule.js``)::
+
+    python -m musicwordle.schedule build
+    python -m musicwordle.schedule export-js
+"""
+import argparse
+import base64
+import datetime
+import hashlib
+import json
+import random
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .config import ANSWERS, COLS
+
+MAGIC = b'MWSC'
+VERSION = 1
+HEADER = struct.Struct('<4sHBxIHII10x')
+MASTER_SEED = 'music-wordle'
+EPOCH = datetime.date(2025, 1, 1)
+YEARS = 10
+DEFAULT_PATH = Path(__file__).resolve().parent / 'data' / 'schedule.mws'
+JS_PATH = Path(__file__).resolve().parents[2] / 'music-wordle' / 'schedule.js'
+
+
+class ScheduleFormatError(ValueError):
+    """Raised when a ``.mws`` file is truncated, corrupt or of another version."""
+
+
+def _le(arr: array) -> bytes:
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(typecode: str, data) -> array:
+    arr = array(typecode)
+    arr.frombytes(data)
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr
+
+
+def generate(answers: Sequence[str], days: int, master_seed: str = MASTER_SEED) -> List[int]:
+    """Answer indices for ``days`` consecutive days, in no-repeat cycles.
+
+    Where two cycles meet, the first quarter of the new cycle avoids the last
+    quarter of the old one, so a word never comes back within about a quarter
+    cycle (``len(answers) // 4 + 1`` days).
+    """
+    out: List[int] = []
+    keep_apart = len(answers) // 4
+    cycle = 0
+    while len(out) < days:
+        order = list(range(len(answers)))
+        h = int(hashlib.sha256(f"{master_seed}:{cycle}".encode()).hexdigest(), 16)
+        random.Random(h).shuffle(order)
+        if out and keep_apart:
+            # The new cycle's first words must not be among the last ones played
+            recent = set(out[-keep_apart:])
+            head = [i for i in order if i not in recent][:keep_apart]
+            order = head + [i for i in order if i not in set(head)]
+        elif out and len(order) > 1 and order[0] == out[-1]:
+            order[0], order[1] = order[1], order[0]
+        out.extend(order)
+        cycle += 1
+    return out[:days]
+
+
+def encode(answers: Sequence[str], day_index: Sequence[int], epoch: datetime.date = EPOCH) -> bytes:
+    length = len(answers[0]) if answers else COLS
+    buckets: List[List[int]] = [[] for _ in answers]
+    for day, idx in enumerate(day_index):
+        buckets[idx].append(day)
+    offsets = array('I', [0])
+    uses = array('I')
+    for b in buckets:
+        uses.extend(b)
+        offsets.append(len(uses))
+    payload = (''.join(answers).encode('ascii') + _le(array('H', day_index)) + _le(offsets) + _le(uses))
+    header = HEADER.pack(MAGIC, VERSION, length, epoch.toordinal(), len(answers), len(day_index), zlib.crc32(payload))
+    return header + payload
+
+
+def build(answers: Sequence[str] = ANSWERS, out: Path = DEFAULT_PATH, master_seed: str = MASTER_SEED,
+          epoch: datetime.date = EPOCH, years: int = YEARS) -> Path:
+    answers = [w for w in answers if len(w) == COLS]
+    days = (datetime.date(epoch.year + years, epoch.month, epoch.day) - epoch).days
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out.with_suffix(out.suffix + '.tmp')
+    tmp.write_bytes(encode(answers, generate(answers, days, master_seed), epoch))
+    tmp.replace(out)
+    return out
+
+
+class Schedule:
+    """Loaded calendar with O(1) lookups in both directions."""
+
+    __slots__ = ('epoch', 'answers', 'index', 'days', '_offsets', '_uses')
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise ScheduleFormatError('truncated header')
+        magic, version, length, epoch, n, d, crc = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ScheduleFormatError(f"not a version {VERSION} schedule")
+        payload = memoryview(data)[HEADER.size:]
+        if len(payload) != n * length + 2 * d + 4 * (n + 1) + 4 * d or zlib.crc32(payload) != crc:
+            raise ScheduleFormatError('size or checksum mismatch')
+        pos = n * length
+        words = bytes(payload[:pos]).decode('ascii')
+        self.epoch = datetime.date.fromordinal(epoch)
+        self.answers = tuple(words[i:i + length] for i in range(0, pos, length))
+        self.index = {w: i for i, w in enumerate(self.answers)}
+        self.days = _from_le('H', payload[pos:pos + 2 * d])
+        pos += 2 * d
+        self._offsets = _from_le('I', payload[pos:pos + 4 * (n + 1)])
+        pos += 4 * (n + 1)
+        self._uses = _from_le('I', payload[pos:])
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_PATH) -> 'Schedule':
+        return cls(Path(path).read_bytes())
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def last_day(self) -> datetime.date:
+        return self.epoch + datetime.timedelta(days=len(self.days) - 1)
+
+    def secret_for(self, day: datetime.date) -> Optional[str]:
+        """Scheduled secret for ``day``, or ``None`` outside the calendar."""
+        i = day.toordinal() - self.epoch.toordinal()
+        if 0 <= i < len(self.days):
+            return self.answers[self.days[i]]
+        return None
+
+    def dates_for(self, word: str) -> List[datetime.date]:
+        """Every scheduled date for ``word`` (ascending)."""
+        i = self.index.get(word)
+        if i is None:
+            return []
+        start = self.epoch.toordinal()
+        return [datetime.date.fromordinal(start + d) for d in self._uses[self._offsets[i]:self._offsets[i + 1]]]
+
+    def to_js(self) -> str:
+        """``schedule.js`` for the static client (see ``game.js``)."""
+        data = {
+            'epoch': self.epoch.isoformat(),
+            'answers': list(self.answers),
+            'days': base64.b64encode(_le(self.days)).decode('ascii'),
+        }
+        return ('// Auto-generated by python -m musicwordle.schedule export-js\n'
+                f"window.MUSIC_WORDLE_SCHEDULE = {json.dumps(data)};\n")
+
+
+_shared: Optional[Schedule] = None
+_shared_lock = threading.Lock()
+_missing = False
+
+
+def shared_schedule() -> Optional[Schedule]:
+    """The bundled calendar, loaded once per process (``None`` if unavailable)."""
+    global _shared, _missing
+    if _shared is None and not _missing:
+        with _shared_lock:
+            if _shared is None and not _missing:
+                try:
+                    sched = Schedule.load()
+                except (OSError, ScheduleFormatError):
+                    sched = None
+                # A stale calendar (answers edited without a rebuild) is ignored
+                if sched is None or not _built_from(sched, ANSWERS):
+                    _missing = True
+                else:
+                    _shared = sched
+    return _shared
+
+
+def _built_from(sched: Schedule, answers: Sequence[str]) -> bool:
+    return sched.answers == tuple(w for w in answers if len(w) == COLS)
+
+
+def daily_secret(day: datetime.date, answers: Sequence[str] = ANSWERS) -> str:
+    """Scheduled secret for ``day``, falling back to ``seeded_choice`` on the date.
+
+    The calendar is only used when it was built from ``answers``.
+    """
+    sched = shared_schedule()
+    secret = sched.secret_for(day) if sched is not None and _built_from(sched, answers) else None
+    if secret is None:
+        from .engine import seeded_choice
+
+        secret = seeded_choice(list(answers), day.isoformat())
+    return secret
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.schedule', description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p_build = sub.add_parser('build', help='generate the calendar file')
+    p_build.add_argument('--seed', default=MASTER_SEED)
+    p_build.add_argument('--epoch', type=datetime.date.fromisoformat, default=EPOCH)
+    p_build.add_argument('--years', type=int, default=YEARS)
+    p_build.add_argument('--out', type=Path, default=DEFAULT_PATH)
+    p_js = sub.add_parser('export-js', help='write schedule.js for the static site')
+    p_js.add_argument('--out', type=Path, default=JS_PATH)
+    p_secret = sub.add_parser('secret', help='secret for a date')
+    p_secret.add_argument('date', type=datetime.date.fromisoformat)
+    p_dates = sub.add_parser('dates', help='dates a word is scheduled')
+    p_dates.add_argument('word')
+    args = parser.parse_args(argv)
+
+    if args.cmd == 'build':
+        out = build(out=args.out, master_seed=args.seed, epoch=args.epoch, years=args.years)
+        sched = Schedule.load(out)
+        print(f"wrote {out}: {len(sched)} days from {sched.epoch} to {sched.last_day}, {len(sched.answers)} answers")
+    elif args.cmd == 'export-js':
+        args.out.write_text(Schedule.load().to_js(), encoding='utf-8')
+        print(f"wrote {args.out}")
+    elif args.cmd == 'secret':
+        print(Schedule.load().secret_for(args.date) or '(outside calendar)')
+    else:
+        for day in Schedule.load().dates_for(args.word.lower()):
+            print(day.isoformat())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
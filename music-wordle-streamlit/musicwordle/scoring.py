@@ -0,0 +1,315 @@
+"""Wordle scoring: the reference implementation plus a table-driven engine.
+
+Feedback patterns are encoded as base-3 integers, position 0 most
+significant, with ``absent=0``, ``present=1``, ``correct=2``; a 5-letter
+pattern fits in 0..242 (``uint8``), longer words take two bytes (``3 ** 8``
+is 6561). :class:`PatternMatrix` precomputes the pattern for every guess x
+answer pair with NumPy when it is installed, and falls back to computing
+rows lazily in pure Python when it is not. Matrices are per word length and
+:func:`shared_matrix` only builds one when a game of that length needs it.
+
+Benchmark against the reference ``score_guess`` with::
+
+    python -m musicwordle.scoring
+"""
+import argparse
+import sys
+import threading
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .config import ANSWERS, COLS, answers_for
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+STATUSES = ('absent', 'present', 'correct')
+DIGIT = {'absent': 0, 'present': 1, 'correct': 2}
+ALL_CORRECT = 3 ** COLS - 1
+
+
+def pattern_width(length: int) -> int:
+    """Bytes per pattern code at ``length`` letters: 1 up to five, else 2."""
+    return 1 if 3 ** length <= 256 else 2
+
+
+def code_array(length: int, data: bytes = b''):
+    """Growable per-row codes: ``bytearray``, or ``array('H')`` above five letters.
+
+    ``data`` is a previous :func:`code_bytes` result for the same length.
+    """
+    if pattern_width(length) == 1:
+        return bytearray(data)
+    codes = array('H')
+    codes.frombytes(data)
+    if sys.byteorder == 'big':
+        codes.byteswap()
+    return codes
+
+
+def code_bytes(codes) -> bytes:
+    """Codes from :func:`code_array` as bytes (two-byte codes little-endian)."""
+    if isinstance(codes, array) and sys.byteorder == 'big':
+        codes = array('H', codes)
+        codes.byteswap()
+    return bytes(codes)
+
+
+def score_guess(guess: str, answer: str) -> List[str]:
+    """Wordle scoring with duplicate handling.
+    Returns a list with values in {'correct','present','absent'}.
+    """
+    n = len(answer)
+    res = ['absent'] * n
+    a = list(answer)
+    g = list(guess)
+
+    counts = {}
+    for i in range(n):
+        if g[i] == a[i]:
+            res[i] = 'correct'
+        else:
+            counts[a[i]] = counts.get(a[i], 0) + 1
+    for i in range(n):
+        if res[i] == 'correct':
+            continue
+        ch = g[i]
+        if counts.get(ch, 0) > 0:
+            res[i] = 'present'
+            counts[ch] -= 1
+    return res
+
+
+def encode_pattern(statuses: Iterable[str]) -> int:
+    code = 0
+    for s in statuses:
+        code = code * 3 + DIGIT[s]
+    return code
+
+
+def decode_pattern(code: int, length: int = COLS) -> List[str]:
+    out = ['absent'] * length
+    for i in range(length - 1, -1, -1):
+        code, digit = divmod(code, 3)
+        out[i] = STATUSES[digit]
+    return out
+
+
+def score_code(guess: str, answer: str) -> int:
+    """Same rules as :func:`score_guess`, returning the base-3 pattern code."""
+    n = len(answer)
+    digits = [0] * n
+    counts: Dict[str, int] = {}
+    for i in range(n):
+        if guess[i] == answer[i]:
+            digits[i] = 2
+        else:
+            ch = answer[i]
+            counts[ch] = counts.get(ch, 0) + 1
+    code = 0
+    for i in range(n):
+        d = digits[i]
+        if not d:
+            ch = guess[i]
+            left = counts.get(ch, 0)
+            if left:
+                d = 1
+                counts[ch] = left - 1
+        code = code * 3 + d
+    return code
+
+
+def _letters(words: Sequence[str]):
+    buf = ''.join(words).encode('ascii')
+    return np.frombuffer(buf, dtype=np.uint8).reshape(len(words), -1) - 97
+
+
+def score_matrix_numpy(guesses: Sequence[str], answers: Sequence[str], chunk: int = 2048):
+    """Vectorised pattern codes for every guess x answer pair (``uint8``, ``uint16`` above 5 letters)."""
+    if np is None:
+        raise RuntimeError('NumPy is not installed')
+    a = _letters(answers)
+    length = a.shape[1]
+    weights = [3 ** (length - 1 - i) for i in range(length)]
+    out = np.empty((len(guesses), len(answers)), dtype=np.uint8 if pattern_width(length) == 1 else np.uint16)
+    for start in range(0, len(guesses), chunk):
+        g = _letters(guesses[start:start + chunk])
+        green = g[:, None, :] == a[None, :, :]
+        present = np.zeros_like(green)
+        code = np.zeros(green.shape[:2], dtype=np.int16)
+        for i in range(length):
+            gi = g[:, i][:, None]
+            # Unmatched copies of this letter in the answer...
+            avail = np.zeros(green.shape[:2], dtype=np.int8)
+            for j in range(length):
+                avail += (a[None, :, j] == gi) & ~green[:, :, j]
+            # ...minus those already claimed by earlier yellows of the same letter
+            for k in range(i):
+                avail -= (g[:, k] == g[:, i])[:, None] & present[:, :, k]
+            present[:, :, i] = ~green[:, :, i] & (avail > 0)
+            code += weights[i] * (2 * green[:, :, i] + present[:, :, i])
+        out[start:start + len(g)] = code
+    return out
+
+
+class PatternMatrix:
+    """Pattern codes for ``guesses`` x ``answers`` (all one word length).
+
+    With NumPy the whole table is built up front as a ``uint8`` array
+    (``uint16`` for words longer than five letters); without it, each guess
+    row is scored on first use and kept as ``bytes`` (``array('H')``).
+    Rows and columns come back as ``numpy.ndarray`` or ``bytes`` respectively,
+    both indexable by answer position.
+    """
+
+    def __init__(self, guesses: Sequence[str], answers: Sequence[str] = ANSWERS, use_numpy: Optional[bool] = None):
+        start = time.perf_counter()
+        self.guesses = tuple(guesses)
+        self.answers = tuple(answers)
+        self.length = len(self.answers[0]) if self.answers else COLS
+        self.n_patterns = 3 ** self.length
+        self.guess_index = {w: i for i, w in enumerate(self.guesses)}
+        self.answer_index = {w: i for i, w in enumerate(self.answers)}
+        self.use_numpy = (np is not None) if use_numpy is None else (use_numpy and np is not None)
+        self._wide = pattern_width(self.length) == 2
+        self._rows: Dict[int, bytes] = {}
+        self.table = score_matrix_numpy(self.guesses, self.answers) if self.use_numpy else None
+        self.build_seconds = time.perf_counter() - start
+
+    @property
+    def nbytes(self) -> int:
+        if self.table is not None:
+            return int(self.table.nbytes)
+        return sum(sys.getsizeof(r) for r in self._rows.values())
+
+    def _codes(self, codes: Iterable[int]):
+        return array('H', codes) if self._wide else bytes(codes)
+
+    def _as_array(self, codes):
+        return np.frombuffer(codes, dtype=np.uint16 if self._wide else np.uint8)
+
+    def _score_row(self, guess: str) -> bytes:
+        return self._codes(score_code(guess, a) for a in self.answers)
+
+    def row(self, guess: str):
+        """Codes for ``guess`` against every answer (batched one-to-many)."""
+        i = self.guess_index.get(guess)
+        if i is None:
+            row = self._score_row(guess)
+            return self._as_array(row) if self.use_numpy else row
+        if self.table is not None:
+            return self.table[i]
+        row = self._rows.get(i)
+        if row is None:
+            row = self._rows[i] = self._score_row(guess)
+        return row
+
+    def column(self, answer: str, guesses: Optional[Sequence[str]] = None):
+        """Codes for many ``guesses`` (default: all) against one answer."""
+        j = self.answer_index.get(answer)
+        if guesses is None:
+            guesses = self.guesses
+        if j is None:
+            col = self._codes(score_code(g, answer) for g in guesses)
+            return self._as_array(col) if self.use_numpy else col
+        if self.table is not None:
+            if guesses is self.guesses:
+                return self.table[:, j]
+            idx = [self.guess_index.get(g, -1) for g in guesses]
+            if min(idx, default=0) >= 0:
+                return self.table[idx, j]
+        col = self._codes(self.code(g, answer) for g in guesses)
+        return self._as_array(col) if self.use_numpy else col
+
+    def codes(self, guess: str, answers: Sequence[str]) -> List[int]:
+        """Codes for ``guess`` against several answers in one call: a single
+        row lookup (multi-board games), not one scoring pass per answer."""
+        idx = [self.answer_index.get(a, -1) for a in answers]
+        if guess not in self.guess_index or min(idx, default=0) < 0:
+            return [score_code(guess, a) for a in answers]
+        row = self.row(guess)
+        if self.table is not None:
+            return row[idx].tolist()
+        return [row[j] for j in idx]
+
+    def code(self, guess: str, answer: str) -> int:
+        i = self.guess_index.get(guess)
+        j = self.answer_index.get(answer)
+        if i is None or j is None:
+            return score_code(guess, answer)
+        if self.table is not None:
+            return int(self.table[i, j])
+        return self.row(guess)[j]
+
+
+_shared: Dict[int, PatternMatrix] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_matrix(length: int = COLS) -> PatternMatrix:
+    """Pattern matrix for the shared ``length``-letter dictionary x answers, built on first use."""
+    matrix = _shared.get(length)
+    if matrix is None:
+        with _shared_lock:
+            matrix = _shared.get(length)
+            if matrix is None:
+                from .dictionary import shared_dictionary
+
+                matrix = _shared[length] = PatternMatrix(shared_dictionary(length).ordered, answers_for(length))
+    return matrix
+
+
+def _per_call(fn, pairs, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for g, a in pairs:
+            fn(g, a)
+    return (time.perf_counter() - start) / (repeat * len(pairs))
+
+
+def benchmark(repeat: int = 3) -> Dict[str, float]:
+    """Compare the reference scorer with the encoded and table-driven paths."""
+    from .dictionary import shared_dictionary
+
+    guesses = shared_dictionary().ordered
+    answers = [w for w in ANSWERS if len(w) == COLS]
+    pairs = [(guesses[(i * 97) % len(guesses)], answers[i % len(answers)]) for i in range(2000)]
+    m = PatternMatrix(guesses, answers)
+    start = time.perf_counter()
+    for g in guesses[:200]:
+        m._score_row(g)
+    cold_row_s = (time.perf_counter() - start) / 200
+    if not m.use_numpy:
+        for g in guesses:
+            m.row(g)
+    start = time.perf_counter()
+    for g in guesses[:200]:
+        m.row(g)
+    row_s = (time.perf_counter() - start) / 200
+    return {
+        'numpy': float(m.use_numpy),
+        'build_seconds': m.build_seconds,
+        'matrix_bytes': float(m.nbytes),
+        'score_guess_us': _per_call(score_guess, pairs, repeat) * 1e6,
+        'score_code_us': _per_call(score_code, pairs, repeat) * 1e6,
+        'matrix_code_us': _per_call(m.code, pairs, repeat) * 1e6,
+        'matrix_row_us': row_s * 1e6,
+        'python_row_us': cold_row_s * 1e6,
+        'row_vs_score_guess_speedup': _per_call(score_guess, pairs, 1) * len(answers) / max(row_s, 1e-12),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.scoring', description='Benchmark the scoring engines.')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+    for key, value in benchmark(args.repeat).items():
+        print(f"{key:28} {value:,.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Standalone asyncio JSON game API.
+
+A Streamlit session costs a websocket plus a full script rerun per
+keystroke. This server plays the same games over plain HTTP/1.1 with
+keep-alive, using only the standard library: one event loop, one shared
+dictionary and :class:`~musicwordle.engine.GameEngine`, and games held as
+compact :class:`~musicwordle.engine.GameState` objects in a TTL store.
+Typing happens client side; the server only sees whole guesses.
+
+Endpoints (JSON in and out, CORS enabled for the static site)::
+
+    POST /api/new    {"daily": true, "date": "2025-06-01"} or {"seed": "abc"}
+    POST /api/guess  {"id": "...", "guess": "piano"}  (unknown words get "suggestions")
+    GET  /api/state?id=...
+    GET  /api/share?id=...   (text and an SVG card, cached per distinct result)
+    GET  /healthz
+
+Daily games follow the precomputed calendar (a client may ask for
+yesterday's or tomorrow's date to allow for time zones, no further). The
+secret is only revealed once a game is finished. Run with::
+
+    python -m musicwordle.server --port 8765
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import secrets
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .config import ANSWERS, COLS, ROWS
+from .engine import (
+    CONTINUE, LOST, SHORT, UNKNOWN, WON, GameEngine, GameState, describe, seeded_choice,
+)
+from .scoring import decode_pattern
+from .share import share_card
+from .spelling import did_you_mean
+
+DEFAULT_TTL = 6 * 3600
+MAX_GAMES = 200_000
+MAX_BODY = 4096
+MAX_HEADER = 8192
+
+_REASONS = {200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            409: 'Conflict', 413: 'Payload Too Large', 500: 'Internal Server Error'}
+_CORS = (b'Access-Control-Allow-Origin: *\r\n'
+         b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+         b'Access-Control-Allow-Headers: Content-Type\r\n')
+
+
+class _Entry:
+    __slots__ = ('state', 'seed', 'daily', 'expires')
+
+    def __init__(self, state: GameState, seed: str, daily: bool, expires: float):
+        self.state = state
+        self.seed = seed
+        self.daily = daily
+        self.expires = expires
+
+
+class GameStore:
+    """Games by id, evicted ``ttl`` seconds after their last use.
+
+    Entries are kept in last-use order, so expired games are always at the
+    front and each access pops at most the ones that have run out. ``limit``
+    caps the number of live games (oldest evicted first).
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, limit: int = MAX_GAMES, clock=time.monotonic):
+        self.ttl = ttl
+        self.limit = limit
+        self.clock = clock
+        self._games: 'OrderedDict[str, _Entry]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def _evict(self, now: float) -> None:
+        games = self._games
+        while games:
+            entry = next(iter(games.values()))
+            if entry.expires > now and len(games) <= self.limit:
+                break
+            games.popitem(last=False)
+
+    def add(self, state: GameState, seed: str, daily: bool) -> str:
+        now = self.clock()
+        game_id = secrets.token_urlsafe(12)
+        self._games[game_id] = _Entry(state, seed, daily, now + self.ttl)
+        self._evict(now)
+        return game_id
+
+    def get(self, game_id: str) -> Optional[_Entry]:
+        now = self.clock()
+        self._evict(now)
+        entry = self._games.get(game_id)
+        if entry is not None:
+            entry.expires = now + self.ttl
+            self._games.move_to_end(game_id)
+        return entry
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class GameAPI:
+    """Request handlers, independent of the HTTP layer."""
+
+    def __init__(self, engine: Optional[GameEngine] = None, store: Optional[GameStore] = None, today=None):
+        if engine is None:
+            from .dictionary import shared_dictionary
+
+            engine = GameEngine(shared_dictionary(), [w for w in ANSWERS if len(w) == COLS], rows=ROWS)
+        self.engine = engine
+        self.store = store or GameStore()
+        self.today = today or (lambda: datetime.datetime.utcnow().date())
+
+    def _entry(self, game_id) -> _Entry:
+        entry = self.store.get(game_id) if isinstance(game_id, str) else None
+        if entry is None:
+            raise ApiError(404, 'unknown or expired game')
+        return entry
+
+    def _view(self, game_id: str, entry: _Entry) -> dict:
+        state = entry.state
+        view = {
+            'id': game_id, 'daily': entry.daily, 'seed': entry.seed, 'rows': self.engine.rows, 'cols': state.cols,
+            'guesses': state.guess_words, 'statuses': state.status_rows,
+            'finished': state.finished, 'won': state.won,
+        }
+        if state.finished:
+            view['answer'] = state.secret
+        return view
+
+    def new_game(self, payload: dict) -> dict:
+        if payload.get('daily', True) and 'seed' not in payload:
+            today = self.today()
+            try:
+                day = datetime.date.fromisoformat(payload.get('date') or today.isoformat())
+            except (TypeError, ValueError):
+                raise ApiError(400, 'date must be YYYY-MM-DD') from None
+            if abs((day - today).days) > 1:
+                raise ApiError(400, 'daily games are only available for today')
+            from .schedule import daily_secret
+
+            seed, daily = day.isoformat(), True
+            secret = daily_secret(day, self.engine.answers)
+        else:
+            seed = payload.get('seed')
+            if not isinstance(seed, str) or not seed.strip() or len(seed) > 100:
+                raise ApiError(400, 'seed must be a non-empty string')
+            seed, daily = seed.strip(), False
+            secret = seeded_choice(self.engine.answers, seed)
+        state = GameState(secret)
+        game_id = self.store.add(state, seed, daily)
+        return self._view(game_id, self.store.get(game_id))
+
+    def guess(self, payload: dict) -> dict:
+        game_id = payload.get('id')
+        entry = self._entry(game_id)
+        guess = payload.get('guess')
+        if not isinstance(guess, str):
+            raise ApiError(400, 'guess must be a string')
+        state = entry.state
+        if state.finished:
+            raise ApiError(409, 'game is finished')
+        guess = guess.strip().lower()
+        if not (guess.isascii() and guess.isalpha()):
+            outcome = SHORT if len(guess) != state.cols else UNKNOWN
+        else:
+            outcome = self.engine.submit(state, guess)
+        result = {'outcome': outcome, 'message': describe(outcome, state)}
+        if outcome == UNKNOWN and self.engine.allowed is not None:
+            result['suggestions'] = did_you_mean(guess, self.engine.allowed, self.engine.answers)
+        if outcome in (CONTINUE, WON, LOST):
+            result['row'] = state.tries - 1
+            result['statuses'] = decode_pattern(state.codes[-1], state.cols)
+        result.update(finished=state.finished, won=state.won)
+        if state.finished:
+            result['answer'] = state.secret
+        return result
+
+    def state(self, query: Dict[str, List[str]]) -> dict:
+        game_id = (query.get('id') or [None])[0]
+        return self._view(game_id, self._entry(game_id))
+
+    def share(self, query: Dict[str, List[str]]) -> dict:
+        entry = self._entry((query.get('id') or [None])[0])
+        if not entry.state.finished:
+            raise ApiError(409, 'game is not finished')
+        # Players with the same result get the same cached card
+        card = share_card(list(entry.state.codes), entry.daily, entry.seed, rows=self.engine.rows)
+        return {'lines': card.text.split('\n'), 'text': card.text, 'card': card.key, 'svg': card.svg}
+
+    def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Optional[dict]]:
+        """Route one request; returns (status, JSON payload or None)."""
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+        try:
+            if method == 'OPTIONS':
+                return 204, None
+            if path in ('/api/new', '/api/guess'):
+                if method != 'POST':
+                    raise ApiError(405, 'use POST')
+                try:
+                    payload = json.loads(body or b'{}')
+                except ValueError:
+                    raise ApiError(400, 'body must be JSON') from None
+                if not isinstance(payload, dict):
+                    raise ApiError(400, 'body must be a JSON object')
+                return 200, (self.new_game(payload) if path == '/api/new' else self.guess(payload))
+            if path in ('/api/state', '/api/share', '/healthz'):
+                if method != 'GET':
+                    raise ApiError(405, 'use GET')
+                if path == '/healthz':
+                    return 200, {'ok': True, 'games': len(self.store)}
+                query = parse_qs(url.query)
+                return 200, (self.state(query) if path == '/api/state' else self.share(query))
+            raise ApiError(404, 'not found')
+        except ApiError as exc:
+            return exc.status, {'error': str(exc)}
+        except Exception:
+            # A bug in one handler must not drop the connection without a response
+            traceback.print_exc()
+            return 500, {'error': 'internal error'}
+
+
+def _response(status: int, payload: Optional[dict], keep_alive: bool) -> bytes:
+    body = b'' if payload is None else json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode()
+    head = (f'HTTP/1.1 {status} {_REASONS.get(status, "")}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n').encode()
+    if payload is not None:
+        head += b'Content-Type: application/json; charset=utf-8\r\n'
+    return head + _CORS + b'\r\n' + body
+
+
+async def _serve_connection(api: GameAPI, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b'\r\n\r\n')
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                break
+            try:
+                request_line, *header_lines = head[:-4].decode('latin-1').split('\r\n')
+                method, target, version = request_line.split(' ', 2)
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get('content-length') or 0)
+            except ValueError:
+                writer.write(_response(400, {'error': 'malformed request'}, False))
+                break
+            if length > MAX_BODY or length < 0:
+                writer.write(_response(413, {'error': 'request body too large'}, False))
+                break
+            body = await reader.readexactly(length) if length else b''
+            keep_alive = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+            status, payload = api.dispatch(method, target, body)
+            writer.write(_response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start(api: Optional[GameAPI] = None, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+    """Start serving ``api`` (a fresh :class:`GameAPI` by default); port 0 picks a free port."""
+    api = api or GameAPI()
+    return await asyncio.start_server(lambda r, w: _serve_connection(api, r, w), host, port, limit=MAX_HEADER)
+
+
+async def _serve_forever(host: str, port: int, ttl: float) -> None:
+    # Dictionary and calendar are ready before the first request, not built by it
+    from .warmup import enabled, warm_up
+
+    if enabled():
+        warm_up(('dictionary', 'schedule'))
+    server = await start(GameAPI(store=GameStore(ttl)), host, port)
+    bound = server.sockets[0].getsockname()
+    print(f'listening on http://{bound[0]}:{bound[1]}', flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.server', description='Serve the game as a JSON API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765, help='0 picks a free port')
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL, help='seconds an idle game is kept')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve_forever(args.host, args.port, args.ttl))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
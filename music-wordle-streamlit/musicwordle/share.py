@@ -0,0 +1,302 @@
+"""Pre-rendered share cards, cached by content.
+
+A card is everything the finished-game view offers for sharing: the emoji
+text block (:func:`~musicwordle.engine.build_share_summary`), an SVG of
+the tile grid with its title, and a PNG of the grid. Both images are drawn
+in pure Python (the PNG is raw RGB rows through ``zlib``), so no network or
+imaging library is needed.
+
+A card depends only on the seed, the mode and the feedback grid, and a
+puzzle has few distinct grids, so most players who finish the same puzzle
+share the same card. Cards are keyed by a hash of those inputs
+(:func:`card_key`) and kept in a process-wide LRU bounded by bytes. Cards
+evicted from memory spill to a directory (``MUSIC_WORDLE_CARDS_DIR``,
+``~/.music-wordle/cards`` by default, ``off`` for memory only), where a
+later request finds them without rendering again.
+"""
+import hashlib
+import os
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from .config import COLS, ROWS
+from .engine import build_share_summary
+from .scoring import decode_pattern
+
+CACHE_BUDGET_BYTES = 4 * 1024 * 1024
+DISK_LIMIT = 4096  # spilled cards kept on disk; the oldest go first
+TILE = 24
+GAP = 4
+PER_LINE = 4  # boards across, like the app's multi-board view
+
+BACKGROUND = (0x12, 0x12, 0x13)
+COLORS = {
+    'correct': (0x53, 0x8d, 0x4e),
+    'present': (0xb5, 0x9f, 0x3b),
+    'absent': (0x3a, 0x3a, 0x3c),
+    '': (0x1a, 0x1a, 0x1b),  # row not played on this board
+}
+_MAGIC = b'MWC1'
+_HEADER = struct.Struct('<4sIII')
+
+
+@dataclass(frozen=True)
+class ShareCard:
+    key: str
+    text: str
+    svg: str
+    png: bytes
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.text.encode()) + len(self.svg) + len(self.png)
+
+    def to_bytes(self) -> bytes:
+        text, svg = self.text.encode(), self.svg.encode()
+        return _HEADER.pack(_MAGIC, len(text), len(svg), len(self.png)) + text + svg + self.png
+
+    @classmethod
+    def from_bytes(cls, key: str, data: bytes) -> 'ShareCard':
+        magic, n_text, n_svg, n_png = _HEADER.unpack_from(data)
+        if magic != _MAGIC or _HEADER.size + n_text + n_svg + n_png != len(data):
+            raise ValueError('not a share card')
+        text = data[_HEADER.size:_HEADER.size + n_text].decode()
+        start = _HEADER.size + n_text
+        return cls(key, text, data[start:start + n_svg].decode(), bytes(data[start + n_svg:]))
+
+
+Grids = Sequence[Sequence[int]]
+
+
+def card_key(seed_str: str, daily: bool, grids: Grids, rows: int = ROWS, cols: int = COLS) -> str:
+    """Hash of everything a card shows: seed, mode and each board's pattern codes."""
+    boards = '/'.join(','.join(str(int(c)) for c in codes) for codes in grids)
+    raw = f"{'daily' if daily else 'seeded'}|{seed_str}|{rows}|{cols}|{boards}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:24]
+
+
+def _layout(boards: int, cols: int, height: int) -> Tuple[int, int, int, int]:
+    across = min(boards, PER_LINE)
+    down = -(-boards // across)
+    board_w = cols * TILE + (cols - 1) * GAP
+    board_h = height * TILE + (height - 1) * GAP
+    return across, down, board_w, board_h
+
+
+def _statuses(grids: Grids, cols: int) -> List[List[List[str]]]:
+    height = max((len(codes) for codes in grids), default=0) or 1
+    return [[decode_pattern(int(c), cols) for c in codes] + [[''] * cols] * (height - len(codes)) for codes in grids]
+
+
+def render_png(grids: Grids, cols: int = COLS) -> bytes:
+    """The boards' tile grids as an RGB PNG, ``PER_LINE`` boards a line."""
+    boards = _statuses(grids, cols)
+    height = len(boards[0])
+    across, down, board_w, board_h = _layout(len(boards), cols, height)
+    margin = 2 * GAP
+    width = 2 * margin + across * board_w + (across - 1) * TILE
+    px_height = 2 * margin + down * board_h + (down - 1) * TILE
+    bg = bytes(BACKGROUND)
+    blank = b'\x00' + bg * width  # filter byte 0, then the pixels
+    tiles = {status: bytes(rgb) * TILE for status, rgb in COLORS.items()}
+    out = [blank * margin]
+    for line in range(down):
+        line_boards = boards[line * across:(line + 1) * across]
+        for r in range(height):
+            parts = [b'\x00', bg * margin]
+            for b, board in enumerate(line_boards):
+                if b:
+                    parts.append(bg * TILE)
+                parts.append((bg * GAP).join(tiles[s] for s in board[r]))
+            parts.append(bg * (width - margin - len(line_boards) * board_w - (len(line_boards) - 1) * TILE))
+            # Every pixel row of a tile row is the same scanline
+            out.append(b''.join(parts) * TILE)
+            if r < height - 1:
+                out.append(blank * GAP)
+        if line < down - 1:
+            out.append(blank * TILE)
+    out.append(blank * margin)
+    return _png(width, px_height, b''.join(out))
+
+
+def _png(width: int, height: int, raw: bytes) -> bytes:
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(raw, 9)) + chunk(b'IEND', b'')
+
+
+def render_svg(lines: Sequence[str], grids: Grids, cols: int = COLS) -> str:
+    """Title and score lines over the boards' tile grids, as a standalone SVG."""
+    boards = _statuses(grids, cols)
+    height = len(boards[0])
+    across, down, board_w, board_h = _layout(len(boards), cols, height)
+    margin, line_h = 2 * GAP, 22
+    top = margin + line_h * 2
+    width = max(2 * margin + across * board_w + (across - 1) * TILE, 320)
+    total_h = top + down * board_h + (down - 1) * TILE + margin
+    hex_colors = {s: '#%02x%02x%02x' % rgb for s, rgb in COLORS.items()}
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{total_h}" '
+        f'viewBox="0 0 {width} {total_h}">',
+        f'<rect width="100%" height="100%" fill="#{bytes(BACKGROUND).hex()}"/>',
+        '<g font-family="system-ui, sans-serif" fill="#e5e5e5">',
+        f'<text x="{margin}" y="{margin + 15}" font-size="16" font-weight="700">{escape(lines[0])}</text>',
+        f'<text x="{margin}" y="{margin + line_h + 13}" font-size="13">{escape(lines[1])}</text>',
+        '</g>',
+    ]
+    for i, board in enumerate(boards):
+        x0 = margin + (i % across) * (board_w + TILE)
+        y0 = top + (i // across) * (board_h + TILE)
+        for r, row in enumerate(board):
+            y = y0 + r * (TILE + GAP)
+            parts.extend(f'<rect x="{x0 + c * (TILE + GAP)}" y="{y}" width="{TILE}" height="{TILE}" rx="3" '
+                         f'fill="{hex_colors[s]}"/>' for c, s in enumerate(row))
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def render_card(key: str, lines: Sequence[str], grids: Grids, cols: int = COLS) -> ShareCard:
+    return ShareCard(key, '\n'.join(lines), render_svg(lines, grids, cols), render_png(grids, cols))
+
+
+class CardCache:
+    """LRU of rendered cards bounded by total bytes, spilling evictions to ``directory``."""
+
+    def __init__(self, budget: int = CACHE_BUDGET_BYTES, directory: Optional[str] = None,
+                 disk_limit: int = DISK_LIMIT):
+        self.budget = budget
+        self.directory = Path(directory) if directory else None
+        self.disk_limit = disk_limit
+        self.used = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+        self.spilled = 0
+        self._items: 'OrderedDict[str, ShareCard]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.card'
+
+    def get(self, key: str) -> Optional[ShareCard]:
+        with self._lock:
+            card = self._items.get(key)
+            if card is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return card
+        if self.directory is None:
+            return None
+        try:
+            card = ShareCard.from_bytes(key, self._path(key).read_bytes())
+        except (OSError, ValueError, struct.error):
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        self.put(card)
+        return card
+
+    def put(self, card: ShareCard) -> None:
+        size = card.nbytes
+        if size > self.budget:
+            return
+        evicted = []
+        with self._lock:
+            old = self._items.pop(card.key, None)
+            if old is not None:
+                self.used -= old.nbytes
+            self._items[card.key] = card
+            self.used += size
+            while self.used > self.budget:
+                _, gone = self._items.popitem(last=False)
+                self.used -= gone.nbytes
+                evicted.append(gone)
+        for gone in evicted:
+            self._spill(gone)
+
+    def get_or_render(self, key: str, render: Callable[[], ShareCard]) -> ShareCard:
+        """The cached card for ``key``, rendering (and caching) it on a miss."""
+        card = self.get(key)
+        if card is None:
+            card = render()
+            with self._lock:
+                self.renders += 1
+            self.put(card)
+        return card
+
+    def _spill(self, card: ShareCard) -> None:
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(card.key)
+            if not path.exists():
+                tmp = path.with_suffix('.tmp')
+                tmp.write_bytes(card.to_bytes())
+                os.replace(tmp, path)
+                with self._lock:
+                    self.spilled += 1
+                    prune = self.spilled % 64 == 0
+                if prune:
+                    self._prune()
+        except OSError:
+            pass  # the cache is an optimisation; a full or read-only disk just means re-rendering
+
+    def _prune(self) -> None:
+        files = sorted(self.directory.glob('*.card'), key=lambda p: p.stat().st_mtime)
+        for path in files[:max(0, len(files) - self.disk_limit)]:
+            path.unlink(missing_ok=True)
+
+
+def cards_dir() -> Optional[str]:
+    """Spill directory from ``MUSIC_WORDLE_CARDS_DIR`` (``None`` when set to ``off``)."""
+    path = os.environ.get('MUSIC_WORDLE_CARDS_DIR')
+    if path is None:
+        return os.path.join(os.path.expanduser('~'), '.music-wordle', 'cards')
+    return None if path.strip().lower() in ('', 'off', '0', 'false') else path
+
+
+_cache: Optional[CardCache] = None
+_cache_lock = threading.Lock()
+
+
+def shared_card_cache() -> CardCache:
+    """The process-wide card cache, created on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CardCache(directory=cards_dir())
+    return _cache
+
+
+def share_card(codes: Sequence[int], daily: bool, seed_str: str, rows: int = ROWS, cols: int = COLS,
+               cache: Optional[CardCache] = None) -> ShareCard:
+    """Card for a finished single-board game, from the cache when the same grid was shared before."""
+    cache = shared_card_cache() if cache is None else cache
+    grids = (tuple(codes),)
+    key = card_key(seed_str, daily, grids, rows, cols)
+    return cache.get_or_render(key, lambda: render_card(
+        key, build_share_summary(list(codes), daily, seed_str, rows, cols), grids, cols))
+
+
+def multi_share_card(state, daily: bool, seed_str: str, rows: int, cache: Optional[CardCache] = None) -> ShareCard:
+    """Card for a finished :class:`~musicwordle.multiboard.MultiGameState`, boards side by side."""
+    from .multiboard import build_multi_summary
+
+    cache = shared_card_cache() if cache is None else cache
+    grids = tuple(tuple(board.codes) for board in state.boards)
+    key = card_key(seed_str, daily, grids, rows, state.cols)
+    return cache.get_or_render(key, lambda: render_card(
+        key, build_multi_summary(state, daily, seed_str, rows), grids, state.cols))
@@ -0,0 +1,205 @@
+"""Play every answer with automated strategies and report per-answer difficulty.
+
+Games are spread over a process pool; each worker builds the shared pattern
+matrix once and then plays its share of (answer, strategy) pairs. Results
+are written as CSV or JSON (picked from the ``--out`` extension)::
+
+    python -m musicwordle.simulate --strategy entropy minimax --out difficulty.csv
+    python -m musicwordle.simulate --from 2025-01-01 --to 2025-12-31 --out year.json
+
+The ``frequency`` strategy plays blind: it does not know the curated answer
+list and narrows the whole allowed dictionary, always guessing the remaining
+word with the most common letters. That is the closest model here of a
+player meeting ``guqin`` cold, so it is the one to look at for fairness.
+
+With ``--from``/``--to`` the answers are the daily secrets for each date
+(from the puzzle calendar, see :mod:`musicwordle.schedule`), and ``scheduled`` counts how often each
+word comes up. Solvers keep guessing past the board limit (up to
+``--cap``) so hard words still get a guess count; anything over the
+board's rows counts as a fail.
+"""
+import argparse
+import csv
+import datetime
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .config import ANSWERS, COLS, ROWS
+from .schedule import daily_secret
+from .scoring import ALL_CORRECT, score_code, shared_matrix
+from .solver import STRATEGIES, full_candidates, suggest
+
+DEFAULT_CAP = 12
+FREQUENCY = 'frequency'
+
+
+def _frequency_pick(words: Sequence[str]) -> str:
+    """Word whose distinct letters are most common among ``words``."""
+    freq = Counter(ch for w in words for ch in set(w))
+    return max(words, key=lambda w: (sum(freq[ch] for ch in set(w)), w))
+
+
+def play_blind(answer: str, cap: int = DEFAULT_CAP) -> Dict:
+    """Solve ``answer`` from the full dictionary without knowing ``ANSWERS``."""
+    from .dictionary import shared_dictionary
+
+    cands: Sequence[str] = shared_dictionary().ordered
+    guesses: List[str] = []
+    codes: List[int] = []
+    sizes: List[int] = []
+    while len(guesses) < cap and cands:
+        guess = _opener() if not guesses else _frequency_pick(cands)
+        code = score_code(guess, answer)
+        guesses.append(guess)
+        codes.append(code)
+        if code == ALL_CORRECT:
+            break
+        cands = [w for w in cands if score_code(guess, w) == code]
+        sizes.append(len(cands))
+    return {'answer': answer, 'strategy': FREQUENCY, 'guesses': guesses, 'codes': codes, 'sizes': sizes}
+
+
+_opening: Optional[str] = None
+
+
+def _opener() -> str:
+    global _opening
+    if _opening is None:
+        from .dictionary import shared_dictionary
+
+        _opening = _frequency_pick(shared_dictionary().ordered)
+    return _opening
+
+
+def play(answer: str, strategy: str, cap: int = DEFAULT_CAP) -> Dict:
+    """Solve ``answer`` with ``strategy``; returns guesses, codes and pool sizes."""
+    if strategy == FREQUENCY:
+        return play_blind(answer, cap)
+    matrix = shared_matrix()
+    cands = full_candidates()
+    guesses: List[str] = []
+    codes: List[int] = []
+    sizes: List[int] = []
+    while len(guesses) < cap:
+        top = suggest(cands, strategy, top=1)
+        guess = top[0][0] if top else answer
+        code = matrix.code(guess, answer)
+        guesses.append(guess)
+        codes.append(code)
+        if code == ALL_CORRECT:
+            break
+        cands = cands.narrow(guess, code)
+        sizes.append(len(cands))
+    return {'answer': answer, 'strategy': strategy, 'guesses': guesses, 'codes': codes, 'sizes': sizes}
+
+
+def _play_chunk(jobs: Sequence[Tuple[str, str]], cap: int) -> List[Dict]:
+    return [play(answer, strategy, cap) for answer, strategy in jobs]
+
+
+def daily_answers(start: datetime.date, end: datetime.date, answers: Sequence[str] = ANSWERS) -> List[Tuple[str, str]]:
+    """(ISO date, secret) for every day in ``[start, end]``."""
+    out = []
+    day = start
+    while day <= end:
+        out.append((day.isoformat(), daily_secret(day, answers)))
+        day += datetime.timedelta(days=1)
+    return out
+
+
+def run(answers: Sequence[str], strategies: Sequence[str], workers: Optional[int] = None,
+        cap: int = DEFAULT_CAP, chunk: int = 16) -> List[Dict]:
+    """Play every (answer, strategy) pair, in parallel unless ``workers == 1``."""
+    jobs = [(a, s) for a in dict.fromkeys(answers) for s in strategies]
+    chunks = [jobs[i:i + chunk] for i in range(0, len(jobs), chunk)]
+    if workers == 1 or len(chunks) <= 1:
+        return _play_chunk(jobs, cap)
+    results: List[Dict] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_play_chunk, chunks, [cap] * len(chunks)):
+            results.extend(part)
+    return results
+
+
+def difficulty_table(results: Iterable[Dict], rows: int = ROWS, scheduled: Optional[Counter] = None) -> List[Dict]:
+    """One row per answer, hardest first (fail rate, then mean guesses)."""
+    by_answer: Dict[str, List[Dict]] = {}
+    for r in results:
+        by_answer.setdefault(r['answer'], []).append(r)
+    table = []
+    for answer, games in by_answer.items():
+        counts = [len(g['guesses']) for g in games]
+        after1 = [g['sizes'][0] for g in games if g['sizes']]
+        row = {
+            'answer': answer,
+            'games': len(games),
+            'mean_guesses': round(statistics.fmean(counts), 3),
+            'max_guesses': max(counts),
+            'fail_rate': round(sum(c > rows for c in counts) / len(counts), 3),
+            'mean_left_after_1': round(statistics.fmean(after1), 3) if after1 else 0.0,
+            'distinct_patterns': len({c for g in games for c in g['codes']}),
+        }
+        for g in games:
+            row[f"guesses_{g['strategy']}"] = len(g['guesses'])
+        if scheduled is not None:
+            row['scheduled'] = scheduled.get(answer, 0)
+        table.append(row)
+    table.sort(key=lambda r: (-r['fail_rate'], -r['mean_guesses'], r['answer']))
+    return table
+
+
+def write_report(table: List[Dict], out: Path, meta: Dict) -> None:
+    out = Path(out)
+    if out.suffix.lower() == '.json':
+        out.write_text(json.dumps({'meta': meta, 'answers': table}, indent=2), encoding='utf-8')
+        return
+    fields: List[str] = []
+    for row in table:
+        fields.extend(k for k in row if k not in fields)
+    with out.open('w', newline='', encoding='utf-8') as fh:
+        writer = csv.DictWriter(fh, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.simulate', description=__doc__.splitlines()[0])
+    parser.add_argument('--strategy', nargs='+', default=['entropy'], choices=sorted(STRATEGIES) + [FREQUENCY])
+    parser.add_argument('--from', dest='start', type=datetime.date.fromisoformat, default=None)
+    parser.add_argument('--to', dest='end', type=datetime.date.fromisoformat, default=None)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--cap', type=int, default=DEFAULT_CAP)
+    parser.add_argument('--out', type=Path, default=Path('difficulty.csv'))
+    args = parser.parse_args(argv)
+
+    answers = [w for w in ANSWERS if len(w) == COLS]
+    scheduled = None
+    if args.start or args.end:
+        start = args.start or args.end
+        end = args.end or args.start
+        days = daily_answers(start, end, answers)
+        scheduled = Counter(a for _, a in days)
+        answers = [a for _, a in days]
+
+    t0 = time.perf_counter()
+    results = run(answers, args.strategy, workers=args.workers, cap=args.cap)
+    elapsed = time.perf_counter() - t0
+    table = difficulty_table(results, scheduled=scheduled)
+    meta = {'strategies': args.strategy, 'games': len(results), 'seconds': round(elapsed, 3),
+            'workers': args.workers, 'rows': ROWS}
+    write_report(table, args.out, meta)
+    print(f"played {len(results)} games in {elapsed:.2f}s with {args.workers} workers -> {args.out}")
+    for row in table[:10]:
+        print(f"  {row['answer']}  mean {row['mean_guesses']:.2f}  max {row['max_guesses']}  fail {row['fail_rate']:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+"""Next-guess suggestions over the remaining candidate answers.
+
+:class:`CandidateSet` tracks the answers still consistent with the feedback
+seen so far and is narrowed once per submitted guess (one matrix row lookup)
+instead of replaying every guess. Strategies rank guesses from the shared
+:class:`~musicwordle.scoring.PatternMatrix`; with NumPy the whole allowed
+dictionary is scored in one vectorised pass, without it the pool is limited
+to the remaining candidates so hints stay fast. Each word length has its
+own matrix and full candidate set, built the first time a hint asks.
+"""
+import math
+from collections import Counter, OrderedDict
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .config import COLS
+from .scoring import PatternMatrix, np, shared_matrix
+
+
+class CandidateSet:
+    """Immutable set of answer indices into ``matrix.answers``."""
+
+    __slots__ = ('matrix', 'indices')
+
+    def __init__(self, matrix: PatternMatrix, indices=None):
+        self.matrix = matrix
+        if indices is None:
+            indices = range(len(matrix.answers))
+        if matrix.use_numpy:
+            self.indices = np.asarray(indices, dtype=np.int32)
+        else:
+            self.indices = tuple(indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __contains__(self, word: str) -> bool:
+        j = self.matrix.answer_index.get(word)
+        return j is not None and j in self.indices
+
+    @property
+    def words(self) -> List[str]:
+        answers = self.matrix.answers
+        return [answers[int(i)] for i in self.indices]
+
+    def key(self) -> Hashable:
+        """Hashable identity used to cache rankings."""
+        if self.matrix.use_numpy:
+            return self.indices.tobytes()
+        return self.indices
+
+    def narrow(self, guess: str, code: int) -> 'CandidateSet':
+        """Candidates that would have produced ``code`` for ``guess``."""
+        row = self.matrix.row(guess)
+        if self.matrix.use_numpy:
+            return CandidateSet(self.matrix, self.indices[row[self.indices] == code])
+        return CandidateSet(self.matrix, [i for i in self.indices if row[i] == code])
+
+
+def _bucket_sizes(matrix: PatternMatrix, pool: Sequence[str], candidates: CandidateSet):
+    """How many candidates share each (pool word, candidate) feedback code.
+
+    NumPy: an int array of shape ``(len(pool), len(candidates))``; the
+    strategies only need these per-entry bucket sizes. Pure Python: one
+    ``Counter`` of codes per pool word.
+    """
+    if matrix.use_numpy and matrix.table is not None:
+        if pool is matrix.guesses:
+            sub = matrix.table[:, candidates.indices]
+        else:
+            sub = np.stack([matrix.row(w)[candidates.indices] for w in pool])
+        if sub.shape[1] <= 12:
+            return (sub[:, :, None] == sub[:, None, :]).sum(axis=2)
+        n_patterns = matrix.n_patterns
+        keys = sub.astype(np.int32) + (np.arange(len(pool), dtype=np.int32) * n_patterns)[:, None]
+        counts = np.bincount(keys.ravel(), minlength=len(pool) * n_patterns)
+        return counts[keys]
+    cand = candidates.indices
+    out = []
+    for w in pool:
+        row = matrix.row(w)
+        out.append(Counter(row[i] for i in cand))
+    return out
+
+
+class Strategy:
+    """Ranks guesses; subclasses implement :meth:`score` (higher is better)."""
+
+    name = ''
+    label = ''
+    answers_only = False
+
+    def score(self, sizes, total: int):
+        raise NotImplementedError
+
+    def rank(self, candidates: CandidateSet, pool: Optional[Sequence[str]] = None, top: int = 5) -> List[Tuple[str, float]]:
+        matrix = candidates.matrix
+        total = len(candidates)
+        if total == 0:
+            return []
+        if total <= 2:
+            return [(w, 0.0) for w in candidates.words[:top]]
+        if pool is None:
+            pool = candidates.words if (self.answers_only or not matrix.use_numpy) else matrix.guesses
+        sizes = _bucket_sizes(matrix, pool, candidates)
+        scores = self.score(sizes, total)
+        # Prefer guesses that could themselves be the answer on ties
+        live = set(candidates.words)
+        bonus = [1e-6 if w in live else 0.0 for w in pool]
+        if matrix.use_numpy and not isinstance(sizes, list):
+            scores = np.asarray(scores, dtype=np.float64) + np.asarray(bonus)
+            order = np.argsort(-scores, kind='stable')[:top]
+            return [(pool[int(i)], float(scores[i])) for i in order]
+        ranked = sorted(zip(pool, (s + b for s, b in zip(scores, bonus))), key=lambda x: -x[1])
+        return ranked[:top]
+
+
+class GreedyEntropy(Strategy):
+    """Maximise expected information gain (bits) over the candidates."""
+
+    name = 'entropy'
+    label = 'Greedy entropy'
+
+    def score(self, sizes, total):
+        if isinstance(sizes, list):
+            return [math.log2(total) - sum(c * math.log2(c) for c in cnt.values()) / total for cnt in sizes]
+        # sum over buckets of c*log2(c) == sum over candidates of log2(bucket size)
+        return math.log2(total) - np.log2(sizes).sum(axis=1) / total
+
+
+class Minimax(Strategy):
+    """Minimise the worst-case number of candidates left."""
+
+    name = 'minimax'
+    label = 'Minimax worst case'
+
+    def score(self, sizes, total):
+        if isinstance(sizes, list):
+            return [-float(max(cnt.values())) for cnt in sizes]
+        return -sizes.max(axis=1).astype(np.float64)
+
+
+class AnswersOnly(GreedyEntropy):
+    """Greedy entropy, but only ever suggest words that could be the answer."""
+
+    name = 'answers'
+    label = 'Answers only'
+    answers_only = True
+
+
+STRATEGIES: Dict[str, Strategy] = {s.name: s for s in (GreedyEntropy(), Minimax(), AnswersOnly())}
+
+_full: Dict[int, CandidateSet] = {}
+_hint_cache: 'OrderedDict[Tuple[str, int, Hashable], List[Tuple[str, float]]]' = OrderedDict()
+_HINT_CACHE_SIZE = 512
+
+
+def full_candidates(length: int = COLS) -> CandidateSet:
+    """Every answer in the shared ``length``-letter matrix; shared, since narrowing never mutates."""
+    full = _full.get(length)
+    if full is None:
+        full = _full[length] = CandidateSet(shared_matrix(length))
+    return full
+
+
+def suggest(candidates: CandidateSet, strategy: str = 'entropy', top: int = 5) -> List[Tuple[str, float]]:
+    """Top guesses for ``candidates``; repeated states (e.g. the opener) are cached."""
+    key = (strategy, candidates.matrix.length, candidates.key())
+    hit = _hint_cache.get(key)
+    if hit is not None:
+        _hint_cache.move_to_end(key)
+        return hit[:top]
+    ranked = STRATEGIES[strategy].rank(candidates, top=max(top, 5))
+    _hint_cache[key] = ranked
+    if len(_hint_cache) > _HINT_CACHE_SIZE:
+        _hint_cache.popitem(last=False)
+    return ranked[:top]
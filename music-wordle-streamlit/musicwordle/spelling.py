@@ -0,0 +1,146 @@
+""""Did you mean" suggestions: dictionary words within Hamming distance 2.
+
+Words are base-26 integers (as in :mod:`musicwordle.packed`). For every
+pair of positions ``(i, j)`` :class:`NeighbourIndex` keeps the dictionary
+sorted by a key that lists the *other* letters first and ``i``, ``j``
+last. Every word differing from a guess at most at ``i`` and ``j`` then
+sits in one contiguous range of 26 x 26 keys, found with two bisects. A
+lookup is ``C(length, 2)`` range reads (10 for five letters) plus a
+distance check on the few words in them, independent of dictionary size.
+
+The index is ``C(length, 2)`` integer arrays (about 40 bytes a word for
+five letters), built with NumPy when it is installed. :func:`shared_index`
+builds it once per process per dictionary, so every session using the
+bundled words, or the same uploaded file, shares one::
+
+    did_you_mean('pianp', shared_dictionary())  # ['piano', ...]
+"""
+import bisect
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import combinations
+from operator import itemgetter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .config import ANSWERS, COLS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+MAX_DISTANCE = 2
+_TO_DIGITS = str.maketrans('abcdefghijklmnopqrstuvwxyz', '0123456789abcdefghijklmnop')
+_SPAN = 26 * 26
+
+
+class NeighbourIndex:
+    """Words by Hamming neighbourhood (see module docs)."""
+
+    def __init__(self, words: Iterable[str], answers: Iterable[str] = ANSWERS, length: int = COLS):
+        self.length = length
+        self.answers = frozenset(w for w in answers if len(w) == length)
+        vocab = sorted({w for w in words if len(w) == length and w.isascii() and w.isalpha() and w.islower()}
+                       | self.answers)
+        self.size = len(vocab)
+        self.orders: List[Tuple[Tuple[int, ...], Sequence[int]]] = []
+        typecode = 'I' if 26 ** length <= 2 ** 32 else 'Q'
+        digits = np.frombuffer(''.join(vocab).encode('ascii'), np.uint8).reshape(-1, length) - 97 \
+            if np is not None and vocab else None
+        for pair in combinations(range(length), 2):
+            perm = tuple(p for p in range(length) if p not in pair) + pair
+            if digits is not None:
+                keys = np.zeros(len(vocab), np.uint64)
+                for p in perm:
+                    keys = keys * 26 + digits[:, p]
+                keys = array(typecode, np.sort(keys).astype(np.uint32 if typecode == 'I' else np.uint64).tobytes())
+            else:
+                pick = itemgetter(*perm)
+                keys = array(typecode, sorted(int(''.join(pick(w.translate(_TO_DIGITS))), 26) for w in vocab))
+            self.orders.append((perm, keys))
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def nbytes(self) -> int:
+        return sum(keys.itemsize * len(keys) for _, keys in self.orders)
+
+    def neighbours(self, word: str, max_distance: int = MAX_DISTANCE) -> List[Tuple[str, int]]:
+        """``(word, distance)`` for every indexed word 1..``max_distance`` letters away."""
+        n = self.length
+        if len(word) != n or not (word.isascii() and word.isalpha()):
+            return []
+        word = word.lower()
+        digits = [ord(c) - 97 for c in word]
+        letters = list(word)
+        found = {}
+        for perm, keys in self.orders:
+            prefix = 0
+            for p in perm[:-2]:
+                prefix = prefix * 26 + digits[p]
+            lo = prefix * _SPAN
+            start = bisect.bisect_left(keys, lo)
+            stop = bisect.bisect_left(keys, lo + _SPAN, start)
+            if start == stop:
+                continue
+            i, j = perm[-2:]
+            di, dj = digits[i], digits[j]
+            # Only the last two letters vary inside the range
+            for key in keys[start:stop]:
+                a, b = divmod(key - lo, 26)
+                distance = (a != di) + (b != dj)
+                if distance:
+                    letters[i], letters[j] = chr(97 + a), chr(97 + b)
+                    found[''.join(letters)] = distance
+            letters[i], letters[j] = word[i], word[j]
+        return [(w, d) for w, d in found.items() if d <= max_distance]
+
+    def suggest(self, word: str, limit: int = 3, max_distance: int = MAX_DISTANCE) -> List[str]:
+        """Closest words, answers first, then by distance, then alphabetically."""
+        answers = self.answers
+        ranked = sorted(self.neighbours(word, max_distance), key=lambda wd: (wd[0] not in answers, wd[1], wd[0]))
+        return [w for w, _ in ranked[:limit]]
+
+
+MAX_CACHED = 4
+_indexes: 'OrderedDict[Tuple[int, int], Tuple[object, NeighbourIndex]]' = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def shared_index(words, answers: Sequence[str] = ANSWERS, length: int = COLS) -> NeighbourIndex:
+    """Index for the word list object ``words``, built once per process.
+
+    Keyed by object identity: the bundled dictionary and content-cached
+    uploads are one object however many sessions use them. The last
+    ``MAX_CACHED`` indexes are kept (each entry holds its word list, so an
+    id is never reused while cached).
+    """
+    key = (id(words), length)
+    with _indexes_lock:
+        hit = _indexes.get(key)
+        if hit is not None:
+            _indexes.move_to_end(key)
+            return hit[1]
+    index = NeighbourIndex(words, answers, length)
+    with _indexes_lock:
+        hit = _indexes.setdefault(key, (words, index))
+        _indexes.move_to_end(key)
+        while len(_indexes) > MAX_CACHED:
+            _indexes.popitem(last=False)
+    return hit[1]
+
+
+def did_you_mean(guess: str, words, answers: Sequence[str] = ANSWERS, limit: int = 3) -> List[str]:
+    """Up to ``limit`` valid words near ``guess`` (see :meth:`NeighbourIndex.suggest`)."""
+    return shared_index(words, answers, len(guess)).suggest(guess, limit)
+
+
+def format_suggestions(words: Optional[List[str]]) -> str:
+    """``"Did you mean PIANO or PIANI?"`` (empty when there are none)."""
+    if not words:
+        return ''
+    shown = [w.upper() for w in words]
+    joined = shown[0] if len(shown) == 1 else ', '.join(shown[:-1]) + ' or ' + shown[-1]
+    return f"Did you mean {joined}?"
@@ -0,0 +1,395 @@
+"""Player statistics in a local SQLite database (WAL mode).
+
+Every finished game is one row in ``games``. Recording never touches the
+disk on the caller's thread: :meth:`StatsStore.record` puts the row on a
+bounded queue (dropping it, and counting the drop, if the queue is full)
+and a background writer thread commits whatever has queued up, up to
+``batch_size`` rows per transaction, at most ``flush_interval`` seconds
+after the first one arrived.
+
+Reads use one connection per thread; WAL lets them run while the writer
+commits. Three indexed queries back the aggregates:
+
+* :meth:`~StatsStore.player_stats`: played, wins, streaks and guess
+  distribution for one player (``games_player``);
+* :meth:`~StatsStore.day_distribution`: how everyone did on one daily
+  puzzle (``games_day``, covering);
+* :meth:`~StatsStore.answer_stats` / :meth:`~StatsStore.hardest`: solve
+  rate and mean tries per answer (``games_answer``, covering).
+
+Results are cached for ``ttl`` seconds, so a stats panel drawn on every
+rerun costs a dict lookup. A player's own entry is also dropped when they
+record a game, and rows still queued for that player are counted in, so
+a finished game shows up in the player's stats on the very next rerun.
+
+The database lives at ``MUSIC_WORDLE_STATS_DB`` (``off`` disables it),
+default ``~/.music-wordle/stats.sqlite3``. Summaries from the command line::
+
+    python -m musicwordle.stats --db stats.sqlite3 --day 2025-06-01
+"""
+import argparse
+import atexit
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .config import ROWS
+from .engine import GameState
+from .scoring import code_array, code_bytes, pattern_width
+
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 0.25
+CACHE_TTL = 30.0
+QUEUE_LIMIT = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    daily INTEGER NOT NULL,
+    day TEXT,
+    seed TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    tries INTEGER NOT NULL,
+    hard TEXT,
+    guesses TEXT NOT NULL,
+    codes BLOB NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_player ON games (player, finished_at);
+CREATE INDEX IF NOT EXISTS games_day ON games (day, won, tries) WHERE daily = 1;
+CREATE INDEX IF NOT EXISTS games_answer ON games (answer, won, tries);
+"""
+_INSERT = ('INSERT INTO games (player, daily, day, seed, answer, won, tries, hard, guesses, codes, finished_at) '
+           'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+
+class GameRecord(NamedTuple):
+    """One finished game: guesses run together, pattern codes one byte per row (two above 5 letters)."""
+
+    player: str
+    daily: bool
+    seed: str
+    answer: str
+    won: bool
+    guesses: str
+    codes: bytes
+    hard: Optional[str] = None
+    finished_at: float = 0.0
+
+    @classmethod
+    def from_state(cls, player: str, state: GameState, daily: bool, seed: str,
+                   hard: Optional[str] = None) -> 'GameRecord':
+        return cls(player, daily, seed, state.secret, state.won, state.guesses.decode('ascii'),
+                   code_bytes(state.codes), hard)
+
+    @property
+    def tries(self) -> int:
+        return len(self.codes) // pattern_width(len(self.answer))
+
+    def to_state(self) -> GameState:
+        """The finished game again, for the board and share card."""
+        state = GameState(self.answer)
+        state.guesses = bytearray(self.guesses.encode('ascii'))
+        state.codes = code_array(len(self.answer), self.codes)
+        state.finished = True
+        return state
+
+    def row(self) -> tuple:
+        return (self.player, int(self.daily), self.seed if self.daily else None, self.seed, self.answer,
+                int(self.won), self.tries, self.hard, self.guesses, self.codes, self.finished_at)
+
+
+class _Cache:
+    """Values by key, each good for ``ttl`` seconds."""
+
+    def __init__(self, ttl: float, clock: Callable[[], float]):
+        self.ttl = ttl
+        self.clock = clock
+        self._items: Dict[tuple, Tuple[float, object]] = {}
+        self.hits = self.misses = 0
+
+    def get(self, key: tuple, compute: Callable[[], object]):
+        now = self.clock()
+        item = self._items.get(key)
+        if item is not None and item[0] > now:
+            self.hits += 1
+            return item[1]
+        self.misses += 1
+        value = compute()
+        self._items[key] = (now + self.ttl, value)
+        return value
+
+    def drop(self, key: tuple) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+_FLUSH = object()
+_STOP = object()
+
+
+class StatsStore:
+    """Finished games in SQLite, written in batches off the caller's thread (see module docs)."""
+
+    def __init__(self, path: str, batch_size: int = BATCH_SIZE, flush_interval: float = FLUSH_INTERVAL,
+                 ttl: float = CACHE_TTL, clock: Callable[[], float] = time.monotonic):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cache = _Cache(ttl, clock)
+        self.written = self.batches = self.dropped = self.failed = 0
+        self._queue: 'queue.Queue' = queue.Queue(QUEUE_LIMIT)
+        self._pending: Dict[str, List[GameRecord]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connection()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    # -- writing -----------------------------------------------------------
+
+    def record(self, game: GameRecord) -> bool:
+        """Queue ``game`` for the writer; never blocks. False if it was dropped."""
+        if self._closed:
+            return False
+        if not game.finished_at:
+            game = game._replace(finished_at=time.time())
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(target=self._write_loop, name='stats-writer', daemon=True)
+                    self._writer.start()
+        with self._lock:
+            try:
+                self._queue.put_nowait(game)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending.setdefault(game.player, []).append(game)
+        self.cache.drop(('player', game.player))
+        return True
+
+    def _write_loop(self) -> None:
+        conn = self._connection()
+        stop = False
+        while not stop:
+            batch: List[GameRecord] = []
+            item = self._queue.get()
+            taken = 1
+            deadline = time.monotonic() + self.flush_interval
+            while item is not _FLUSH and item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                taken += 1
+            stop = item is _STOP
+            if batch:
+                self._commit(conn, batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    def _commit(self, conn: sqlite3.Connection, batch: List[GameRecord]) -> None:
+        try:
+            conn.execute('BEGIN')
+            conn.executemany(_INSERT, [g.row() for g in batch])
+            conn.execute('COMMIT')
+            ok = True
+        except sqlite3.Error:
+            # Disk full, database locked for too long, ...: drop the batch, keep the writer alive
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            ok = False
+        with self._lock:
+            for g in batch:
+                mine = self._pending.get(g.player)
+                if mine:
+                    mine.remove(g)
+                    if not mine:
+                        del self._pending[g.player]
+                self.cache.drop(('player', g.player))
+            if ok:
+                self.written += len(batch)
+                self.batches += 1
+            else:
+                self.failed += len(batch)
+
+    def flush(self) -> None:
+        """Block until everything recorded so far is committed."""
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self) -> None:
+        """Commit what is queued and stop the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    # -- reading -----------------------------------------------------------
+
+    def player_stats(self, player: str, rows: int = ROWS) -> dict:
+        """Played, wins, win %, current and best win streak, wins by number of tries."""
+        return self.cache.get(('player', player), lambda: self._player_stats(player, rows))
+
+    def _player_stats(self, player: str, rows: int) -> dict:
+        results = [(won, tries) for won, tries in self._connection().execute(
+            'SELECT won, tries FROM games WHERE player = ? ORDER BY finished_at', (player,))]
+        with self._lock:
+            results.extend((g.won, g.tries) for g in self._pending.get(player, ()))
+        distribution = [0] * rows
+        streak = best = wins = 0
+        for won, tries in results:
+            if won:
+                wins += 1
+                streak += 1
+                best = max(best, streak)
+                if tries > len(distribution):
+                    # Longer words get more rows
+                    distribution.extend([0] * (tries - len(distribution)))
+                distribution[tries - 1] += 1
+            else:
+                streak = 0
+        played = len(results)
+        return {'played': played, 'wins': wins, 'win_pct': round(100 * wins / played) if played else 0,
+                'streak': streak, 'max_streak': best, 'distribution': distribution}
+
+    def day_distribution(self, day: str, rows: int = ROWS) -> dict:
+        """Everyone's result on the daily puzzle for ``day``: wins by tries, plus losses."""
+        return self.cache.get(('day', day), lambda: self._day_distribution(day, rows))
+
+    def _day_distribution(self, day: str, rows: int) -> dict:
+        distribution, lost = [0] * rows, 0
+        for won, tries, n in self._connection().execute(
+                'SELECT won, tries, COUNT(*) FROM games WHERE daily = 1 AND day = ? GROUP BY won, tries', (day,)):
+            if not won:
+                lost += n
+            else:
+                if tries > len(distribution):
+                    distribution.extend([0] * (tries - len(distribution)))
+                distribution[tries - 1] += n
+        return {'played': sum(distribution) + lost, 'distribution': distribution, 'lost': lost}
+
+    def answer_stats(self, answer: str) -> dict:
+        """How often ``answer`` was solved, and in how many tries on average."""
+        return self.cache.get(('answer', answer), lambda: self._answer_stats(answer))
+
+    def _answer_stats(self, answer: str) -> dict:
+        played, solved, mean = self._connection().execute(
+            'SELECT COUNT(*), COALESCE(SUM(won), 0), AVG(CASE WHEN won THEN tries END) FROM games WHERE answer = ?',
+            (answer,)).fetchone()
+        return {'played': played, 'solved': solved, 'solve_rate': solved / played if played else 0.0,
+                'mean_tries': round(mean, 2) if mean is not None else None}
+
+    def hardest(self, limit: int = 10, min_games: int = 5) -> List[dict]:
+        """Answers with the lowest solve rate among those played ``min_games`` times."""
+        return self.cache.get(('hardest', limit, min_games), lambda: [
+            {'answer': answer, 'played': played, 'solve_rate': solved / played,
+             'mean_tries': round(mean, 2) if mean is not None else None}
+            for answer, played, solved, mean in self._connection().execute(
+                'SELECT answer, COUNT(*) AS played, SUM(won) AS solved, AVG(CASE WHEN won THEN tries END) '
+                'FROM games GROUP BY answer HAVING played >= ? ORDER BY 1.0 * solved / played, answer LIMIT ?',
+                (min_games, limit))
+        ])
+
+    def last_daily(self, player: str, day: str) -> Optional[GameRecord]:
+        """The player's finished daily game for ``day``, if any (to restore the result after a refresh)."""
+        with self._lock:
+            for g in reversed(self._pending.get(player, ())):
+                if g.daily and g.seed == day:
+                    return g
+        row = self._connection().execute(
+            'SELECT seed, answer, won, guesses, codes, hard, finished_at FROM games '
+            'WHERE player = ? AND daily = 1 AND day = ? ORDER BY finished_at DESC LIMIT 1', (player, day)).fetchone()
+        if row is None:
+            return None
+        seed, answer, won, guesses, codes, hard, finished_at = row
+        return GameRecord(player, True, seed, answer, bool(won), guesses, bytes(codes), hard, finished_at)
+
+
+def stats_path() -> Optional[str]:
+    """Database path from ``MUSIC_WORDLE_STATS_DB`` (``None`` when set to ``off``)."""
+    path = os.environ.get('MUSIC_WORDLE_STATS_DB')
+    if path is None:
+        return os.path.join(os.path.expanduser('~'), '.music-wordle', 'stats.sqlite3')
+    return None if path.strip().lower() in ('', 'off', '0', 'false') else path
+
+
+_shared: Optional[StatsStore] = None
+_shared_failed = False
+_shared_lock = threading.Lock()
+
+
+def shared_store() -> Optional[StatsStore]:
+    """The process-wide store, opened on first use; ``None`` if disabled or unusable."""
+    global _shared, _shared_failed
+    if _shared is None and not _shared_failed:
+        with _shared_lock:
+            if _shared is None and not _shared_failed:
+                path = stats_path()
+                try:
+                    _shared = StatsStore(path) if path else None
+                except (OSError, sqlite3.Error):
+                    _shared = None
+                if _shared is None:
+                    _shared_failed = True
+                else:
+                    atexit.register(_shared.close)
+    return _shared
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.stats', description='Summarise recorded games.')
+    parser.add_argument('--db', default=stats_path(), help='database path (default: MUSIC_WORDLE_STATS_DB)')
+    parser.add_argument('--day', help='show the guess distribution for this daily puzzle (YYYY-MM-DD)')
+    parser.add_argument('--player', help='show one player\'s statistics')
+    parser.add_argument('--hardest', type=int, default=10, help='list this many hardest answers')
+    parser.add_argument('--min-games', type=int, default=5)
+    args = parser.parse_args(argv)
+    if not args.db or not os.path.exists(args.db):
+        print(f'no statistics database at {args.db}', file=sys.stderr)
+        return 1
+    store = StatsStore(args.db)
+    games, players = store._connection().execute('SELECT COUNT(*), COUNT(DISTINCT player) FROM games').fetchone()
+    print(f'{games:,} games by {players:,} players')
+    if args.player:
+        s = store.player_stats(args.player)
+        print(f"{args.player}: played {s['played']}, won {s['win_pct']}%, streak {s['streak']} "
+              f"(best {s['max_streak']}), by tries {s['distribution']}")
+    if args.day:
+        d = store.day_distribution(args.day)
+        print(f"{args.day}: {d['played']} games, by tries {d['distribution']}, lost {d['lost']}")
+    for row in store.hardest(args.hardest, args.min_games):
+        mean = '-' if row['mean_tries'] is None else f"{row['mean_tries']:.2f}"
+        print(f"  {row['answer']:<8} solved {row['solve_rate']:>6.1%} of {row['played']:>5}  mean tries {mean}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
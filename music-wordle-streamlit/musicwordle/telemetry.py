@@ -0,0 +1,225 @@
+"""Opt-in timing spans for app reruns, with percentile summaries.
+
+Each named span keeps its most recent durations in a fixed-size ring
+buffer (``array('d')``), so memory stays constant however long the process
+runs, plus lifetime count and sum. Summaries (p50/p95/p99/max over the
+window) are computed on demand and exported as a Prometheus text file and
+JSON. Recording is off until :meth:`SpanRecorder.enable` is called; a
+disabled ``span()`` returns a shared no-op context manager.
+
+One rerun can also be captured under ``cProfile`` or ``tracemalloc`` with
+:func:`capture`, which returns a plain-text report. The profilers and
+``json`` are only imported when first used, keeping them off app start-up.
+"""
+import os
+import threading
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+CAPACITY = 1024
+EXPORT_INTERVAL = 60.0
+QUANTILES = (0.5, 0.95, 0.99)
+METRIC = 'music_wordle_span_seconds'
+PROFILE_MODES = ('cprofile', 'tracemalloc')
+
+_NULL = nullcontext()
+
+
+class _Window:
+    """Ring buffer of the last ``capacity`` durations for one span."""
+
+    __slots__ = ('values', 'pos', 'filled', 'count', 'total')
+
+    def __init__(self, capacity: int):
+        self.values = array('d', bytes(8 * capacity))
+        self.pos = 0
+        self.filled = 0
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, seconds: float) -> None:
+        values = self.values
+        values[self.pos] = seconds
+        self.pos = (self.pos + 1) % len(values)
+        if self.filled < len(values):
+            self.filled += 1
+        self.count += 1
+        self.total += seconds
+
+    def summary(self) -> Dict[str, float]:
+        recent = sorted(self.values[:self.filled])
+        out = {'count': self.count, 'sum': self.total, 'window': self.filled}
+        for q in QUANTILES:
+            # Nearest rank
+            out[f'p{round(q * 100)}'] = recent[min(self.filled - 1, int(q * self.filled))] if recent else 0.0
+        out['max'] = recent[-1] if recent else 0.0
+        return out
+
+
+class _Span:
+    __slots__ = ('recorder', 'name', 'start')
+
+    def __init__(self, recorder: 'SpanRecorder', name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.recorder.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class SpanRecorder:
+    """Thread-safe per-span ring buffers shared by every session."""
+
+    def __init__(self, capacity: int = CAPACITY, enabled: bool = False):
+        self.capacity = capacity
+        self.enabled = enabled
+        self._windows: Dict[str, _Window] = {}
+        self._lock = threading.Lock()
+        self._last_export = 0.0
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def span(self, name: str):
+        """Context manager timing its block as ``name`` (no-op while disabled)."""
+        return _Span(self, name) if self.enabled else _NULL
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            window = self._windows.get(name)
+            if window is None:
+                window = self._windows[name] = _Window(self.capacity)
+            window.add(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._windows.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: w.summary() for name, w in sorted(self._windows.items())}
+
+    def to_json(self) -> str:
+        import json
+
+        return json.dumps({'generated': time.time(), 'spans': self.snapshot()}, indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            f'# HELP {METRIC} Time spent in app phases per rerun.',
+            f'# TYPE {METRIC} summary',
+        ]
+        for name, s in self.snapshot().items():
+            for q in QUANTILES:
+                lines.append(f'{METRIC}{{span="{name}",quantile="{q}"}} {s[f"p{round(q * 100)}"]:.6g}')
+            lines.append(f'{METRIC}_sum{{span="{name}"}} {s["sum"]:.6g}')
+            lines.append(f'{METRIC}_count{{span="{name}"}} {s["count"]}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, directory) -> List[Path]:
+        """Write ``metrics.prom`` and ``metrics.json`` atomically into ``directory``."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        written = []
+        for filename, text in (('metrics.prom', self.to_prometheus()), ('metrics.json', self.to_json())):
+            path = directory / filename
+            tmp = path.with_name(f'.{filename}.{os.getpid()}.tmp')
+            tmp.write_text(text)
+            # Scrapers never see a half-written file
+            os.replace(tmp, path)
+            written.append(path)
+        return written
+
+    def maybe_export(self, directory, interval: float = EXPORT_INTERVAL) -> bool:
+        """Export if ``interval`` seconds have passed since the last export."""
+        now = time.monotonic()
+        with self._lock:
+            if self._last_export and now - self._last_export < interval:
+                return False
+            self._last_export = now
+        self.export(directory)
+        return True
+
+
+def format_summary(snapshot: Dict[str, Dict[str, float]]) -> str:
+    """Fixed-width table of a snapshot in milliseconds."""
+    if not snapshot:
+        return ''
+    width = max(len(name) for name in snapshot)
+    lines = [f"{'span':<{width}} {'count':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"]
+    for name, s in snapshot.items():
+        lines.append(f"{name:<{width}} {s['count']:>6} " + ' '.join(
+            f"{s[k] * 1000:>8.2f}" for k in ('p50', 'p95', 'p99', 'max')))
+    return '\n'.join(lines)
+
+
+_shared: Optional[SpanRecorder] = None
+_shared_lock = threading.Lock()
+
+
+def shared_recorder() -> SpanRecorder:
+    """The process-wide recorder; enabled from the start if ``MUSIC_WORDLE_TELEMETRY`` is set."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = SpanRecorder(enabled=bool(os.environ.get('MUSIC_WORDLE_TELEMETRY')))
+    return _shared
+
+
+def metrics_dir() -> Optional[str]:
+    """Directory for periodic exports (``MUSIC_WORDLE_METRICS_DIR``), if configured."""
+    return os.environ.get('MUSIC_WORDLE_METRICS_DIR') or None
+
+
+@contextmanager
+def capture(mode: str, limit: int = 25) -> Iterator[List[str]]:
+    """Profile the block; the yielded list receives the report once it exits.
+
+    ``mode`` is ``'cprofile'`` (top functions by cumulative time) or
+    ``'tracemalloc'`` (top allocation sites still alive at the end, plus the
+    peak). The report is filled in even if the block raises.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"unknown profile mode {mode!r}; choose from {', '.join(PROFILE_MODES)}")
+    report: List[str] = []
+    if mode == 'cprofile':
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(limit)
+            report.append(out.getvalue())
+        return
+    import tracemalloc
+
+    already = tracemalloc.is_tracing()
+    if not already:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    try:
+        yield report
+    finally:
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if not already:
+            tracemalloc.stop()
+        lines = [f'current {current / 1024:.1f} KB, peak {peak / 1024:.1f} KB']
+        lines += [str(stat) for stat in after.compare_to(before, 'lineno')[:limit]]
+        report.append('\n'.join(lines))
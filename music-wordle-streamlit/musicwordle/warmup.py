@@ -0,0 +1,111 @@
+"""Process warm-up: build the shared tables before players need them.
+
+Everything a session shares is built lazily on first use: the dictionary
+(memory-mapped, a few milliseconds), the daily calendar, the hint /
+multi-board pattern matrix, the word-finder bitsets and the did-you-mean
+index. Lazy is right for the first rendered board, which needs only the
+first two, but it means the first player to ask for a hint or open the
+word finder pays hundreds of milliseconds for the rest.
+
+:func:`warm_up` builds them up front and reports how long each took.
+:func:`start_background` does that on a daemon thread, once per process;
+the Streamlit app calls it after its first render (Streamlit gives scripts
+no earlier hook), and ``python -m musicwordle.server`` warms what it needs
+before it starts listening. Set ``MUSIC_WORDLE_WARMUP=off`` to keep
+everything lazy. Every step goes through the same locked ``shared_*``
+accessor a session would use, so a session racing the warm-up waits for
+the one build instead of starting another.
+
+``python -m musicwordle.warmup`` prints the per-step times of a fresh
+process.
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .config import COLS, answers_for
+
+STEPS = ('dictionary', 'schedule', 'matrix', 'finder', 'spelling')
+
+
+def _build(step: str, length: int) -> None:
+    from .dictionary import shared_dictionary
+
+    if step == 'dictionary':
+        shared_dictionary(length)
+    elif step == 'schedule':
+        if length == COLS:
+            from .schedule import shared_schedule
+
+            shared_schedule()
+    elif step == 'matrix':
+        from .solver import full_candidates
+
+        full_candidates(length)
+    elif step == 'finder':
+        from .finder import shared_index
+
+        shared_index(length)
+    elif step == 'spelling':
+        from .spelling import shared_index
+
+        shared_index(shared_dictionary(length), answers_for(length), length)
+    else:
+        raise ValueError(f"unknown warm-up step {step!r}; choose from {', '.join(STEPS)}")
+
+
+def warm_up(steps: Sequence[str] = STEPS, lengths: Sequence[int] = (COLS,)) -> Dict[str, float]:
+    """Build each step's shared objects for each length; seconds per ``step[length]``."""
+    timings: Dict[str, float] = {}
+    for length in lengths:
+        for step in steps:
+            start = time.perf_counter()
+            _build(step, length)
+            timings[f'{step}[{length}]'] = time.perf_counter() - start
+    return timings
+
+
+def enabled() -> bool:
+    """False when ``MUSIC_WORDLE_WARMUP`` is ``off``."""
+    return os.environ.get('MUSIC_WORDLE_WARMUP', '').strip().lower() not in ('off', '0', 'false')
+
+
+_started: Optional[threading.Thread] = None
+_started_lock = threading.Lock()
+
+
+def start_background(steps: Sequence[str] = STEPS, lengths: Sequence[int] = (COLS,)) -> Optional[threading.Thread]:
+    """Run :func:`warm_up` on a daemon thread, once per process (later calls return the same thread).
+
+    ``None`` when disabled.
+    """
+    global _started
+    if not enabled():
+        return None
+    with _started_lock:
+        if _started is None:
+            _started = threading.Thread(target=warm_up, args=(steps, lengths), name='music-wordle-warmup',
+                                        daemon=True)
+            _started.start()
+    return _started
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m musicwordle.warmup',
+                                     description='Build the shared tables and print how long each step takes.')
+    parser.add_argument('--steps', nargs='+', choices=STEPS, default=list(STEPS))
+    parser.add_argument('--length', type=int, nargs='+', default=[COLS], help='word lengths to warm')
+    args = parser.parse_args(argv)
+    timings = warm_up(args.steps, args.length)
+    width = max(len(k) for k in timings)
+    for name, seconds in timings.items():
+        print(f'{name:<{width}}  {seconds * 1000:8.1f} ms')
+    print(f"{'total':<{width}}  {sum(timings.values()) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -4,31 +4,16 @@
   const ROWS = 6;
   const COLS = 5;
 
-  // Expanded 5-letter music words: composers, pieces/forms, instruments, genres, terms
-  // Curated answers only
-  const ANSWERS = [
-    // Composers / artists
-    'haydn','liszt','verdi','ravel','bizet','elgar','satie','grieg','glass','reich','adams','faure','dukas','ibert','nyman',
-    'berio','weber','wolfe','sousa','price','rouse',
-    'adele','bjork','swift','sting','drake','lorde','seger',
-
-    // Instruments
-    'piano','viola','cello','organ','oboes','flute','drums','synth','tabla','sitar','lyres','harps','banjo','reeds',
-    'kazoo','guqin','zurna','veena','sarod','rebab','mbira','bongo','conga','shawm','cajon','snare','fifes','pipes',
-    'guiro','tiple','viols',
-
-    // Notation, technique, and theory
-    'forte','largo','tenor','mezzo','lento','dolce','grave','segue','segno','ossia','pedal','clefs','tacet','tutti',
-    'theme','motif','rests','slurs','trill','staff','stave','codas','pitch','voice','lyric','sheet','meter','metre','tempo',
-    'sharp','flats','third','fifth','sixth','ninth','tenth','round','drone','beats','riffs','licks','tunes','songs','vocal',
-    'notes','score','solfa','cresc','frets','capos','barre','beams','octet','nonet','duets','trios','solos','choir','arias',
-    'carol','vibes','sines','mixer','delay','phase','codec','music','audio','hertz',
-
-    // Pieces, forms, dances, styles, and genres
-    'canon','fugue','etude','opera','rondo','tango','waltz','missa','motet','suite','gigue','salsa','mambo','rumba','polka',
-    'choro','djent','drill','swing','disco','house','grime','metal','indie','blues','folky','samba','bossa','noise','chant',
-    'chime','psalm','verse',
-  ].filter(w => w.length === 5);
+  // Curated answers come from words.js, generated from musicwordle/config.py by
+  // `python -m musicwordle.build` (the Python app uses the same list). If it
+  // failed to load, a few built-in answers keep the game playable.
+  const FALLBACK_ANSWERS = ['piano', 'cello', 'flute', 'organ', 'tempo', 'opera', 'viola', 'banjo', 'choir', 'tenor'];
+  const ANSWERS = (window.MUSIC_WORDLE_ANSWERS || []).filter(w => w.length === COLS);
+  const WORDS_MISSING = ANSWERS.length === 0;
+  if (WORDS_MISSING) {
+    console.error('words.js did not load: using the built-in answers');
+    ANSWERS.push(...FALLBACK_ANSWERS);
+  }
 
   // Guesses: English 5-letter words. Seed with a small built-in list and
   // allow loading a larger dictionary file via the UI (Load Dictionary).
@@ -88,6 +73,11 @@
   let statuses = Array.from({ length: ROWS }, () => Array(COLS).fill('')); // correct/present/absent
   let finished = false;
   let seedStr = computeSeed();
+  // Optional server-validated daily games (python -m musicwordle.server):
+  // set window.MUSIC_WORDLE_API = 'http://host:8765' before this script loads.
+  const API = (typeof window !== 'undefined' && window.MUSIC_WORDLE_API) || null;
+  let apiGame = null;   // server game id while one is active
+  let apiPending = false;
 
   // Deterministic RNG helpers for seeded choice
   function xmur3(str) {
@@ -117,6 +107,22 @@
     const idx = Math.floor(rnd() * arr.length);
     return arr[idx];
   }
+  // Precomputed daily calendar shared with the Python app (schedule.js).
+  // days is base64 of little-endian u16 answer indexes, one per day from epoch.
+  let scheduleDays = null;
+  function scheduledSecret(iso) {
+    const sched = (typeof window !== 'undefined') ? window.MUSIC_WORDLE_SCHEDULE : null;
+    if (!sched) return null;
+    if (!scheduleDays) {
+      const bin = atob(sched.days);
+      const view = new DataView(Uint8Array.from(bin, c => c.charCodeAt(0)).buffer);
+      scheduleDays = new Uint16Array(bin.length / 2);
+      for (let i = 0; i < scheduleDays.length; i++) scheduleDays[i] = view.getUint16(i * 2, true);
+    }
+    const day = Math.round((Date.parse(iso) - Date.parse(sched.epoch)) / 86400000);
+    if (!(day >= 0 && day < scheduleDays.length)) return null;
+    return sched.answers[scheduleDays[day]];
+  }
   function computeSeed() {
     const daily = dailyToggle ? dailyToggle.checked : true;
     if (daily) {
@@ -134,7 +140,8 @@
   buildKeyboard();
   // Init seed + secret
   updateSeedUIState();
-  secret = seededChoice(ANSWERS, seedStr);
+  secret = pickSecret();
+  startServerGame();
   updateBoard();
   setSeedMessage();
 
@@ -151,7 +158,8 @@
   if (hcToggle) onHighContrastChange();
 
   function pickSecret() {
-    return seededChoice(ANSWERS, seedStr);
+    const daily = dailyToggle ? dailyToggle.checked : true;
+    return (daily && scheduledSecret(seedStr)) || seededChoice(ANSWERS, seedStr);
   }
 
   function buildBoard() {
@@ -217,6 +225,7 @@
         return setMessage('Not enough letters');
       }
       const guess = grid[currentRow].join('').toLowerCase();
+      if (apiGame) return submitToServer(guess);
       if (!allowedSet.has(guess)) {
         shakeRow(currentRow);
         return setMessage('Word not in dictionary');
@@ -240,8 +249,8 @@
     }
   }
 
-  function revealGuess(guess) {
-    const res = scoreGuess(guess, secret);
+  function revealGuess(guess, scored) {
+    const res = scored || scoreGuess(guess, secret);
     statuses[currentRow] = res;
     // Update keyboard statuses with max priority: correct > present > absent
     res.forEach((st, i) => updateKeyStatus(guess[i].toUpperCase(), st));
@@ -351,7 +360,9 @@
 
   function setSeedMessage() {
     const daily = dailyToggle ? dailyToggle.checked : true;
-    if (daily) {
+    if (WORDS_MISSING) {
+      setMessage('Word list failed to load (words.js) — playing with a few built-in words. Try reloading the page.');
+    } else if (daily) {
       setMessage(`Guess the music word! Answers: ${ANSWERS.length}, Dictionary: ${allowedSet.size}. Seeded with (UTC): ${seedStr}`);
     } else {
       setMessage(`Guess the music word! Answers: ${ANSWERS.length}, Dictionary: ${allowedSet.size}. Seeded with custom: "${seedStr}"`);
@@ -371,9 +382,54 @@
     return `${p} You solved it in ${tries} ${tries === 1 ? 'try' : 'tries'}.`;
   }
 
+  async function apiPost(path, payload) {
+    const resp = await fetch(API.replace(/\/$/, '') + path, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(payload),
+    });
+    const data = await resp.json();
+    if (!resp.ok && resp.status !== 409) throw new Error(data.error || resp.status);
+    return data;
+  }
+
+  function startServerGame() {
+    apiGame = null;
+    const daily = dailyToggle ? dailyToggle.checked : true;
+    if (!API || !daily) return;
+    const requested = seedStr;
+    apiPost('/api/new', { daily: true, date: requested })
+      .then(game => { if (seedStr === requested && currentRow === 0) apiGame = game.id; })
+      .catch(() => { apiGame = null; });
+  }
+
+  // The server scores the guess and checks the dictionary; if it cannot be
+  // reached the game carries on locally with the same scheduled secret.
+  async function submitToServer(guess) {
+    if (apiPending) return;
+    apiPending = true;
+    try {
+      const res = await apiPost('/api/guess', { id: apiGame, guess });
+      if (res.outcome === 'unknown') {
+        shakeRow(currentRow);
+        const near = (res.suggestions || []).map((w) => w.toUpperCase());
+        return setMessage(near.length ? `Word not in dictionary. Did you mean ${near.join(', ')}?` : 'Word not in dictionary');
+      }
+      if (!res.statuses) return setMessage(res.message || res.error || '');
+      if (res.answer) secret = res.answer;
+      revealGuess(guess, res.statuses);
+    } catch (err) {
+      apiGame = null;
+      setMessage('Server unavailable — playing offline.');
+    } finally {
+      apiPending = false;
+    }
+  }
+
   function resetGame() {
     seedStr = computeSeed();
     secret = pickSecret();
+    startServerGame();
     currentRow = 0;
     currentCol = 0;
     finished = false;
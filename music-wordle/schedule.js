@@ -0,0 +1,2 @@
+// Auto-generated by python -m musicwordle.schedule export-js
+window.MUSIC_WORDLE_SCHEDULE = {"epoch": "2025-01-01", "answers": ["haydn", "liszt", "verdi", "ravel", "bizet", "elgar", "satie", "grieg", "glass", "reich", "adams", "faure", "dukas", "ibert", "nyman", "berio", "weber", "wolfe", "sousa", "price", "rouse", "adele", "bjork", "swift", "sting", "drake", "lorde", "seger", "piano", "viola", "cello", "organ", "oboes", "flute", "drums", "synth", "tabla", "sitar", "lyres", "harps", "banjo", "reeds", "kazoo", "guqin", "zurna", "veena", "sarod", "rebab", "mbira", "bongo", "conga", "shawm", "cajon", "snare", "fifes", "pipes", "guiro", "tiple", "viols", "forte", "largo", "tenor", "mezzo", "lento", "dolce", "grave", "segue", "segno", "ossia", "pedal", "clefs", "tacet", "tutti", "theme", "motif", "rests", "slurs", "trill", "staff", "stave", "codas", "pitch", "voice", "lyric", "sheet", "meter", "metre", "tempo", "sharp", "flats", "third", "fifth", "sixth", "ninth", "tenth", "round", "drone", "beats", "riffs", "licks", "tunes", "songs", "vocal", "notes", "score", "solfa", "cresc", "frets", "capos", "barre", "beams", "octet", "nonet", "duets", "trios", "solos", "choir", "arias", "carol", "vibes", "sines", "mixer", "delay", "phase", "codec", "music", "audio", "hertz", "canon", "fugue", "etude", "opera", "rondo", "tango", "waltz", "missa", "motet", "suite", "gigue", "salsa", "mambo", "rumba", "polka", "choro", "djent", "drill", "swing", "disco", "house", "grime", "metal", "indie", "blues", "folky", "samba", "bossa", "noise", "chant", "chime", "psalm", "verse"], "days": "XwAJAEkAFwBEAGQAhACgAFIAnABrAJMAlQBPAIYAMQA+ABsAOgBAAAEAfAA9AFoAbwAGAJgAfQCQAIMAIAB6AG0AEABbAE4AVQACAAcAFQBpACgACwAeAJcAHQBDAEEAPwANAAAASABKAJ8AUQAaAAoANgAvAIgAfgBLAA4ALQCdABkAcQBdAJEAIgB7AGcAdAApADgAkgBgADsAagB/AIsAgQAlAJ4AYQBlAFcAYgBFACEAdwBCAIkAjAAqAIAALABcACsAEQAEABgARgAzAFQAEwBQAHIAHAB2AI4AmwAnABYAXgAmAGgAMACNAHAAUwCZAE0AbgAPADkANAAMAEwAjwBzAGwANQB5ADcAJAAUABIAAwCHAAgAggCWAGMAIwBZAFgAigA8AC4AdQCFAHgAVgBHAB8AMgBmAJoABQCUAD8AQACNAIMAFgAgAAoAIgBUAA4ALAA4AAkATgCLAJcAOgAlAJIAKgBxAGcAgABkABgAYQAnAEIAVQCTAKAAewBXAAYAmAB2ABkALwAtAFAAhQBMAEcAHwAFAGwACAASAG4AYwABAF4ADQCUACMAawBvAFMAngA9AFIAAACRAIQAYgByAI4AhwCGAH4ADwA0ACgAnACWAH0AnQCKAFwAVgB/AGgAmQBwAJUABwA1AHkAaQCQAEEAjwBZABsAgQBaAHQAEQBfADkAZgA7AJ8APgAMAFgAiQCCAFEABAAhAHgAmwBtADAAEwCIAB4AFwBKAEsAXQAuAHoAMQALAHwATQB3AEgAjAAQAGUAHQAzACsANwApAJoAAgAcADwAdQBGAEQAFABzACYAMgADAEkANgBFACQAGgBbAE8AagAVAGAAQwA4AIgAQgAtABYAbQCTACoAeABmAB4AXwBHAFAAFwA7ADkAlwAgAHIAjwAsAIAAggB7AC8AVgAwAE4AmwBwABMAJwBiAAUASgANAHQAkgCKAEkAKQBDABwACwA8ABAASAAUAEYARQBNAHwAmgAuAFsAkQAhACsAjQBPAAMAUgAkAHMAbwCcAJgAgwBxADIAngBqAD0AAgB3AEsAaACdAJQAQQCFABUAEQA3AJkAAQAYAJAAdQB9AAAAOgAOADMAJQBnADQAGQCJAHkAlgAdAAQAMQAfAEwAdgAjAGAAYwAKAAwAPgCGACIAWABuAFwAWgCMAKAAPwCHAAYACQCVAHoAiwBZADUAVwBdAJ8AKABUAGUAJgBrAGQAVQAPADYAGwB+AFEAbACOABoAUwCBAH8AEgCEAAcAQABeAAgAaQBEAGEAcQB0AI0AeAAFAEkAggBwAJcAGQBuACMALgAhABYACgBYAJwACwBcABcAbQAMAA0AkwBMADgARQAxABEAWwBOAJ4AIgAVAIgAHAAUAIkAQgCOAA8AoACEAFEAJgBAAJUAGgAHAH8ARACfAHoAZAAoAD8AaQBKACQAQwCaACAAAgAGAGsAYwAbABgAjwCMAFMAmwBgAH4ANABSAGEALQA9ADkAZwAsAIoARgCLAB0AMgBvAJgAMACSAEcAAQCDAF8AAACFAJQAEgAEADoAbAADAJ0AewByAGoACQAIACUAPAAnAEEAVwCZAIYASwCQAFYAEAB8AE0ANQBmAHUAMwBeAGIAXQCAAHcANwAqAEgAHwBaABMAPgBZAJYALwArADsAfQB2AFAAHgBUAGgAgQA2AIcAeQBVAE8AcwCRAA4AKQBlACQAFQBSACIAAACYACMACABCAEYAbAAYACgALgAwAAMAYwAgAAwAPAAFAIgARQCCAJAAbgAdAEcAiwAsAGkACQCUABYAeAA/AH4AlQA9AIMANQA+AHcAKwBdABMAMwA7ADcATQB8AEgAaAAfAGUAHgBmADIADwB1AAsARABhAG0AWQBfAH8AJwBeAFsAbwA6AI8ATAAlABQALwCRAIcAQACgAFcADgCMABsAGQCdAI0ANgBgABoAgQAXAFwAUwBRAHAAjgCFAAEAlwAEAGsAcwBxAFQAnwCSAEoAngANAFUAnACbAE4AAgCWAGcAcgAhAC0ABwB9AHQAKgA0ABIAHAAmAEsAigCGAFoACgAQAIkAkwB7AEMAhACZACkAUABkAGIAdgBqADkAEQBPAEEAmgAGAHoAVgBYADgAMQB5AEkAgACMAC8AfACVAAwAbgCYAB8ATQBOAEoAGAArACcAVAB4AJAAlwBxAFkAIACHAGgAPAAdAJYAgwBwAGkAkQANAGYAIQCPAFEAPgAAAH4ACQBcAIoAkwBPABAAfQBJAGoAHABDAEYAQAAiAGEACwA0AGIAHgAIAC0AGQA3AI0AdAAEACwAmwCUAEIAnABkAH8AFAB6AHIAhAAlABEAbABrABcAXQA5AIYAbwBMAA8ARQBWAF8AGwAGAHkAYABSAFUAYwApACoAjgBTAEEAJgA6AAUAAQCSABIAAwBYABoAPwAyABYAXgATADgAiwCgAHcAdgA9AEcANgCAAFcAZwAVAFoANQAkAAIAmgAxAJ8AUACCAHUACgA7AIEAWwBEAC4AMAAzAG0ADgBLAIgAewCZAIkASABlAJ0AngAHACgAIwBzAIUABAAAACYAKwBuAEoAoABMAFkAWABUAJMAIgBSAHgAfgAdAJYAgwBsAHQAagAJAAMAYQAhADoADACLAEkAlAALAJEAdwCKACUAmwA5AIYARQCAAJ8AKACBAJkAWgAuADEAiACEAAUAAQAsAIIAaQBmABgAkAATAFMATwCcAIUAdgAHABEATQA+ABoAjwBkAEIAQQBrABwANQBWAHkAjQCXAEAAVQBjADcALwAWAJgAcwBGAHAAWwBEABUAZwA2ABkAKgAPAHoAMACJAHwAmgAnADwAfQBgAG8AdQASAGIAcQA0ABAAGwACAFcAewBtAF0AjACHAJUAOABQAJIAUQAyAE4ADgAtACAAXABeAEgAcgBLAAoAHgAfAAgARwA9AA0AFABlAF8AMwAjAI4AngAkAGgAOwAGAH8AFwCdAD8AQwApADwAZwBPAEYAdwB2AIMARACgAIUAlwAiABsAggCAADEAagB8AC4AjABWAFMAYAB+ADkAAwAZACcAiQBzAHUAbwALAGwAiABXABIAHQBpAGYAHgA/AAoAhwCeAH8ADgAIADsAIwAoAG4AhgBFAAEAXwBOAHkAXABSAGgAIQCSABAAMgBtAFAAVQBjAGQAGAB0AGsATAA4AE0AlAAlACsAgQAwAFEABwBeAEMACQCOAEoAHAATAGEAjQARAJUAWQByAEAAMwAXAHEALwB9AHgAmABCAAUAhAAGAJsAFAAsADUAPgAfAEEAnwA2AA8ALQCWAJkAjwBIAJ0AYgAMAF0AKQB7ABYAJACKACYADQBbAGUAKgBHADcAegCQAEkAkQCaAJwAPQBYADQAWgAaADoAkwBwAIsAVAAAAAQAFQBLAAIAIACFACMAVgAvAEAAJQCBAE4AgwASAFEAcgAxAC0AaAB2AGQAmwAYAFIANQAbABAAKACSAGwAgAAOAHMABwBqAIcATAB9AC4ALACeAAEAoAB5AF0ANAAgAAwAigCPAFoAWAApAJ0AcAA3ACoAiwADAB4AlQAAAF8AMAA/AG8AGQBPADIAPgB+AEIAkAB1AJYARgAXAGEAEwA8ADoANgBTAHoAJgA5AGYAAgBDABYARABnAEkAhAAFABoAhgBuAGkAcQCIAGsAfwALAEoAlACaACQAjAB0AHgAHwBIAHsAQQA7AJcAFAB8AG0ADwAiADMAUAA4AGAAdwBUAAkADQBNAI0AiQBbAAYAHQCfAD0AmQCYABUASwBVAGIAjgBlAGMABACRAJMAggBFAF4ACAArABwAEQAnAFkAXACcAAoAVwBHACEANwB2AE8AcABKAH8AWgADAJQATgASAAAAJAAtAIsAagCAAHgAUQCdADwAcQCFAJ4AMQAHAJIAVgAsAIcAigBdAJoAdQBJAEYAHwBfABgAZgAcAJgAVQA9AEUAiQBLAA0AggBiAHcAkQAVAFwAnAB6ADYAawCXAEQAGQAWAFcAYwA7ADQARwBuAFMAlgBYABcAOACEAGkAEQBkAI8AYABtAAYAgQAaAAoAiACQAD4ANQB5AEwAcwABAC8AIQArAGcAQABbADkAVACOABAAQgAOAEgAMgCZACcAZQBQAE0AOgCVACgAnwAeAGgAMABvABsAKgBsAAgAQwAEAGEADAByAJsAdACMAAsAewBeAC4AQQAPAI0AfQApAB0AIgCTACYAUgAgAAkAfAB+ABMABQAjAIMAJQAzAD8AoACGABQAWQACAEYASQBNAEUANQASAGsAZwBYAFUAbQArAIkAYACYAFAAOwCIAIUAgQCLAEcAaABWADwAOAB4ABoAFgBbACcAMABkADcASAAeAHEAdgCfAJoAjACNAC4ACQB+AAwABQALAAIAoAB7AF4AcAAEAIYASgBCAB0AXQCOAHUAigBLACUAegAcAJMAbACZABkANgAYACEAfQCSAEwAbwBlADkAmwB/AHIAEwBTAAYAggBqAAcAKQA+AHkAbgBOAAMAFACRAJQAQACDAC8AhACVABUADgA/ACQAQwCdABsAQQBiADEAWQBaAGEAEACAAA8AMgBSAFwARAAoAJ4AlwBXAFQALABzAGkAnAAmAJAAIwAIAC0AFwA6ACoAdwBPAJYAAQAfAHwAhwAzAHQAIAARAF8AjwAAAGYAPQANADQAUQBjACIACgA8AIgAcQCBAFsACwBdAD4ABgBrAIQAmACFADgAewB1AI4ATQATAGwAeABAAFUAoAAZAAIABwBkAEoABQAdAIIABAAYAD8AYAAVAAwAWgCRAF8ALAA0AI8AAQCHAHQAVAAKAGMAIwA9AC0AKgAmAEgAOgBnAEIAUAA7AIwAUgBuAFEAMAB+AJAAHgB/AIYANgANAFMASQCAAJsAkwByAG0AEABHAGkAWABcAJkAQwCUABYAIAAkAJYAngBwAGUANQASAGoAVgAAAAkALgBXAHcAEQAiAHkAGgA5ADMALwCXAEwAigBEAJwAcwBBAEYAfABeAEUAJwBLAJIAmgBZADIADwAxABwAYQB9AGYAdgCdAGIAjQBPACgAlQAUACkAegBOAA4ANwAlAAgAaAArAIsAbwAhAJ8AgwAbAB8AFwCJAAMABACMAJcAFQARAFYAlAA4AFoAhQCeAEkAPwAtAGUAawBQAEwADQB4AD4AkwBkAJwADABIAGkACwBRAIAAHQCHADwATQByACMAOQA0AFMAIAAxAI0ATgCLAG8AiQBZAAgAYQAoAGYAgwAcACkAJwBPAEsAlQAyACsAnwCdABcAmQB6ADsAmAAqAIEAjwBYABMAfgAAAG4AjgB9AEIAYwCCAA8AdQAwAJIARgB3AFcAQwBxABQAkACWAFsAdgBcAAkAFgB0ADMAcwBnAAYABwB7AGAAXQBoABsAEgAZAEAARQCgAEoAHwCbAD0AXgADABoARAAuADUAOgAiAH8AXwABAG0AhACGAFIAVQCaAAoAYgCKADYALAAlACYABQBqAFQAQQBHAC8AeQAeAJEAEAB8ACEAGAAOAGwAiAA3AHAAAgAkAJ8AcgBKAEAACACXADsATwANACsABAA9ABYAQwB1AHoAaABCADQAmABjABoAWgCTAJkALQCVAFgAaQCdABkASQCCAHEAkgAgAI4AgACgAAMAmgCGAAUALwBfAAIAGAAeAFUAOgBsAIgAJAAlAGQAAAA5AHAATAAPAFIAMwBqAFcAXgAQADwASACDAEYAbwAGABUATgBWAB0AfAA4ADIAEgAnAHkAhQB9AGYAHABNAGAANQBUAH4AMAAqAAsAHwARAGIALAB0AI0APgBZAFMAWwBLAAEAewBRAGcAZQCUADcARQAOAG0AJgCRAIEAGwAHAAwAIgBHAJsAFwCEAEEAFAATADYALgCWAIoAKQCeACEAjAB/AAoAiQB4AIcARABrAHMAnAAxAJAAPwBcAF0AYQBuAFAAIwB2AHcAKACPAIsACQCOAJQAfQAcAJoAQABoAIIAnwAFAAcATwArAAMAHQCTADgAlwBtAI0AYAAaAG8AXwBxABkACwBFAJ0AhgB7AIMAZwARAEgAEgBGAFUAOQBKAGEAiwCJAJwAlgBuACkAXAAoAAoAIgB4AJAAXQAfADcADQA2AHkAdQCIADAAEACYABgANABLAHIAgAAUAAEAVACRAJUAcABJAFYAWwBNAIQAIwCgAI8AMwA8AAkAUwA6AD8ADAAqAAAAJQAtAD0ARACKAHoAdwBpACAAJACZAH8AgQBXAAQAMQAeAF4ATgB8AAYAJgA7AJ4AUgA+AEwAkgBZAGYAmwBHAGoAYwBiAAgALwAnAFEAdAAPACEAdgBzACwALgAyAEIAZAAbAEEAWAAXAGsADgCMADUAAgBDAFoAhwAWAGUAfgATAFAAFQCFAGwALQAjAEoAGQB7AIkAOgCcADcAVgBJAFcAlwBSAIYATAB5AJIAPwAGACYAbwCdAD4AAwCWADsAIgBcAFsATQAHAJAAEAB3ADkAmACaAJQAhABDAAIAUAAyABsAhQAIAGIAZgAhAGsALAAVAHQADwBgAEQASABxAB0AEQAlAAAALgCBAGEAWAByAAQAXQAfAAwAQQBTACcABQBpAI4AnwATACsAkQCgAHUAMQBZAE8AUQAwAAsAfQCeAGMAEgAoADMAdgCLAFQAHgCIAF4AFACTAIwAegBtAEUAfgBlAGgADgAgAH8AlQCPAGcANQCAABoATgCDADYAPQA0ABgADQAcABYAVQBAADwAZAAqAG4AjQCbAEcAfABsAHMAOAAvAIcAFwBLAAEAQgB4ACQAggCKAHAACQBqAF8AWgAKACkARgCZAH0AEgA/ABMAhAA7ADMAlQBbAE4AOgBFAF0AdACcACYAZQCfABEAEABxADAAKwCJAFMAdwAHADEATAAtAHsANwByAG0AAAAVACgASgBhAH8AZABsACkAKgBwAFUAgwA2AI0AggBzAAkAJAANAAEAhwAdABgAhQAGAC4AegAfAFEAgAADAGMAZwCGAG4AQgBNAGIAngCMAHkARwBIAGoAkwCZAFYAFAAFAJAAZgAPAGAAMgBZACcAOAAXAAoAPQBfAD4AdQA5ABoAnQAeAFwAoABSAGsAlwAvAAgAVwBGAHgAlgAZAGkAaAA1AJIADgCYAI8AbwBYAFoAIwCBABwAdgAlAE8AiAA0AAwAIQBBAFAAlABUAI4ARACaAH4ASQBDAF4AigCLACAAPABAACwAfAALACIAFgCRABsAmwAEAEsAAgBWAIAASAA/AFwAKQAAAEYAfwBCAB4ANgAaAAMAOwBpAEUAJwBnAHIAAQBmACsAbgA9ADMAPgCDAIIAMAARAGsAeQBgAJgAKAAKAIQAaACGAJsAfAA8AH4AGwAMAEMAiwCIABwAXgBEAF0AMgATAJEAbwAmADEAYgCHAIwAkAA3AFkAnQB6ACwAWABPAEsAEACcAAkAVAAiAEAAlQAXAG0ACABNAH0AUgB0AAQAFgAHADUAUwBBAJoAYQAYACEAjQAfAHgAbAAkAI4AlAALAFoASgCPABQAEgCFAIkAZACeADgAewCKABkAlwAGABUAHQBqACMAdgBHAKAAJQA5AA8ANAAqAJIALgCBAA0AOgAvAF8AcwAtAFEABQAgAA4AnwBwAJMATgBMAEkAcQBlAFsAVwBQAFUAdQCZAAIAYwCWAHcACgBWAJ4AewBCAGcAKQAXAFwAjgAYAGwAdABUAIgAAQBFAI0AAwBiAE0AeQAmAGgAUgCCAEQAGwAIADAAGgAcAIkAhABmAFoAEACAAHIAeAAPAC8AAgCfAAUAlgCZAFcAIwCgAE4AUQBjACUAgQAyAJgAPwBdABUAgwBxAG0AmwBrAHAABgA4ADwATwA1AJEAfQA0AD0ATABDAIUAOgCTAIcAJABeABMALQBIAHUAYAArAGoAMwBvAEAAHwBVAJcAUAB2ACAAhgBHAEoAKAB6AJwAIgB+AI8AEgBuAD4AXwCaAJQASQCKAGkAEQAWAFMAQQANAAsAfwAOAJUAJwAZADsAHQBhAAkAWwBGACoAWAAxAJAAcwAeAAQAIQB8ADYAdwA3AIwAFACdAFkASwCLAGUAkgAMACwALgAAAAcAZAA5AIgAmAAfAI8AOgCfAHUAGACgADQAagCUABYAcgB2ACMAaABwAJcAkwBnAAIAkQAgAIoAIgB+AGAAJAAbAFoAgABKADIAeABHAD8ALQBQAIMABAAnAHcAFAAOAJAAMQA7AAcATgAZAF0AlgCVAAYAEwBbAA0AcwBLAF4AaQADAGIACgBVAG0AjQARAJkAmgAmACoAPgBWAHsADwArAFcAfABFAG4AEgAAABcAZgABAEkAhAAzAHEAmwA8AFIAjgBlAHoALgBhACEAnQA1AHkAUQBIABwAiwCSAAUAUwCJAIcAQACCACUATwA3AH0ANgBkAGMARgAvAFkAQwA5AJwACwBNAEQALABBABUAKACGAH8AEAA9AFQADAAwAIUACQApAEIAHgCBAGwAXABrAFgAbwCeADgATAAIAB0AjABfAHQAGgAhABkAAQAXABMAlgBaACAAMgASADQABwBwAB8AhAB+AF0ANgAGAGIARwCUAJUAJABzADcAkgAUAJcAAwA7ACoAUQCHABwAIwBxAGMAPwAzAF8AOAAVACgAQgAaAD0AjAAdAFwACQCeAJ0AUwALAHwABQBsACwARgAiAFAAiAA+AFUAFgB5AE8AewBZAJgAHgAtAEQAggBlAJAAMABNAGAAAABJAIsAkQAYAEMAUgBKAJoAkwA6AIkAYQCKABAAfQAPAHYALwBvAEUAhQAuAGkABABOAI0AKwCAAHQAhgCDAI4AJwCgADEAAgBUAG0AQQBWAFgAjwBoAA0AVwBrACkAeABAAEwANQAbAA4APAB/AJsADAB3ACYAagCBAJkAegBnAGYAXgCfAEsAEQAIAJwAOQBkAHIAWwAlAHUAbgBIAAoALQCRADAAfAAyAAMATQCCAFAAEACeAAsAYgAXADEAVABdAEcAVgAaAE4AhQBxAFUAHgB2ACMAAABJAC8AbQCGAEMAewAkAFoAIQAfAJQAUwAmAJsAGwANADUAdwCfAHoASAARAEsAOQAOAI8AYAAFAAcAagCMAEAAVwBSACsAaQBfAEwAaABFAFgAfQCKAIsAfwA8AJUAWQBKAFsAIgASABgARAA9ADYAZAAzAEEAmACZAAYACACNABQAfgCBAKAATwBlAI4AZgAVABkAnQAdADoAKABCAIcAbACcAHkAJwAuAAIAKgBGAGsAYQA4AHMACQCEAHIAIABnAD4AiQBuADsAlgBvAIAACgBeABYAcAB0AJIAYwAcAAEAmgCQACUALAA0AIMAiAApAHgAUQAPAJcAEwA/AAwAXAB1ADcAkwAEAIoAmwBFAIwAaABYAAkAVABrAH4ACwCOABUAEQBIAEwAewAzAFYAZABaADUASwCGAAMAegCUADkAeQAfAFAAJACdAGAAXQBDADoAiwBTAIcAJQBjADcAXgATAHUAeAAKAJYAPgA/AJcABACJAIgAVQB/AIIAgABfACcAGgByAEoADABNADYAlQBZAJEAkwAdAIUAdgBXAH0AagCDAA0APAAsAJ4AnwAcAEIAMgAuACMAPQASAHQABgBlAJwAFwAWABgAEABxAIQAWwA0AGkAXABmADEASQCSAHAAIQA="};
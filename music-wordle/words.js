@@ -0,0 +1,9 @@
+// Generated by python -m musicwordle.build from musicwordle/data/allowed.txt; do not edit.
+(function (w) {
+  var L = 5, s = "0aahed2lii2pas2rgh3ti1baca4i4k4s3ft3ht3ka3mp3nd3se4h4k3te3ya2bas3ed4s4y3ot2cee2eam4r4t3er3le3ng3rs3ts3ys2hor2ide3es3us2jad3ud2led4r4s4t3ow2mho2net2ode3hm3il3ma3on3rd4e4n4t3ut3ve2ram4y3im4n4s2sey3it2una4e3ra4n3se3ts3zz2yes3sm4s1cais3ra4i2cas3ha3oy3ra2edy3ne3rb4s3ta2har3ed4r4s4y3oo2ids4y3es3ng4i2kee4r2mes3ic2ned4s2ock3el3ld3ne3rn2ral3ed4s3id3on4s3yl2tas3ed3in3on4r3us2ute2yls1dage3pt3ts3wn4s3ys2bot2das4x3ed4r3in4o3le3ra2ead3em3pt2han3oc2ieu3os3ts2lib2man3en3in4t4x2nex2obe4o3on3pt3rb4e4n3wn3ze2rad4w3ed4t3ip2sum2uki3lt3nc3st2vew3ts2yta4s2zed4s1ecia2des2ger3is2ons2rie3os2sir2vum1fald3nc3ra4s2ear2fix3ly2ion3re3zz2laj4p3ow2oam3ot3re3ul2ret3it3os2ter3os1gain3ls3ma4i4y3pe3rs3sp4t3te4y3ve3ze2bas2ene4t3rs2gag3er3ie3ri4o4y2has2idi3la4e3ng3os3sm4t3ta2lee4t4y3oo4w3us2mas2oge4o3ne4s4y3od3ra2ree3ia4n3os3um2ued4s4y3na3sh3ti1head4p3nt2igh3nd4g4t2old4e2ull3ru1idas3ed4r4s3oi4s2ery2gas3ht2led2mag4k3ed4r2nee3ga2oli2red4r3ns3th4s2sle2tch3us2ver2xes2yah3ee3oh4o2zle1jies3va2uga3pa2wan1kara2ees3la3ne2ing3ta2kas3er2oia3ja3ya2sed4s1laap3ck3la3mo3nd4e4g4s4t3pa4s3rm4y3ta4e3ys2bas3ee3id3um2cea4s3id3os2dea4r3ol2eak3ck4s3em3fs4t3ph3rt3ws3ye2fas2gae4l4s3id4n3or4s3um2ias3bi3ck3en3fs3gn3ke3ms3ne3os3st3ve3ya2kie4n3os3yd4l2lan4y3ee4l4n4r4y3in4s3od4t4w4y3us3yl2mah4s3eh4s3ud4g2ods3ed4s3ft3ha3in3ne4g3of4s3se3ud3we2pha2tar3er3ho3os2ula3ms4y3re4k2var2way1mahs3in3ri4o3ss3te3ut3ze2ban3er3it3le3os3ry2eba3er3nd4e4s4t2ias3ce4i3de4o4s3es3ga4o3ne4o4s3rs3ss3ty2las2man4s3on4s2nia4c4o2oks3le3ng3re4t3ur3ve3wt2ped3le4y3ul2rit2uck3se2yls1nana3ta2cho3le3on2dic3ro2ear3le3nt2gas3el4r3le4o3ry3st2igh3le4s3ma4e4i3on3se2ker3hs3le3us2las2nal4n4s4t3ex3oy3ul4m4s2oas3de3le3my2sae4s2tae4r4s3ed4s3ic4s3ra4e3sy2ura2vil2yon1orta1pace3ge3id3rt3yd4s2eak3ek3rs4t4y2gar2hid4s2ian3ng3ol3sh4m2nea2ode4s3ls3op3rt2pal4m4y3el3le4y3ro3ts3ui4y2res3on2ses3is3os2ted4r3ly1quae4s1raba3ks3me3rs2bah4s3or2ced3hi3os3us2deb3or3ri2ead4e4l4r4s3ca3dd4e3fy3ic3na4e3pa3re3te4s4t2gal4n3il3le3ol4n4t3ue4s2hat2ias3el3ki3ls3ot3se4h3th2ked2led4s2med4r4t3il3or2nas3is3ut2oba3ha3id3ma3se2pas3en2rah4s4y3et3is3ow4z2sed4s4y3is3on2tal3el4r3ic4s3ly3sy2uhe3ms2val3ee3os2yls1sada3na2con4t3us2dic2hed4n4s4t2ide3ty2kar3ed4r4w3oi4s2pen4r3ic4e4s3ro2sai4m4y3ed4s4t4z3ot2ter3ir3un2ura2way3im2yla1taps3xy2igi3lt3my2las2man4s3os2ocs3ke4s3ll3ms4y3ne4y3py2ria4p2tap4r4s3er3ic2uas1ucht2dad4x3io4t2gen4r4s3ht3ur2las3ic3oi4s2mil2nes3ts4y2rae4l4r4s3ei4s3ic4s3um2tos2xin1vail3le3nt3st2els3ns3rs4t2gas2ian3ne3on3se4o3ze2oid3ws2yze1wait3ke3rd4e4i4n3sh3to3ve3ys2dls2eel3to2ful2ing2kin2mry2ned4r2oke3ls3rk1xels2ial3le4s3ng3om4n3te2led4s2man3en2oid3ne4s1yahs3ya2elp2gre2ins2mag2ont2res3ie1zans2ide4o3ne2lon2oic3le3ns3te4h2uki3re4n4y2ygy3me4s0baaed3ls3ps2bas3by3el4s3ka3oo3ul4s2cca4o4y3ha4s3ks4y3ne3on2dam3dy3ge3ly2els2ffs4y3ta4s2gel3gy3hs3ie3sy3ua2hts3us4t2iks3le4s3rn3sa3th4s3za4e2jan3ra4i3us2ked4n4r4s3ra2las3ds4y3ed4r4s3ks4y3lo4s4y3ms4y3oi4n4o4t3sa3ti3un4s4t2mas3bi3ma4y2nak4l3co4s3da4h4s4y3ed4s3gs3ia3jo3ks4y3ns3ts4u4y4z3ya2ons3zi2ppu3us2rbe4s4y3ca3de4o4s4y3ed4r4s3fi4s4y3ge3ic3ks4y3ms4y3ns4y3on3ps3ra4e4o4y3ye2sal4n4s3ed4n4r4s3ha4o3ic4j4l4n4s3ks3on3se4i4o4y3ta4e4i4o4s2tch3ed4s3he4s3ik3on4s3ta4s4u4y2uds3ks3lk3rs2vin2wds4y3ks3ls3ns3rs3ty2yas3ed4r4s3le3ou3ts2zar4s3oo1ball1days1each3ds4y3ks4y3ls3ms4y3no4s4y3rd4e4s3st3th4s4y3us4t4x2bop2cap3ke4s2dad3el4s4w3im3ye2ech3di3fs4y3ps3rs4y3ts2fit3og2gad4n4r4t3em4t3in3ob4t3um4n2ige4y3ng4s3ra3sa2kah2lah4r4y3ch3ee3ga3ie4t3le4i4o4s4y3on4w3ts3ve2mad4s3ix3ud2nch3ds4y3es4t3ga3is3ji3ne4i4y3to4s4y2pat2ray3es4t3gs3ko4s3me4s3ob3ry3th3yl2sat4w3ee4s4t3it3om4t3ti4s2tas3ed4l4s3hs3id3on3ta4y2van3el4r3or3ue3vy2wdy3et3ig2zel4s3il3zy1hais3ji3ng3ts3va2els2oot2una3ts1iach3li4y2bbs3es3is3le2ccy3ep4s3ky2ddy3ed4r4s4t3is3on3ri2eld3rs2ffo4s4y3id2gae3gs4y3ha4t3ly3os4t2hon2jou2ked4r4s3ie3ky2lal4t3bo4y3ed4s3ge4y3ks3ls4y2mah4s3bo2nal3di4s3er4s3ge4o4s4y3it3ks4y3ts2ogs3me3ns4t3se3ta2ped3od3py2rch3do4s3is3ks3le4s3os3rs3se4y3th3ze4z2ses3ks3om4n2tch3er4s4y3os4u3sy3te4s4y2via3vy2zes3zo4y1labs3ck3de4s4y3er4s3ff3gs3hs3in3me4s3nc4d4k3re4t3se4h4t3te4s4t3ud3wn4s3ys3ze2eah4k4r4t3bs3ch3ed4p4s3nd4t3rt3ss4t3ts3ys2imp4y3nd4g4i4k4s4y3ps3ss4t3te4s4z3ve2oat3bs3ck4s3gs3ke3nd4x3od4k4m4p3re3ts3wn4s4y2ubs3de4s4y3ed4r4s4t4y3ff3id3me3nk4t3rb4s4t3sh2ype1oabs3ks3rd4s4t3st3ts4y2bac4k4s3by3ol4s2cca4e4i3he3ks2ded4s3ge4y3hi3le3oh2eps3rs3ti4s3uf2ffo4s2gan3ey3gy3ie3le3ue4s2hea3os2ils3ng4k3te2ked4h4s3os2lar4s3do4s3es4t3ix3ks3ls3os3ts3us2mas3be4o4s3oh4r2nce3ds3ed4r4s4y3go4s3ie3ks3ne4y3um4s3za4e2oai4y3bs4y3dy3ed3fy3gy3hs3ks4y3ls3ms4y3ng4s3rd4s3se4t3th4s4y3ze4y2ppy2rak4l4s4x3de4s3ed4e4k4l4r4s3go3ic3ks3ms3na4e3on3ts4y4z2sey3ie3ks4y3om4n3sa4y3un2tas3ch3eh4l4s4w3hy3os3te4s4y2uge4h3ks3le4t3nd4s3rd4g4n3se4y3ts4u2vid2wat3ed4l4r4s4t3ie3ls3ne3rs3se2xed4n4r4s3la3ty2yar4u3ed4y3fs3gs3la4y3os3sy2zos1raai3ce4h4k4t3ds3es3gs3hs3id4l4n3ke4s4y3me3nd4e4k4s4t3sh4s4t3ts3va4e4i4o3wl4n4s3xy3ys3za4e2ead4k4m3de4s3ed4m4r4s3id4s3me3ns4t3re4s3ve3ws3ys2iar3be3ck3de3ef4r4s3gs3ki4s3ll3ms3ne4g4k4s4y3os3se4k4s3th4s4t3ze2oad3ch4k3ds3gh4s3il3ke3me4o3nc4d3od4k4l4m4s3se4y3th3wn4s2uck3gh3hs3in4t3ja4o3le3me3ng4t3sh4k4t3te4s3vs1uats3ze2bal4s3ba4e4y3us2chu3ko4s4u2das3dy3ed4s3ge3is3os2ena2ffa4e4i4o4s4y3os3ty2gan3gy3le2hls3rs2iks3ld4t3st2kes3os2lbs3ge4y3ks4y3la4s4y3se2mbo3fs3ph4s4y2nas3ce4h4o3de4h4s4t4u4y3gs4y3ia3je4y3ko4s3ns4y3ts4y3ya2oys2ppy2ran4s3bs3ds3et3fi3gh4s3in3ka4e4s3ls4y3ns4t3oo3ps3qa3ra4o4s4y3sa4e4t2sby3ed4s3hy3ks4y3su3ti4s4y2tch3eo4s3le3oh3te4s4y3ut3yl2xom2yer3in2zzy1wana3zi1yded4s2ked4s2law2res3ls2ssi2tes2way0caaed2bal4s3by3er3in3le3ob4c3re2cao4s3he3ks4y3ti2ddy3ee4s4t3ge4y3ie4s3re2eca3se2fes3fe4s2ged4r4s4y3ot2how2ids3ns3rd4n2jon3un2ked4s4y2lfs3id4f4x3ks3la4e4s3ms4y3os3pa4s3ve3yx2man4s3el4o4s3is3os3pi4o4s4y3us2nal3do4y3ed4h4r4s3gs3id3na4s4y3oe4n3so4t3ti4o4s4y2pas4x3ed4r4s4x3hs3iz3le3on4s4t3ri3ul4t2rap4t3bo4s4y3di4s4y3ed4r4s4t4x3go3ks3le4s3ne4s4y3ob4l4m4n3pe4i4s3rs4y3se3ta4e4s3ve4y2sas3co3ed4r4s3ks4y3te4s3us2tch3er4s3ty2uda3ks3ld4k4s3ms3ps3ri3sa4e2vas3ed4l4r4s3ie4l3us2wed3ks2xon1ease3ze2bid2cal3um2dar3ed4r4s3is2iba3li4s2leb3la4i4o4s4y3om3ts2nse3to4s4u2orl2pes2rci3ed4s3ge3ia4c3ne3oc4s3ts4y2sse3ta4i2tes3yl2zve1haap4t3ce4k4o3do4s3fe4f4t3in4r4s3lk4s3mp4s3na4g4k4t3os3pe4s4t3ra4d4e4k4m4r4s4t4y3se4m3ts3va4e4s3wk4l4s3ya4s2eap4t3ba3ck3di3eb4k4p4r4t3fs3ka3la4p3mo4s3re4t3ss4t3th3vy3ws4y2iao4s3ba4s3ca4h4k4o4s3de3ef4l3ko4s3ld4e4i4l3mb4e4o4p3na4e4g4k4o4s3ps3rk4l4m4o4p4r4t4u3ti4s3va4e4s4y3zz2ock4o4s3de3gs3il4r3ke4o4y3la4i4o3mp3ns3of4k4m4n3ps3rd4e3se4s3ta4t3ut4x3wk4s2ubs3ck3fa4f3gs3mp4s3nk3rl4n4r3se3te4s2yle3me3nd1ibol2ded4r4s2els2gar3gy2lia3ls2mar3ex2nch4t3es3qs2ons2ppi2rca4s3es3ls3ri2sco3sy3ts2tal3ed4e4r4s2ves4t3ic4e4l3vy1lach4k3de4s3es3gs3im4r3me4p4s3ng4k4s3ps4t3ro4t4y3sh4p4s4t3ts3ut3ve4i3ws3ys2ean4r4t3ck3ek4p3fs4t3gs3ik3ms3pe4t3rk3ve3ws2ick3ed4s3ff4t3mb4e3ne4g4k4t3pe4s4t3ts2oak4m3ck3ds3ff3gs3ke3mb4p3ne4k4s3op4t3ps3se3te4h4s3ud4r4s4t3ve3wn4s3ye4s3ze2ubs3ck3ed4s4y3mp3ng4k2ype1nida1oach4t3dy3la4s4y3pt3rb3st3te4i4s2bbs4y3ia3le3ot3ra3za2cas3ci4o3ks4y3oa4s3us2das3ec4d4n4r4s4x3on2eds2ffs2gie3on3ue2hab3en3oe4g4s2ifs3gn3ls3ns3rs3ts2ked4s4y2las3by3ds3ed4s4y3ic4n3le4s4y3og4n4r3ts3za2mae4l4s3be4i4o4s4y3er4s4t3fy3ic4x3ma4e4o4s4y3po4s4t3te3us2nch3do3ed4s4x4y3fs3ga4e4o3ia4c4n3ks4y3ne4s3te4o3us3vo2och3ed4e4r4y3fs3ks4y3ls4y3mb4s4y3ns3ps4t3st3ts4y3ze2pal4y3ed4n4r4s3ha3py3ra3se4y2qui2ral4m3be4y3da4s3ed4r4s4y3gi3ia3ks4y3ms3ni4o4s4u4y3ps3se4o2sec4d4s4t4y3ie3ta4e4s2tan3ch3ed4s3hs3ta4s2uch3de3gh3ld3nt3pe4s3rb4d4e4s4t3ta4h2ved4n4r4s4t4y3in2wal4n3ed4r3ks3ls3ps3ry2xae4l3ed4s3ib2yau3ed4r3ly3pu2zed4n4s4y3ie1raal3bs3ck3ft3gs3ic4g3ke3me4p4s3ne4k4s3pe4s4y3re3sh4s3te3ve3wl4s3ys3ze4y2eak4m3do4s3ed4k4l4p4s3in3ma4e4s3na3pe4s4t4y3ss4t3we4s2ias3bo4s3ck3ed4r4s3me4p4s3ne4k4s3os3pe4s3se4p4s3th4s2oak3ci4k4s3ft3gs3mb4e3ne4k4s4y3ok4l4n3ps3re3ss4t3up4t3wd4l4n4s3ze2uck3de4o4s4y3el4s4t3ft3mb4p3nk3or3ra3se4h4t4y3ve2wth2yer3ne3pt1tene1ubby3eb4d4r4s3ic4t2cks2dda4y2eca2ffo4s2ifs3ng3sh3ts2kes2lch3et4x3ls4y3ms3pa3ti4s4y2mec3in2ndy3ei3it3ny3ts2pel3id3pa4y3ro2rat3bs3ch3ds4y3ed4r4s4t3fs3ia4e4o3li4s4y3ns4y3rs4y3se4i4t3ve4y2sec3hy3ks3ps4y3so3um2tch3er4s4y3ie4n4s3to4y3up2vee2zes1wtch1yano4s2ber2cad4s3le4o2der2lix2mae4r4s3es3ol2nic2sts2tes3on1zars0daals2bba2ces3ha3ks2dah4s3dy3is3la3os2ffs4y2gga4y3os2his3ls2iko3ly3ne4t3ry3sy2ker2led4k4s3is3le4y3ts2man4r3es3me3na4s3ps4y2nce4y3da4y3gs3io3ks3ny3se3ts2ppy2raf3bs3cy3ed4r4s3ga4s3ic4s3ks4y3ls3ns3re3ts3zi2shi4y2tal3ed4r4s3il3os3to3um2ube4s4y3ds3lt3nt3rs3ts2ven3it2wah3ds3ed4n3gs3ks3ns3ts2yal4n3ch3nt2zed4r4s1bags1eads3ir3ls4t3ns3re4n4s4y3sh3th3ve3ws4y2bag4r3by3el4s3it3ts3ud4g4r4s4t3ye2cad4f4l4n4y3im3ko4s3or4s4y3ry3yl2dal2eds4y3ly3ms3ns3ps3re4s3ts3ve4s2fat3er3fo3is3og2gas3um4s2ice3ds3fy3gn3ls3nk3sm4t3ty2ked4s3ko2lay3ed4s3fs4t3is3la4s4y3os3ph3ta4s3ve2man3es3ic4t3ob4i4n4s4t3pt3ur2nar4y3ch3es4t3im4s3se3te4s2och3xy2pot3th2rat4y3by3ed4s3ig3ma4s3ns4y3os3py3ro4y3th3vs2sex3hi3is3ks3se2tag3er3ox2uce2vas3el3il4s3on4s4t2wan4r4x3ed2xes3ie3ys1haba3ks3ls2ikr2obi3le4l4s3ni3ti3ws2uti1iact3ls3na4e3ry3zo2bbs2ced4r4s4y3ht3ks4y3ot3ta4o4s4u4y2ddy3ie4s3os3st2ebs3ls3ne3ts2ffs2ght3it2kas3ed4r4s4y2ldo3li4s4y2mbo3er4s3ly3ps2nar3ed4r4s3ge4o4s4y3ic3ks4y3lo3na3os3ts2och3de3ls3ta2ppy3so2ram3er3ge3ke4s3ls3ts4y2sas3ci4o4s3hy3ks3me2tal4s3ch3ed4s3sy3to4s4y3zy2van4s3ed4r4s4y3is3na3os4t3vy2wan2xie4t2yas2zen3zy1jinn4s1oabs3ts2bby3es3ie3la4e3ra4o2cht3ks3os3us2ddy3ge4y3os2eks3rs3st3th2ffs2gal4n3es4y3go4y3ie3ly3ma2hyo2ilt4y3ng3ts2jos2lce4i3ed4e4s4y3ia4e3ls4y3ma3or4s3ts2mal3ed4s3ic2nah4s3ee4r3ga4s3ko3na4e4y3or3sy3ut2obs3ce3dy3fs3ks4y3le4s4y3ms4y3na3rn4s3zy2pas3ed4r4s4y3pe2rad3ba4s3ee4s3ic4s3je3ks4y3ms4y3ps3rs3sa4e3ts4y2sai4s3ed4h4r4s3ha2tal3ed4r4s3ty2uar3bt3ce4s3gh3ks3la3ma4s3ps3ra3se3ts2ved4n4r4s3ie2wak4r3ds4y3ed4l4r3fs3ie3le4s4y3na4s4y3ps3ry3se3ts2xed4s3ie2yen3ly2zed4n4r4s1rabs3ck4o3ff4t3gs3il4n3ke3ma4s3nk4t3pe4s4y3ts3ve3wl4n4s3ys2ead4m4r3ck3ed4r4s3gs3ks3nt3re3ss4t3ys2ibs3ce3ed4r4s3ft3ll4y3nk3ps4t3ve2ock3id4l4t3ke3le4l3me3ne4y3ob4g4k4l4p3ps4t3ss3uk3ve3wn4s2ubs3gs3id3ms3nk3pe3se4y3xy2yad4s3er3ly1sobo3mo1uads3ls3ns3rs2bbo4y2cal4t3es3hy3ks4y3ti4s2ddy3ed4s2els3ts4t2ffs3us2ing3ts2kas3ed4s3ka3un2lce3es3ia3ls4y3se2mas3bo4s3ka4y3my3ps4y2nam3ce4h3es3gs4y3ks3no4y3sh3ts2omi4o2ped4r4s3le4y3py2ral4s3ed4s3gy3ns3oc4s4y3ra4s4y3st3um3zi2sks4y3ts4y2tch2vet2xes1waal3le4m3ms4y3ng3rf3um2eeb3ll4t2ile3ne1yads2ers2ing2ked4s4y3on2nel4s3os1zhos0eager3le4y3re2led4s2ned2rds3ed3ls4y3ns4t3st3th2sed4l4r4s3le3ts2ten4r3he3in2ved4r4s1bank2bed4t2ena4e2ike2ons4y3ok1cads3rd3sh2hed4s3os2igs2lat2ole2rus1dema2ged4r4s2ict3fy3le3ts2uce4t1ejit2nsy2rie2ven4r3ns1ffed4r2its1gads2ers3st2gar3ed4r2mas2ret1hing1ider3os2ght3ne2ked3on2lds2ron2sel1ject2ido1kdam2ing2kas1lain3nd4s3te2bow2chi2der3in2ect3et3gy3mi2fed3in2iad3de3nt3te2men2oge4y3in3pe4s2pee2sin2ude3te2van3en4r4s1macs3il2bar4y3ed4r3og4w4x3us2cee2eer3nd3rg4y3us2ics3rs3ts2mas3er4t4w3ys2oji3ng3te3ve2pts4y2ule3re2yde4s1nact3rm3te2ded4r4w3ow3ue2ema4y3ws2fix2iac2joy2lit2mew2nog3ui2oki3ls3rm3ws2rol2sew3ky3ue2ter3ia3re4y2ure4n2voi4y2zym1olid2rls2sin1pact2ees3na4e2hah4s3od4r2ics2och3de3pt3xy2pie2ris1qual3es3id4p1rase2bia2ect3vs2gon4s4t2hus2ica4k4s3ng2ned4s2ode3se2red3or2ses2uct3go3pt3vs2ven3il1scar3ot2ile2kar3er2nes2rog2say3es2ter3oc4p3ro1tage3pe3ts2ens2hal3er3ic3ne3os3yl2ics2nas2rog2tin3le2ude3is2wee2yma1ughs2ked2pad2ros2sol1vade2egs3ns4t3rt4y3ts2hoe2ict3ls3te2ohe3ke1wers3st2how2ked1xact3lt3ms2cel2eat3cs3em3me3rt2fil2ier4s3le3ne4g3st3te4s2ode3me3ns2pat3el3os2tol3ra2ude3ls4t3rb1yass2ers2ing2ots2ras3es3ie4r1zine0fabbo4y3le2ced4r4s4t4y3ia4e3ta4o4s4y2ddy3ed4r4s3ge3os2ena3ry2ffs4y2ggy3in3ot2iks3ls3ne4s4t3re4s4y3th2ked4r4s4y3ie4r2laj3es3ls3se4y2med4s2nal3cy3ds3es3ga4o4s3ks3ny3on4s3um2qir2rad3ce4i4y3ds3ed4r4s3le4s3ms3os3ro3se3ts2sci3ti4s2tal3ed4s3ly3so3ty3wa2uch3gh3ld4t3na4s3rd3te4s3ve2vas3el4r4s3or3us2wns4y2xed4s2yed4r3ne3re2zed4s1eals3rd4e4s4t3se4t3ts3ze2cal3es3ht3it3ks2dai3ex2ebs3ds3ls4y3ns3rs3se3ze2hme2ign3nt3st2lch3id4x3la4s4y3on3ts4y2mal3es3ic3me4y3ur2nce3ds4y3is3ks3ny3ts2ods3ff2ral3er4s3ia3ly3mi4s3ns4y3ox3ry2sse3ta4s4y2tal4s3ch3ed4s3id3or3ta4s3us3wa2uar3ds3ed2ver2wer2yed4r3ly2zes3zy1iars3ts2ber3re4o2ces3he4u3in3os3ta3us2des3ge3os3us2efs3ld3nd4t3re4i4s4y3st2fed4r4s3is3th4y2ggy3ht3os2ked4s2lar3ch3ed4r4s4t3ii3ks3le4o4s4y3mi4s4y3on4s3th3um2nal3ca4h3ds3ed4r4s3is3ks3ny3os2ord2qhs3ue2red4r4s3ie3ks3ma4s3ni4s3ry3st3th2scs3ho4y3ks3ts4y2tch3ly3na3te4s2ver4s2xed4r4s3ie4t2zzy1jeld2ord1labs3ck3ff3gs3il4r3ke4s4y3me4m4s4y3ne4k4s3ps3re4y3sh4k3ts3va3wn4s4y3xy3ys2eam4s3ck3ek4r4s4t3gs3me3sh3ur3ws3xi4o3ys2ick4s3ed4r4s3mp4s3ng4t3ps3rs4t3sk3te4s4t2oat3bs3ck4s3es3gs3ng3od4r3ps3ra4e4s4y3sh4s3ta4e3ur4t3wn4s4y2ubs3ed4s4y3ff3id3ke4y3me4p3ng4k3or3rr3sh3te4y3yt2yby3er3in3pe3te1narr1oals3ms4y2cal3us2ehn2gey3gy3ie3le3os4u2hns2ids3ls3ns3st2lds3ey3ia4c4e4o3ks4y3ly2mes2nda4s4u3es3io3ly3ts2ods4y3ls3ts4y2ram4y3bs4y3ce3do4s3el4s4x3ge4o3ks4y3ma4e4s3te4h4s4y3um3za4e2ssa4e2uat3ds3er4t3le4s3nd4t3rs3th2vea2wls3th2xed4s3ie2yer3le3ne1rabs3ck4t3gs3il4m4s3me3nc4k3pe4s3ss3te4i4s3ud4s3ys2eak3ed4r4s4t3it3md3na3on3re3sh3ts2iar3bs3ed4r4s3gs3ll3se4k4t3ta4e4h4s4t4z3ze4z2ock3es3gs3mm3nd4s4t3om3re4n4y3sh4t3th3wn4s4y3yo3ze2ugs3it3mp3sh4t2yer1ubar3by3sy2cks3us2ddy3ge4y2els3ro2ffs4y2gal3gy3ie4o4s3le4y3ue4s2jis2lla4s4y3th3wa2med4r4s4t2nda4i4o4s4y3gi4o4s3ic4s3ks4y3ny3sy3ts2ral4n3ca3ls3ol4r4s3rs4y3th3ze4y2sed4e4l4s3il3ks3sy3ts4y2ton2zed4e4s3il3zy1yces2ked4s2les2rds2tte0gabba4y3le2ddi3es3ge4y3id4s3je4o3so2ffe4s2ged4r4s2ids3ly3ns3rs3ta4s4t2jos2lah4s4x3ea4d4s3ia4s3ls4y3op3ut3vo2mas4y3ba4e4o4s3ed4r4s4y3ic4n3ma4e4y3ps3ut2nch3dy3ef4v3gs3ja3ks3of3ts2ols2ped4r4s3os3py2ram3ba4e4o4s3da4e3es3is3ms3ni3re4i3th3um2ses3hy3ps4y3sy3ts2tch3ed4r4s3hs3or2uch4y3ds4y3ge3je3lt3ms4y3nt3ps3rs3ss3ze4y2vel3ot2wcy3ds3ks4y3ps3sy2yal3er3ly2zal4r3ed4r4s3on4o1eals3ns3re4s3sa3ts2bur2cko4s2eks4y3ps3se4t2ist3ts2lds3ee3id3ly3ts2mel3ma4y3ot2nae4l4s3es4t3ic4e4i4n4o4p3ny3oa4m3re4o3ts4y3ua4s2ode3id2rah3be3es3le3ms4y3ne2sse4o3te4s2tas3up2ums2yan3er1hast3ts3ut3zi2ees3st2ost3ul2usl2yll1iant2bed4l4r4s3li3us2ddy2fts2gas3he3ot3ue2las3ds3et3ia3ls4y3py3ts2mel3me3ps4y2nch3ga4e4s3ks3ny3zo2pon3po4y3sy2rds3lf4s4y3ns3on4s3rs3sh3th4s2smo4s3ts2tch3es2ust2ved4n4r4s2zmo1lace3de4s4y3ik4r3mp4s3nd4s3re4y3ss3tt3um4r3ze4y2eam4n3ba4e4y3de4s3ed4k4s4t3is3ns4t3ys2ial4s3bs3de3ff4t3ke3me4s3nt3sk3ts4z2oam4t3be4i4s4y3de3gg3ms3om4p3ps3ry3ss4t3ut3ve3ws4y3ze2ued4r4s4y3gg4s3me4s3on3te4s2yph1napi3rl4r4s3sh3ts3wn4s2ome3ws1oads3fs4t3ls3ry3ts4y3ve2ban4r3be4i4o4y3is3os2det3ly3so2els3rs3st3th4y2fer3fs2gga3os2ier3ng2jis2kes2lds4y3em4s3fs3ly3pe4s2mbo3er3pa2nad3ch3ef4r3gs3ia4f3ks3na3of3ys3zo2oby3do4s4y3ey3fs4y3gs3ks4y3ld4s4y3my3ns4y3ps4y3rs4y3se4y2pak3ik2ral4s4y3bs3do3ed4s3ge3is3ms4y3ps3se4y2sht3se2tch3hs4y3ta2uch3ge3ks3ra4d3ts4y2ved4s2wan3ds3fs3ks3ls3ns2xes2yim3le1raal3bs3ce3de4s3ff4t3il4n4p3ma4e4p4s3na4d4o4s4t3pe4h4y3sp4s3ta4e4s3ve4s4y3ys3ze2eat3be4o3ce3ed4k4n4s4t3ge4o3in3ns3ps3se3ve3ws3ys2ice3de4s3ef3ff4t3gs3ke3ll3me4y3nd4s3ot3pe4s4t4y3se4t4y3th4s3ze2oan4t3dy3gs3in3ks3ma4s3ne3of4m3pe3ss4z3ts3uf4p4t3ve4y3wl4n4s2rls3rl2ubs3ed4l4s3fe4f3me4p3nd4t2yce3de3ke3pe4t1uaco3na4o4s3rd4s3va2bba2cks4y2des2ess4t2ffs2gas3gl2ide4o4s3ld4e4t3mp3ro3se2lab4g4r4s3ch3es4t3fs4y3ls4y3ph4s4y2mbo3ma4i4y3ps2nas3di4y3ge4y3ks4y3ny2ppy2qin2rdy3ge3ks3ls4y3ns3ry3sh3us2shy3la4e4i3sy3to4s4y2tsy3ta4y2yed3le3ot3se1wine1yals3ns2bed4s2eld2mps2nae3ie3ny3os2oza2pes3os3po4y3sy2ral3ed4s3on4s3us2tes2ved4r4s0haafs3rs3ts2bit3le3us2cek3ks4y2dal3ed4s3ji3st2ems3re3ts2ffs3iz3ta4s2ggs2ham4s2ick3ka4s4u3ls4y3ns4t3rs4y3th2jes3is3ji2kam4s3ea4s3im3us2lal3di3ed4r4s3fa4s3id3lo4s3ma4s3on4s3se4h3ts3va4e3wa2mal3ba3ed4l4s3my3za2nap3ce4h3di4s4y3gi4s3ks4y3sa4e3ts2ole3ma2pas4x3ly3pi4y3us2ram3ds4y3ed4m4s3im3ks3ls3ms3ns3os3ps4y3ry3sh3ts2shy3ks3ps3ta4e4y2tch3ed4r4s3ha4i3ty2uds3fs3gh4o3ld4m4s4t3ns4t3se3te2van3el4n4r4s3oc2wed3ks3ms3se2yed4r4y3le2zan3ed4l4r4s3le1eads4y3ld4s3me3ps4y3rd4e4s4t3st3th4s4y3ve4y2ben4s2cht3ks2der3ge4y2eds4y3ls3ze2fte4s4y2iau3ds3gh3ls3rs3st2jab3ra2led4s3io4x3la4o4s4y3ms3os4t3ps3ve2mal3es3ic4n3ps4y2nce4h3ds3ge3na4y3ry3ts2par2rbs4y3ds3es3ls3ma4s3ns3on4s3ps3ry3se3tz3ye2sps3ts2tes3hs2uch3gh2vea4l2wed4r3gh2xad3ed4r4s3yl2yed1iant2bas2cks2ded4r4s2ems2fis2ghs4t2jab3ra2ked4r4s3oi2lar3ch3lo4s4y3sa3ts3um4s2mbo2nau3ds3ge4s3ky3ny3ts2ois2ped4r4s3ly3po4y2red4e4r4s2ssy3ts2tch3he2ved4r4s2zen1oach3ed3gy3rd4s4y3st2bby3os2cks3us2dad3ja2ers2gan3en3gs3hs3oh4s2hed2ick3ed3ks3ng3se4t2kas3ed4s4y3is3ku3um2lds3ed4s4y3ks3la4o4y3me4s3on4s3ts2mas3ed4r4s4y3ie3me3os2nan3da4s3ed4r4s4y3gi4s3ks4y3or2och3ds4y3ey3fs3go3ha3ka4s4y3ly3ns3ps3rd4s3sh3ts4y3ve2pak3ed4r4s3py2rah4l4s3de3is3ks3me3ns4y3se4t4y2sed4l4n4r4s4y3ta4s2tch3el4n3is3ly3te4y2uff4s3gh3nd3ri4s3se3ts2vea4d4l4n4r4s2way3be3dy3es3ff4s3ks3ls3re3so3to2xed4s2yas3ed3le1ubba4y2cks2dna3ud2ers2ffs4y2ger3gy2hus2ias3es2kou2las3es3ks4y3lo4s4y2man4s3fs3ic4d3or3ph4s4y3us2nch3do3ks4y3ts2rds3ls4y3ra4y3st3ts4y2shy3ks4y3os3sy2tch3ia2zza4y1wyls1ydel3ra4o2ena4s2gge2ing2kes2las3eg4s3ic2men3ns2nde2oid2ped4r4s3ha4y3os2rax2son2the0iambi4s1brik1cers2hed4s3or2ier3ly3ng2ker3le2ons2tal3ic3us1dant2dah4t3ut2eal4s3es3nt2iom4t2led4r4s3is2ola4s2yll4s1ftar1gapo2ged2loo3us2nis1hram1iwis1kans3ts2ons1leac4l3um4s2iac4d4l3um2ler3th1mage4o4y3ms3ri3um2bar3ed3os3ue2ide4o4s3ne4o2lis2mew3it4x2ped4l3is3ly3ot3ro2shi4y1nane3pt3rm2box3ye2cas3el3le3og3ur4s4t2dew4x3ia4e3ol4w3ri3ue2ept3rm4t2fer3ix3os3ra2gan3le3ot2ion2ked4r3le2lay3et2ned4r3ie4t2orb2put2ros3un2see4t3po2tel4r3il4s3ra4o2ula3re4n3st2var3er2wit1odic4d4n2nic2ras2tas1ppon1rade3te2ids3ng2ked2oko3ne4s4y1sbas2hes2led4s4t2nae2sei3ue2tle1tchy2ems2her1vied4s2ory1xias2nay2ora2tle1zard4s2zat0jaaps2bot2cal3et3ks4y2ded4s2fas3fa2gas3er3gs4y3ir3ra2ils2ker4s4y3ie2lap3eo3op2mbe4o4s4u3es3my3on3un2nes3ky3ns4y3ty2pan3ed4r4s2rks3ls3ps3ta3ul2sey3pe4s2tha3is3os2uks3ne4t3ps2vas3el2wan3ed3ns2xie2zzy1eans3ts2bel2dis2els4y3ps3ra4s3ze2fes3fs2had3us2lab3lo4s4y2mbe3my2nny2ons2rid3ks4y3ry2sse4y3ts3us2tee4s3on3ty2une2wed4l3ie1hala2eel2ils1iaos2bba4s3ed4r4s2ffs4y2ggy3ot2had2lls3ts2mmy3py2ngo4s3ks3ne4i4s2rds3ga3re2sms2tis3ty2ved4r4s4y1nana1obed4s2cko4s4y3os2del2eys2hns2ins4t3st2ked4r4s4y3ol2led4s3ie3lo4s4y3ts4y2mon4s2nes3gs3ty2oks2ram3ts3um2tas3ty3un2ual3gs3ks3le3rs3st2war3ed3ls4y2yed1ubas3es2cos2das3ge4y3os2gal3um2ice4y2jus2ked4s3us2lep3ia2mar3bo4y3ps4y2nco3ks4y3ta4o2pes3on2ral4t3el4s3is3or2ste4s2tes3ty2ves3ie0kaama2bab4r3ob2cha3ks2dai3es3is2fir2gos3us2hal2iak3ds3es3fs3ka4s3ls3ms3ng4s2jal2kas3is2lam4s3es3if4s3pa3ua2mas3es3ik4s3me2nae4l4s4t3dy3eh4s3ga4s3ji3ts3zu2ons2pai4s3ha4s3ok4w3pa3ur4s4t2rai4s4t3ee4z3ks3ma3ns3oo4s3ri3st4y3ts3zy2sha3me2tal4s3is3ti2ugh3ri4u4y2val4s2was4u3ed2yak3le3os2zis3oo1bars1cals1eaki2bab4r3ob2cks2dge4y2ech3fs3ks3ls3ma3no4s3ps3ts3ve2fir2hua2irs2lep3im3ls4y3ps4y3ts4y2mbo4s3ps4t4y2naf3ch3do3os3te4s2pis2rbs3el3fs3ky3ma3ne4s3os3ry3ve2sar3ts2tas3ch3es3ol2vel3il2xes2yed4r1hadi4s3fs3ki3na4s3ph3ts3ya3zi2eda3er3th4s2irs2oja3rs3um2uds3la2yal1iaat3ck3ki3ng3su2bbe4i3ei4s3la2cks4y2ddo4y3el4o3ge2efs3rs3ve4s2ght2kay3es3oi2ley3ig4m3ls3ns3os3ps3ts4y2mbo3et2nas3da4s4y3es3gs4y3in3ks4y3os2ore3sk2pah4s3es3pa4s3sy2rby3ks3ns3ri2san3sy3ts2tab3ed4r4s3he4s3ke3ty3ul2vas2wis1lang3ps2ett2ick3eg3ks2ong3of2uge3tz1nack3gs3ps3rl4s3ur3ve3we2ead3ed4l4s3ll4t2ick3fe3sh3ts3ve2obs3ck3ll3op3ps3sp3ts3ud4t3wd4e4n4s2ubs3le3rl4r4s3ts1oala3ns3ps2ban3os2els2ffs3ta2gal2has3en3ls2ine3wi2jis2kam4s3er3ra3um2las3os2mbi4u2nbu3do3ks2oks4y3ri2pek3hs3je3pa2rai4n4s4t3es3is3ma3os3un4s2ses2tch3os4w2ura1raal3bs3ft3is4t3ng4s4z3ut3ys2eef4n4p3ng3we2ill3ol2ona4e3on2ubi3mp3nk1sars1ubie2dos3us3zu2fis2gel2ias2kri3us2lak4n4s3fi2mis3ys2nas3ds2ris3re3ta3us2sso3ti2tai4s3ch3is3us2yas2zus1vass2ell1waai2ela2ink3rl1yack3ks3ng3rs3ts2bos2dst2les3ie4n4x3oe2nde4s2pes2rie2tes3he2udo0laarf4i2bda3el3ia4s3ne3or3ra2ccy3ed4r4s4t4y3is3ka4s4y2ddu4y3ed4e4n4r4s3le3oo2ers3vo2gan4r3er3gy2hal4r2ich4s3de4s3gh3ka4s3rd4s4y3th4y2ked4r4s3hs3in3sa2ldy3ls2mas3bs4y3ed4r4s3ia3my3ps2nai4s3ce4h3de4s3ed4s3ks4y3ts2pas3el3in4s3je3pa4y3se2rch3ds4y3ee4s3fs3ga4e4o3is3ks4y3ns4t3um3va2sed4r4s3si4o4u4y3ts2tah3ch3ed4n4r4x3he4i4s4y3ke3te3us2uan3ch3de4s3fs3gh3nd3ra2val4s3ed4r4s3ra3vy2wed4r3in3ks3ns4y3sy2xed4r4s3ly2yby3ed4r3in3up2zar3ed4s3os3zi4o1each3ds4y3fs4y3ks4y3ms3ns4t4y3ps4t3re4n4s4y3se4h4t3ts3ve4y3ze2ben2ccy3he2des3ge4y3um2ear3ch3ks3ps3rs4y3se3ts3ze2fte4s4y2gal3er4s3ge4o4y3it3no2hrs3ua2irs3sh2man3ed4l4s3ma4e3on3ur2nds3es3gs3is3os3se3ti4o2one2pak3er3id3ra3ta2red4s3ps2sbo3es3os3ts2tch3he3ty3up2uch4o3ds3gh2vas3ee4l4r4s3in4s2wis2xes3is2zes3za4o4y1iana4e4g3rd4s4t2bel4r3or3ra4e4i2cet3hi4t3it3ks2dar3os2efs3ge3ns3rs3us3ve2fer4s4y3ts2gan3er3ge3ht3ne2ked4n4r4s3in2lac3ls3os3ts4y2man4s4x3ba4i4o4s4y3ed4n4s4y3it3ma3ns3os3pa4s2nac3ch3ds4y3ed4n4r4s4y3ga4o4s4y3in3ks4y3ns4y3os3ts4y3um4x2ons2pas3es3id4n3os3py2ras3ks3ot2ses3ks3le3ps3ts2tai4s3ed4m4r4s3he4o4s3ie3re2ved4n4r4s3id3or3re2waa4s1lama3no1oach3ds3fs3ms4y3ns3st3th3ve2bar3by3ed4s3os3us2cal3he4s4y3ie4s3ks4y3os3um4s2den4s3ge2ess2fts4y2gan3es3gy3ia4c4e4n3oi4n4s2han2ids3ns3pe3rs2kes4y3um2las3ed3lo4s4y3og4s2mas3ed4s2ner3ga4e4s2oby3ed4y3fa4s3ie3ks4y3ms3ns4y3ps4y3rd3se3ts2ped4r4s3py2ral4n3ds4y3el4s3ic4s3ry2sed4l4n4r4s3sy2tah4s3es3ic3os3sa3ta4e4o3us2ued3gh3ie4s3ma3nd4s3pe4s3re4s4y3se4y3ts2vat3ed4e4r4s4y3ie2wan3ed4n4r4s3ly3nd4e4s3ps3ry3se3th4s2xed4s2yal2zen1uach3us2bed4s3ra2ces3id3ks4y3re2des3ic3os2ffa4s2ged4r4s2lls3us2mas3bi3en3me4y3ps4y2nar4s3ch3es4t3ge4i4s3ks3ts2pin3us2rch3ed4r4s4x3gi4y3id3ks3ry3ve2ser3hy3ks3ts4y3us2tea4d4r4s2vvy2xed4r4s1weis1yams3rd4t3se2cea4e3ra2ing2mes3ph2nch3es2res3ic2sed4s3in4s3ol3sa2ted4s3he3ic3ta0maaed3re4s2ban3es2cas4w3ca3ed4r4s3he4i4o4s3ka4s3le3on3ro3te2dal4m4r3dy3ge3id3ly3os3re2edi3rl2fia4c3ts2gas3es3gs3ic3ma3na3ot3us2hal3em3is3oe3rs3ua3wa2ids3ko4s3le4l4o4s3ms3ns3re4s3se4t3ze2jas4t3oe4r4s2kaf4i4n4r3ee4r4s3ie4s3os2lae4i4m4r4s4x3eo4s3ic4k4s3ky3ls3ms4y3ts4y3us3va3wa2mak4s3ba4o4u3ee4y3ie4l3ma4y2nas4t3di4s4y3eb4d4h4s4t3ga4e4i4o4s4y3ia4c4e4s3ks4y3ly3na4y3oa4r4s3se4o3ta4e4o4s4y3ul4s3zo2pau3es3le3ou3py2qam3ui2rae4h4l4n4s4y3ch4s3ds4y3es3ga4e4o4s3ia4d4l3ka4s3le4s4y3ma4s3on4r3ra4i4y3se4h3ts3ua3vy2sas3ed4r4s3ha4y3ks3on3sa4e4y3ts4y3ur4s4t2tai3ch3ed4r4s4y3he4s3in3lo3ra3su3te4s4y3za4o2uby3ds3ka3la4s3ms4y3nd4t3ri3sy3ts3ve4y3zy2ven3ie4n4s2wed3ks4y3la3ns3ps3rs2xed4s3im4s2yan4s3be3ed3or4s3st2zac4k4r4s3ed4l4r4s4t4y3ut1bari4s2ila3ra2ret2ube3ga1eads3ke4s3ls4y3ne4s4t4y3re3se3th4s4y2bbe3os2cca3ha4s3ks3um2dal3ia4c4i4n3le2ech3ds3ja3ps3rs3ts2ffs2ids3ko3ls3ns4t4y3sm3th2kka2lam4s3ba3ch3ds3ee4s3ic4k3ls3oe4n4s3ts4y2mes3ic3os2nad3ce3ds3ed4s3ge4s3il3sa4e4h3ta4o4s3us2ous3ws2rch4s4y3de4s3ed4l4r4s3ge3il4s4t3ks3le4s3ry3se4k2sad4l4s3ca3el4m4s3hy3ia4c3ne3on3sy3to3yl2tal4s3ed4g4l4r4s3hi4o4s4y3ic4f4s3ol3re4o3ta2ums3se2ved4s2wed3ls2ynt2zes3za4e4o1gals1horr1iais3ou4w3sm3ul2cas3he4i4t3ks4y3os3ra4o2ddy3ge4y3is3st2ens3ux3ve2ffs4y3ty2ggs3ht3ma3od2has3is2kan3ed4s3os3ra3va2lch3ds3er4s3fs3ia3ko4s4y3le4s4y3or4s3pa3ts4y4z2med4o4r4s3ic4s3sy2nae4r4s3ce4y3di4s3ed4r4s3ge4i4s4y3im4s3ke4s3ny3or4s3se3ts4y3us3xy2raa4h3ch3ed4s4x3id4n3kn4s4y3ls4y3os3rl4s3th3vs3za2sal3ch3do3er4s3go3ky3ls3os3sa4y3to4s4y2tas3ch3er4s4y3ie4s3re4y3ta4s2vey3vy2xed4n4r4s3ie4s3te3up2yas2zen4s3zy1mkay1neme1oais3ky3ls3na4s4y3rs3ts2bby3ed4e4s4y3ie3le3os2cap3ha4i4s4y3ks4y3os3us2dal3el4m4r4s3ge3ii4n3oc4m3us2eni3rs2fos2gar4s3gy3os3ra3ue4l2har3el3os3rs3ua4r2ile4s3ra4e3st3ts4y2jos2ker4s4y3is3ky3os3us2lal4r4s3ds4y3ed4r4s4y3ie3la4e4o4s4y3oi4s3to4s3ue3vi3ys2mes3ie3ma4e4y3os3pe3us2nad4l4s3de4o3er4y3go4s3ic4e3ks3os3pe3te4h4y2obs3ch3ds4y3ed4y3ks3la4i4s4y3ng4i4s4y3ps3rs4y3se3th4s3ve2ped4r4s4y3py3sy3us2rae4h4l4n4s4t4y3ee4l4s3gy3ia4n3mo3na4e4s3on4r3ph3ra4o3se3ts3uk2sed4s4y3ks3so4y3te4o4s2ted4l4n4s4t4y3hs4y3if4s3on4r3te4o4s4y3us3za2uch3es3fs3ld4e4s4t4y3nd4t3ps3rn3se4t4y3th2ved4r4s3ie2was3ed4r3ie3ra2xas3ie2yas3le4s2zed4s3os1pret1rads1sasa1tepe1ucho3ic4d4n3ko4s4y3or3ro3us2dar3dy3ge3if4m4r3ra2ffs4y3ti2gga4s4y3ho3il3os2hly2ids3ls3rs4y3st2jik2kim3ti2lai3ch4t3ed4s4y3ga3ie3la4s3se4h2mbo3ms4y3ph4s3sy3us2nch3ds4u3ga4e4i4o4s4y3ia4s3ja4s3ts4u2ons2ral4s3ed4s4x3gh4i3id3ks4y3ls4y3ra4e4i4s4y3th4i3uk3va2sar3ca3ed4e4r4s4t3ha4y3ic4t3ks4y3os3se4y3ta4h4s4y2tas3ch3ed4r4s3ha3ic4s3on3ti4s3um2vva2xed4s2zak3zy1vula4e4i1yall4s2lar2nah4s2oid3ma3ns3pe4s4y2rrh2sid4e2thi4s4y2xos1zees0naams3ns3ts2bam3by3es3is3ks3la3ob2che4o3re2das3ir2eve4i2ffs2gar4s3es3gy3or2hal2iad3bs3ce3ds3eo3fs3ks3ls4y3ns3os3ra4u3ve2jib2kas3ed4r3fa2las3ed3la2mad4k4z3ed4r4s3ma3us2nas3ce4y3du3na4y3os3te4i4o4s4y3ua2pas3ed4s3oh4o3pa4e4y2ras3co4s3ds3es3ic4s3ks4y3od3ra4e2sal3hi4o3is3on3ty3us2tak4l3ch3es3is3to4y3ya2uch3nt2val4r3ed4l4s4w3vy2wab4l2zar3es3ir4s3zy1duja1eafe3ls3nt3ps3rs3th4o4s2bby3ek4l2che3ks2ddy2ebs3ds4y3fs3ld4e3mb4s3ps3se3ze2fie2gri4o3us2ifs3gh3st3ve2lia4s3ly2mas3ic3ns3pt2nes3ta2ons3sa3za2per3it2ral4m3ds4y3fs3ka4s3ol3ts4z3ve4y2ski3ts4y2tas3es3op3ta4s4y2uks3me4s2vel4r4s3is3us3vy2wbs3ed4l4r3ie3ly3sy3ts2xal3in3ts3um4s1gaio3ka3na3pi3ti2ege2oma3ni2ram2wee1ibby2cad3ed4r4y3he4t3ks4y3ol2dal3ed4s3or3us2ece3fs3ss3ve2fes3fs4y3le3ty2ger3ga3hs4t3re3ua2hil2kab4h4u2las3ls2mbi4s4y3ps2ner4s3ja3ny3on3ta4h2opo3za2pas3et3py2qab2rls4y2sei3in3se3us2tal3er4s3id3on3re4o4y3ta4o4y2val4s3el2xed4r4s3ie2zam1jirl1kosi1moli4s1oahs2bby3le4y2cks2dal3dy3ed4s3um4s2els3ma4e2gal3gs4y2how2ias3ls4y3nt3re4s3se4y2kes2les3le4s3os2mad4s3en4s3ic3oi4s2nan4s3ce4y3da4o3es4t3gs3ic4s3na4o4y3yl2obs3is4t3ks4y3ne4s3ps3se3ve2pal2ria4e4s3ks3ma4s3th2sed4r4s4y3hi3ir2tal4m3ch3ed4r4s3um2ugs3ja3ld4e4s3ns4y3ps3st2vae4s3el3ia4o3um2way3ds3ed3ls3ts4y2xal4s3es2yau3ed4s1rtta3ya1sima1ubby3ia2cha3in2ddy3er4s3ge4y3ie3zh2evo2ffs2gae2jol2ked4s2lla4o4s4y2mbs3en3my3ps2nks4y3ny3us2que2rds4y3ls3rs3se3ts4z2sed4s2tso4y3ty1yaff3la3ms2ing2lon2mph2ong2ssa2ung3se3ze0oafos2ked4n4r3um2red4r2sal3es3is3ts2ten4r3hs2ves1bang2bos2eah3li3se3ys2ias3ed3it3ts2jet2oes3le4i4s1ccam3ur2ean2her4s3re4y2ker2ote2rea2tad4l4n4s3et3ic3li3yl2uli1dahs3ls2der3ly2eon3um2ism4t3um2oom3rs3ur2ums2yle4s1fays2fal3ed4r3ie2lag2ten4r2uro1gams2eed4s2gin2ham2ive2led4r4s2mic2res1helo2ias3ng2mic2one1icks2dia2led4r4t2nks3ts2ran1jime1kapi3ys2ehs2ies3ng2ole2ras3ug2tas1late2den4r3ie3ly2ehs3ic4n3nt3os3um3yl2igo3os3va4e2las4v3er3ie2ogy3na2pae3es1masa2ber3re3us2dah4s3da3eh2ees3ga3ns3rs2iai3ts2lah2mel3in2nes2ovs2rah2uls1ncer4s4t3us2des3ol2ely3rs4y2gon2ion3um2kus2lap4y2mun2ned2sen4t2tal3ic1oaas2bit2hed2ids2jah2mph2nts2pak3ed3sy2rie2ses2tid2yah2zed4s3ie3le1pahs3ls2ens3pe3ra4y2gaf2ihi3ne4g3um2pos2sat3in4t2ted4r3ic2zit1rach4y3ls3ng4s4t3te2bat3ed3ic4t2cas3in2der3ie3os2ead2fes3ul2gan3ia4c3ue2ibi3el3go3xa2les3on4p2mer2nee3is2ped3in2ris2tet3ho2val2zos1sars2car2etr3ys2hac2ier2kin2lin2mic3ol2one2sia2tia1taku3ry2her3yl2ium2tar3er3os1ubit2che4t2eds3ns2ght2ija2lks2mas2nce3dy2pas3ed3he4s2rey3ie2sel3ia3ts2tby3do3ed4n4r3go3ie3re4o3ta2zel3os1vals3ry3te2els3ns3rs4t2ine3sm4t2oid3li4o2ule1ware4i2che2ers2ies3ng2led4r4t2ned4r3io2res3ie2sen1xbow2eas3rs3ye2ide4s3es3me4s3ne2lip2man3en2ter1yama2ers1zeki3na2one2zie0paaho3ls3ns2cai4s4y3ed4r4s4y3ha3ks4y3os3ta4s2dam4s3do4y3is3le3ma3ou3re4i2ean3do3on2gan3ed4r4s3le3ne3od3ri2hit3os3us2iks3ls3ns4t3pe4s3re4s3sa4e2kay3ka4i3ua4l2lak4r4s4y3ea4d4r4s4t3is3ki3la4s4u4y3ms4y3pi4s3sa4y3us2mby3pa2nax3ce4h3da4s4y3ed4l4s3ga4s3ic4m4r3ko4s3na4e4i4y3sy3to4s4y2oli4o2pad4l4s4w3er4s4y3pi4y3ri2rae4s3ch4s3di4s4y3ed4n4o4r4s4u4v3ge4o3id4s3ka4i4s4y3le4y3ma4o4s3ol3ps3ra4s4y3se3te4i4s4y3ve4o2sag4r3ch3eo4s3ha4m3ka3mo3py3se4u3ta4e4s4y2tas3ch3ed4e4l4n4r4s3hs3ia4n4o3ka3ly3sy3ta4e4u4y3us2uas3ls3se3xi2van4s3ed4n4r4s3id4e4n4s3on3vy2was4w3ed4r3ks4y3ls3ns2xes2yed4e4r3or3sd1eace4h3ge4s3ke4s4y3ls3ns3re4l4s4t3se4y3ts4y3vy3ze2bas2can3hs3ia3ke4s4y3ts2dal3es3is3on4s3ro2ece3ks4y3ls4y3ns4t3oy3pe4s4y3rs4y3ve4o2ggy3hs3ma3os2ine4s3se4y3ze2kan4u3ea4s3id4n3oe2las4u3ch3es3fs3ls3ma3og4n3sh3ta4s3us2nal3ce3ds4u3ed4s3go3ie4s3ks3na4e4i4y3se4y3ts2ola3ns4y2pla4e3on4s3py3si2qui2rae4i3ce4h4s3du4y3ea4s3fs3il4s3ks4y3le4s3ms4y3ne4s3og3ps3ry3se4p4t3ts3ve4o4s4y2sch3ky3os3ta4o4s4y2tal4r3er3it3os3re4i3ti4o4y2wed4e3it2yse1fftt1hage3ng3re4m3se4m2eer3me3ne3on3se2ial3es3sh3zz2lox2obe3ca3ne4o4s4y3oh4o3ta4o4s4y2pht2ubs3ts4u2wat2yla4e3ma3nx3sa1iais3ni4o4s2bal2cal4s3cy3ey3hi3ks4y3on4t3ra3ul2ece3ds3nd3rs4t3ta4s4y3zo2ggy3ht3ly3my2ing2kas4u3ed4l4r4s4y3is3ul2lae4f4o4r4u4w3ch3ea4d4i4r4s4y3in4s3ls3on4t4w3um4s2mas3ps2nas4x3ce4h3da4s3ed4r4s4y3ga4e4o4s3ko4s4y3na4y3ol4n4t3ta4o4s3up2ons4y3us3ye4s2pal4s3ed4r4s4t3id4s4t3py3ul2que4i2rai3ks3ls3ns3og3re4i4s2sco3es3ky3os3sy3te2tas3ch3hs4y3on4t3so4u3ta4u2uma4s2vos4t2xel4s3ie2yut2zed4r4s3za1laas3ce4k3ga4e3id4g4n4t3nc4e4h4k4s4t3ps3sh4m4t3te4s4t4y3ud4r3vs3ya4s3za2ead4s4t3be4s3ck3ep3in3na4e4o3on3sh3ts3ws3xi2ica3ed4r4s3gs3ms3ng4k3ps3sh2oat3ce4k3ds3it3mb3ng4k3ok4t3ps3re3ts4z3uk4t3ws4t3ye4s2uck3ds3es3ff3gs3ke3mb4e4p4s4y3ng4k3ot3ps3sh3te4o4y2yer1neus1oach3ka4e3lo2bby3oy2can3he4o3ks4y2dal3dy3ex3ge4y3ia3os3us2ems3na3ps3sy3te4s2gey3ge4y3os3ue2hed2ilu3nd4t3re3se2kal3ed4r4s4y3ie4t2lar3ed4r4s4y3io4s3je3ka4s3lo4s4y3os3ts3yp4s2mas3be3es3me4y3os3pa4s2nce4y3ds4y3es4y3ga4o4s4y3ks3or3to4s4y3zu2oay3ch3ds3ed4y3fs4y3hs4y3ja3ka4s3ls4y3ns3pa4s4y3ri4t3ts4y3ve4y2pes3ia3os3pa4y3sy3up2rae4l3ch3ed4r4s4y3ge4y3in3ks4y3no4s4y3ta4e4h4s4y3us2sca3ed4r4s4t4y3ho3it3ol3se3te4s2tae4i3ch3ed4s3in3oo3ro3sy3to4s4y2uce4h3ff4s4y3is3ke4s3le4p4t3nd3pe4t3rs3sy3ts4y2vos2wan3er3ie4n4s3lt3nd4s4y3re3sy2xed4s2yas3nt3ou3se2zzy1raam3ds3gs3hu3ms3na4g4k3os3ps3se3te4s4t4y3us3wn3ys2eak3dy3ed4m4n4s3if3ke3ms4y3nt3on4p3ps3sa4e4s4t3ta3ux3ve3xy3ys2ial4n3ce4k4y3de4y3ed4f4r4s3gs3ll3ma4e4i4o4p4s4y3ng4k4t3on4r3se4m4s3us3vy3ze2oal4s3be4s4y3dd4s3em3fs3gs3in3ke3le4l3mo4s3ne4g4k3of4k4t3ps3ra4e3se4o4s4t4y3to3ud4l3ve3wk4l4s3xy3yn2ude3ne4o4t4y3ta2yan3er3se1salm2eud2haw3ut2ias3on2oae4i4s3ra2ych3op1tish2ype1ubby3co3es3ic4s3sy2can3er4s3ka4s2ddy3ge4y3ic3or3sy3us2ers2ffa4s4y2ggy3il2has2jah4s2kas3ed4r4s4y3ka3us2lao4s3ed4r4s3ik4s3ka4s3li4s4y3mo3ps4y3se3us4t2mas3ie3ps4y2nas3ce4h3ga4i4o4s4y3im3ji3ka4s4y3ny3to4s4y2pae4l4s3il3pa4y3us2rao4u3da4y3ed4e4r4s3ga4e3in4s3ls3os3ps4y3re4s4y3se4y3ty2ses3hy3le3sy2tas3er3id4n3on4s3ti4o4s4u4y3za2uko2yas2zel3ta1wned1yats2ets2gal3my2ins2lon2ned4s2oid3ts2ral4n3es4x3ic3os3us2uff2xed4s3ie4s1zazz0qadis2ids2jaq2nat2pik1ibla2las2pao1ophs2rma1uabs3ck3ds3ff3gs3il4r4s3ke4y3le4m4y3nk4t3re4k4l4t3sh4i4s3te4s3wk4s3yd4s2bit2ean3ck3ek4m4n4r3ll3me3na3rn4y3so4t3te3ue3yn4s4u2ibs3ch4k3ds3es4t3ff3la4l4t3ms3na4e4k4o4s4t3po4s4u3re4k4l4t3st3te4s2oad3ds3if4n4s4t3ll3nk3ps3rk4l3ta4e4h3uk3ys2ran3sh2yte0raads3ke2bat3bi3ic4d4s2ced4r4s3he3ks3on2dar3di4y3ge4y3if4i4o4x3on2fee3fs4y3ik4q3ts4y2gas3de3ed4e4r4s3ga4s4y3is3us2hed3ui2iah4s3ds3ke4s3le4s3ne4s4y3rd3se3ta4h4s2jah4s3es2ked4e4r4s3hi3ia4s3ki3si3us2les3li4y3ph2mal3ee4n4s4t3ie4n4s3my3on3ps3se4h3us2nas3ce4h3do4s4y3ed4e4s3ga4e4i4s4y3id4s3ke4s3ns4y3se3ts4y2ped4e4r4s3he3id4n3pe3so2red4e4r4s3ks2sam4s3ed4r4s3ps4y3se3ta2tal4n4s3ch3ed4l4r4s3ha4e4s3io3oo4s3ti4y3us2uli3ns3po2ved4l4n4r4s4y3in2wdy3er3in3ks3ly3ns2xed4s2yah4s3ed3le4s3ne3on2zai3ed4e4r4s4t3oo4r1each4t3dd4s4y3is3ks3lm4o4s3me4s4y3ns3ps3rd4m4s3st3ta4e3ve2bab4r3be3ec4l3id4t3op3ud4s4t4y2cal4p3ce4o4y3ep3it3ks3on3ta4e4i4o3ue4r4t2dan3ds4y3ed4s3ia4d4f4g4p3ly3on4s4x3ry3ub4g4x3ye2eaf3ch3de4s4y3fs4y3ks4y3ls4y3ms3ns3rd3st3ve3ze2fan3ed4l4r3fo3is4t4x3ly3ry2gal4r3es4t4x3go3ia4e3le3ma3na3os4t3ur2hab3em2ifs4y3gn3ki4s3ne4g4k4s3rd3st3ve2jas3ig3on2ked4s4y2lax4y3et3ic4e4t3lo3os2man4p3en4t4x3it4x3ou2nal4y3ds4u3ew4y3ga4s3ig4n3ks3ne3os3te4s2oil3rg2pas4t4y3eg4l4n3in3la4y3os4t3ps3ro3un4t2ran3ig3un2sam4t4w4y3ee4s4t4w3id4n4t3od4l4w3to4s4y3ue4s2tag4m4x3ch3em3ia4e4n4p3ox3ro4y2une3ps3se2vel4t3ie3ow3ue2wan4x3ed4t3in3on3th2xes2zes1habd2eas3id3me3um2ies3me3ne4o2ody3mb3ne2umb2yme4y3ne3ta1iads3ls3nt3ta4o2bas3by3es2ced4r4s4y3he4t3in3ks2der4s3ge4y3ic2els3ms3ve2fer3fs4y3le3te4s4y2ggs3ht3id3mo3ol4r2kka3wa2led4s4y3le4s4y2mae3ed4r4s3on3us2nce3ds4y3es3ge4s4y3ks3se2oja3ne3ts4y2ped4n4r4s3ps2qqs2sen4r4s3hi3ks4y3ps3ts3us2tes3he3ts3zy2val4s3ed4l4n4r4s4t2yal2zas1oach3ds4y3ke4y3ms3ns4y3rs4y3st3te2bbo3ed4r4s3in3le3ot3ug4r2che3ks4y2ded4o4s3ny2ers2gan3er3ue4y2han3es3un4s2ids3ls4y3ns3st2jak3is2ked4r4s4y3os2lag3eo4s3fs3ls4y2mal4n3eo4r3ps4u4y2nde4o3eo4s3in3ne3te4s3uk2ods3fs4y3ks4y3ms4y3ns3ps4y3sa4e4t3ts4y2ped4r4s4y2que2ral3es3ic4d4e3ts4y2sal3co3ed4s4t3ha4i3in4t3ps3sa4o3ti4s2tal4n4s3ch3ed4s3is3ls3on4r4s3ta4e4o4y2uen4s4t3fs3ge4h4y3ks4y3le4s3ms3nd3ps4y3se4t3te4h4s2ved4n4r4s2wan3dy3ed4l4n4r4t3ie3me3nd4s3th4s2yal3et3ne3st2zes4t3it1uach3na2bai4n3by3el4s3in4o3le4i3or3us2che4y3ks2das3ds4y3er4s3ie4s2eda3rs2ffe4s4y3us2gae4l4s3by3gy2ice3ng4s2khs2led4r4s3ly2mal3ba4o3en4s3ly3my3or3po4s4y2nce4h3ds3ed4r4s3gs3ic3ny3os3ts4y3up2ote2pee3ia2ral3ps3us2sas3es3hy3ks4y3ma3se3ts4y2ths3in3ty2vid1yals2bat2iji4y2ked4s2mer3me2nds2oti4s2per3in2the2ugi0saags2bal3ed4r4s3ha3in4r3ji3le3os4t3ra4e3zi2cks3ra4e2ddo4y3es3he4u3ic4s3ly3os3za2eta2fed4r4s2gar4s3er4s3gy3os3um2hab3eb3ib2ice4k4s3ds3ga3ls3ms3ne4s4t3rs3st3th2jou2kai3er4s3ia4s3ti2lad4l4s4t3ep4s4t3ic4s4x3le4y3mi3ol4n4p3pa4s3sa4e3to4s4y3ud4e4t3ve4o2man4s3ba4o3ek4l4n4s4y3fi4u3my3pi4s2nad3ds4y3ed4r4s3ga4h4o4s3ko3sa3to4s2ola2pan3id3or3py2ran3ds3ed4e3ge4o3in4r4s3ks4y3od4s3us3vo2ser3in3se4y2tai4y3ed4m4r4s3in4s3yr2uba3ce4h4y3gh3ls4t3na4f4t3ry3te4s3ve2ved4r4s4y3in3or4y3vy2wah3ed4r2xes2yas3ed4e4r3id3ne3on3st2zes1cabs3ds3ff3gs3il3la4d4e4l4p4y3mp4s3nd4s4t3pa4e4i3re4f4p4s4t4y3th4s4t3ud4p4r3ws2eat3na4d4e4t2hav3if3mo3ul3wa2ifi3nd3on3re2lim2obe3dy3ff3gs3ld3ne3og4p4t3pa4e4s3re4n4p3te4s3ug4p4r4t3wl4p4s2rab4e4g4m4n4p4t4w4y3ee4w3im4p3ob4d4g4o4w3ub4m2uba3di4o4s3ff4t3gs3lk4l4p4s3ms3ps3rf4s3se3ta4e4s3zz2yes1dayn2ein1eals3me4s4y3ns3re4s3se3ts3ze2bum2cco3hs3ts2dan3er4s3ge4y3um2eds4y3ks3ld4s4y3ms3ps4y3rs2fer2gar4s3ni4o3ol4s3ue2hri2ifs3ls3ne3rs3se4m3ty3za4e2kos3ts2lah3es3fs4y3ky3la4e4s3va2mas3ee4n4s3ie4s2nas3ds3es4x3gi3na3or3sa4e4i4u3te4i4s3vy3za2pad4l3ia4c3oy3po3ta4s2rac4i4l3ed4r4s3fs3ge3ia4c4f4n4r3ks3on4w3ra4e4s4y3um3ve4o2sey3sa2tae4l3er3hs3on3ts3up2vak3en4r3ir2wan4r3ed4l4n4r3in2xed4r4s3or3to4s2yen2zes1hack3de4s4y3ft3gs3hs3ka4e4o4t4y3le4l4m4t4y3ma4e4s3nd4k4s3pe4s3rd4e4k4n4p4t3sh3ul3ve3wl4m4n4s3ya4s2chi2eaf4l4r4s3ds3el4n4p4r4t3ik3lf4l3nd4g4t3ol3rd4e4o3ts3va3wn4s2iai3ed4l4r4s3ft3ll4y3ms3ne4s4y3ok3ps3re4k4r4s4t3sh4o4t3te4s3ur3va4e4s2lep3ub2mek3oe2oal4t3ck3ed4r4s3gi4s3ji4o3la3ne4k3ok4l4n4s4t3pe4s3re4l4n4t3te4s4t3ud4t3ve3wd4n4s4y3yu2red4w3is3ow3ub4g2tar3ik3um4p2uba3ck3le4n4s3ns4t3ra3sh3te4s2was2yer3ly1ials2bbs3ia3yl2ces3ht3ko4s4y2das3ed4r4s4y3ha4e3le2ege3ld3ns4t3th3ur3ve2fts2ghs4t3il3la3ma3na4s3ri2jos2kas3er4s2lds3ed4n4r4s4x3ks4y3ls4y3os3ts4y3va2mar4s3ba3is3ps3ul2nce3ds3ed4s4w3ge4s3hs3ks4y3si3us2ped4s3py2red4e4n4s3ih4s3oc3ra3up2sal3es3sy3ta4s2tar3ch3ed4s3he3ka3up4s2ver2xer4s3mo3te4h4y2zar3ed4l4r4s1kags3il3ld3nk3rn4t3te4s4t3ws2ean4r3ds3ed4f4n4r4s4t4v4z3gg4s3in3lf4l4m4p3ne4s3os3ps3rm4s3ts3ws2ids3ed4r4s4y3ff3ll3mo4p4s3nk4s4t3os3ps3rl4r4t3te4s3ve4y2lim2oal3be3dy3ff4s3gs3ls3ol3rt3sh2ran3ik3oo2uas3gs3lk4l3nk2yed4r4y3fs3re4s3te1labs3ck3de3es3gs3id4n3ke3ms3ne4g4k4t3ps3rt3sh3te4s4y3ve3ws3ys2ebs3ds3ek4p4r4t3pt3ws3ys2ice4k3de3er3ly3me4s4y3ng4k3pe4s4t3sh3ts3ve2oan3bs3es3gs3id3jd3ka3mo3om4p4t3pe4s4y3rm3sh3th4s3ve3ws3yd2ubb4s3ed4s3ff3gs3it3mp4s3ng4k3rb4p4s3se4h3ts2yer3ly3pe1maak3ck3ik3ll4m4t3rm4t3sh3ze2ear3ek4s3ik3ke3ll4t3rk3ws2ick3le4y3rk4r4s3te4h4s3ze2ock3gs3ke4o4y3lt3or4t3re4g3te3ut3wt2ugs3rs3sh3ts1nabs3ck3fu3gs3il3ke4y3ps3re4f4k4l4s4y3sh3th3ws2ead4k4p3bs3ck3ds3ed4r4s3ll2ibs3ck3de3ed4s3ff4t3gs3pe4s4y3rt3ts3ve2obs3ds3ek4p3gs3ke3od4k4l4p4t3re4t3ts3ut3wk4s4y2ubs3ck3ff3gs3sh2yes1oaks3ps4y3re4s3ve2bas3er2cas3es3ia3ko4s3le2das3dy3ic3om2far4s3ta4s4y2ger3gy2hur2ils4y2jas3us2kah3en4s3ol2lah4n4r4s3de4i4o4s3ed4i4r4s3id3on4s3um4s3ve2man4s2nar3ce3de3es3go4s4y3ic3ly3ne4y3se4y2oey3ks4y3le4s3ms3ps3te4h4s4y2phs4y3or3py3ra2ral4s3bi4o4s3da4o4s3ed4e4l4r4s4x3go3ns3ra4y3ta4s3us2ths3ol3to2uce4t3gh3ks3ls4y3ms3nd3ps4y3rs3se3th4s2war3ce3ed4r3ff4s3le4s3ms3nd4e3ps3se3th2xes2yas3le3uz2zin1pace4k4y3de4o4s3ed4r4s3gs3hi3il4n4t3ke3ld4e4l4t3ms3ne4g4k4s3rd4e4k4s4t3sm3te4s3ul3wl4n4s3yd4s3za4z2eak4l4n4r4t3ck4s4t3ed4l4r3il4r3ks3ld4k4l4t3nd4t3os3rm3sh3ts3ug3ws4y2ial3ca4e4k4s4y3de3ed4l4r4s3ff4s3ke4s4y3le4l4t3ms3na4e4k4s4y3re4t4y3te4s4z3vs2lat4y3it3og2ode4s3il3ke3of4k4l4m4n4r4t3re4k4t3sa4h4o3ts3ut2rad4g4t4y3ed4e4w3ig4t3od4g3ue4g2uds3ed4r4s3gs3le3me4y3nk3rn4s4t3ta2yal3re1quab4d4t4w3ee4g3ib4d4t4z1rsly1tabs3ck3de3ff3ge4s4y3id4g4n4r3ke3le4k4l3mp3nd4e4g4k4s3ph4s3re4k4n4r4s4t4y3sh3te4s4u3un3ve3ws3ys2ead4k4l4m4n4r3dd4e4s3ed4k4l4m4n4p4r4z3ik4l4n3la4e4l3me4s3nd4o4s4t3ps4t3re4n3ts3ws4y3ys2ich4k3ed4s3ff3lb4e4l4t3me4s4y3ng4k4t3pa4e3re4k4p4s3ve4y2oae4i4s4t3bs3ck3ep3gs4y3ic4t3ke3le4n3ma4p3nd4e4g4k4n4y3od4k4l4p4r3pe4s4t3re4k4m4y3ss3ts4t3un4p4r4t3ve3wn4p4s2rad4e4g4k4p4w4y3ep4w3ia4g4m4p3op4w4y3um4t2ubs3ck4s3de4s4y3ff3ll4m3mm4p4s3ng4k4s4t3pa4e3re4t3sh2yed4s3le4i4o3me4y3re3te1uave2bah4k4s3by3er3ha2cci3ks4y3re2dan3ds3or3sy2ede3nt3rs3te4s4y2gan4r3hs3os2hur2ids3ng4t3te4s2jee2khs3is3uk2lci3fa4o3ks4y3ls4y3ph3us2mac3is3ma3os3ph4s2nis3ks3na4s4y3ts3up2ona2ped4r4s3ra2rah4l4s4t3ds3ed4r4s3fs4y3ge4y3ly3ra2sed4s3hi3us2tor3ra3ta1wabs3ck3ds3ge4s3il4n3le4y3mi4p4y3ng4k4s3ps4t3rd4e4f4m4t3sh3th4s3yl4s2eal4r4t3de3ed4l4p4r4s4t3ir3ll4t3pt3rf3ys2ies3ft3gs3le4l3ms3ne4g4k3pe3re4l3sh4s3th4s3ve3zz2obs3le4l4n3on4p3ps4t3rd4e4n3ts3un2ung1ybbe3il3oe4w2cee4s3on2eds3ns2ker4s2lis3ph3va2mar2nch4s3ds3ed4s3od3th2ped4s3hs2rah3en3up2sop2the2ver0taals3ta2bac3by3er4s3id4s3la4e4s3oo4r4s3un4s2can3es4t3he4i4o4s3it3ks4y3os3ts2dah2els2ffy3ia2ggy3ma3ua2has3rs2iga4s3ko3ls3ns4t3ra3sh3ts2jes2kas3en4r4s3hi4t3in4s3ky2lak4q4r4s3cs4y3ea4r4s3ik3ks4y3ls4y3ma3on3pa3uk4s2mal4s3ed4r4s3in4s3my3ps2nas3ga4i4o4s4y3hs3ia3ka4s4y3na3su4y3te4i4o4y2pas3ed4n4r4s4t3ir4s3pa3us2ras3do4s4y3ed4s3ga4e3ka3ns3oc4k4s4t3ps3re4y3se4i3te4s4y3zy2sar3ca3ed4r4s3ks3sa4e4o3te4o4y2tar3er4s3hs3ie3ou3ts4y3us2ube3ld3nt3on3pe3ts4y2vah4s3er2waf4i4s3ed4r3ie3ny3se3ts2xed4r4s3is3ol4n4r3us2yra2zza4e1each3de4s3ed3ks3ls3ms3rs4y3se3ts3ze2chs4y3ta3um2ddy2els3ms3nd4e4s4y3rs3th4s2ffs2ggs3ua4s2hee3rs2iid3ls3nd4s2kke2lae3co3es4x3ia4c3ls4y3oi4s2med4s3pi4o4s4t3se2nch3ds4u3es4t3ge3ia3ne4o4y3on4r3se3th4s4y3ue2pal4s3ee3id3oy2rai4s3ce3ek4s3fe4s3ga3ms3ne4s3ra4e4y3se3ts3za2sla3ta4e4s4y2tes3hs3ra4i2uch3gh2wed4l3it2xas3es3ta4s1hack3gi3im3le4i3na4e4g4k4s4x3rm4s3ws4t4y2ebe3ca3ed4k4s3ft3gn3ic4n4r3lf3ma4e3ns3or4w3re4m3se4p3ta4e3ws4y2ick3ef3gh4s3lk4l3ne4g4k4s3ol3rd4l2oft3le4i3ng3rn4o4p3se3ts3us3wl2rae4w3ee4w3id4p3ob4e4w3um2uds3gs3ja3mb4p3nk3rl3ya2yme4i4y1ians3ra4e4s2bia2cal3ca3ed4s3hy3ks4y2dal3dy3ed4s2efs3rs2ffs3os3ts2ger4s3ht3on2kas3es3ia4s3ka2lak3de3ed4r4s3ls4y3th4s2mbo3ed4r4s3id3on3ps2nas3ct3ds3ea4d4s3ge4s3ks3ny3to4s4y2pis3py3sy3up2red4s3ls3os3rs3th2tan4r4s3ch3er3he4i3in4r4s3le3re3ty3up2yin3ns2zes3zy1oads4y3st3ze2cks4y3os2day3de4y3ea3os2eas2ffs4y3ts3us2gae4s3ed4s3ue2hos2idy3le4s3ng3se3ts4y2kay3ed4n4r4s3os2lan4r4s3ed4s3ls4y3ts3us3yl2man3bo4s3en4s3ia4n3me4y3os4z2nal3di4o3ed4r4s4y3ga4s3ic3ka4s3ne3us2ols3ms3ns3th4s2paz3ed4e4k4r4s3he4i4s3ic4s3oi4s3py2que2rah4n4s3ch4s3es3ic4i3os4t3rs3se4i4k4o3ta4e4s3us2sas3ed4s3hy3sy3yl2tal3ed4m4r4s3ty2uch3gh3ks3ns3rs3se4y3ts3ze4y2wai3ed4l4r3ie3no4s4y3se4y3ts3ze4y2xic4n2yed4r3on4s2zed4s3ie1rabs3ce4k4t3de4s4y3ga4i4s4u3ik4l4n4t3mp4s3nk4q4s4t3pe4o4s4t3sh4s3ts4t3ve3wl3yf4s2ead4t3ck3ed4n4s3fa3if3ks3ma4s3nd3ss4t3ts3ws3yf4s2iac4d4l3be3ce4k3de3ed4r4s3fa4f3go4s3ke3ld4l3ms3ne4s3ol4r4s3pe4s4y3st3te2oad4k4t3ck3de4s3gs3is3ke3ll3mp3na4c4e4k4s3op4z3pe4o3th4s3ut3ve3ws3ys2uce4k3ed4r4s3go4s3ll4y3mp3nk3ss4t3th2yer3ke3ma3ps3st1sade4i3rs2ked2uba4o1uans3rt3th2bae4l4r4s3by3ed4r4s2cks2fas3fe4s3ts4y2gra2ile3na3sm2ktu2les3ip3le3pa4s3si2mid3my3or3ps4y2nas3ds3ed4r4s3gs3ic3ny2pek3ik3le2que2rbo3ds3fs4y3ks3me4s3ns4t3on3ps3rs2shy3ks4y2tee4s3or3ti4y3us2xes2yer1waes3in3ls3ng4k3ts3ys2eak3ed4l4n4p4r4t3rk4p2ice3er3gs3ll4t3ne4k4s4y3re4k4l4p3st3te4s3xt2ocs3er3nk2yer1yees3rs2ing3yn2kes2ler2mps2nde3ed4s2pal3ed4s4y3ic3os3ps3to2ran3ed4s3os2the1zars0ubacs2ity1dals2der2ons2yog1gali2ged1hlan2uru1kase1lama3ns2cer2ema2min3os2nad4e4r4s2pan2tra2vas2yie2zie1mami2bel4r3le3os3ra4e2iac4k4q2mah4s3ed2ped3hs3ie3ty2rah4s1nagi3is3pt3rm4y3us2bag4n4r3ed3id3ox2cap3es3ia3le3os4y3us4t2dam3ee4r3id3os3ue4g2eth2fed3it4x2gag3et3od4t3um2hat3ip2ica3fy3on4s3te4s4y2jam2ked4t4y3id3ut2lap4w4y3ed4g4t3id4t2mad4n3et4w3ix2ode3ld3wn2pay3eg4n3in3ly3ot3ut2red3id4g4p2saw4y3ee4t4w4x3od3ub2tag4x3ie4l4n2wed4t3it3on2zip1pbow3ye2dos3ry2end2ful2jet2lay3ed3it2ped4r2ran3un2see4t4y2tak3er3ie1raei3li3os3re4i3se3te2ban3ex3ia2dee2eal4s3do3ic4d3na4t2ged4r4s2ial3ne3te2man2nal3ed2ped2sae3id3on2ubu3pa2vas1sage2ens3rs3ta2her2ing2nea3ic2que2tad3er2ual3re4p4y1teri4o2ile2ter1veal4s2ula0vacas4y3ua4i4o2das3ed4s3ge2gal3ue4s2ids3ls3re4s4y2jra2kas3il2les4t3id4s3li3or3se3ue3ve2mps4y2nda3ed4s3ga4s3ts2ped4r4s3id3or2ran4s3da4o4y3ec4s3ia4x3na3us3ve2sal3es3ts4y2tas3ha3ic3je3os3us2uch3lt3nt3te4s2wte2xes1eale4s4y2ena3ps3rs4y2gan4s3es3go3ie3os2hme2ils4y3ns4y2lar3ds4t3es3ls3um2nae4l4s3ds4u3ey3ge3in3om3ti4s3ue4s2rba4s3de3ge3ra4e4y3sa4e4o4t3te4s4u3ve2spa3ta4s2tch2uve2ves2xed4r4s3il2zir1ials3nd2bed4s4x4y2car3ed4s3hy3us2deo2ers3ux3ws4y2fda3fs2gas3ia4l3or2lde3er3la4e4i4s2men2nal4s3ca3ed4r4s4w3ho3ic3ny3os3ts3yl2ola4d4s2per2ral3ed4o4s3ga4e4o3id3ls3tu3us2sas3ed4s3ie4t3na4e3on4r3ta4o2tae4l4s3ex3ro3ta2vas4t3da3er4s3id3os3re2xen2zir3or1last2eis2ies2ogs1oars2bla2cab4l3es2ddy3ka3ou3un2ema2gie3ue2ice4i3ds3la4e3ps2lae4r3ed4s4t3ke4s3ta4e4i4s3va4e2mer3it2ted4r4s2uch3ge3lu2wed4l4r2xel4s2zhd1raic2ils2oom3us4w3ws1uggs4y3hs4y2lgo3ns3va2tty1ygie2ing0waacs2cke4o4s4y2das3ds4y3ed4r4s3ge3is3ts2fer3fs3ts2ged4r4s3ga3on3yu2hay3ey3oo2ide3fs4t3ls3ns3rs3st3te4s3ve2kas3ed4n4r4s3fs2ldo4s3ed4r4s3ie4s3ks3la4s4y3ty4z2med4s3us2nds3ed4s4y3gs3ks4y3le4y3na3ta4s4y3ze2qfs2rbs4y3ds3ed4s4z3ks3ms3ns3ps3re3st3ts4y2ses3hi4y3ms3ps4y3te4s2tap3ch3er3ts2uff3gh3ks3lk4s3rs2ved4r4s4y2was3es3ls2xed4n4r4s2yed2zir3oo1eald4s3mb3ns3rs4y3ve2bby3er2cht2del3ge4y2eds4y3is3ke4s3ls3ms3ns4y3ps4y3st3te4s2fte4s2ids3gh3ls3rd4s3se3ze2kas2lch3ds3ke4s4t3ls4y3sh3ts2mbs2nch3ds3ge3ny3ts2rfs3os3sh2sts2tas3ly2xed4s1hack3le3mo4s3ng3ps3re4f3ta4s3up4r2eal4r4t3ek4l4n4p3ft3lk4m4p3ns3re3ts3ws3ys2ich3ds3es3ff4t3gs3le4k3ms3ne4s4y3os3ps4t3rl4r4s3sh4k4s4t3te4s4y3zz2ole3mp3of4p4t3ps3re4l4t3se4o3ws2ump3ps2yda1icca3ks4y2ddy3en4r4s3ow3th2eld4s2fed4s4y3ie3ts4y2gan3ga4y3ht2kis2lco3ds3ed4s3ga3is3ja3ls4y3ts2mps4y2nce4h3ds4y3ed4s4y3ge4s4y3ks4y3na4s3os3ze2ped4r4s2red4r4s3ra4i2sed4r4s3ha4t3ps4y3ts2tan3ch3ed4s3he4s4y3ty2ved4r4s2zen4s3zo1oads4y3ld2cks2dge4y2ful2jus2ken4r3ka2lds3fs3ly3ve2man4s3bs4y3en3yn2nga4i3ks4y3ts2ods4y3ed4r3fs4y3ld4s4y3ns3ps4y3se4h3tz3zy2rds4y3ks4y3ld3ms4y3ry3se4t3th4s2uld3nd2ven2wed4e3se2xen1rack3ng3ps4t3st3te4h3wl2eak3ck3ns3st2ick3ed4r4s3ng3st3te4s2oke3ng3ot3te4h2ung2yer3ly1uddy3us2ffs2lls2nga2rst2ses3hu3sy2xia1yled4s2nds3ns2ted4s3he0xebec2nia4c3on2ric3ox3us1oana2los1rays1viii1ylan3em3ic3ol3yl2sti4s0yaars3ss2bas3ba4y2cca3ht3ka4s2dda2ffs2ger4s3is3na2hoo2ird2jna2kka3ow2les2men3pa4y3un2ndy3gs3ks2pok4n3ps4y2rak3co3ds3er3fa3ks3ns3ra4s3ta4o2tes3ra2uds3ld3ps2wed4y3ls3ns4y3ps2yas1bore1clad3ed2ond1drad3ed1eads3hs3lm3ns3rd4n4s3st2cch3hs4y2des2eds3ek3sh2ggs2lks3ls3ms3ps3ts2nta4e2rba3ds3ks2ses3ks3ts4y2tis3ts2uch3ks4y2ven4s2wen2xed4s1fere1ield2ked4s2lls2nce2pes3py2rds3ks3rs3th2tes3ie1lems2ide4s3ke2kes1molt2pes1obbo4y2cks2del3hs3le2gas3ee3hs3ic4n4s2hah4y2ick2jan2kan3ed4g4l4r4s3ul2lks4y3ps2mim3ps2nic4s3ks3ny2ofs3ps2pos3po2res3ga3ks3ps2uks3ng3rn4s4t3se3th2wed4s3ie3ls3sa3za2yos1rapt2ent2ivd2neh1same1tost1uans2cas3ca4h3ko4s4y2fts2gas2ked4s3ky3os2lan3es2mmo4y3ps2pon3py2rta4s2zus0zabra2cks2ida4e4y3re2kat2mac4k4n3bo3ia4s2nja3te3za4e2ppy2rda3fs3is2tis2wns2xes2yde3in2zen1eals2bec3ra3ub4s2das2era2ins2ndo2rda3ks3os2sts4y2tas2xes2zes1homo2ush3zh1ibet2ffs2gan2krs2las3ch3la4s2mbi4s2nco4s4y3eb4s3gs4y3ke4y3os2ppo4y2ram2tis3ty2zel3it1lote4y1oaea2bos3us2cco2eae4l4s2ism4t2kor2lle2mbi2nae4l3da3ed4r4s3ks2oea4y3id3ks3ms4y3ns3ty2ppa4o2ril4s3ro3se2uks2wee3ie1ulus2pan4s3pa2rfs2zim1ygal3on2mes3ic";
+  var out = [], word = "", i = 0, k;
+  while (i < s.length) { k = +s[i]; word = word.slice(0, k) + s.substr(i + 1, L - k); i += 1 + L - k; out.push(word); }
+  w.ALLOWED_GUESSES = out;
+  w.MUSIC_WORDLE_ANSWERS = ["haydn","liszt","verdi","ravel","bizet","elgar","satie","grieg","glass","reich","adams","faure","dukas","ibert","nyman","berio","weber","wolfe","sousa","price","rouse","adele","bjork","swift","sting","drake","lorde","seger","piano","viola","cello","organ","oboes","flute","drums","synth","tabla","sitar","lyres","harps","banjo","reeds","kazoo","guqin","zurna","veena","sarod","rebab","mbira","bongo","conga","shawm","cajon","snare","fifes","pipes","guiro","tiple","viols","forte","largo","tenor","mezzo","lento","dolce","grave","segue","segno","ossia","pedal","clefs","tacet","tutti","theme","motif","rests","slurs","trill","staff","stave","codas","pitch","voice","lyric","sheet","meter","metre","tempo","sharp","flats","third","fifth","sixth","ninth","tenth","round","drone","beats","riffs","licks","tunes","songs","vocal","notes","score","solfa","cresc","frets","capos","barre","beams","octet","nonet","duets","trios","solos","choir","arias","carol","vibes","sines","mixer","delay","phase","codec","music","audio","hertz","canon","fugue","etude","opera","rondo","tango","waltz","missa","motet","suite","gigue","salsa","mambo","rumba","polka","choro","djent","drill","swing","disco","house","grime","metal","indie","blues","folky","samba","bossa","noise","chant","chime","psalm","verse"];
+  w.MUSIC_WORDLE_WORDS_VERSION = "b144c11197aa10bf";
+})(window);
@@ -2,16 +2,20 @@ import os
 import sys
 
 
-def main():
-    # Make the subfolder importable and delegate to the real app
+def load():
+    # Make the subfolder importable and import the real app (once per process)
     here = os.path.dirname(os.path.abspath(__file__))
     sub = os.path.join(here, 'music-wordle-streamlit')
     if sub not in sys.path:
         sys.path.insert(0, sub)
-    from app import main as run
-    run()
+    import app
+    return app
+
+
+def main():
+    # Delegate to the real app
+    load().main()
 
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,263 @@
+"""Offline benchmarks for the Streamlit app's hot paths.
+
+Runs against the same Streamlit stub as ``test_app.py``, so no server or
+browser is needed::
+
+    python tests/bench_app.py                    # full run -> bench-results.json
+    python tests/bench_app.py --quick            # smaller inputs, fewer calls
+    python tests/bench_app.py --update-baseline  # accept the current numbers
+
+Every case is timed call by call, giving throughput and latency
+percentiles. Peak memory comes from one extra call under ``tracemalloc``,
+kept apart so tracing does not skew the timings. Results are compared with
+``tests/bench_baseline.json`` (only cases present in both). A case whose
+p50 latency or peak memory grew by more than the tolerance is listed under
+``"regressions"`` and the run exits with status 1. Timings are machine
+specific, so refresh the baseline when switching machines.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from test_app import load_app_module
+
+BASELINE = Path(__file__).resolve().parent / 'bench_baseline.json'
+TOLERANCE = 1.0  # flag at 2x: shared CI machines easily swing by +50%
+# Ignore changes below these; they are timer and allocator noise
+MIN_DELTA_MS = 0.02
+MIN_DELTA_KB = 64.0
+
+
+@dataclass
+class Case:
+    name: str
+    fn: Callable[[], object]
+    calls: int
+    setup: Optional[Callable[[], object]] = None
+    ops: int = 1  # operations per call, for throughput of bulk cases
+
+
+def _percentile(sorted_ms: List[float], pct: float) -> float:
+    # Nearest rank
+    k = max(0, min(len(sorted_ms) - 1, round(pct / 100 * len(sorted_ms) + 0.5) - 1))
+    return sorted_ms[k]
+
+
+def measure(case: Case, calls: Optional[int] = None) -> Dict[str, float]:
+    calls = calls or case.calls
+    # One untimed call first: imports, caches and allocator arenas warm up
+    if case.setup is not None:
+        case.setup()
+    case.fn()
+    samples = []
+    for _ in range(calls):
+        if case.setup is not None:
+            case.setup()
+        start = time.perf_counter_ns()
+        case.fn()
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+    if case.setup is not None:
+        case.setup()
+    tracemalloc.start()
+    try:
+        case.fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    samples.sort()
+    total = sum(samples)
+    return {
+        'calls': calls,
+        'ops_per_call': case.ops,
+        'ops_per_sec': round(case.ops * calls / (total / 1000), 1) if total else 0.0,
+        'mean_ms': round(total / calls, 4),
+        'p50_ms': round(_percentile(samples, 50), 4),
+        'p95_ms': round(_percentile(samples, 95), 4),
+        'p99_ms': round(_percentile(samples, 99), 4),
+        'max_ms': round(samples[-1], 4),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def synthetic_upload(n: int, seed: int = 0) -> bytes:
+    """``n`` random five-letter words, newline separated (~6 bytes/word)."""
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return '\n'.join(''.join(rng.choices(letters, k=5)) for _ in range(n)).encode()
+
+
+def build_cases(quick: bool = False) -> List[Case]:
+    app = load_app_module()
+    st = app.st
+    from musicwordle import dictionary, ingest
+
+    scale = 10 if quick else 1
+    engine = app.GameEngine()
+    game = engine.play('piano', ['arose', 'until', 'dumpy', 'chowk', 'glyph'])
+    answers = list(app._ANSWERS)
+    guesses = sorted(app.shared_dictionary())[:200]
+    finder = app.shared_index()
+
+    def score_bulk():
+        for g in guesses:
+            for a in answers:
+                app.score_guess(g, a)
+
+    def cold_session():
+        st.session_state.clear()
+        # Forget the process-wide dictionary too: a first session after start-up
+        dictionary._shared.clear()
+
+    def fresh_session():
+        st.session_state.clear()
+        app.ensure_state()
+
+    def cold_length():
+        fresh_session()
+        # First game at another word length since start-up
+        dictionary._shared.pop(7, None)
+
+    def fresh_upload():
+        fresh_session()
+        ingest.shared_ingest_cache().clear()
+
+    def cached_upload():
+        fresh_session()
+        ingest.ingest_bytes(cached)
+
+    def typed_guess():
+        st.session_state.clear()
+        st.query_params.clear()
+        app.main()
+        st.session_state.game.current = 'cello'
+        st.query_params['k'] = 'ENTER'
+
+    def idle_rerun():
+        st.query_params.clear()
+
+    from musicwordle import share
+    from musicwordle.multiboard import MultiEngine
+    multi = MultiEngine(app.shared_dictionary(), answers, matrix=app.shared_matrix())
+    boards = []
+
+    def multi_game():
+        boards[:] = [multi.new_game('melody', 8)]
+
+    cases = [
+        Case('load_bundled_dictionary', app.load_bundled_dictionary, 5 if quick else 20),
+        Case('ensure_state[cold]', app.ensure_state, 50, setup=cold_session),
+        Case('ensure_state[warm]', app.ensure_state, 5000 // scale),
+        Case('switch_length[7,cold]', lambda: app.switch_length(7), 20, setup=cold_length),
+        Case('score_guess', lambda: app.score_guess('cello', 'piano'), 20000 // scale),
+        Case('score_guess[bulk]', score_bulk, 5 if quick else 10, ops=len(guesses) * len(answers)),
+        Case('seeded_choice', lambda: app.seeded_choice(answers, 'melody'), 20000 // scale),
+        Case('compute_key_status', lambda: app.compute_key_status(game), 5000 // scale),
+        Case('share_card[render]', lambda: share.render_card('k', ['title', 'score'], (tuple(game.codes),)),
+             1000 // scale),
+        Case('share_card[cached]', lambda: share.share_card(list(game.codes), True, '2025-06-01'), 20000 // scale),
+        Case('multi_submit[8 boards]', lambda: multi.submit(boards[0], 'arose'), 2000 // scale, setup=multi_game),
+        Case('board_rows[cold]', lambda: app.board_rows(game), 2000 // scale, setup=app.row_html.cache_clear),
+        Case('board_rows[warm]', lambda: app.board_rows(game), 20000 // scale),
+        Case('finder_query', lambda: finder.search('p?a??', include='n', exclude='e', not_at='r2').page(0),
+             5000 // scale),
+        Case('did_you_mean', lambda: app.did_you_mean('pianp', app.shared_dictionary(), answers), 5000 // scale),
+    ]
+    sizes = [(10_000, '10k', 10), (100_000, '100k', 5)] + ([] if quick else [(1_000_000, '1M', 3)])
+    for n, label, calls in sizes:
+        data = synthetic_upload(n)
+        cases.append(Case(f'load_custom_dictionary[{label}]',
+                          lambda data=data: app.load_custom_dictionary(data), calls, setup=fresh_upload, ops=n))
+    cached = synthetic_upload(100_000)
+    cases.append(Case('load_custom_dictionary[100k,cached]',
+                      lambda: app.load_custom_dictionary(cached), 20, setup=cached_upload, ops=100_000))
+    n, label = (100_000, '100k') if quick else (400_000, '400k')
+    uploaded = ingest.ingest_bytes(synthetic_upload(n, seed=1)).words
+    # The warm-up call builds the index; calls measure the lookup alone
+    cases.append(Case(f'did_you_mean[{label}]', lambda: app.did_you_mean('pianp', uploaded, answers), 1000 // scale))
+    cases.append(Case('rerun[submit]', app.main, 500 // scale, setup=typed_guess))
+    cases.append(Case('rerun[idle]', app.main, 2000 // scale, setup=idle_rerun))
+    return cases
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float = TOLERANCE) -> List[dict]:
+    """Cases whose p50 latency or peak memory grew beyond ``tolerance``."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, floor in (('p50_ms', MIN_DELTA_MS), ('peak_kb', MIN_DELTA_KB)):
+            old, new = base[metric], current[metric]
+            if new > old * (1 + tolerance) and new - old > floor:
+                regressions.append({
+                    'case': name, 'metric': metric, 'baseline': old, 'current': new,
+                    'ratio': round(new / old, 2) if old else None,
+                })
+    return regressions
+
+
+def run(quick: bool = False, only: str = '') -> Dict[str, dict]:
+    results = {}
+    for case in build_cases(quick):
+        if only and only not in case.name:
+            continue
+        results[case.name] = measure(case)
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python tests/bench_app.py', description=__doc__.splitlines()[0])
+    parser.add_argument('--quick', action='store_true', help='smaller inputs and fewer calls')
+    parser.add_argument('--only', default='', help='run cases whose name contains this text')
+    parser.add_argument('--out', type=Path, default=Path('bench-results.json'))
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help='allowed relative growth (1.0 = twice the baseline)')
+    parser.add_argument('--update-baseline', action='store_true', help='write results to the baseline file')
+    args = parser.parse_args(argv)
+
+    results = run(args.quick, args.only)
+    baseline = {}
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())['results']
+    regressions = [] if args.update_baseline else compare(results, baseline, args.tolerance)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            'baseline': args.baseline.name if baseline else None,
+            'tolerance': args.tolerance,
+        },
+        'results': results,
+        'regressions': regressions,
+    }
+    args.out.write_text(json.dumps(report, indent=2) + '\n')
+    if args.update_baseline:
+        if baseline and args.only:
+            baseline.update(results)
+            report['results'] = baseline
+        args.baseline.write_text(json.dumps(report, indent=2) + '\n')
+
+    width = max(len(n) for n in results) if results else 0
+    print(f"{'case':<{width}}  {'ops/s':>12}  {'p50 ms':>9}  {'p95 ms':>9}  {'p99 ms':>9}  {'peak KB':>9}")
+    for name, r in results.items():
+        print(f"{name:<{width}}  {r['ops_per_sec']:>12,.0f}  {r['p50_ms']:>9.3f}  {r['p95_ms']:>9.3f}  "
+              f"{r['p99_ms']:>9.3f}  {r['peak_kb']:>9.1f}")
+    for reg in regressions:
+        print(f"REGRESSION {reg['case']} {reg['metric']}: {reg['baseline']} -> {reg['current']}")
+    print(f"wrote {args.out}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
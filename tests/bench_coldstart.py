@@ -0,0 +1,144 @@
+"""Cold-start benchmark: import time and first render of a fresh process.
+
+An autoscaled container pays for everything between ``streamlit_app.main()``
+and the first board on screen: putting the app folder on ``sys.path``,
+importing ``app`` (and through it ``musicwordle``), then the first full
+rerun. Each run here is a fresh interpreter on the test suite's Streamlit
+stub, timing those phases separately, then one warm rerun and the
+background warm-up (``musicwordle.warmup``) step by step::
+
+    python tests/bench_coldstart.py                        # 5 runs per mode -> coldstart.json
+    python tests/bench_coldstart.py --runs 10 --budget-import-ms 100 --budget-render-ms 20
+
+Modes: ``daily`` (the default Streamlit session: daily puzzle, calendar
+lookup) and ``practice`` (custom seed, word finder panel open). Each run
+also lists modules that should stay lazy (profilers, upload parser, share
+cards) but were imported anyway. The run exits with status 1 when a p50
+exceeds its budget or a lazy module was loaded. The stub skips
+Streamlit's own import and start-up, so the numbers are this repo's share
+of a cold start.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+HERE = Path(__file__).resolve().parent
+MODES = ('daily', 'practice')
+# Only the debug panel, uploads, finished games and the module CLIs need these
+LAZY = ('cProfile', 'pstats', 'tracemalloc', 'musicwordle.ingest', 'musicwordle.share', 'musicwordle.build',
+        'musicwordle.simulate')
+
+
+def child(mode: str) -> dict:
+    """One cold start in this (fresh) process."""
+    sys.path.insert(0, str(HERE))
+    from test_app import install_streamlit_stub
+
+    install_streamlit_stub()
+    st = sys.modules['streamlit']
+    if mode == 'daily':
+        # A real toggle returns its default: Daily mode on
+        st.sidebar.toggle = lambda label, value=False, **kwargs: value
+    sys.path.insert(0, str(HERE.parent))
+    import streamlit_app
+
+    start = time.perf_counter()
+    app = streamlit_app.load()
+    imported = time.perf_counter()
+    app.main()
+    rendered = time.perf_counter()
+    app.main()
+    rerun = time.perf_counter()
+    lazy_loaded = [name for name in LAZY if name in sys.modules]
+    from musicwordle.warmup import warm_up
+
+    warm = warm_up()
+    return {
+        'import_ms': (imported - start) * 1000,
+        'first_render_ms': (rendered - imported) * 1000,
+        'rerun_ms': (rerun - rendered) * 1000,
+        'warm_up_ms': {name: seconds * 1000 for name, seconds in warm.items()},
+        'lazy_loaded': lazy_loaded,
+        'modules': len(sys.modules),
+    }
+
+
+def run_once(mode: str) -> dict:
+    env = dict(os.environ)
+    env['MUSIC_WORDLE_WARMUP'] = 'off'  # warmed explicitly, after the timed phases
+    env['MUSIC_WORDLE_STATS_DB'] = os.path.join(tempfile.mkdtemp(prefix='mw-cold-'), 'stats.sqlite3')
+    out = subprocess.run([sys.executable, str(Path(__file__).resolve()), '--child', mode],
+                         capture_output=True, text=True, env=env, check=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def summarise(runs: List[dict]) -> dict:
+    summary = {}
+    for key in ('import_ms', 'first_render_ms', 'rerun_ms'):
+        values = [r[key] for r in runs]
+        summary[key] = {'p50': round(_median(values), 2), 'max': round(max(values), 2)}
+    steps = runs[0]['warm_up_ms']
+    summary['warm_up_ms'] = {step: round(_median([r['warm_up_ms'][step] for r in runs]), 2) for step in steps}
+    summary['lazy_loaded'] = sorted({name for r in runs for name in r['lazy_loaded']})
+    summary['modules'] = runs[-1]['modules']
+    return summary
+
+
+def over_budget(summary: dict, budget_import_ms: float, budget_render_ms: float) -> List[str]:
+    """Human-readable budget failures for one mode's summary."""
+    failures = []
+    for key, budget in (('import_ms', budget_import_ms), ('first_render_ms', budget_render_ms)):
+        if summary[key]['p50'] > budget:
+            failures.append(f"{key} p50 {summary[key]['p50']:.1f} > {budget:g}")
+    if summary['lazy_loaded']:
+        failures.append(f"imported at start-up: {', '.join(summary['lazy_loaded'])}")
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python tests/bench_coldstart.py', description=__doc__.splitlines()[0])
+    parser.add_argument('--child', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per mode')
+    parser.add_argument('--budget-import-ms', type=float, default=150.0)
+    parser.add_argument('--budget-render-ms', type=float, default=50.0)
+    parser.add_argument('--out', type=Path, default=Path('coldstart.json'))
+    args = parser.parse_args(argv)
+    if args.child:
+        print(json.dumps(child(args.child)))
+        return 0
+
+    report: Dict[str, dict] = {}
+    failures = []
+    for mode in args.modes:
+        summary = report[mode] = summarise([run_once(mode) for _ in range(args.runs)])
+        failures += [f'{mode}: {f}' for f in over_budget(summary, args.budget_import_ms, args.budget_render_ms)]
+        print(f"{mode:<9} import {summary['import_ms']['p50']:7.1f} ms  first render "
+              f"{summary['first_render_ms']['p50']:7.1f} ms  rerun {summary['rerun_ms']['p50']:6.2f} ms  "
+              f"({summary['modules']} modules)")
+        steps = '  '.join(f'{k} {v:.1f}' for k, v in summary['warm_up_ms'].items())
+        print(f"{'':<9} warm-up ms: {steps}")
+    args.out.write_text(json.dumps({
+        'budget_import_ms': args.budget_import_ms, 'budget_render_ms': args.budget_render_ms,
+        'runs': args.runs, 'modes': report, 'failures': failures,
+    }, indent=2) + '\n')
+    for failure in failures:
+        print(f'OVER BUDGET {failure}')
+    print(f'wrote {args.out}')
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
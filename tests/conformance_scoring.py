@@ -0,0 +1,295 @@
+"""Differential conformance and throughput suite for the scoring engines.
+
+The duplicate-letter rules are implemented several times: ``score_guess``
+(the reference), ``score_code``, the NumPy and pure-Python pattern
+matrices, ``PatternMatrix.codes`` (multi-board lookups) and ``scoreGuess``
+in ``music-wordle/game.js``. This scores word sets through every engine,
+compares each with the reference pair by pair, and reports pairs scored per
+second per engine::
+
+    python tests/conformance_scoring.py                      # 5 letters -> conformance.json
+    python tests/conformance_scoring.py --lengths 4 5 6 7 8 --answers 20
+    python tests/conformance_scoring.py --export-golden      # after changing the words or game.js
+
+Sets: ``dictionary`` (every answer x every allowed guess), ``adversarial``
+(every word over a two- or three-letter alphabet, so every arrangement of
+repeated letters) and ``duplicates`` (real words with at most ``length - 2``
+distinct letters). With ``node`` installed, the JS ``scoreGuess`` runs as one
+more engine. Without it, the reference results are still checked against
+``tests/scoring_golden.json``: per-answer digests of the JS results at five
+letters (the static client's word length), exported with
+``--export-golden``. The run exits with status 1 on any mismatch, or when
+the golden file was exported from other word lists.
+"""
+import argparse
+import base64
+import hashlib
+import itertools
+import json
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from test_app import load_app_module
+
+ROOT = Path(__file__).resolve().parent.parent
+GAME_JS = ROOT / 'music-wordle' / 'game.js'
+GOLDEN = Path(__file__).resolve().parent / 'scoring_golden.json'
+GOLDEN_LENGTH = 5  # COLS in game.js
+SETS = ('dictionary', 'adversarial', 'duplicates')
+EXAMPLES = 5  # mismatching pairs kept per engine
+
+# Pulls scoreGuess out of game.js and runs it with COLS bound to the word length
+NODE_SCRIPT = r'''
+const fs = require('fs');
+const req = JSON.parse(fs.readFileSync(0, 'utf8'));
+const src = fs.readFileSync(req.game_js, 'utf8').match(/function scoreGuess\([\s\S]*?\n  \}\n/)[0];
+const scoreGuess = new Function('COLS', src + '\nreturn scoreGuess;')(req.length);
+const digit = {absent: 0, present: 1, correct: 2};
+const wide = req.length > 5;
+const out = Buffer.alloc(req.guesses.length * req.answers.length * (wide ? 2 : 1));
+const start = process.hrtime.bigint();
+let k = 0;
+for (const g of req.guesses) {
+  for (const a of req.answers) {
+    let code = 0;
+    for (const s of scoreGuess(g, a)) code = code * 3 + digit[s];
+    if (wide) { out.writeUInt16LE(code, k); k += 2; } else { out[k++] = code; }
+  }
+}
+const seconds = Number(process.hrtime.bigint() - start) / 1e9;
+console.log(JSON.stringify({codes: out.toString('base64'), seconds}));
+'''
+
+
+def _scoring():
+    load_app_module()
+    from musicwordle import scoring
+    return scoring
+
+
+def adversarial_words(length: int) -> List[str]:
+    """Every word over ``abc`` (``ab`` above five letters, to keep the square small)."""
+    alphabet = 'abc' if length <= 5 else 'ab'
+    return [''.join(p) for p in itertools.product(alphabet, repeat=length)]
+
+
+def word_sets(length: int, names: Sequence[str] = SETS) -> Dict[str, Tuple[List[str], List[str]]]:
+    """``name -> (guesses, answers)`` at ``length`` letters."""
+    _scoring()
+    from musicwordle.config import answers_for
+    from musicwordle.dictionary import shared_dictionary
+
+    allowed = list(shared_dictionary(length).ordered)
+    answers = list(answers_for(length))
+    sets = {}
+    for name in names:
+        if name == 'dictionary':
+            sets[name] = (allowed, answers)
+        elif name == 'adversarial':
+            words = adversarial_words(length)
+            sets[name] = (words, words)
+        elif name == 'duplicates':
+            words = sorted({w for w in allowed + answers if len(set(w)) <= length - 2})
+            sets[name] = (words, words)
+        else:
+            raise ValueError(f'unknown word set: {name}')
+    return sets
+
+
+def python_engines(length: int) -> Dict[str, Callable[[List[str], List[str]], object]]:
+    """Engines scoring ``guesses x answers`` into flat guess-major codes (:func:`scoring.code_array`)."""
+    scoring = _scoring()
+
+    def pairs(fn):
+        def run(guesses, answers):
+            out = scoring.code_array(length)
+            out.extend(fn(g, a) for g in guesses for a in answers)
+            return out
+        return run
+
+    def matrix_python(guesses, answers):
+        m = scoring.PatternMatrix(guesses, answers, use_numpy=False)
+        out = scoring.code_array(length)
+        for g in guesses:
+            out.extend(m.row(g))
+        return out
+
+    def matrix_numpy(guesses, answers):
+        table = scoring.score_matrix_numpy(guesses, answers)
+        return scoring.code_array(length, table.astype('<u2' if table.itemsize == 2 else 'u1').tobytes())
+
+    def matrix_codes(guesses, answers):
+        m = scoring.PatternMatrix(guesses, answers)
+        out = scoring.code_array(length)
+        for g in guesses:
+            out.extend(m.codes(g, answers))
+        return out
+
+    engines = {
+        'score_guess': pairs(lambda g, a: scoring.encode_pattern(scoring.score_guess(g, a))),
+        'score_code': pairs(scoring.score_code),
+        'matrix_python': matrix_python,
+        'matrix_codes': matrix_codes,
+    }
+    if scoring.np is not None:
+        engines['matrix_numpy'] = matrix_numpy
+    return engines
+
+
+def run_js(guesses: List[str], answers: List[str], length: int) -> Tuple[object, float]:
+    """``scoreGuess`` from game.js over ``guesses x answers``: (codes, seconds spent scoring in node)."""
+    request = {'game_js': str(GAME_JS), 'length': length, 'guesses': guesses, 'answers': answers}
+    out = subprocess.run(['node', '-e', NODE_SCRIPT], input=json.dumps(request), capture_output=True, text=True,
+                         check=True).stdout
+    result = json.loads(out)
+    return _scoring().code_array(length, base64.b64decode(result['codes'])), result['seconds']
+
+
+def column_digests(codes, guesses: Sequence[str], answers: Sequence[str]) -> Dict[str, str]:
+    """Per answer, a digest of its codes against every guess (in ``guesses`` order)."""
+    scoring = _scoring()
+    n = len(answers)
+    return {a: hashlib.sha256(scoring.code_bytes(codes[j::n])).hexdigest()[:16] for j, a in enumerate(answers)}
+
+
+def words_digest(words: Sequence[str]) -> str:
+    return hashlib.sha256('\n'.join(words).encode()).hexdigest()[:16]
+
+
+def mismatches(expected, got, guesses: Sequence[str], answers: Sequence[str]) -> Tuple[int, List[dict]]:
+    """Number of differing pairs, and the first few as examples."""
+    if len(got) != len(expected):
+        return len(expected), [{'error': f'{len(got)} codes for {len(expected)} pairs'}]
+    if got == expected:
+        return 0, []
+    n = len(answers)
+    bad = [k for k in range(len(expected)) if got[k] != expected[k]]
+    examples = [{'guess': guesses[k // n], 'answer': answers[k % n], 'expected': int(expected[k]), 'got': int(got[k])}
+                for k in bad[:EXAMPLES]]
+    return len(bad), examples
+
+
+def check_golden(golden: Optional[dict], name: str, codes, guesses: Sequence[str],
+                 answers: Sequence[str]) -> Optional[dict]:
+    """Reference codes against the exported JS digests for one set (``None`` if it has none)."""
+    entry = (golden or {}).get('sets', {}).get(name)
+    if entry is None:
+        return None
+    if entry['guesses_sha256'] != words_digest(guesses):
+        return {'stale': True, 'checked': 0, 'mismatched': []}
+    columns = entry['columns']
+    digests = column_digests(codes, guesses, answers)
+    known = [a for a in answers if a in columns]
+    return {
+        'stale': any(a not in columns for a in answers),
+        'checked': len(known),
+        'mismatched': [a for a in known if digests[a] != columns[a]],
+    }
+
+
+def run(lengths: Sequence[int] = (GOLDEN_LENGTH,), names: Sequence[str] = SETS, answers: int = 0,
+        use_node: bool = True, golden_path: Path = GOLDEN) -> Dict[str, dict]:
+    """Score every set through every engine: ``{'<length>/<set>': report}``."""
+    golden = json.loads(golden_path.read_text()) if golden_path.exists() else None
+    node = use_node and shutil.which('node') is not None
+    report = {}
+    for length in lengths:
+        engines = python_engines(length)
+        for name, (guesses, targets) in word_sets(length, names).items():
+            if answers:
+                targets = targets[:answers]
+            timings, results = {}, {}
+            for engine, fn in engines.items():
+                start = time.perf_counter()
+                results[engine] = fn(guesses, targets)
+                timings[engine] = time.perf_counter() - start
+            if node:
+                results['js'], timings['js'] = run_js(guesses, targets, length)
+            reference = results['score_guess']
+            pairs = len(guesses) * len(targets)
+            entry = {'pairs': pairs, 'engines': {}}
+            for engine, codes in results.items():
+                count, examples = mismatches(reference, codes, guesses, targets)
+                entry['engines'][engine] = {
+                    'seconds': round(timings[engine], 4),
+                    'pairs_per_sec': round(pairs / timings[engine]) if timings[engine] else 0,
+                    'mismatches': count,
+                    'examples': examples,
+                }
+            if length == (golden or {}).get('length'):
+                entry['golden'] = check_golden(golden, name, reference, guesses, targets)
+            report[f'{length}/{name}'] = entry
+    return report
+
+
+def failures(report: Dict[str, dict]) -> List[str]:
+    """Human-readable problems in a :func:`run` report."""
+    out = []
+    for key, entry in report.items():
+        for engine, r in entry['engines'].items():
+            if r['mismatches']:
+                out.append(f"{key}: {engine} differs from score_guess on {r['mismatches']} pairs, "
+                           f"e.g. {r['examples'][0]}")
+        golden = entry.get('golden')
+        if golden and golden['stale']:
+            out.append(f'{key}: {GOLDEN.name} is stale, run --export-golden')
+        if golden and golden['mismatched']:
+            out.append(f"{key}: differs from game.js for answers {', '.join(golden['mismatched'][:EXAMPLES])}")
+    return out
+
+
+def export_golden(path: Path = GOLDEN, names: Sequence[str] = SETS) -> dict:
+    """Score the sets with game.js at five letters and write their per-answer digests to ``path``."""
+    golden = {'source': 'music-wordle/game.js scoreGuess', 'length': GOLDEN_LENGTH, 'sets': {}}
+    for name, (guesses, answers) in word_sets(GOLDEN_LENGTH, names).items():
+        codes, _ = run_js(guesses, answers, GOLDEN_LENGTH)
+        golden['sets'][name] = {
+            'guesses': len(guesses),
+            'guesses_sha256': words_digest(guesses),
+            'columns': column_digests(codes, guesses, answers),
+        }
+    path.write_text(json.dumps(golden, indent=1, sort_keys=True) + '\n')
+    return golden
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python tests/conformance_scoring.py', description=__doc__.splitlines()[0])
+    parser.add_argument('--lengths', type=int, nargs='+', default=[GOLDEN_LENGTH], choices=range(4, 9))
+    parser.add_argument('--sets', nargs='+', choices=SETS, default=list(SETS))
+    parser.add_argument('--answers', type=int, default=0, help='score only the first N answers of each set')
+    parser.add_argument('--no-node', action='store_true', help='skip the live game.js engine')
+    parser.add_argument('--golden', type=Path, default=GOLDEN)
+    parser.add_argument('--export-golden', action='store_true', help='rewrite the golden file from game.js (needs node)')
+    parser.add_argument('--out', type=Path, default=Path('conformance.json'))
+    args = parser.parse_args(argv)
+    if args.export_golden:
+        if shutil.which('node') is None:
+            parser.error('--export-golden needs node')
+        golden = export_golden(args.golden, args.sets)
+        print(f"wrote {args.golden} ({sum(len(s['columns']) for s in golden['sets'].values())} columns)")
+        return 0
+
+    report = run(args.lengths, args.sets, args.answers, not args.no_node, args.golden)
+    for key, entry in report.items():
+        print(f"{key:<16} {entry['pairs']:>10,} pairs")
+        for engine, r in entry['engines'].items():
+            flag = f"  {r['mismatches']} MISMATCHES" if r['mismatches'] else ''
+            print(f"  {engine:<14} {r['pairs_per_sec']:>14,} pairs/s  {r['seconds']:8.3f} s{flag}")
+        golden = entry.get('golden')
+        if golden:
+            print(f"  {'golden':<14} {golden['checked']} answers checked, {len(golden['mismatched'])} differ"
+                  + ('  STALE' if golden['stale'] else ''))
+    problems = failures(report)
+    args.out.write_text(json.dumps({'report': report, 'failures': problems}, indent=2) + '\n')
+    for problem in problems:
+        print(f'FAIL {problem}')
+    print(f'wrote {args.out}')
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""Multi-session load test for the Streamlit app, on the test suite's stub.
+
+Streamlit runs every session's reruns on threads of one server process, so
+this harness does the same: each simulated session gets its own thread and
+its own ``session_state``/``query_params`` (routed per thread), and plays
+whole games. Keystrokes are played as a ``type_letter`` callback plus a
+keyboard-fragment rerun, and submits and uploads as full ``main()``
+reruns. Some sessions upload a dictionary first, either the same file for
+everyone (``--upload shared``, served from the content-hash cache) or a
+different one each (``--upload unique``, a private ``allowed`` list per
+session).
+
+Each step (number of sessions) runs in a fresh process so RSS growth is
+attributable. ``--processes`` spreads a step's sessions over several
+processes, like running several server replicas::
+
+    python tests/loadtest_app.py --sessions 1 4 16 64 --budget-ms 100
+    python tests/loadtest_app.py --sessions 8 32 --upload unique --upload-every 2 --out loadtest.json
+
+Reported per step: rerun latency percentiles per kind, reruns/s, CPU time
+per rerun, RSS growth per session, approximate per-session state size, and
+p50 per app phase from the telemetry spans (board, keyboard, submit, ...).
+The summary names the largest step whose p95 stays within the budget.
+The stub skips Streamlit's own delta serialisation and websocket work, so
+latencies are a lower bound; relative growth with sessions is the signal.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from test_app import _SessionState, load_app_module
+
+KINDS = ('keystroke', 'submit', 'upload', 'new_game')
+
+
+class _PerThread:
+    """Mapping/attribute access forwarded to the calling thread's own object."""
+
+    def __init__(self):
+        object.__setattr__(self, '_local', threading.local())
+
+    def bind(self, target) -> None:
+        self._local.target = target
+
+    def _target(self):
+        return self._local.target
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._target(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self._target(), name)
+
+    def __getitem__(self, key):
+        return self._target()[key]
+
+    def __setitem__(self, key, value):
+        self._target()[key] = value
+
+    def __delitem__(self, key):
+        del self._target()[key]
+
+    def __contains__(self, key):
+        return key in self._target()
+
+    def __iter__(self):
+        return iter(self._target())
+
+    def __len__(self):
+        return len(self._target())
+
+
+class _Upload(io.BytesIO):
+    """Just enough of Streamlit's ``UploadedFile``."""
+
+    def __init__(self, data: bytes, name: str):
+        super().__init__(data)
+        self.name = name
+        self.size = len(data)
+        self.file_id = f'{name}:{hash(data)}'
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as fh:
+            return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        scale = 1 if sys.platform == 'darwin' else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _dictionary_upload(seed: int, words: int) -> bytes:
+    rng = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return '\n'.join(''.join(rng.choices(letters, k=5)) for _ in range(words)).encode()
+
+
+def install_router(app):
+    """Give every thread its own session state, query params and uploader."""
+    st = app.st
+    if isinstance(st.session_state, _PerThread):
+        return st.session_state, st.query_params, st._uploads
+    st._unrouted = (st.session_state, st.query_params, st.file_uploader)
+    state, params, uploads = _PerThread(), _PerThread(), threading.local()
+    st.session_state, st.query_params, st._uploads = state, params, uploads
+    st.file_uploader = lambda *args, **kwargs: getattr(uploads, 'file', None)
+    return state, params, uploads
+
+
+def remove_router(app) -> None:
+    st = app.st
+    if isinstance(st.session_state, _PerThread):
+        st.session_state, st.query_params, st.file_uploader = st._unrouted
+        del st._unrouted, st._uploads
+
+
+def play_session(app, index: int, games: int, upload: Optional[bytes], samples: Dict[str, List[float]],
+                 start_gate: threading.Barrier, keep: list) -> float:
+    """One session: optional upload, then ``games`` games. Returns thread CPU seconds."""
+    st = app.st
+    state, params, uploads = install_router(app)
+    session, query = _SessionState(), {}
+    state.bind(session)
+    params.bind(query)
+    keep.append(session)
+    rng = random.Random(index)
+    answers = list(app._ANSWERS)
+
+    def timed(kind, fn, *args):
+        start = time.perf_counter()
+        fn(*args)
+        samples[kind].append(time.perf_counter() - start)
+
+    start_gate.wait()
+    cpu = time.thread_time()
+    app.main()
+    if upload is not None:
+        uploads.file = _Upload(upload, f'words-{index}.txt')
+        timed('upload', app.main)
+    for game in range(games):
+        if game:
+            def restart():
+                app.new_game()
+                app.main()
+            timed('new_game', restart)
+        while not st.session_state.game.finished:
+            for ch in rng.choice(answers):
+                def keystroke(ch=ch):
+                    app.type_letter(ch)
+                    app.keyboard_panel(False, None)
+                timed('keystroke', keystroke)
+            query['k'] = 'ENTER'
+            timed('submit', app.main)
+    return time.thread_time() - cpu
+
+
+def run_step(sessions: int, games: int, upload_every: int, upload_mode: str, upload_words: int,
+             first_index: int = 0) -> dict:
+    """Run ``sessions`` concurrent sessions in this process (one thread each)."""
+    app = load_app_module()
+    try:
+        return _run_step(app, sessions, games, upload_every, upload_mode, upload_words, first_index)
+    finally:
+        app._telemetry.enabled = False
+        remove_router(app)
+
+
+def _run_step(app, sessions, games, upload_every, upload_mode, upload_words, first_index) -> dict:
+    app._telemetry.enable()
+    app._telemetry.reset()
+    # Process-wide pieces every session shares, loaded before measuring
+    app.shared_dictionary()
+    install_router(app)
+    samples: Dict[str, List[float]] = defaultdict(list)
+    keep: list = []
+    gate = threading.Barrier(sessions)
+    cpu = [0.0] * sessions
+    uploads = {}
+    for i in range(sessions):
+        if upload_every and (first_index + i) % upload_every == 0:
+            seed = 0 if upload_mode == 'shared' else first_index + i
+            uploads[i] = _dictionary_upload(seed, upload_words)
+    rss_before = rss_bytes()
+
+    def worker(i):
+        cpu[i] = play_session(app, first_index + i, games, uploads.get(i), samples, gate, keep)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(sessions)]
+    wall = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - wall
+    rss_after = rss_bytes()
+    sizes = []
+    state, _, _ = install_router(app)
+    for session in keep:
+        state.bind(session)
+        sizes.append(app.session_state_bytes())
+    return {
+        'samples': {k: v for k, v in samples.items()},
+        'cpu_seconds': sum(cpu),
+        'wall_seconds': wall,
+        'rss_growth': rss_after - rss_before,
+        'rss': rss_after,
+        'session_bytes': sizes,
+        'phases': {name: s['p50'] for name, s in app._telemetry.snapshot().items()},
+    }
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    if not values:
+        return {}
+    pick = lambda q: round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 3)  # noqa: E731
+    return {'count': len(values), 'p50_ms': pick(0.5), 'p95_ms': pick(0.95), 'p99_ms': pick(0.99),
+            'max_ms': round(values[-1] * 1000, 3)}
+
+
+def measure(sessions: int, processes: int = 1, games: int = 1, upload_every: int = 0, upload_mode: str = 'shared',
+            upload_words: int = 20_000) -> dict:
+    """One step in fresh worker process(es); returns the aggregated report."""
+    processes = max(1, min(processes, sessions))
+    shares = [sessions // processes + (i < sessions % processes) for i in range(processes)]
+    firsts = [sum(shares[:i]) for i in range(processes)]
+    with ProcessPoolExecutor(processes) as pool:
+        parts = list(pool.map(run_step, shares, [games] * processes, [upload_every] * processes,
+                              [upload_mode] * processes, [upload_words] * processes, firsts))
+    samples = defaultdict(list)
+    for part in parts:
+        for kind, values in part['samples'].items():
+            samples[kind].extend(values)
+    everything = [t for values in samples.values() for t in values]
+    wall = max(p['wall_seconds'] for p in parts)
+    sizes = [b for p in parts for b in p['session_bytes']]
+    phases = defaultdict(list)
+    for part in parts:
+        for name, value in part['phases'].items():
+            phases[name].append(value)
+    return {
+        'sessions': sessions,
+        'processes': processes,
+        'reruns': len(everything),
+        'reruns_per_second': round(len(everything) / wall, 1) if wall else 0.0,
+        'latency': _percentiles(everything),
+        'by_kind': {kind: _percentiles(samples[kind]) for kind in KINDS if samples.get(kind)},
+        'cpu_ms_per_rerun': round(sum(p['cpu_seconds'] for p in parts) * 1000 / max(1, len(everything)), 3),
+        'rss_mb': round(sum(p['rss'] for p in parts) / 2 ** 20, 1),
+        'rss_kb_per_session': round(sum(p['rss_growth'] for p in parts) / 1024 / sessions, 1),
+        'session_state_kb': round(sum(sizes) / len(sizes) / 1024, 1) if sizes else 0.0,
+        'phase_p50_ms': {name: round(max(v) * 1000, 3) for name, v in sorted(phases.items())},
+    }
+
+
+def capacity(steps: List[dict], budget_ms: float) -> Optional[int]:
+    """Largest session count whose overall p95 stays within ``budget_ms``."""
+    ok = [s['sessions'] for s in steps if s['latency'].get('p95_ms', float('inf')) <= budget_ms]
+    return max(ok) if ok else None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python tests/loadtest_app.py', description=__doc__.splitlines()[0])
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--processes', type=int, default=1, help='split each step over this many processes')
+    parser.add_argument('--games', type=int, default=1, help='games per session')
+    parser.add_argument('--upload-every', type=int, default=4, help='every Nth session uploads a dictionary (0: none)')
+    parser.add_argument('--upload', choices=('shared', 'unique'), default='shared')
+    parser.add_argument('--upload-words', type=int, default=20_000)
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='p95 rerun latency budget')
+    parser.add_argument('--out', help='write the report as JSON')
+    args = parser.parse_args(argv)
+
+    steps = []
+    print(f"{'sessions':>8} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'cpu/rerun':>9} "
+          f"{'RSS MB':>7} {'KB/sess':>8} {'state KB':>8}")
+    for n in args.sessions:
+        step = measure(n, args.processes, args.games, args.upload_every, args.upload, args.upload_words)
+        steps.append(step)
+        lat = step['latency']
+        print(f"{n:>8} {step['reruns_per_second']:>9,.0f} {lat['p50_ms']:>8.2f} {lat['p95_ms']:>8.2f} "
+              f"{lat['p99_ms']:>8.2f} {step['cpu_ms_per_rerun']:>9.3f} {step['rss_mb']:>7.1f} "
+              f"{step['rss_kb_per_session']:>8.1f} {step['session_state_kb']:>8.1f}")
+    last = steps[-1]
+    phases = ', '.join(f'{k} {v:.3f}' for k, v in last['phase_p50_ms'].items())
+    print(f"phase p50 ms at {last['sessions']} sessions: {phases}")
+    cap = capacity(steps, args.budget_ms)
+    print(f"within p95 budget of {args.budget_ms:g} ms: {cap if cap is not None else 'none'} sessions")
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump({'budget_ms': args.budget_ms, 'capacity': cap, 'upload': args.upload, 'steps': steps}, fh,
+                      indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
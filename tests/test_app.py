@@ -1,10 +1,28 @@
 import importlib.util
+import os
 import sys
+import tempfile
 import types
 from pathlib import Path
 import unittest
 
 
+class _SessionState(dict):
+    """Dict with attribute access, like ``st.session_state``."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as exc:
+            raise AttributeError(name) from exc
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def __delattr__(self, name):
+        del self[name]
+
+
 class _DummyContext:
     def __enter__(self):
         return None
@@ -13,16 +31,45 @@ class _DummyContext:
         return False
 
 
+class _Container(types.SimpleNamespace):
+    """Sidebar/column stub: widget functions that also work as a ``with`` block."""
+
+    __enter__ = _DummyContext.__enter__
+    __exit__ = _DummyContext.__exit__
+
+
+def _first_option(label, options, *args, **kwargs):
+    return list(options)[kwargs.get('index', 0)]
+
+
 def load_app_module():
     """Import the Streamlit app module with lightweight stubs if needed."""
     module_name = 'music_wordle_streamlit_app'
     if module_name in sys.modules:
         return sys.modules[module_name]
+    # Finished games go to a throwaway statistics database, not ~/.music-wordle
+    os.environ.setdefault('MUSIC_WORDLE_STATS_DB', os.path.join(tempfile.mkdtemp(prefix='mw-stats-'), 'stats.sqlite3'))
+    os.environ.setdefault('MUSIC_WORDLE_CARDS_DIR', tempfile.mkdtemp(prefix='mw-cards-'))
+    # Tests build the shared tables themselves; no warm-up thread racing them
+    os.environ.setdefault('MUSIC_WORDLE_WARMUP', 'off')
 
-    # Provide simple stubs so the module can be imported without Streamlit.
+    install_streamlit_stub()
+    spec = importlib.util.spec_from_file_location(
+        module_name,
+        Path(__file__).resolve().parents[1] / 'music-wordle-streamlit' / 'app.py',
+    )
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    sys.modules[module_name] = module
+    return module
+
+
+def install_streamlit_stub():
+    """Provide simple stubs so the app can be imported without Streamlit."""
     if 'streamlit' not in sys.modules:
         st_stub = types.ModuleType('streamlit')
-        st_stub.session_state = {}
+        st_stub.session_state = _SessionState()
 
         def _noop(*args, **kwargs):
             return None
@@ -37,13 +84,19 @@ def load_app_module():
         st_stub.text_input = lambda *args, **kwargs: ''
         st_stub.toggle = lambda *args, **kwargs: False
         st_stub.button = lambda *args, **kwargs: False
-        st_stub.columns = lambda n, **kwargs: [types.SimpleNamespace(button=lambda *a, **k: False) for _ in range(n)]
+        st_stub.selectbox = _first_option
+        st_stub.columns = lambda n, **kwargs: [_Container(button=lambda *a, **k: False) for _ in range(n)]
         st_stub.file_uploader = lambda *args, **kwargs: None
         st_stub.text_area = _noop
+        st_stub.image = _noop
+        st_stub.download_button = lambda *args, **kwargs: False
+        st_stub.code = _noop
         st_stub.expander = lambda *args, **kwargs: _DummyContext()
-        st_stub.sidebar = types.SimpleNamespace(
+        st_stub.sidebar = _Container(
             header=_noop,
             caption=_noop,
+            markdown=_noop,
+            selectbox=_first_option,
             toggle=lambda *args, **kwargs: False,
             text_input=lambda *args, **kwargs: '',
             button=lambda *args, **kwargs: False,
@@ -62,16 +115,6 @@ def load_app_module():
         sys.modules['streamlit.components'] = components_pkg
         sys.modules['streamlit.components.v1'] = components_v1
 
-    spec = importlib.util.spec_from_file_location(
-        module_name,
-        Path(__file__).resolve().parents[1] / 'music-wordle-streamlit' / 'app.py',
-    )
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)
-    sys.modules[module_name] = module
-    return module
-
 
 class TestScoreGuess(unittest.TestCase):
     @classmethod
@@ -113,5 +156,38 @@ class TestShareSummary(unittest.TestCase):
         self.assertEqual(summary[2], '🟩🟨⬛⬛🟩')
 
 
+class TestKeyboard(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+
+    def test_enter_key_submits_a_full_word(self):
+        st = self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        self.app.main()
+        game = st.session_state.game
+        for ch in 'cello':
+            self.app.type_letter(ch)
+        buttons = {}
+        saved = st.button
+
+        def button(label, key=None, **kwargs):
+            buttons[key or label] = kwargs
+            return False
+
+        st.button = button
+        try:
+            self.app.main()
+        finally:
+            st.button = saved
+        enter = buttons['kb_enter']
+        self.assertFalse(enter['disabled'])
+        self.assertFalse(buttons['Guess']['disabled'])
+        enter['on_click']()
+        self.assertEqual(game.guess_words, ['cello'])
+        self.assertEqual(game.current, '')
+
+
 if __name__ == '__main__':
     unittest.main()
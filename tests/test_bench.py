@@ -0,0 +1,43 @@
+import unittest
+
+import bench_app
+from test_app import load_app_module
+
+
+class TestBenchHarness(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+
+    def test_measure_reports_percentiles_and_memory(self):
+        case = bench_app.Case('alloc', lambda: [0] * 100_000, calls=20, ops=100_000)
+        r = bench_app.measure(case)
+        self.assertEqual(r['calls'], 20)
+        self.assertLessEqual(r['p50_ms'], r['p95_ms'])
+        self.assertLessEqual(r['p95_ms'], r['p99_ms'])
+        self.assertLessEqual(r['p99_ms'], r['max_ms'])
+        self.assertGreater(r['peak_kb'], 700)  # 100k pointers
+        self.assertGreater(r['ops_per_sec'], 0)
+
+    def test_compare_flags_only_real_growth(self):
+        base = {'a': {'p50_ms': 1.0, 'peak_kb': 100.0}, 'b': {'p50_ms': 0.001, 'peak_kb': 1.0}}
+        now = {'a': {'p50_ms': 2.0, 'peak_kb': 110.0},
+               'b': {'p50_ms': 0.01, 'peak_kb': 3.0},  # tiny absolute changes are noise
+               'new': {'p50_ms': 9.0, 'peak_kb': 9.0}}
+        regressions = bench_app.compare(now, base, tolerance=0.5)
+        self.assertEqual([(r['case'], r['metric']) for r in regressions], [('a', 'p50_ms')])
+
+    def test_stub_runs_a_full_submit_rerun(self):
+        st = self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        self.app.main()
+        st.session_state.game.current = 'cello'
+        st.query_params['k'] = 'ENTER'
+        self.app.main()
+        self.assertEqual(st.session_state.game.guess_words, ['cello'])
+        self.assertNotIn('k', st.query_params)
+
+
+if __name__ == '__main__':
+    unittest.main()
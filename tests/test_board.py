@@ -0,0 +1,36 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestBoardRendering(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+
+    def test_rows_are_single_line_and_cached(self):
+        code = self.app.GameEngine().play('piano', ['cello']).codes[0]
+        html = self.app.row_html('cello', code)
+        self.assertNotIn('\n', html)
+        self.assertEqual(html.count('mw-tile'), self.app.COLS)
+        self.assertIn('mw-tile absent', html)
+        self.assertIs(self.app.row_html('cello', code), html)
+
+    def test_board_rows_pad_with_blank_rows(self):
+        game = self.app.GameEngine().play('piano', ['cello', 'pinto'])
+        rows = self.app.board_rows(game)
+        self.assertEqual(len(rows), self.app.ROWS)
+        self.assertEqual(rows[2:], [self.app.row_html()] * (self.app.ROWS - 2))
+        self.assertIn('>C</div>', rows[0])
+
+    def test_key_status_cache_tracks_the_game(self):
+        st = self.app.st
+        st.session_state.clear()
+        first = self.app.GameEngine().play('piano', ['cello'])
+        second = self.app.GameEngine().play('cello', ['cello'])
+        self.assertEqual(self.app._key_status(first)['C'], 'absent')
+        self.assertEqual(self.app._key_status(second)['C'], 'correct')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import json
+import re
+import shutil
+import subprocess
+import unittest
+
+from test_app import load_app_module
+
+
+class TestDictionaryBuild(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import build
+        cls.build = build
+
+    def test_prefix_encoding_round_trips(self):
+        words = ['piano', 'pianp', 'pitch', 'aahed', 'aalii', 'piano', 'zonal']
+        payload = self.build.prefix_encode(words)
+        self.assertTrue(payload.startswith('0aahed2lii0piano4p2tch'))
+        self.assertEqual(self.build.prefix_decode(payload), sorted(set(words)))
+        six = self.build.prefix_encode(['sonata', 'sonnet', 'chorus'], length=6)
+        self.assertEqual(self.build.prefix_decode(six, length=6), ['chorus', 'sonata', 'sonnet'])
+
+    def test_committed_artifacts_are_up_to_date(self):
+        built = self.build.outputs()
+        self.assertEqual(self.build.stale(built), [], 'run: python -m musicwordle.build')
+        manifest = json.loads(built[self.build.MANIFEST])
+        sizes = manifest['outputs']['music-wordle/words.js']
+        self.assertLess(sizes['bytes'], manifest['before']['allowed-guesses.js']['bytes'] // 2)
+        self.assertIn(f'words.js?v={sizes["sha256"]}', built[self.build.INDEX_HTML].decode())
+
+    def test_hash_follows_content(self):
+        words = self.app.load_bundled_dictionary()
+        js = self.build.render_js(words, self.app.ANSWERS)
+        self.assertEqual(js, self.build.render_js(words, self.app.ANSWERS))
+        self.assertNotEqual(js, self.build.render_js(words, self.app.ANSWERS[:-1]))
+        changed = self.build.render_js(words[:-1], self.app.ANSWERS)
+        self.assertNotEqual(self.build.content_hash(js.encode()), self.build.content_hash(changed.encode()))
+
+    @unittest.skipUnless(shutil.which('node'), 'node not installed')
+    def test_js_decoder_matches_python(self):
+        words = self.app.load_bundled_dictionary()
+        script = ('global.window = {}; eval(require("fs").readFileSync(0, "utf8"));'
+                  'console.log(JSON.stringify([window.ALLOWED_GUESSES, window.MUSIC_WORDLE_ANSWERS]))')
+        out = subprocess.run(['node', '-e', script], input=self.build.render_js(words, self.app.ANSWERS),
+                             capture_output=True, text=True, check=True).stdout
+        guesses, answers = json.loads(out)
+        self.assertEqual(guesses, sorted(set(words)))
+        self.assertEqual(answers, list(self.app.ANSWERS))
+
+
+    def test_game_js_fallback_answers_are_answers(self):
+        game_js = (self.build.SITE / 'game.js').read_text(encoding='utf-8')
+        fallback = re.search(r"FALLBACK_ANSWERS = \[([^\]]*)\]", game_js).group(1)
+        words = re.findall(r"'([a-z]+)'", fallback)
+        self.assertTrue(words)
+        self.assertLessEqual(set(words), set(self.app.ANSWERS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import conformance_scoring as cs
+from test_app import load_app_module
+
+
+class TestScoringConformance(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import scoring
+        cls.scoring = scoring
+        cls.golden = json.loads(cs.GOLDEN.read_text())
+
+    def test_engines_agree_with_each_other_and_game_js(self):
+        report = cs.run(names=('adversarial', 'duplicates'), answers=40, use_node=False)
+        self.assertEqual(cs.failures(report), [])
+        entry = report['5/adversarial']
+        self.assertEqual(entry['pairs'], 243 * 40)
+        self.assertLessEqual({'score_guess', 'score_code', 'matrix_python', 'matrix_codes'}, set(entry['engines']))
+        self.assertTrue(all(r['pairs_per_sec'] > 0 for r in entry['engines'].values()))
+        self.assertEqual(entry['golden'], {'stale': False, 'checked': 40, 'mismatched': []})
+
+    def test_golden_covers_every_answer_and_allowed_guess(self):
+        report = cs.run(names=('dictionary',), answers=3, use_node=False)
+        self.assertEqual(cs.failures(report), [])
+        entry = self.golden['sets']['dictionary']
+        guesses, answers = cs.word_sets(5, ('dictionary',))['dictionary']
+        self.assertEqual(entry['guesses'], len(guesses))
+        self.assertEqual(set(entry['columns']), set(answers), 'run: python tests/conformance_scoring.py --export-golden')
+
+    def test_other_lengths_agree(self):
+        report = cs.run(lengths=(4, 6, 7, 8), answers=4, use_node=False)
+        self.assertEqual(cs.failures(report), [])
+        self.assertNotIn('golden', report['6/dictionary'])
+
+    def test_differences_are_reported(self):
+        scoring = self.scoring
+        guesses, answers = ['allee', 'eerie'], ['eerie', 'geese']
+        expected = scoring.code_array(5, bytes(scoring.score_code(g, a) for g in guesses for a in answers))
+        wrong = scoring.code_array(5, expected)
+        wrong[3] = 0
+        count, examples = cs.mismatches(expected, wrong, guesses, answers)
+        self.assertEqual((count, examples[0]['guess'], examples[0]['answer']), (1, 'eerie', 'geese'))
+        golden = {'sets': {'x': {'guesses_sha256': cs.words_digest(guesses),
+                                 'columns': cs.column_digests(expected, guesses, answers)}}}
+        self.assertEqual(cs.check_golden(golden, 'x', wrong, guesses, answers)['mismatched'], ['geese'])
+        self.assertTrue(cs.check_golden(golden, 'x', expected, guesses[:1], answers)['stale'])
+        self.assertIsNone(cs.check_golden(golden, 'y', expected, guesses, answers))
+
+    @unittest.skipUnless(shutil.which('node'), 'node not installed')
+    def test_golden_file_matches_game_js(self):
+        path = Path(tempfile.mkdtemp(prefix='mw-golden-')) / 'golden.json'
+        exported = cs.export_golden(path, ('adversarial',))
+        self.assertEqual(exported['sets']['adversarial'], self.golden['sets']['adversarial'])
+        report = cs.run(lengths=(7,), names=('adversarial',), answers=16, golden_path=path)
+        self.assertEqual(cs.failures(report), [])
+        self.assertIn('js', report['7/adversarial']['engines'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestSharedDictionary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import dictionary
+        cls.dictionary = dictionary
+
+    def test_shared_dictionary_is_built_once(self):
+        first = self.dictionary.shared_dictionary()
+        second = self.dictionary.shared_dictionary()
+        self.assertIs(first, second)
+        self.assertGreater(len(first), 10000)
+
+    def test_every_answer_is_guessable(self):
+        words = self.dictionary.shared_dictionary()
+        for answer in self.app.ANSWERS:
+            self.assertIn(answer, words)
+        self.assertNotIn('zzzzz', words)
+
+    def test_ordered_view_is_sorted(self):
+        words = self.dictionary.build_word_list(['zebra', 'apple'], answers=['piano'])
+        self.assertEqual(words.ordered, ('apple', 'piano', 'zebra'))
+        self.assertEqual(list(words), ['apple', 'piano', 'zebra'])
+
+    def test_sessions_share_the_same_object(self):
+        st = self.app.st
+        sessions = []
+        for _ in range(2):
+            st.session_state.clear()
+            self.app.ensure_state()
+            sessions.append(st.session_state.allowed)
+        self.assertIs(sessions[0], sessions[1])
+        self.assertLess(self.app.session_state_bytes(), sessions[0].nbytes)
+
+
+    def test_hint_candidates_are_not_charged_the_shared_matrix(self):
+        st = self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        self.app.main()
+        base = self.app.session_state_bytes()
+        st.session_state.candidates = self.app.current_candidates()  # every answer: the shared set
+        self.assertLess(self.app.session_state_bytes() - base, 1024)
+        st.session_state.candidates = self.app.current_candidates().narrow('arose', 0)
+        self.assertLess(self.app.session_state_bytes() - base, 8 * 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
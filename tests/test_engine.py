@@ -0,0 +1,70 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestGameEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import engine
+        cls.engine = engine
+
+    def setUp(self):
+        self.eng = self.engine.GameEngine({'piano', 'cello', 'arose', 'allee'}, answers=['piano', 'cello'])
+
+    def test_typing_and_submit(self):
+        state = self.engine.GameState('piano')
+        for ch in 'arosex':
+            self.eng.type_letter(state, ch)
+        self.assertEqual(state.current, 'arose')
+        self.assertEqual(self.eng.submit(state), self.engine.CONTINUE)
+        self.assertEqual(state.guess_words, ['arose'])
+        self.assertEqual(state.status_rows, [self.app.score_guess('arose', 'piano')])
+        self.assertEqual(state.current, '')
+
+    def test_rejections_do_not_use_a_row(self):
+        state = self.engine.GameState('piano')
+        self.assertEqual(self.eng.submit(state, 'pia'), self.engine.SHORT)
+        self.assertEqual(self.eng.submit(state, 'zzzzz'), self.engine.UNKNOWN)
+        self.assertEqual(state.tries, 0)
+        self.assertEqual(self.engine.describe(self.engine.UNKNOWN, state), 'Not in dictionary')
+
+    def test_win_and_loss(self):
+        won = self.eng.play('piano', ['cello', 'piano', 'arose'])
+        self.assertTrue(won.finished and won.won)
+        self.assertEqual(won.tries, 2)
+        lost = self.eng.play('piano', ['cello'] * 8)
+        self.assertTrue(lost.finished)
+        self.assertFalse(lost.won)
+        self.assertEqual(lost.tries, self.app.ROWS)
+        self.assertIn('PIANO', self.engine.describe(self.engine.LOST, lost))
+
+    def test_key_status_prefers_best_result(self):
+        state = self.eng.play('apple', ['allee', 'piano'])
+        ks = self.engine.compute_key_status(state)
+        self.assertEqual(ks['A'], 'correct')
+        self.assertEqual(ks['L'], 'present')
+        self.assertEqual(ks['P'], 'present')
+        self.assertEqual(ks['O'], 'absent')
+        self.assertEqual(ks['Z'], '')
+
+    def test_share_summary_accepts_codes(self):
+        state = self.eng.play('apple', ['allee'])
+        summary = self.engine.build_share_summary(list(state.codes), daily=False, seed_str='x')
+        self.assertEqual(summary[2], '🟩🟨⬛⬛🟩')
+
+    def test_submit_from_session_state(self):
+        st = self.app.st
+        st.session_state.clear()
+        self.app.ensure_state()
+        st.session_state.game = self.engine.GameState('piano')
+        for ch in 'piano':
+            self.app.type_letter(ch)
+        self.app.submit_guess_from_state()
+        self.assertTrue(st.session_state.game.won)
+        self.assertTrue(st.session_state.message.startswith('Bravo!'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import time
+import unittest
+from collections import Counter
+
+from test_app import load_app_module
+
+
+class TestEventLog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import events
+        cls.events = events
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def test_records_are_buffered_and_rotate(self):
+        ev = self.events
+        log = ev.EventLog(self.dir, max_bytes=len(ev.HEADER) + 10 * ev.RECORD.size, buffer_records=4,
+                          flush_interval=3600, clock=lambda: 1_750_000_000.0)
+        for i in range(3):
+            log.log(7, ev.KEY, 'pia'[:i + 1])
+        self.assertIsNone(log.path)  # still in the buffer
+        for i in range(22):
+            log.log(7, ev.GUESS, 'piano', 242, row=i % 6)
+        log.close()
+        files = ev.log_files([self.dir])
+        self.assertEqual([f.name for f in files], ['events-000001.mwe', 'events-000002.mwe', 'events-000003.mwe'])
+        records = [r for f in files for r in ev.read_records(f)]
+        self.assertEqual(len(records), 25)
+        self.assertEqual(records[0], (1_750_000_000.0, 7, ev.KEY, 0, 'p', ev.NO_STATUS))
+        self.assertEqual(records[-1][2:], (ev.GUESS, 3, 'piano', 242))
+        # A restarted writer starts a new file instead of appending to an old one
+        again = ev.EventLog(self.dir)
+        again.log(8, ev.NEW)
+        again.close()
+        self.assertEqual(again.path, None)
+        self.assertEqual(len(ev.log_files([self.dir])), 4)
+
+    def test_writers_sharing_a_directory_never_truncate_each_other(self):
+        ev = self.events
+        first, second = ev.EventLog(self.dir, flush_interval=3600), ev.EventLog(self.dir, flush_interval=3600)
+        first.log(1, ev.NEW)
+        first.flush()
+        second.log(2, ev.NEW)
+        second.close()
+        first.close()
+        files = ev.log_files([self.dir])
+        self.assertEqual([f.name for f in files], ['events-000001.mwe', 'events-000002.mwe'])
+        self.assertEqual([[r[1] for r in ev.read_records(f)] for f in files], [[1], [2]])
+
+    def test_idle_buffer_is_flushed_in_the_background(self):
+        ev = self.events
+        log = ev.EventLog(self.dir, flush_interval=0.05)
+        self.addCleanup(log.close)
+        log.log(3, ev.KEY, 'p')
+        self.assertEqual(log.written, 0)
+        deadline = time.monotonic() + 5
+        while log.written == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(log.written, 1)
+        self.assertEqual(len(list(ev.read_records(log.path))), 1)
+
+    def test_aggregate_matches_a_plain_scan(self):
+        ev = self.events
+        written = ev.generate(self.dir, 400, seed=2, max_bytes=2 ** 16)
+        files = ev.log_files([self.dir])
+        self.assertGreater(len(files), 1)
+        records = [r for f in files for r in ev.read_records(f)]
+        self.assertEqual(len(records), written)
+        openers = Counter(r[4] for r in records if r[2] in (ev.GUESS, ev.WON, ev.LOST) and r[3] == 0)
+        started = sum(r[2] == ev.NEW for r in records)
+        for use_numpy in (False, True):
+            report = ev.aggregate([self.dir], top=3, use_numpy=use_numpy)
+            self.assertEqual(report['records'], written)
+            days = report['days'].values()
+            self.assertEqual(sum(d['started'] for d in days), started)
+            self.assertEqual(sum(d['first_guess'] for d in days), 400)
+            self.assertEqual(sum(d['finished'] for d in days), 400)
+            self.assertEqual([n for _, n in report['openers']], [n for _, n in openers.most_common(3)])
+            self.assertTrue(all(0 < d['invalid_rate'] < 0.3 for d in days))
+
+    def test_topk_is_bounded_and_exact_for_heavy_hitters(self):
+        top = self.events.TopK(capacity=8)
+        stream = [b'piano'] * 500 + [b'flute'] * 300 + [bytes([97 + i % 26, 98, 99, 100, 101 + i // 26 % 20])
+                                                        for i in range(2000)]
+        for key in stream:
+            top.add(key)
+        self.assertLessEqual(len(top.counts), 16)
+        (first, n1), (second, n2) = top.top(2)
+        self.assertEqual((first, second), (b'piano', b'flute'))
+        self.assertGreaterEqual(n1, 500 - top.error)
+        self.assertLessEqual(top.error, len(stream) // 9)
+
+    def test_bad_files_are_skipped_and_partial_records_ignored(self):
+        ev = self.events
+        log = ev.EventLog(self.dir)
+        log.log(1, ev.NEW)
+        log.log(1, ev.WON, 'piano', 242)
+        log.close()
+        log_path = ev.log_files([self.dir])[0]
+        with open(log_path, 'ab') as fh:
+            fh.write(b'\x01\x02\x03')  # torn write
+        with open(os.path.join(self.dir, 'junk.mwe'), 'wb') as fh:
+            fh.write(b'not an event log at all')
+        report = ev.aggregate([self.dir])
+        self.assertEqual((report['files'], report['skipped_files'], report['records']), (1, 1, 2))
+        self.assertEqual(len(list(ev.read_records(log_path))), 2)
+
+    def test_app_logs_keystrokes_guesses_and_results(self):
+        ev, app, st = self.events, self.app, self.app.st
+        log = ev.EventLog(self.dir, flush_interval=3600)
+        saved, app._events = app._events, log
+        try:
+            st.session_state.clear()
+            st.query_params.clear()
+            app.main()
+            for ch in 'pianp':
+                app.type_letter(ch)
+            app.submit_guess_from_state()
+            app.backspace()
+            app.type_letter('o')
+            app.submit_guess_from_state()
+        finally:
+            app._events = saved
+            log.close()
+        kinds = [r[2] for r in ev.read_records(ev.log_files([self.dir])[0])]
+        secret_is_piano = st.session_state.game.secret == 'piano'
+        self.assertEqual(kinds, [ev.NEW] + [ev.KEY] * 5 + [ev.INVALID, ev.BACK, ev.KEY]
+                         + [ev.WON if secret_is_piano else ev.GUESS])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import random
+import re
+import unittest
+
+from test_app import load_app_module
+
+
+class TestWordFinder(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import finder
+        cls.finder = finder
+        cls.index = finder.shared_index()
+
+    def brute(self, pattern, include='', exclude='', not_at=()):
+        rx = re.compile(pattern.replace('?', '.'))
+        return [w for w in self.index.words
+                if rx.fullmatch(w) and all(w.count(c) >= include.count(c) for c in include)
+                and not any(c in w for c in exclude) and all(w[i] != c for i, c in not_at)]
+
+    def test_queries_match_a_scan(self):
+        hits = self.index.search('p?a??', include='n', exclude='e', not_at='r2')
+        self.assertEqual(list(hits), self.brute('p?a??', 'n', 'e', [(1, 'r')]))
+        self.assertIn('piano', hits.page(0, 50))
+        self.assertEqual(list(self.index.search('', include='ee', exclude='s')),
+                         self.brute('?????', 'ee', 's'))
+        rng = random.Random(3)
+        for _ in range(20):
+            word = rng.choice(self.index.words)
+            pattern = ''.join(c if rng.random() < 0.3 else '?' for c in word)
+            self.assertEqual(list(self.index.search(pattern, exclude='q')), self.brute(pattern, exclude='q'))
+
+    def test_pages_stream_in_order(self):
+        hits = self.index.search('????s')
+        everything = list(hits)
+        self.assertEqual(len(everything), hits.count)
+        paged = [w for n in range(0, hits.count // 37 + 1) for w in hits.page(n, 37)]
+        self.assertEqual(paged, everything)
+        self.assertEqual(hits.page(10_000), [])
+
+    def test_answers_only_and_errors(self):
+        hits = self.index.search('?i???', answers_only=True)
+        self.assertTrue(set(hits) <= set(self.app._ANSWERS))
+        self.assertIn('piano', hits)
+        for bad in ({'pattern': 'toolong'}, {'pattern': 'p1'}, {'include': '3'}, {'not_at': 'r9'}):
+            with self.assertRaises(self.finder.QueryError):
+                self.index.search(**bad)
+
+    def test_practice_mode_panel_pages(self):
+        st = self.app.st
+        st.session_state.clear()
+        self.app.main()  # stub toggles are off, so this is practice mode
+        self.assertEqual(st.session_state.finder_page, 0)
+        count, page, pages, text = self.app.finder_page(('p?a??', '', '', '', True), 0)
+        self.assertIn('**piano**', text)
+        self.assertEqual((page, pages), (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import io
+import unittest
+
+from test_app import load_app_module
+
+
+class Unseekable(io.BytesIO):
+    """A pipe-like upload: read once, no seeking back."""
+
+    def seekable(self):
+        return False
+
+
+class TestIngest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import ingest
+        cls.ingest = ingest
+
+    def test_json_and_text_uploads(self):
+        parse = self.ingest.parse_upload
+        self.assertEqual(parse(io.BytesIO(b'["Piano", " cello ", "ab cd", 12, ["viola"]]')), {'piano', 'cello'})
+        self.assertEqual(parse(io.BytesIO(b'piano,cello\nHARPS;toolong ab')), {'piano', 'cello', 'harps'})
+        # Not a complete JSON array: fall back to splitting on non-letters
+        self.assertEqual(parse(io.BytesIO(b'["piano", "oboes"')), {'piano', 'oboes'})
+
+    def test_tokens_span_chunk_boundaries(self):
+        original = self.ingest.CHUNK_SIZE
+        try:
+            for size in (1, 2, 3, 7):
+                self.ingest.CHUNK_SIZE = size
+                self.assertEqual(self.ingest.parse_upload(io.BytesIO(b'piano cello toolong harps')),
+                                 {'piano', 'cello', 'harps'})
+                self.assertEqual(self.ingest.parse_upload(io.BytesIO(b'["piano","ce\\"llo", "harps"]')),
+                                 {'piano', 'harps'})
+        finally:
+            self.ingest.CHUNK_SIZE = original
+
+    def test_unseekable_uploads_parse_like_seekable_ones(self):
+        original = self.ingest.CHUNK_SIZE
+        cases = [b'piano,cello\nHARPS;toolong ab', b'["piano", "oboes"', b'  [piano cello]', b'["Piano", " cello "]']
+        try:
+            for size in (3, original):
+                self.ingest.CHUNK_SIZE = size
+                for data in cases:
+                    self.assertEqual(self.ingest.parse_upload(Unseekable(data)),
+                                     self.ingest.parse_upload(io.BytesIO(data)), (size, data))
+        finally:
+            self.ingest.CHUNK_SIZE = original
+        self.assertEqual(self.ingest.parse_upload(Unseekable(b'piano\ncello')), {'piano', 'cello'})
+
+    def test_size_cap(self):
+        with self.assertRaises(self.ingest.DictionaryTooLarge):
+            self.ingest.parse_upload(io.BytesIO(b'piano ' * 100), limit=64)
+
+    def test_cache_by_content_hash(self):
+        cache = self.ingest.IngestCache()
+        data = ' '.join(f"{a}{b}{c}zz" for a in 'abc' for b in 'def' for c in 'ghijkl').encode()
+        first = self.ingest.ingest_bytes(data, cache=cache)
+        second = self.ingest.ingest_bytes(bytes(data), cache=cache)
+        self.assertIs(first.words, second.words)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertFalse(first.kept_bundled)
+        self.assertIn('piano', first.words)  # answers are always guessable
+
+    def test_cache_respects_memory_budget(self):
+        cache = self.ingest.IngestCache(budget=1)
+        self.ingest.ingest_bytes(b'piano cello', cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_small_upload_keeps_bundled_words(self):
+        st = self.app.st
+        st.session_state.clear()
+        self.app.ensure_state()
+        self.app.load_custom_dictionary(b'["piano"]')
+        self.assertIn('about', st.session_state.allowed)
+        self.assertEqual(st.session_state.message, 'Loaded dictionary seems small; keeping bundled too.')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from test_app import load_app_module
+
+
+class TestKnowledge(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import engine, knowledge, scoring
+        cls.engine = engine
+        cls.Knowledge = knowledge.Knowledge
+        cls.score_code = staticmethod(scoring.score_code)
+
+    def test_duplicate_letters(self):
+        k = self.Knowledge(5)
+        k.absorb('allee', self.score_code('allee', 'apple'))
+        l, e = ord('l') - 97, ord('e') - 97
+        self.assertEqual((k.min_counts[l], k.max_counts[l]), (1, 1))
+        self.assertEqual((k.min_counts[e], k.max_counts[e]), (1, 1))
+        self.assertEqual(k.allowed[0], 1 << 0)
+        self.assertFalse(k.allowed[1] >> l & 1)
+        self.assertTrue(k.allowed[3] >> l & 1)
+        self.assertTrue(k.consistent('apple'))
+        self.assertFalse(k.consistent('alley'))
+
+    def test_strict_matches_rescoring_every_row(self):
+        rng = random.Random(7)
+        answers = list(self.app._ANSWERS)
+        for _ in range(40):
+            secret = rng.choice(answers)
+            k = self.Knowledge(5)
+            rows = []
+            for guess in rng.sample(answers, 3):
+                code = self.score_code(guess, secret)
+                k.absorb(guess, code)
+                rows.append((guess, code))
+            for word in answers:
+                expected = all(self.score_code(g, word) == c for g, c in rows)
+                self.assertEqual(k.consistent(word), expected, (rows, word))
+
+    def test_hard_mode_rules_and_messages(self):
+        eng = self.engine.GameEngine(hard=self.engine.HARD_MODE)
+        state = self.engine.GameState('cello')
+        self.assertEqual(eng.submit(state, 'hello'), self.engine.CONTINUE)
+        self.assertEqual(eng.submit(state, 'piano'), self.engine.HARD)
+        self.assertEqual(self.engine.describe(self.engine.HARD, state), 'Hard mode: 2nd letter must be E')
+        self.assertEqual(state.tries, 1)
+        # Grey letters may be reused in hard mode, but not in strict mode
+        self.assertIsNone(state.knowledge.violation('hello'))
+        self.assertEqual(state.knowledge.violation('hello', strict=True), 'H is not in the word')
+        k = self.Knowledge(5)
+        k.absorb('arose', self.score_code('arose', 'cello'))
+        self.assertEqual(k.violation('unity'), 'Guess must contain E')
+
+    def test_key_status_is_incremental_and_unchanged(self):
+        state = self.engine.GameEngine().play('piano', ['cello', 'pinto'])
+        ks = self.engine.compute_key_status(state)
+        self.assertEqual((ks['P'], ks['O'], ks['C'], ks['Z']), ('correct', 'correct', 'absent', ''))
+        self.engine.GameEngine().submit(state, 'piano')
+        self.assertEqual(state.knowledge.rows, 3)
+        self.assertEqual(self.engine.compute_key_status(state)['A'], 'correct')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestWordLengths(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import config, dictionary, scoring
+        cls.config, cls.dictionary, cls.scoring = config, dictionary, scoring
+
+    def test_dictionaries_load_lazily_per_length(self):
+        app, st, shared = self.app, self.app.st, self.dictionary._shared
+        shared.pop(6, None)
+        st.session_state.clear()
+        st.query_params.clear()
+        app.main()
+        self.assertNotIn(6, shared)
+        six = self.dictionary.shared_dictionary(6)
+        self.assertIs(self.dictionary.shared_dictionary(6), six)
+        self.assertTrue(all(len(w) == 6 for w in six))
+        self.assertTrue(set(self.config.answers_for(6)) <= six.members)
+        self.assertIn('violin', six)
+        self.assertNotIn('piano', six)
+
+    def test_matrices_match_reference_at_every_length(self):
+        sc = self.scoring
+        for length in self.config.LENGTHS:
+            answers = self.config.answers_for(length)
+            guesses = self.dictionary.shared_dictionary(length).ordered[::37]
+            for use_numpy in (False, True):
+                m = sc.PatternMatrix(guesses, answers, use_numpy=use_numpy)
+                if m.table is not None:
+                    self.assertEqual(m.table.itemsize, sc.pattern_width(length))
+                for g in guesses[:20]:
+                    row = m.row(g)
+                    self.assertEqual([int(c) for c in row], [sc.score_code(g, a) for a in answers])
+                    self.assertEqual(sc.decode_pattern(row[0], length), sc.score_guess(g, answers[0]))
+        self.assertEqual(sc.score_code('clarinet', 'clarinet'), 3 ** 8 - 1)
+
+    def test_long_games_get_more_rows_and_wide_codes(self):
+        state = self.app.GameEngine().play('clarinet', ['trombone'] * 12)
+        self.assertEqual((state.tries, state.finished, state.won), (9, True, False))
+        self.assertEqual(state.codes.itemsize, 2)
+        self.assertEqual(len(self.app.board_rows(state)), 9)
+        from musicwordle.stats import GameRecord
+        record = GameRecord.from_state('amy', state, False, 'x')
+        self.assertEqual(record.tries, 9)
+        self.assertEqual(list(record.to_state().codes), list(state.codes))
+        summary = self.app.build_share_summary(list(state.codes), False, 'x', 9, 8)
+        self.assertEqual(summary[1], 'Guesses: 9/9')
+        self.assertEqual(len(summary[2]), 8)
+
+    def test_app_plays_the_selected_length(self):
+        app, st = self.app, self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        select = st.sidebar.selectbox
+        st.sidebar.selectbox = lambda label, options, *a, **k: 7 if label == 'Word length' else select(
+            label, options, *a, **k)
+        try:
+            app.main()
+            game = st.session_state.game
+            self.assertEqual(game.cols, 7)
+            self.assertIn(game.secret, self.config.answers_for(7))
+            game.current = 'trumpey'
+            app.submit_guess_from_state()
+            self.assertTrue(st.session_state.message.startswith('Not in dictionary'))
+            game.current = 'trumpet'
+            app.submit_guess_from_state()
+            self.assertEqual(game.tries, 1)
+            self.assertEqual(len(app.current_candidates().matrix.answers), len(self.config.answers_for(7)))
+            app.main()
+            self.assertIs(st.session_state.game, game)
+        finally:
+            st.sidebar.selectbox = select
+        app.main()
+        self.assertEqual(st.session_state.game.cols, 5)
+
+    def test_uploads_are_parsed_at_the_game_length(self):
+        from musicwordle.ingest import ingest_bytes
+        data = ' '.join(['violin', 'guitar', 'piano', 'cello'] + [f'word{c}{d}' for c in 'ab' for d in 'xyz']).encode()
+        five, six = ingest_bytes(data), ingest_bytes(data, length=6)
+        self.assertIn('piano', five.words)
+        self.assertNotIn('piano', six.words)
+        self.assertIn('guitar', six.words)
+        self.assertIn('wordax', six.words)
+        self.assertIsNot(five, six)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import threading
+import unittest
+
+import loadtest_app
+from test_app import load_app_module
+
+
+class TestLoadHarness(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+
+    def test_router_gives_each_thread_its_own_state(self):
+        router = loadtest_app._PerThread()
+        seen = {}
+
+        def worker(name):
+            router.bind({})
+            router['who'] = name
+            seen[name] = router['who']
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in 'ab']
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(seen, {'a': 'a', 'b': 'b'})
+
+    def test_step_plays_concurrent_sessions_and_restores_stub(self):
+        st = self.app.st
+        original = st.session_state
+        report = loadtest_app.run_step(3, games=1, upload_every=2, upload_mode='unique', upload_words=500)
+        self.assertIs(st.session_state, original)
+        self.assertIsNone(st.file_uploader())
+        self.assertEqual(len(report['session_bytes']), 3)
+        self.assertEqual(len(report['samples']['upload']), 2)
+        self.assertGreaterEqual(len(report['samples']['submit']), 3)
+        self.assertGreaterEqual(len(report['samples']['keystroke']), 15)
+        self.assertIn('board', report['phases'])
+
+    def test_capacity_uses_p95_budget(self):
+        steps = [{'sessions': 1, 'latency': {'p95_ms': 5}}, {'sessions': 8, 'latency': {'p95_ms': 40}},
+                 {'sessions': 32, 'latency': {'p95_ms': 150}}]
+        self.assertEqual(loadtest_app.capacity(steps, 50), 8)
+        self.assertIsNone(loadtest_app.capacity(steps, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestMultiBoard(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import multiboard, scoring
+        cls.mb, cls.scoring = multiboard, scoring
+
+    def engine(self, **kw):
+        return self.mb.MultiEngine(None, self.app.ANSWERS, **kw)
+
+    def test_secrets_are_distinct_and_deterministic(self):
+        for n in self.mb.BOARD_COUNTS:
+            secrets = self.mb.pick_secrets(self.app.ANSWERS, '2025-06-01', n)
+            self.assertEqual(len(set(secrets)), n)
+            self.assertEqual(secrets, self.mb.pick_secrets(self.app.ANSWERS, '2025-06-01', n))
+            self.assertEqual(secrets[0], self.app.seeded_choice(self.app.ANSWERS, '2025-06-01#0'))
+        pick = self.mb.pick_secrets
+        self.assertNotEqual(pick(self.app.ANSWERS, 'a', 4), pick(self.app.ANSWERS, 'b', 4))
+        with self.assertRaises(ValueError):
+            self.mb.pick_secrets(['piano', 'piano', 'cello'], 'x', 4)
+
+    def test_one_batched_scoring_call_per_guess(self):
+        sc = self.scoring
+        for use_numpy in (False, True):
+            matrix = sc.PatternMatrix(self.app.load_bundled_dictionary()[::50] + ['arose'], self.app.ANSWERS,
+                                      use_numpy=use_numpy)
+            calls = []
+            codes = matrix.codes
+            matrix.codes = lambda g, a: calls.append(len(a)) or codes(g, a)
+            engine = self.engine(matrix=matrix)
+            state = engine.new_game('seed', 8)
+            for g in ('arose', 'zzzzz'):
+                self.assertEqual(engine.submit(state, g, validate=False), self.mb.CONTINUE)
+            self.assertEqual(calls, [8, 8])
+            for board in state.boards:
+                self.assertEqual(list(board.codes), [sc.score_code(g, board.secret) for g in ('arose', 'zzzzz')])
+
+    def test_solved_boards_stop_and_game_ends(self):
+        engine = self.engine()
+        secrets = ['piano', 'cello', 'banjo', 'organ']
+        state = engine.play(secrets, ['cello', 'arose', 'piano'])
+        self.assertEqual([b.tries for b in state.boards], [3, 1, 3, 3])
+        self.assertEqual((state.tries, state.solved, state.changed), (3, 2, (0, 2, 3)))
+        self.assertEqual(self.mb.describe_multi(self.mb.CONTINUE, state), '2/4 boards solved.')
+        won = engine.play(secrets, ['cello', 'piano', 'banjo', 'organ'])
+        self.assertTrue(won.finished and won.won)
+        self.assertEqual(self.mb.build_multi_summary(won, True, 'x', 9)[2:], ['2️⃣ 1️⃣', '3️⃣ 4️⃣'])
+        lost = engine.play(secrets, ['piano'] + ['arose'] * 20)
+        self.assertEqual((lost.tries, lost.finished, lost.solved), (9, True, 1))
+        self.assertIn('Missed: CELLO, BANJO, ORGAN', self.mb.describe_multi(self.mb.LOST, lost))
+        self.assertEqual(self.mb.build_multi_summary(lost, False, 'x', 9)[2], '1️⃣ 🟥')
+
+    def test_app_reemits_only_changed_boards(self):
+        app, st = self.app, self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        select = st.sidebar.selectbox
+        st.sidebar.selectbox = lambda label, options, *a, **k: 4 if label == 'Boards' else select(
+            label, options, *a, **k)
+        try:
+            app.main()
+            game = st.session_state.game
+            self.assertEqual(len(game.boards), 4)
+            self.assertIn('boards', st.session_state.message)
+            solved = game.boards[1].secret
+            html = [app.mini_board_html(bytes(b.guesses), tuple(b.codes), 5, 9) for b in game.boards]
+            game.current = solved
+            app.submit_guess_from_state()
+            app.main()
+            self.assertIs(st.session_state.game, game)
+            self.assertEqual(game.solved, 1)
+            game.current = 'zzzzz'
+            app.submit_guess_from_state()
+            self.assertTrue(st.session_state.message.startswith('Not in dictionary'))
+            game.current = 'arose'
+            app.submit_guess_from_state()
+            self.assertEqual(game.changed, (0, 2, 3))
+            after = [app.mini_board_html(bytes(b.guesses), tuple(b.codes), 5, 9) for b in game.boards]
+            self.assertIsNot(after[0], html[0])
+            self.assertIs(after[1], app.mini_board_html(bytes(game.boards[1].guesses), (242,), 5, 9))
+            self.assertIn('solved', after[1])
+            self.assertEqual(app._key_status(game)[solved[0].upper()], 'correct')
+        finally:
+            st.sidebar.selectbox = select
+        app.main()
+        self.assertIsInstance(st.session_state.game, app.GameState)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_app import load_app_module
+
+
+class TestPackedDictionary(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import packed
+        cls.packed = packed
+
+    def test_pack_roundtrip_preserves_order(self):
+        self.assertEqual(self.packed.unpack_word(self.packed.pack_word('piano')), 'piano')
+        self.assertLess(self.packed.pack_word('aaaaz'), self.packed.pack_word('aaaba'))
+
+    def test_lookup_and_answers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'words.mwd'
+            path.write_bytes(self.packed.encode(['zebra', 'apple', 'Bogus', 'toolong'], ['piano', 'cello']))
+            with self.packed.PackedWordList(path) as words:
+                self.assertEqual(words.ordered, ('apple', 'cello', 'piano', 'zebra'))
+                self.assertEqual(words.answers, ['piano', 'cello'])
+                self.assertIn('zebra', words)
+                self.assertNotIn('zebrb', words)
+                self.assertNotIn('ZEBRA', words)
+
+    def test_corrupt_file_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'words.mwd'
+            data = bytearray(self.packed.encode(['zebra', 'apple'], ['piano']))
+            data[-1] ^= 0xFF
+            path.write_bytes(bytes(data))
+            with self.assertRaises(self.packed.PackedFormatError):
+                self.packed.PackedWordList(path)
+            self.assertIsNone(self.packed.open_packed(path))
+
+    def test_committed_artifact_matches_sources(self):
+        words = self.packed.PackedWordList(self.packed.DEFAULT_PATH)
+        expected = set(self.app.load_bundled_dictionary()) | set(self.app.ANSWERS)
+        self.assertEqual(set(words.ordered), expected)
+        self.assertEqual(words.answers, self.app.ANSWERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import datetime
+import json
+import unittest
+from pathlib import Path
+
+from test_app import load_app_module
+
+
+class TestSchedule(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import schedule
+        cls.schedule = schedule
+
+    def test_cycles_do_not_repeat(self):
+        answers = ['piano', 'cello', 'oboes', 'harps', 'flute']
+        days = self.schedule.generate(answers, 23, master_seed='test')
+        for start in range(0, 20, 5):
+            self.assertEqual(sorted(days[start:start + 5]), list(range(5)))
+        self.assertTrue(all(a != b for a, b in zip(days, days[1:])))
+        self.assertEqual(days, self.schedule.generate(answers, 23, master_seed='test'))
+
+    def test_lookups_both_ways(self):
+        answers = ['piano', 'cello', 'oboes']
+        epoch = datetime.date(2024, 1, 1)
+        days = self.schedule.generate(answers, 9)
+        sched = self.schedule.Schedule(self.schedule.encode(answers, days, epoch))
+        for i, idx in enumerate(days):
+            day = epoch + datetime.timedelta(days=i)
+            self.assertEqual(sched.secret_for(day), answers[idx])
+            self.assertIn(day, sched.dates_for(answers[idx]))
+        self.assertEqual(len(sched.dates_for('piano')), 3)
+        self.assertIsNone(sched.secret_for(epoch - datetime.timedelta(days=1)))
+        self.assertEqual(sched.dates_for('zzzzz'), [])
+
+    def test_words_stay_apart_across_cycle_boundaries(self):
+        sched = self.schedule.Schedule.load()
+        answers = sched.answers
+        end = datetime.date(sched.epoch.year + self.schedule.YEARS, sched.epoch.month, sched.epoch.day)
+        self.assertEqual(len(sched), (end - sched.epoch).days)  # the bundled file spans YEARS
+        self.assertEqual(list(sched.days), self.schedule.generate(answers, len(sched)))
+        last, gap = {}, len(sched)
+        for day, word in enumerate(sched.days):
+            if word in last:
+                gap = min(gap, day - last[word])
+            last[word] = day
+        self.assertGreater(gap, len(answers) // 4)
+
+    def test_corrupt_file_is_rejected(self):
+        data = bytearray(self.schedule.encode(['piano', 'cello'], [0, 1, 0]))
+        data[-1] ^= 0xFF
+        with self.assertRaises(self.schedule.ScheduleFormatError):
+            self.schedule.Schedule(bytes(data))
+
+    def test_js_export_matches_bundled_calendar(self):
+        sched = self.schedule.Schedule.load()
+        js = self.schedule.JS_PATH.read_text(encoding='utf-8')
+        self.assertEqual(js, sched.to_js())
+        payload = json.loads(js[js.index('{'):js.rindex('}') + 1])
+        self.assertEqual(payload['epoch'], sched.epoch.isoformat())
+
+    def test_daily_secret_falls_back_outside_calendar(self):
+        far = datetime.date(2100, 1, 1)
+        self.assertEqual(self.schedule.daily_secret(far), self.app.seeded_choice(self.app.ANSWERS, far.isoformat()))
+        sched = self.schedule.shared_schedule()
+        self.assertEqual(self.schedule.daily_secret(sched.epoch), sched.secret_for(sched.epoch))
+
+
+    def test_calendar_from_other_answers_is_ignored(self):
+        sc = self.schedule
+        day = datetime.date(2024, 1, 2)
+        sched = sc.Schedule(sc.encode(['piano', 'cello', 'oboes'], sc.generate(['piano', 'cello', 'oboes'], 9),
+                                      datetime.date(2024, 1, 1)))
+        saved = sc._shared, sc._missing, sc.Schedule.__dict__['load']
+        try:
+            sc._shared, sc._missing = sched, False
+            self.assertEqual(sc.daily_secret(day, ['piano', 'cello', 'oboes']), sched.secret_for(day))
+            answers = ['piano', 'cello', 'harps']  # oboes removed from the answers
+            self.assertEqual(sc.daily_secret(day, answers), self.app.seeded_choice(answers, day.isoformat()))
+            # The bundled calendar is dropped when it no longer matches config.ANSWERS
+            sc._shared, sc._missing = None, False
+            sc.Schedule.load = classmethod(lambda cls, path=None: sched)
+            self.assertIsNone(sc.shared_schedule())
+        finally:
+            sc._shared, sc._missing = saved[0], saved[1]
+            sc.Schedule.load = saved[2]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import itertools
+import unittest
+
+from test_app import load_app_module
+
+
+class TestPatternCodes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import scoring
+        cls.scoring = scoring
+
+    def test_encode_decode_roundtrip(self):
+        statuses = ['correct', 'present', 'absent', 'absent', 'correct']
+        code = self.scoring.encode_pattern(statuses)
+        self.assertEqual(code, 2 * 81 + 1 * 27 + 2)
+        self.assertEqual(self.scoring.decode_pattern(code), statuses)
+        self.assertEqual(self.scoring.encode_pattern(['correct'] * 5), self.scoring.ALL_CORRECT)
+
+    def test_score_code_matches_reference_on_duplicates(self):
+        words = [''.join(p) for p in itertools.product('aab', repeat=5)][:120]
+        for guess in words:
+            for answer in words:
+                expected = self.scoring.encode_pattern(self.app.score_guess(guess, answer))
+                self.assertEqual(self.scoring.score_code(guess, answer), expected, (guess, answer))
+
+
+class TestPatternMatrix(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import scoring
+        cls.scoring = scoring
+        cls.guesses = ['allee', 'apple', 'piano', 'cello', 'oboes', 'eerie']
+        cls.answers = ['apple', 'piano', 'eerie', 'tenor']
+
+    def _check(self, matrix):
+        for g in self.guesses + ['zzzzz']:
+            row = matrix.row(g)
+            for j, a in enumerate(self.answers):
+                expected = self.scoring.score_code(g, a)
+                self.assertEqual(int(row[j]), expected)
+                self.assertEqual(matrix.code(g, a), expected)
+        col = matrix.column('eerie', ['allee', 'eerie'])
+        self.assertEqual([int(c) for c in col], [self.scoring.score_code('allee', 'eerie'), self.scoring.ALL_CORRECT])
+
+    def test_pure_python_fallback(self):
+        self._check(self.scoring.PatternMatrix(self.guesses, self.answers, use_numpy=False))
+
+    def test_numpy_table(self):
+        if self.scoring.np is None:
+            self.skipTest('NumPy not installed')
+        matrix = self.scoring.PatternMatrix(self.guesses, self.answers, use_numpy=True)
+        self.assertEqual(matrix.table.shape, (len(self.guesses), len(self.answers)))
+        self.assertEqual(str(matrix.table.dtype), 'uint8')
+        self._check(matrix)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import datetime
+import io
+import unittest
+
+from test_app import load_app_module
+
+
+class TestGameServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import loadgen, server
+        cls.server = server
+        cls.loadgen = loadgen
+
+    def test_store_expires_idle_games_and_caps_size(self):
+        now = [0.0]
+        store = self.server.GameStore(ttl=10, limit=2, clock=lambda: now[0])
+        a = store.add(self.app.GameState('piano'), 's', False)
+        now[0] = 5
+        b = store.add(self.app.GameState('cello'), 's', False)
+        now[0] = 12
+        self.assertIsNone(store.get(a))
+        self.assertIsNotNone(store.get(b))  # touching b extends its lifetime
+        store.add(self.app.GameState('harps'), 's', False)
+        store.add(self.app.GameState('oboes'), 's', False)
+        self.assertEqual(len(store), 2)
+        self.assertIsNone(store.get(b))
+
+    def test_seeded_game_flow(self):
+        api = self.server.GameAPI()
+        game = api.new_game({'seed': 'melody'})
+        secret = self.app.seeded_choice(list(self.app._ANSWERS), 'melody')
+        self.assertNotIn('answer', game)
+        self.assertEqual(api.guess({'id': game['id'], 'guess': 'zzzzz'})['outcome'], 'unknown')
+        self.assertEqual(api.guess({'id': game['id'], 'guess': 'pianp'})['suggestions'][0], 'piano')
+        result = api.guess({'id': game['id'], 'guess': secret.upper()})
+        self.assertEqual((result['outcome'], result['statuses'], result['answer']), ('won', ['correct'] * 5, secret))
+        status, payload = api.dispatch('POST', '/api/guess', f'{{"id": "{game["id"]}", "guess": "piano"}}'.encode())
+        self.assertEqual(status, 409)
+        share = api.share({'id': [game['id']]})
+        self.assertEqual(share['lines'], self.app.build_share_summary([result['statuses']], False, 'melody'))
+
+    def test_daily_games_follow_calendar_near_today(self):
+        today = datetime.date(2025, 6, 1)
+        api = self.server.GameAPI(today=lambda: today)
+        game = api.new_game({'daily': True, 'date': '2025-06-02'})
+        from musicwordle.schedule import daily_secret
+        secret = daily_secret(datetime.date(2025, 6, 2), api.engine.answers)
+        self.assertEqual(api.guess({'id': game['id'], 'guess': secret})['outcome'], 'won')
+        status, payload = api.dispatch('POST', '/api/new', b'{"daily": true, "date": "2025-07-01"}')
+        self.assertEqual(status, 400)
+        self.assertEqual(api.dispatch('GET', '/api/state?id=nope', b'')[0], 404)
+
+    def test_handler_errors_become_500(self):
+        api = self.server.GameAPI()
+
+        def broken(query):
+            raise RuntimeError('boom')
+
+        api.share = broken
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            status, payload = api.dispatch('GET', '/api/share?id=x', b'')
+        self.assertEqual((status, payload), (500, {'error': 'internal error'}))
+        self.assertIn('RuntimeError: boom', err.getvalue())
+        self.assertTrue(self.server._response(status, payload, False).startswith(b'HTTP/1.1 500 Internal Server Error'))
+
+    def test_http_round_trip_under_load(self):
+        async def scenario():
+            srv = await self.server.start(port=0)
+            host, port = srv.sockets[0].getsockname()[:2]
+            async with srv:
+                return await self.loadgen.run_load(host, port, concurrency=4, duration=0.3)
+
+        report = asyncio.run(scenario())
+        self.assertEqual(report['errors'], 0, report['first_errors'])
+        self.assertGreater(report['requests'], 10)
+        self.assertIn('guess', report['endpoints'])
+
+
+if __name__ == '__main__':
+    unittest.main()
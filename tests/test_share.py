@@ -0,0 +1,116 @@
+import struct
+import tempfile
+import threading
+import unittest
+import zlib
+from pathlib import Path
+
+from test_app import load_app_module
+
+
+def decode_png(data):
+    """(width, height, raw scanlines) after checking the signature and every chunk CRC."""
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    pos, chunks = 8, {}
+    while pos < len(data):
+        n, tag = struct.unpack('>I4s', data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + n]
+        assert struct.unpack('>I', data[pos + 8 + n:pos + 12 + n])[0] == zlib.crc32(tag + body)
+        chunks[tag] = body
+        pos += 12 + n
+    width, height = struct.unpack('>II', chunks[b'IHDR'][:8])
+    return width, height, zlib.decompress(chunks[b'IDAT'])
+
+
+class TestShareCards(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import share
+        cls.share = share
+        cls.game = cls.app.GameEngine().play('piano', ['arose', 'until', 'piano'])
+
+    def test_key_covers_seed_mode_and_grid(self):
+        key = self.share.card_key
+        codes = (tuple(self.game.codes),)
+        self.assertEqual(key('2025-06-01', True, codes), key('2025-06-01', True, [list(self.game.codes)]))
+        variants = {key('2025-06-01', True, codes), key('2025-06-02', True, codes), key('2025-06-01', False, codes),
+                    key('2025-06-01', True, (codes[0][1:],)), key('2025-06-01', True, codes, rows=9, cols=5)}
+        self.assertEqual(len(variants), 5)
+
+    def test_png_and_svg_draw_the_grid(self):
+        sc = self.share
+        card = sc.render_card('k', ['Music Wordle <&> x', 'Guesses: 3/6'], (tuple(self.game.codes),))
+        width, height, raw = decode_png(card.png)
+        margins = 4 * sc.GAP
+        self.assertEqual((width, height), (5 * sc.TILE + 4 * sc.GAP + margins, 3 * sc.TILE + 2 * sc.GAP + margins))
+        self.assertEqual(len(raw), height * (1 + 3 * width))
+        # First pixel of the first and last tile rows: AROSE's A is present, PIANO's P correct
+        line = 1 + 3 * width
+        first, last = 2 * sc.GAP, height - 2 * sc.GAP - 1
+        x = 1 + 3 * 2 * sc.GAP
+        self.assertEqual(tuple(raw[first * line + x:first * line + x + 3]), sc.COLORS['present'])
+        self.assertEqual(tuple(raw[last * line + x:last * line + x + 3]), sc.COLORS['correct'])
+        self.assertIn('Music Wordle &lt;&amp;&gt; x', card.svg)
+        self.assertEqual(card.svg.count('rx="3"'), 15)
+        self.assertEqual(card.text, 'Music Wordle <&> x\nGuesses: 3/6')
+
+    def test_same_result_is_rendered_once_and_spills_to_disk(self):
+        sc = self.share
+        directory = tempfile.mkdtemp(prefix='mw-cards-')
+        cache = sc.CardCache(directory=directory)
+        first = sc.share_card(list(self.game.codes), True, '2025-06-01', cache=cache)
+        again = sc.share_card(list(self.game.codes), True, '2025-06-01', cache=cache)
+        self.assertIs(again, first)
+        self.assertEqual((cache.renders, cache.hits), (1, 1))
+        summary = self.app.build_share_summary(list(self.game.codes), True, '2025-06-01')
+        self.assertEqual(first.text.split('\n'), summary)
+        # A budget of about one card: the next one evicts it to disk
+        small = sc.CardCache(budget=first.nbytes + 10, directory=directory)
+        small.put(first)
+        other = sc.share_card([0, 242], True, '2025-06-01', cache=small)
+        self.assertEqual((len(small), small.spilled), (1, 1))
+        self.assertTrue((Path(directory) / f'{first.key}.card').exists())
+        fresh = sc.CardCache(directory=directory)
+        self.assertEqual(fresh.get(first.key), first)
+        self.assertEqual((fresh.disk_hits, fresh.renders), (1, 0))
+        (Path(directory) / 'bad.card').write_bytes(b'MWC1 not a card')
+        self.assertIsNone(fresh.get('bad'))
+        self.assertIsNone(sc.CardCache().get(other.key))  # memory-only cache
+
+    def test_concurrent_spills_are_all_counted(self):
+        sc = self.share
+        directory = tempfile.mkdtemp(prefix='mw-cards-')
+        cards = [sc.ShareCard(f'k{i:03d}', 'x' * 10, '', b'') for i in range(200)]
+        cache = sc.CardCache(budget=10, directory=directory, disk_limit=10)
+        threads = [threading.Thread(target=lambda part=cards[i::8]: [cache.put(c) for c in part]) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        # Every put but the last evicts one card; pruning ran at each 64th spill
+        self.assertEqual((len(cache), cache.spilled), (1, 199))
+        self.assertLessEqual(len(list(Path(directory).glob('*.card'))), 10 + 199 % 64)
+
+    def test_finished_game_view_serves_the_cached_card(self):
+        app, st = self.app, self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        app.main()
+        game = st.session_state.game
+        game.current = game.secret
+        app.submit_guess_from_state()
+        cache = self.share.shared_card_cache()
+        renders, hits = cache.renders, cache.hits
+        app.main()
+        app.main()
+        # Rendered at most once (another test may have shared this grid first), then served from memory
+        self.assertLessEqual(cache.renders, renders + 1)
+        self.assertGreater(cache.hits, hits)
+        card = app.finished_card(game, False, st.session_state.seed_str)
+        self.assertTrue(card.text.endswith('🟩' * 5))
+        self.assertIs(app.clipboard_html(card.text, 'Copied!'), app.clipboard_html(card.text, 'Copied!'))
+
+
+if __name__ == '__main__':
+    unittest.main()
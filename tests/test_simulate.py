@@ -0,0 +1,46 @@
+import datetime
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_app import load_app_module
+
+
+class TestSimulation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import simulate
+        cls.simulate = simulate
+
+    def test_play_solves_answers(self):
+        for strategy in ('entropy', 'frequency'):
+            game = self.simulate.play('guqin', strategy)
+            self.assertEqual(game['guesses'][-1], 'guqin')
+            self.assertEqual(len(game['codes']), len(game['guesses']))
+
+    def test_difficulty_table_and_reports(self):
+        results = self.simulate.run(['piano', 'cresc'], ['entropy', 'minimax'], workers=1)
+        table = self.simulate.difficulty_table(results)
+        self.assertEqual({row['answer'] for row in table}, {'piano', 'cresc'})
+        row = table[0]
+        for key in ('mean_guesses', 'max_guesses', 'fail_rate', 'distinct_patterns', 'guesses_entropy', 'guesses_minimax'):
+            self.assertIn(key, row)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / 'out.csv'
+            json_path = Path(tmp) / 'out.json'
+            self.simulate.write_report(table, csv_path, {'games': len(results)})
+            self.simulate.write_report(table, json_path, {'games': len(results)})
+            self.assertTrue(csv_path.read_text().startswith('answer,games,'))
+            self.assertEqual(len(json.loads(json_path.read_text())['answers']), 2)
+
+    def test_daily_answers_follow_the_calendar(self):
+        days = self.simulate.daily_answers(datetime.date(2024, 1, 1), datetime.date(2024, 1, 3))
+        self.assertEqual([d for d, _ in days], ['2024-01-01', '2024-01-02', '2024-01-03'])
+        from musicwordle.schedule import daily_secret
+        self.assertEqual(days[0][1], daily_secret(datetime.date(2024, 1, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from test_app import load_app_module
+
+
+class TestSolver(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import scoring, solver
+        cls.scoring = scoring
+        cls.solver = solver
+        cls.matrix = scoring.PatternMatrix(['piano', 'cello', 'arose', 'tenor', 'banjo'], ['piano', 'cello', 'tenor', 'banjo'])
+
+    def test_narrow_keeps_only_consistent_answers(self):
+        cands = self.solver.CandidateSet(self.matrix)
+        code = self.scoring.score_code('arose', 'piano')
+        narrowed = cands.narrow('arose', code)
+        self.assertIn('piano', narrowed.words)
+        for answer in narrowed.words:
+            self.assertEqual(self.scoring.score_code('arose', answer), code)
+        self.assertEqual(len(cands), 4)
+
+    def test_single_candidate_is_suggested(self):
+        cands = self.solver.CandidateSet(self.matrix)
+        cands = cands.narrow('piano', self.scoring.ALL_CORRECT)
+        for name in self.solver.STRATEGIES:
+            self.assertEqual(self.solver.suggest(cands, name, top=1)[0][0], 'piano')
+
+    def test_strategies_rank_candidates(self):
+        cands = self.solver.CandidateSet(self.matrix)
+        for name, strategy in self.solver.STRATEGIES.items():
+            ranked = strategy.rank(cands, top=3)
+            self.assertEqual(len(ranked), 3)
+            scores = [s for _, s in ranked]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+            if strategy.answers_only:
+                self.assertTrue(all(w in cands.words for w, _ in ranked))
+
+    def test_session_candidates_follow_guesses(self):
+        st = self.app.st
+        st.session_state.clear()
+        self.app.ensure_state()
+        st.session_state.game = self.app.GameEngine().play('piano', ['arose'])
+        cands = self.app.current_candidates()
+        self.assertIn('piano', cands.words)
+        self.assertLess(len(cands), len(self.app.ANSWERS))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import time
+import unittest
+
+from test_app import load_app_module
+
+
+def hamming(a, b):
+    return sum(x != y for x, y in zip(a, b))
+
+
+class TestDidYouMean(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import spelling
+        cls.spelling = spelling
+        cls.words = cls.app.shared_dictionary()
+        cls.index = spelling.shared_index(cls.words)
+
+    def test_neighbours_match_a_scan(self):
+        vocab = set(self.words) | set(self.app._ANSWERS)
+        rng = random.Random(5)
+        queries = ['pianp', 'zzzzz', 'qxjvk'] + [
+            ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') if rng.random() < 0.3 else c for c in w)
+            for w in rng.sample(sorted(vocab), 25)
+        ]
+        for q in queries:
+            expected = sorted((w, hamming(w, q)) for w in vocab if 0 < hamming(w, q) <= 2)
+            self.assertEqual(sorted(self.index.neighbours(q)), expected, q)
+        self.assertEqual(self.index.neighbours('toolong'), [])
+
+    def test_answers_rank_first(self):
+        near = self.index.suggest('pianp', limit=5)
+        self.assertEqual(near[0], 'piano')
+        answers = set(self.app._ANSWERS)
+        flags = [w in answers for w in near]
+        self.assertEqual(flags, sorted(flags, reverse=True))
+        self.assertEqual(self.spelling.format_suggestions(['piano', 'piani']), 'Did you mean PIANO or PIANI?')
+        self.assertEqual(self.spelling.format_suggestions([]), '')
+
+    def test_built_once_per_word_list(self):
+        self.assertIs(self.spelling.shared_index(self.words), self.index)
+        self.assertIsNot(self.spelling.shared_index(self.app.load_bundled_dictionary()), self.index)
+
+    def test_large_upload_lookup_is_fast(self):
+        rng = random.Random(11)
+        words = {''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=5)) for _ in range(300_000)}
+        index = self.spelling.NeighbourIndex(words)
+        queries = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=5)) for _ in range(50)]
+        start = time.perf_counter()
+        for q in queries:
+            index.suggest(q)
+        per_lookup = (time.perf_counter() - start) / len(queries)
+        self.assertLess(per_lookup, 0.005)  # ~0.2 ms here; generous for slow CI
+
+    def test_rejected_guess_offers_suggestions(self):
+        st = self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        self.app.main()
+        game = st.session_state.game
+        game.current = 'pianp'
+        self.app.submit_guess_from_state()
+        self.assertEqual(st.session_state.did_you_mean[0], 'piano')
+        self.assertTrue(st.session_state.message.startswith('Not in dictionary. Did you mean PIANO'))
+        self.app.use_suggestion('piano')
+        self.assertEqual((game.current, st.session_state.did_you_mean), ('piano', []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import time
+import unittest
+
+from test_app import load_app_module
+
+
+class TestStatsStore(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import stats
+        cls.stats = stats
+
+    def setUp(self):
+        self.now = 0.0
+        self.store = self.stats.StatsStore(os.path.join(tempfile.mkdtemp(), 'stats.sqlite3'), flush_interval=5.0,
+                                           ttl=10.0, clock=lambda: self.now)
+        self.addCleanup(self.store.close)
+
+    def game(self, player, answer, guesses, daily=True, seed='2025-06-01'):
+        state = self.app.GameEngine().play(answer, guesses)
+        state.finished = True
+        return self.stats.GameRecord.from_state(player, state, daily, seed)
+
+    def test_writes_are_batched_off_thread(self):
+        start = time.perf_counter()
+        for i in range(500):
+            self.assertTrue(self.store.record(self.game(f'p{i % 7}', 'piano', ['cello', 'piano'])))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        # Nothing committed yet (flush_interval is 5 s), but queued games already count
+        self.assertEqual(self.store.written, 0)
+        self.assertEqual(self.store.player_stats('p0')['played'], 72)
+        self.store.flush()
+        self.assertEqual((self.store.written, self.store.batches), (500, 2))
+        self.assertEqual(self.store.player_stats('p0')['played'], 72)
+
+    def test_streaks_distributions_and_rates(self):
+        games = [self.game('amy', 'piano', ['piano'], seed='2025-06-01'),
+                 self.game('amy', 'viola', ['cello', 'viola'], seed='2025-06-02'),
+                 self.game('amy', 'tempo', ['cello'] * 6, seed='2025-06-03'),
+                 self.game('amy', 'opera', ['cello', 'piano', 'opera'], daily=False, seed='x'),
+                 self.game('bob', 'piano', ['cello', 'piano'], seed='2025-06-01')]
+        for g in games:
+            self.store.record(g)
+        self.store.flush()
+        amy = self.store.player_stats('amy')
+        self.assertEqual((amy['played'], amy['wins'], amy['win_pct']), (4, 3, 75))
+        self.assertEqual((amy['streak'], amy['max_streak']), (1, 2))
+        self.assertEqual(amy['distribution'], [1, 1, 1, 0, 0, 0])
+        day = self.store.day_distribution('2025-06-01')
+        self.assertEqual((day['played'], day['distribution'][:2], day['lost']), (2, [1, 1], 0))
+        self.assertEqual(self.store.answer_stats('piano'), {'played': 2, 'solved': 2, 'solve_rate': 1.0,
+                                                            'mean_tries': 1.5})
+        self.assertEqual(self.store.hardest(1, min_games=1)[0]['answer'], 'tempo')
+        again = self.store.last_daily('amy', '2025-06-02').to_state()
+        self.assertEqual((again.guess_words, again.won, again.finished), (['cello', 'viola'], True, True))
+        self.assertIsNone(self.store.last_daily('bob', '2025-06-02'))
+
+    def test_aggregates_cached_until_ttl(self):
+        self.store.record(self.game('amy', 'piano', ['piano']))
+        self.store.flush()
+        self.assertEqual(self.store.day_distribution('2025-06-01')['played'], 1)
+        self.store.record(self.game('bob', 'piano', ['piano']))
+        self.store.flush()
+        self.assertEqual(self.store.day_distribution('2025-06-01')['played'], 1)
+        self.now += 11
+        self.assertEqual(self.store.day_distribution('2025-06-01')['played'], 2)
+        self.store.close()
+        self.assertFalse(self.store.record(self.game('amy', 'piano', ['piano'])))
+
+    def test_app_records_finished_games(self):
+        st = self.app.st
+        st.session_state.clear()
+        st.query_params.clear()
+        self.app.main()
+        game = st.session_state.game
+        for word in ['cello', 'viola', 'piano', 'opera', 'tempo', game.secret]:
+            if game.finished:
+                break
+            game.current = word
+            self.app.submit_guess_from_state()
+        store = self.stats.shared_store()
+        player = st.session_state.player
+        self.assertEqual(st.query_params['player'], player)
+        self.assertEqual(store.player_stats(player)['played'], 1)
+        self.app.main()  # stats panel on a finished game
+        # A refresh on the same day brings back the finished daily game
+        store.record(self.stats.GameRecord.from_state(player, game, True, 'today'))
+        st.session_state.game = self.app.GameState(game.secret)
+        self.app.restore_daily_result('today')
+        self.assertEqual(st.session_state.game.guess_words, game.guess_words)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_app import load_app_module
+
+
+class TestTelemetry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import telemetry
+        cls.telemetry = telemetry
+
+    def test_ring_buffer_keeps_recent_window_and_lifetime_totals(self):
+        rec = self.telemetry.SpanRecorder(capacity=4, enabled=True)
+        for ms in range(1, 11):
+            rec.record('board', ms / 1000)
+        s = rec.snapshot()['board']
+        self.assertEqual((s['count'], s['window']), (10, 4))
+        self.assertAlmostEqual(s['sum'], 0.055)
+        self.assertAlmostEqual(s['p50'], 0.009)
+        self.assertAlmostEqual(s['max'], 0.010)
+
+    def test_disabled_spans_record_nothing(self):
+        rec = self.telemetry.SpanRecorder()
+        with rec.span('rerun'):
+            pass
+        self.assertEqual(rec.snapshot(), {})
+        rec.enable()
+        with rec.span('rerun'):
+            pass
+        self.assertEqual(rec.snapshot()['rerun']['count'], 1)
+
+    def test_prometheus_and_json_export(self):
+        rec = self.telemetry.SpanRecorder(enabled=True)
+        rec.record('submit', 0.002)
+        text = rec.to_prometheus()
+        self.assertIn('# TYPE music_wordle_span_seconds summary', text)
+        self.assertIn('music_wordle_span_seconds{span="submit",quantile="0.99"} 0.002', text)
+        self.assertIn('music_wordle_span_seconds_count{span="submit"} 1', text)
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertTrue(rec.maybe_export(tmp, interval=3600))
+            self.assertFalse(rec.maybe_export(tmp, interval=3600))
+            data = json.loads((Path(tmp) / 'metrics.json').read_text())
+            self.assertEqual(data['spans']['submit']['count'], 1)
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['metrics.json', 'metrics.prom'])
+
+    def test_capture_reports(self):
+        with self.telemetry.capture('cprofile') as report:
+            sorted(range(1000))
+        self.assertIn('function calls', report[0])
+        with self.telemetry.capture('tracemalloc') as report:
+            blob = [bytes(1000) for _ in range(100)]
+        self.assertTrue(report[0].startswith('current '))
+        del blob
+        with self.assertRaises(ValueError):
+            with self.telemetry.capture('perf'):
+                pass
+
+    def test_debug_rerun_records_app_phases(self):
+        st = self.app.st
+        rec = self.app._telemetry
+        st.session_state.clear()
+        st.query_params.clear()
+        st.query_params['debug'] = '1'
+        try:
+            self.app.main()
+            st.session_state.game.current = 'cello'
+            st.query_params['k'] = 'ENTER'
+            st.session_state.profile_next = 'cprofile'
+            self.app.main()
+        finally:
+            rec.enabled = False
+            st.query_params.clear()
+        spans = rec.snapshot()
+        for name in ('rerun', 'ensure_state', 'secret', 'query_params', 'board', 'key_status', 'keyboard', 'submit'):
+            self.assertIn(name, spans)
+        mode, report = st.session_state.profile_report
+        self.assertEqual(mode, 'cprofile')
+        self.assertIn('_render', report[0])
+        rec.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import os
+import unittest
+
+import bench_coldstart
+from test_app import load_app_module
+
+
+class TestWarmUp(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = load_app_module()
+        from musicwordle import finder, warmup
+        cls.finder, cls.warmup = finder, warmup
+
+    def test_warm_up_builds_the_shared_tables(self):
+        self.finder._shared.pop(6, None)
+        timings = self.warmup.warm_up(('dictionary', 'finder'), lengths=(6,))
+        self.assertEqual(list(timings), ['dictionary[6]', 'finder[6]'])
+        self.assertIn(6, self.finder._shared)
+        self.assertIs(self.finder.shared_index(6), self.finder._shared[6])
+        with self.assertRaises(ValueError):
+            self.warmup.warm_up(('everything',))
+
+    def test_background_warm_up_runs_once_unless_disabled(self):
+        self.assertIsNone(self.warmup.start_background())  # tests set MUSIC_WORDLE_WARMUP=off
+        saved, os.environ['MUSIC_WORDLE_WARMUP'] = os.environ['MUSIC_WORDLE_WARMUP'], ''
+        try:
+            thread = self.warmup.start_background(('dictionary',))
+            self.assertIs(self.warmup.start_background(), thread)
+            thread.join(10)
+            self.assertFalse(thread.is_alive())
+        finally:
+            os.environ['MUSIC_WORDLE_WARMUP'] = saved
+            self.warmup._started = None
+
+    def test_practice_mode_builds_the_finder_index_on_first_query(self):
+        st = self.app.st
+        st.session_state.clear()
+        self.finder._shared.pop(5, None)
+        self.app.finder_page.cache_clear()
+        self.app.main()  # stub toggles are off: practice mode, finder fields empty
+        self.assertNotIn(5, self.finder._shared)
+        self.assertGreater(self.app.finder_page(('p?a??', '', '', '', False), 0)[0], 0)
+        self.assertIn(5, self.finder._shared)
+
+    def test_cold_start_keeps_rare_paths_lazy(self):
+        run = bench_coldstart.run_once('daily')
+        self.assertEqual(run['lazy_loaded'], [])
+        self.assertGreater(run['import_ms'], 0)
+        self.assertGreater(run['first_render_ms'], 0)
+        self.assertEqual(set(run['warm_up_ms']), {f'{s}[5]' for s in self.warmup.STEPS})
+        summary = bench_coldstart.summarise([run, run])
+        self.assertEqual(bench_coldstart.over_budget(summary, 1e6, 1e6), [])
+        self.assertEqual(len(bench_coldstart.over_budget(summary, 0, 0)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()